@@ -2,10 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import datetime as dt
+import hashlib
+import json
+import multiprocessing
 import os
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Set, Tuple
 from urllib.parse import quote_plus
+from zoneinfo import ZoneInfo
 
 import contextlib
 
@@ -17,14 +23,41 @@ import pandas as pd
 import numpy as np
 import yfinance as yf
 import FinanceDataReader as fdr
-import feedparser
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from services.ai import rank_recommendations, summarize_headline, translate_to_korean
-import subprocess
-import sys
+from services.ai import (
+    cached_korean_translations,
+    rank_recommendations,
+    summarize_headline,
+    translate_many_to_korean,
+)
+from services.backtest import (
+    additional_report,
+    bollinger_accuracy,
+    macd_accuracy,
+    moving_average_accuracy,
+    risk_metrics,
+    rsi_accuracy,
+    support_resistance_accuracy,
+    tail_days,
+    technical_report,
+    trend_line_accuracy,
+)
+from services.disk_cache import JsonDiskCache
+from services.feeds import FeedEntry, FeedParsePool
+from services.indicator_engine import IndicatorEngine, IndicatorSnapshot
+from services.jobs import JobQueue, JobQueueFull
+from services.leader import KeyedFileLock, LeaderLease, SnapshotChannel
+from services.news_index import NewsDedupIndex
+from services.price_series import DailySeries
+from services.regression import last_linregress, trend_types
+from services.screener import PriceMatrix
+from services.screening import FACTOR_NAMES, FactorMatrix, compute_price_factors
+from services.symbol_index import SymbolMatcher
+from services.sweep import expand_grid, rank_parameters, sweep_symbol
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +159,48 @@ class RecommendationResponse(BaseModel):
     items: List[RecommendationItem]
 
 
+class ScreeningRequest(BaseModel):
+    universe: str = Field("SP500", description="스크리닝 대상 유니버스 (SP500, KOSPI200, KOSPI, KOSDAQ, KRX)")
+    weights: Optional[dict[str, float]] = Field(
+        None,
+        description="요소별 가중치. eps_growth, revenue_growth, momentum, volatility 중 일부/전부 지정 가능",
+    )
+    top_k: int = Field(20, ge=1, le=500, description="반환할 상위 종목 수")
+
+
+class ScreeningResponse(BaseModel):
+    universe: str
+    generated_at: dt.datetime
+    universe_size: int
+    items: List[RecommendationItem]
+
+
+class ScreenerRequest(BaseModel):
+    universe: str = Field("KOSPI200", description="사전 계산된 유니버스 (SCREENING_UNIVERSES)")
+    conditions: Dict[str, Any] = Field(
+        ...,
+        description='조건 트리. 예: {"all": [{"indicator": "rsi", "period": 14, "op": "<", "value": 30}, '
+        '{"indicator": "golden_cross", "fast": 5, "slow": 20}]}',
+    )
+    limit: int = Field(100, ge=1, le=1000)
+
+
+class ScreenerMatch(BaseModel):
+    ticker: str
+    close: float
+    change_pct: Optional[float] = None
+    values: Dict[str, Optional[float]]
+
+
+class ScreenerResponse(BaseModel):
+    universe: str
+    as_of: dt.date
+    generated_at: dt.datetime
+    universe_size: int
+    matched: int
+    items: List[ScreenerMatch]
+
+
 class NewsArticle(BaseModel):
     headline: str
     headline_ko: Optional[str] = None
@@ -136,6 +211,8 @@ class NewsArticle(BaseModel):
     published_at: dt.datetime
     symbols: List[str] = Field(default_factory=list)
     image: Optional[str] = None
+    # 백그라운드 번역 대기 중 (완료 전까지 headline_ko/summary_ko는 비어 있음)
+    translation_pending: bool = False
 
 
 class MarketQuote(BaseModel):
@@ -211,12 +288,46 @@ class TradingSignal(BaseModel):
     reason: str
 
 
+class TradingSignalPoint(TradingSignal):
+    time: int
+
+
+class TradingSignalSeriesResponse(BaseModel):
+    symbol: str
+    resolution: str
+    signals: List[TradingSignalPoint]  # 매수/매도 신호가 난 봉만 (보유 제외)
+    buy_count: int
+    sell_count: int
+    hold_count: int
+
+
 class ChartAnalysisRequest(BaseModel):
     symbol: str
     resolution: str = "D"
     range_days: int = 60
 
 
+class BatchChartAnalysisRequest(BaseModel):
+    symbols: List[str] = Field(..., min_length=1, max_length=100, description="분석할 종목 목록 (관심 종목 등)")
+    resolution: str = "D"
+    range_days: int = 60
+
+
+class BacktestJobRequest(BaseModel):
+    kind: Literal["technical", "additional"] = Field("technical", description="technical: 지지/저항·추세·이동평균, additional: RSI·MACD·볼린저·리스크")
+    symbols: List[str] = Field(..., min_length=1, max_length=20)
+
+
+class ParameterSweepRequest(BaseModel):
+    indicator: Literal["rsi", "macd", "bollinger", "ma_cross"] = "rsi"
+    symbols: List[str] = Field(..., min_length=1, max_length=20)
+    horizon: int = Field(10, ge=1, le=60, description="신호 평가 기간 (봉 수)")
+    range_days: int = Field(3650, ge=365, le=7300, description="사용할 일봉 기간 (일)")
+    grid: Optional[Dict[str, List[float]]] = Field(None, description="파라미터별 후보 값 (생략한 항목은 기본 그리드)")
+    top_k: int = Field(10, ge=1, le=100)
+    min_signals: int = Field(5, ge=1)
+
+
 class ChartAnalysisResponse(BaseModel):
     symbol: str
     technical_indicators: List[TechnicalIndicator]
@@ -228,6 +339,35 @@ class ChartAnalysisResponse(BaseModel):
     summary: str
 
 
+class MultiTimeframeAnalysisRequest(BaseModel):
+    symbol: str
+    resolutions: List[str] = Field(["60", "D", "W"], min_length=1, max_length=6, description="분석할 타임프레임 목록")
+    range_days: int = Field(365, ge=1, le=5000)
+
+
+class TimeframeAnalysis(BaseModel):
+    resolution: str
+    analysis: Optional[ChartAnalysisResponse] = None
+    error: Optional[str] = None
+    range_days: Optional[int] = None  # 분석에 쓴 기준 데이터의 기간(일) - 분봉 조회 한도로 요청보다 짧을 수 있음
+
+
+class TimeframeConfluence(BaseModel):
+    signal: str  # 다수 타임프레임이 가리키는 방향: "buy", "sell", "hold"
+    bullish: int
+    bearish: int
+    neutral: int
+    agreement: float  # 분석에 성공한 타임프레임 중 signal과 같은 방향의 비율 (0-1)
+    summary: str
+
+
+class MultiTimeframeAnalysisResponse(BaseModel):
+    symbol: str
+    base_resolution: str
+    timeframes: List[TimeframeAnalysis]
+    confluence: TimeframeConfluence
+
+
 @app.post("/api/summarize", response_model=SummarizeResponse)
 def summarize_news(payload: SummarizeRequest) -> SummarizeResponse:
     try:
@@ -447,7 +587,7 @@ async def chat_with_llm(payload: ChatRequest) -> ChatResponse:
     
     if payload.include_news and not is_ai_analysis_question:
         try:
-            articles_list = await _fetch_usa_news()
+            articles_list = await _cached_news("usa")
             articles = articles_list[:payload.max_news] if isinstance(articles_list, list) else list(articles_list)[:payload.max_news]
             if articles:
                 news_items = []
@@ -671,10 +811,56 @@ TradeNote의 AI 분석 기능은 두 가지가 있습니다:
     return "\n\n".join(reply_parts)
 
 
+def _load_fundamentals(ticker: str) -> Dict[str, float]:
+    """최근 실적 발표 기준 매출/EPS 성장률 (디스크 캐시 우선, 동기 함수)"""
+    cached = FUNDAMENTALS_CACHE.get(ticker)
+    if cached is not None:
+        return cached
+
+    earnings = yf.Ticker(ticker).get_earnings_dates(limit=4)
+    revenue_growth = 0.0
+    eps_growth = 0.0
+    if earnings is not None and hasattr(earnings, 'empty') and not earnings.empty:
+        earnings = earnings.sort_index()
+        if "Revenue" in earnings.columns and len(earnings["Revenue"].dropna()) >= 2:
+            revenue_growth = (
+                earnings["Revenue"].iloc[-1] - earnings["Revenue"].iloc[-2]
+            ) / abs(earnings["Revenue"].iloc[-2])
+        if "EPS" in earnings.columns and len(earnings["EPS"].dropna()) >= 2:
+            eps_growth = (
+                earnings["EPS"].iloc[-1] - earnings["EPS"].iloc[-2]
+            ) / abs(earnings["EPS"].iloc[-2])
+
+    fundamentals = {
+        "revenue_growth": float(revenue_growth),
+        "eps_growth": float(eps_growth),
+    }
+    FUNDAMENTALS_CACHE.set(ticker, fundamentals)
+    return fundamentals
+
+
+async def _fetch_fundamentals(tickers: List[str]) -> Dict[str, Dict[str, float]]:
+    """여러 종목의 실적 지표를 제한된 동시성으로 가져옵니다. 실패한 종목은 결과에서 제외됩니다."""
+
+    async def fetch_one(ticker: str) -> Tuple[str, Optional[Dict[str, float]]]:
+        async with FUNDAMENTALS_SEMAPHORE:
+            try:
+                return ticker, await asyncio.to_thread(_load_fundamentals, ticker)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("%s 실적 데이터 수집 실패, 제외합니다: %s", ticker, exc)
+                return ticker, None
+
+    results = await asyncio.gather(*(fetch_one(ticker) for ticker in tickers))
+    return {ticker: fundamentals for ticker, fundamentals in results if fundamentals is not None}
+
+
 @app.post("/api/recommendations", response_model=RecommendationResponse)
-def generate_recommendations(payload: RecommendationRequest) -> RecommendationResponse:
+async def generate_recommendations(payload: RecommendationRequest) -> RecommendationResponse:
+    # 실적 데이터는 시세 다운로드와 동시에 가져온다
+    fundamentals_task = asyncio.create_task(_fetch_fundamentals(payload.tickers))
     try:
-        history = yf.download(
+        history = await asyncio.to_thread(
+            yf.download,
             payload.tickers,
             period="6mo",
             interval="1d",
@@ -683,13 +869,20 @@ def generate_recommendations(payload: RecommendationRequest) -> RecommendationRe
             progress=False,
         )
     except Exception as exc:  # noqa: BLE001
+        fundamentals_task.cancel()
         raise HTTPException(status_code=502, detail=f"데이터 수집 실패: {exc}") from exc
 
     if history.empty:
+        fundamentals_task.cancel()
         raise HTTPException(status_code=404, detail="다운로드한 시세 데이터가 없습니다.")
 
+    fundamentals = await fundamentals_task
+
     metrics = []
     for ticker in payload.tickers:
+        ticker_fundamentals = fundamentals.get(ticker)
+        if ticker_fundamentals is None:
+            continue
         try:
             ticker_history = history[ticker] if len(payload.tickers) > 1 else history
             close_prices = ticker_history["Close"].dropna()
@@ -699,53 +892,192 @@ def generate_recommendations(payload: RecommendationRequest) -> RecommendationRe
             returns = close_prices.pct_change().dropna()
             momentum = (close_prices.iloc[-1] / close_prices.iloc[0]) - 1
             volatility = returns.std()
-
-            earnings = yf.Ticker(ticker).get_earnings_dates(limit=4)
-            revenue_growth = 0.0
-            eps_growth = 0.0
-            if earnings is not None and hasattr(earnings, 'empty') and not earnings.empty:
-                earnings = earnings.sort_index()
-                if "Revenue" in earnings.columns and len(earnings["Revenue"].dropna()) >= 2:
-                    revenue_growth = (
-                        earnings["Revenue"].iloc[-1] - earnings["Revenue"].iloc[-2]
-                    ) / abs(earnings["Revenue"].iloc[-2])
-                if "EPS" in earnings.columns and len(earnings["EPS"].dropna()) >= 2:
-                    eps_growth = (
-                        earnings["EPS"].iloc[-1] - earnings["EPS"].iloc[-2]
-                    ) / abs(earnings["EPS"].iloc[-2])
-
-            metrics.append(
-                {
-                    "ticker": ticker,
-                    "momentum": float(momentum),
-                    "volatility": float(volatility),
-                    "revenue_growth": float(revenue_growth),
-                    "eps_growth": float(eps_growth),
-                }
-            )
         except Exception as exc:  # noqa: BLE001
-            raise HTTPException(status_code=500, detail=f"{ticker} 분석 실패: {exc}") from exc
+            logger.warning("%s 시세 분석 실패, 제외합니다: %s", ticker, exc)
+            continue
+
+        metrics.append(
+            {
+                "ticker": ticker,
+                "momentum": float(momentum),
+                "volatility": float(volatility),
+                "revenue_growth": ticker_fundamentals["revenue_growth"],
+                "eps_growth": ticker_fundamentals["eps_growth"],
+            }
+        )
 
     if not metrics:
         raise HTTPException(status_code=404, detail="평가 가능한 종목 데이터가 없습니다.")
 
-    default_weights = {
-        "momentum": 0.4,
-        "volatility": -0.2,  # 낮을수록 좋음
-        "revenue_growth": 0.2,
-        "eps_growth": 0.2,
-    }
-
+    weights = dict(DEFAULT_RECOMMENDATION_WEIGHTS)
     if payload.weights:
-        default_weights.update(payload.weights)
+        weights.update(payload.weights)
 
-    ranked = rank_recommendations(metrics, weights=default_weights)
+    ranked = rank_recommendations(metrics, weights=weights)
     return RecommendationResponse(
         generated_at=dt.datetime.utcnow(),
         items=[RecommendationItem(**item) for item in ranked],
     )
 
 
+@app.post("/api/recommendations/screen", response_model=ScreeningResponse)
+async def screen_recommendations(payload: ScreeningRequest) -> ScreeningResponse:
+    """사전 계산된 팩터 행렬로 유니버스 전체를 스코어링하여 상위 종목을 반환합니다."""
+    universe = payload.universe.upper()
+    if universe not in SCREENING_UNIVERSES:
+        raise HTTPException(status_code=404, detail=f"{universe}은(는) 사전 계산 대상 유니버스가 아닙니다.")
+
+    matrix = SCREENING_MATRICES.get(universe)
+    if matrix is None:
+        raise HTTPException(status_code=503, detail="팩터 데이터가 준비되지 않았습니다. 잠시 후 다시 시도해주세요.")
+
+    weights = dict(DEFAULT_RECOMMENDATION_WEIGHTS)
+    if payload.weights:
+        weights.update(payload.weights)
+
+    ranked = matrix.rank(weights, payload.top_k)
+    return ScreeningResponse(
+        universe=universe,
+        generated_at=dt.datetime.fromtimestamp(matrix.built_at, tz=dt.timezone.utc),
+        universe_size=len(matrix),
+        items=[RecommendationItem(**item) for item in ranked],
+    )
+
+
+@app.post("/api/screener", response_model=ScreenerResponse)
+async def run_screener(payload: ScreenerRequest) -> ScreenerResponse:
+    """유니버스 전체에 기술적 조건(RSI, 이동평균, 골든/데드 크로스 등)을 한 번에 적용합니다."""
+    universe = payload.universe.upper()
+    if universe not in SCREENING_UNIVERSES:
+        raise HTTPException(status_code=404, detail=f"{universe}은(는) 사전 계산 대상 유니버스가 아닙니다.")
+
+    matrix = SCREENER_MATRICES.get(universe)
+    if matrix is None or matrix.as_of is None:
+        raise HTTPException(status_code=503, detail="스크리너 데이터가 준비되지 않았습니다. 잠시 후 다시 시도해주세요.")
+
+    try:
+        mask, values = matrix.screen(payload.conditions)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"잘못된 스크리닝 조건: {exc}")
+
+    return ScreenerResponse(
+        universe=universe,
+        as_of=matrix.as_of.astype(dt.date),
+        generated_at=dt.datetime.fromtimestamp(matrix.built_at, tz=dt.timezone.utc),
+        universe_size=len(matrix),
+        matched=int(mask.sum()),
+        items=[ScreenerMatch(**item) for item in matrix.results(mask, values, payload.limit)],
+    )
+
+
+def _load_universe_tickers(universe: str) -> List[Tuple[str, str]]:
+    """유니버스 구성 종목을 (표시용 티커, yfinance 티커) 목록으로 반환합니다."""
+    if universe == "SP500":
+        listing = fdr.StockListing("S&P500")
+        symbols = listing["Symbol"].dropna().astype(str)
+        return [(symbol, symbol.replace(".", "-")) for symbol in symbols]
+
+    if universe in ("KOSPI", "KOSPI200", "KOSDAQ"):
+        listing = fdr.StockListing("KOSDAQ" if universe == "KOSDAQ" else "KOSPI")
+        if universe == "KOSPI200" and "Marcap" in listing.columns:
+            # 공식 구성 종목 대신 시가총액 상위 200종목으로 근사
+            listing = listing.sort_values("Marcap", ascending=False).head(200)
+        suffix = ".KQ" if universe == "KOSDAQ" else ".KS"
+        return [(code, f"{code}{suffix}") for code in listing["Code"].astype(str)]
+
+    if universe == "KRX":
+        listing = fdr.StockListing("KRX")
+        pairs = []
+        for code, market in zip(listing["Code"].astype(str), listing["Market"].astype(str)):
+            if market == "KOSPI":
+                pairs.append((code, f"{code}.KS"))
+            elif market.startswith("KOSDAQ"):
+                pairs.append((code, f"{code}.KQ"))
+        return pairs
+
+    raise ValueError(f"지원하지 않는 유니버스입니다: {universe}")
+
+
+async def _build_factor_matrix(universe: str) -> FactorMatrix:
+    pairs = await asyncio.to_thread(_load_universe_tickers, universe)
+    if not pairs:
+        raise ValueError(f"{universe} 구성 종목이 없습니다.")
+    display_tickers = [display for display, _ in pairs]
+    provider_tickers = [provider for _, provider in pairs]
+
+    fundamentals_task = asyncio.create_task(_fetch_fundamentals(provider_tickers))
+    history = await asyncio.to_thread(
+        yf.download,
+        provider_tickers,
+        period="6mo",
+        interval="1d",
+        auto_adjust=True,
+        progress=False,
+        threads=True,
+    )
+    fundamentals = await fundamentals_task
+
+    closes = history["Close"]
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame(provider_tickers[0])
+    price_factors = compute_price_factors(closes).reindex(provider_tickers)
+
+    columns = {
+        "momentum": price_factors["momentum"].to_numpy(dtype=np.float64),
+        "volatility": price_factors["volatility"].to_numpy(dtype=np.float64),
+    }
+    for name in ("revenue_growth", "eps_growth"):
+        columns[name] = np.array(
+            [fundamentals.get(ticker, {}).get(name, np.nan) for ticker in provider_tickers],
+            dtype=np.float64,
+        )
+    raw = np.column_stack([columns[name] for name in FACTOR_NAMES])
+    return FactorMatrix.build(universe, display_tickers, raw)
+
+
+async def _build_price_matrix(universe: str) -> PriceMatrix:
+    pairs = await asyncio.to_thread(_load_universe_tickers, universe)
+    if not pairs:
+        raise ValueError(f"{universe} 구성 종목이 없습니다.")
+    display_tickers = [display for display, _ in pairs]
+    provider_tickers = [provider for _, provider in pairs]
+
+    # 120일 이동평균까지 계산할 수 있도록 1년치 일봉 사용
+    history = await asyncio.to_thread(
+        yf.download,
+        provider_tickers,
+        period="1y",
+        interval="1d",
+        auto_adjust=True,
+        progress=False,
+        threads=True,
+    )
+    closes = history["Close"]
+    volumes = history["Volume"]
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame(provider_tickers[0])
+        volumes = volumes.to_frame(provider_tickers[0])
+    return PriceMatrix.build(
+        universe,
+        display_tickers,
+        closes.reindex(columns=provider_tickers),
+        volumes.reindex(columns=provider_tickers),
+    )
+
+
+def _last_data_ready_time(universe: str) -> float:
+    """가장 최근 거래일의 일봉이 확정된 시각 (주말은 건너뜀, 공휴일은 고려하지 않음)"""
+    tz_name, ready_time = SCREENER_DATA_READY.get(universe, ("Asia/Seoul", dt.time(16, 0)))
+    tz = ZoneInfo(tz_name)
+    now = dt.datetime.now(tz)
+    ready = dt.datetime.combine(now.date(), ready_time, tzinfo=tz)
+    if now < ready:
+        ready -= dt.timedelta(days=1)
+    while ready.weekday() >= 5:
+        ready -= dt.timedelta(days=1)
+    return ready.timestamp()
+
+
 FINNHUB_NEWS_URL = "https://finnhub.io/api/v1/news"
 FINNHUB_QUOTE_URL = "https://finnhub.io/api/v1/quote"
 FINNHUB_SEARCH_URL = "https://finnhub.io/api/v1/search"
@@ -766,7 +1098,9 @@ QUOTE_CACHE: Dict[str, tuple[MarketQuote, float]] = {}
 CANDLE_CACHE: Dict[Tuple[str, str, int], tuple[CandleResponse, float]] = {}
 ALPHAVANTAGE_URL = "https://www.alphavantage.co/query"
 ALPHA_CACHE_TTL = 300
-ALPHA_SERIES_CACHE: Dict[str, tuple[List[dict], float]] = {}
+# compact 응답은 최근 100거래일만 포함하므로 마지막 보유 일자가 이보다 오래되면 full로 다시 받는다
+ALPHA_COMPACT_MAX_GAP_DAYS = 120
+ALPHA_SERIES_CACHE: Dict[str, tuple[DailySeries, float]] = {}
 SYMBOL_ALIAS_MAP: Dict[str, Tuple[str, Optional[str]]] = {
     "KOSPI": ("^KS11", "KOSPI 지수"),
     "KOSDAQ": ("^KQ11", "KOSDAQ 지수"),
@@ -783,7 +1117,68 @@ NEWS_CACHE: Dict[str, tuple[List[NewsArticle], float]] = {}
 NEWS_CACHE_LOCK = asyncio.Lock()
 MARKET_REFRESH_TASK: Optional[asyncio.Task] = None
 NEWS_REFRESH_TASK: Optional[asyncio.Task] = None
+# 새로고침 루프가 멈춘 경우에만 요청 처리 중 갱신을 시작하는 기준 (그 전까지는 루프가 갱신)
+NEWS_STALE_AFTER = 2 * NEWS_REFRESH_INTERVAL
 NEWS_CATEGORIES = ["general"]
+# 캐시 키별 백그라운드 번역 작업과 번역 완료 알림 구독자 (SSE)
+NEWS_TRANSLATION_TASKS: Dict[str, asyncio.Task] = {}
+NEWS_SUBSCRIBERS: Dict[str, Set[asyncio.Queue]] = {}
+# 워커 간 공유 상태 (리더 선출 잠금 파일, 캐시 스냅샷)
+STATE_DIR = os.getenv("BACKEND_STATE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".state"))
+# 리더가 아닌 워커가 스냅샷 갱신 및 리더 승계를 확인하는 주기
+FOLLOWER_POLL_INTERVAL = 15
+MARKET_SNAPSHOT = SnapshotChannel("market_cache", STATE_DIR)
+NEWS_SNAPSHOT = SnapshotChannel("news_cache", STATE_DIR)
+# 요청 중 캐시 미스: 같은 키는 한 워커만 외부 API를 호출하고 나머지는 기다렸다가 스냅샷을 읽음
+ON_DEMAND_FETCH_LOCK = KeyedFileLock("fetch", STATE_DIR)
+ON_DEMAND_LOCK_TIMEOUT = 30.0
+NEWS_LEASE = LeaderLease("news_refresh", STATE_DIR)
+# 실적 데이터는 분기마다 바뀌므로 하루 동안 디스크에 캐시
+FUNDAMENTALS_CACHE = JsonDiskCache(os.path.join(STATE_DIR, "fundamentals"), ttl_seconds=24 * 3600)
+FUNDAMENTALS_CONCURRENCY = 8
+# 동시에 들어온 추천 요청 전체에 걸친 yfinance 실적 조회 동시 실행 수 제한
+FUNDAMENTALS_SEMAPHORE = asyncio.Semaphore(FUNDAMENTALS_CONCURRENCY)
+DEFAULT_RECOMMENDATION_WEIGHTS = {
+    "momentum": 0.4,
+    "volatility": -0.2,  # 낮을수록 좋음
+    "revenue_growth": 0.2,
+    "eps_growth": 0.2,
+}
+# 하루 한 번 팩터 행렬을 다시 계산할 유니버스 목록
+SCREENING_UNIVERSES = [
+    name.strip().upper()
+    for name in os.getenv("SCREENING_UNIVERSES", "SP500,KOSPI200").split(",")
+    if name.strip()
+]
+SCREENING_REBUILD_INTERVAL = 24 * 3600
+SCREENING_CHECK_INTERVAL = 600
+SCREENING_MATRICES: Dict[str, FactorMatrix] = {}
+SCREENING_REFRESH_TASK: Optional[asyncio.Task] = None
+# 기술적 스크리너 가격 행렬 (장 마감 후 유니버스별로 다시 만든다)
+SCREENER_MATRICES: Dict[str, PriceMatrix] = {}
+SCREENER_REFRESH_TASK: Optional[asyncio.Task] = None
+# 유니버스별 (시간대, 일봉 확정 시각) - 데이터 반영 지연을 고려해 장 마감 30분 후
+SCREENER_DATA_READY = {
+    "SP500": ("America/New_York", dt.time(16, 30)),
+    "KOSPI": ("Asia/Seoul", dt.time(16, 0)),
+    "KOSPI200": ("Asia/Seoul", dt.time(16, 0)),
+    "KOSDAQ": ("Asia/Seoul", dt.time(16, 0)),
+    "KRX": ("Asia/Seoul", dt.time(16, 0)),
+}
+
+# RSS 동시 요청 수, 피드별 연결/읽기 제한과 전체 마감 시간, 전체 갱신 시간 예산 (초)
+RSS_FETCH_CONCURRENCY = int(os.getenv("RSS_FETCH_CONCURRENCY", "8"))
+RSS_FEED_TIMEOUT = httpx.Timeout(5.0, connect=3.0)
+RSS_FEED_DEADLINE = 8.0
+RSS_REFRESH_BUDGET = float(os.getenv("RSS_REFRESH_BUDGET", "12"))
+# 피드 파싱 워커 풀 (thread 또는 process)
+FEED_PARSER = FeedParsePool(
+    mode=os.getenv("FEED_PARSE_MODE", "thread"),
+    workers=int(os.getenv("FEED_PARSE_WORKERS", "2")),
+)
+# (피드 URL, 번역 여부) -> 마지막 응답의 ETag, Last-Modified, 본문 해시와 변환된 기사 목록
+RSS_FEED_STATE: Dict[Tuple[str, bool], Dict[str, object]] = {}
+RSS_FETCH_STATS = {"parsed": 0, "not_modified": 0, "unchanged": 0}
 
 # RSS 피드 URL 목록 (확장)
 KOREA_NEWS_RSS = [
@@ -849,24 +1244,12 @@ async def _fetch_finnhub_news(category: str) -> List[NewsArticle]:
         headline = item.get("headline", "").strip()
         summary = (item.get("summary") or "").strip()
 
-        # Try translation with timeout protection
-        headline_ko = None
-        summary_ko = None
-        try:
-            headline_ko = translate_to_korean(headline) or None
-        except Exception:
-            pass
-        try:
-            summary_ko = translate_to_korean(summary) or None
-        except Exception:
-            pass
-        
         articles.append(
             NewsArticle(
                 headline=headline,
-                headline_ko=headline_ko,
+                headline_ko=None,
                 summary=summary or None,
-                summary_ko=summary_ko,
+                summary_ko=None,
                 url=item.get("url", ""),
                 source=item.get("source"),
                 published_at=published_at,
@@ -878,102 +1261,263 @@ async def _fetch_finnhub_news(category: str) -> List[NewsArticle]:
     if not articles:
         raise HTTPException(status_code=404, detail="Finnhub에서 뉴스 데이터를 받지 못했습니다.")
 
+    await _apply_cached_translations(articles)
     return articles
 
 
+def _untranslated_fields(articles: List[NewsArticle]) -> List[Tuple[NewsArticle, str]]:
+    return [
+        (article, field)
+        for article in articles
+        for field in ("headline", "summary")
+        if getattr(article, field) and not getattr(article, f"{field}_ko")
+    ]
+
+
+async def _translate_articles(articles: List[NewsArticle]) -> None:
+    """
+    영어 기사의 제목/요약을 한 번에 모아 배치 번역합니다.
+
+    이미 번역된 항목은 건너뛰고, 번역에 실패한 항목은 원문을 그대로 사용합니다.
+    """
+    fields = _untranslated_fields(articles)
+    if fields:
+        try:
+            translations = await translate_many_to_korean([getattr(article, field) for article, field in fields])
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"뉴스 배치 번역 실패 (원문 사용): {exc}")
+            translations = [getattr(article, field) for article, field in fields]
+        for (article, field), translated in zip(fields, translations):
+            setattr(article, f"{field}_ko", translated or getattr(article, field))
+    for article in articles:
+        article.translation_pending = False
+
+
+async def _apply_cached_translations(articles: List[NewsArticle]) -> None:
+    """
+    번역 캐시에 있는 제목/요약은 바로 채우고, 번역할 항목이 남은 기사만 translation_pending으로 표시합니다.
+
+    모델 호출은 하지 않으므로 응답 지연이 번역 속도에 좌우되지 않습니다.
+    실제 번역은 _schedule_news_translation이 백그라운드에서 처리합니다.
+    바뀌지 않은 피드의 기사는 이전 갱신의 표시를 그대로 갖고 오므로 매번 다시 계산합니다.
+    """
+    fields = _untranslated_fields(articles)
+    if fields:
+        try:
+            cached = await asyncio.to_thread(cached_korean_translations, [getattr(a, f) for a, f in fields])
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"번역 캐시 조회 실패: {exc}")
+            cached = [None] * len(fields)
+        for (article, field), translated in zip(fields, cached):
+            if translated:
+                setattr(article, f"{field}_ko", translated)
+    remaining = {id(article) for article, _ in _untranslated_fields(articles)}
+    for article in articles:
+        article.translation_pending = id(article) in remaining
+
+
+def _article_identity(article: NewsArticle) -> Tuple[str, str]:
+    return article.url, article.headline
+
+
+def _schedule_news_translation(key: str) -> None:
+    """
+    캐시 키의 번역 대기 기사를 번역하는 백그라운드 작업을 (없으면) 시작합니다.
+
+    번역은 리더만 하고 결과는 스냅샷으로 다른 워커에 전달됩니다. 팔로워가 직접 수집한
+    기사는 번역 대기 상태로 발행되고, 리더의 다음 갱신이 번역본으로 교체합니다.
+    """
+    if not NEWS_LEASE.is_leader:
+        return
+    task = NEWS_TRANSLATION_TASKS.get(key)
+    if task is None or task.done():
+        NEWS_TRANSLATION_TASKS[key] = asyncio.create_task(_translate_cached_news(key))
+
+
+async def _translate_cached_news(key: str) -> None:
+    """
+    NEWS_CACHE[key]의 번역 대기 기사를 번역해 캐시 항목을 교체하고 구독자에게 알립니다.
+
+    번역 중에 새로 들어온 대기 기사도 처리하도록 대기 기사가 없어질 때까지 반복합니다.
+    이미 응답으로 나간 목록은 건드리지 않도록 기사 사본을 번역합니다.
+    """
+    try:
+        while True:
+            async with NEWS_CACHE_LOCK:
+                entry = NEWS_CACHE.get(key)
+                pending = [article.model_copy() for article in entry[0] if article.translation_pending] if entry else []
+            if not pending:
+                return
+
+            start = time.perf_counter()
+            await _translate_articles(pending)
+            translated = {_article_identity(article): article for article in pending}
+            async with NEWS_CACHE_LOCK:
+                entry = NEWS_CACHE.get(key)
+                if entry:
+                    articles = [
+                        translated.get(_article_identity(article), article) if article.translation_pending else article
+                        for article in entry[0]
+                    ]
+                    _store_news(key, articles, entry[1])
+            logger.info(f"뉴스 번역 완료({key}): {len(pending)}개 기사, {time.perf_counter() - start:.1f}초")
+            _notify_news_subscribers(key)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:  # noqa: BLE001
+        logger.exception(f"뉴스 백그라운드 번역 오류({key}): {exc}")
+
+
+def _notify_news_subscribers(key: str) -> None:
+    """/api/news/events 구독자에게 캐시 항목이 바뀌었음을 알림"""
+    for queue in NEWS_SUBSCRIBERS.get(key, ()):
+        queue.put_nowait(key)
+
+
+async def _wait_news_translations(keys: List[str]) -> None:
+    tasks = [NEWS_TRANSLATION_TASKS[key] for key in keys if key in NEWS_TRANSLATION_TASKS]
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _rss_entry_to_article(entry: FeedEntry, feed_title: str, translate: bool) -> NewsArticle:
+    """파싱된 피드 항목을 NewsArticle로 변환"""
+    # 날짜 파싱
+    published_at = dt.datetime.utcnow()
+    if entry.published:
+        try:
+            published_at = dt.datetime(*entry.published, tzinfo=dt.timezone.utc)
+        except Exception:
+            pass
+    elif entry.updated:
+        try:
+            published_at = dt.datetime(*entry.updated, tzinfo=dt.timezone.utc)
+        except Exception:
+            pass
+    
+    headline = entry.title.strip()
+    # summary, description, content 등에서 요약 추출 시도
+    summary = entry.summary.strip() or entry.description.strip() or entry.content.strip()
+    url = entry.link
+    source = entry.source if entry.source is not None else feed_title
+    image = entry.image
+    
+    # summary가 빈 문자열이면 None으로 설정
+    final_summary = summary if summary else None
+    
+    # 번역이 필요한 경우 (미국 뉴스)는 나중에 _fetch_usa_news에서 처리, 한국 뉴스는 이미 한국어
+    headline_ko = None if translate else headline
+    summary_ko = None if translate else final_summary
+    
+    return NewsArticle(
+        headline=headline,
+        headline_ko=headline_ko,
+        summary=final_summary,
+        summary_ko=summary_ko,
+        url=url,
+        source=source,
+        published_at=published_at,
+        symbols=[],
+        image=image,
+    )
+
+
+async def _fetch_rss_feed(
+    client: httpx.AsyncClient, rss_url: str, semaphore: asyncio.Semaphore, translate: bool
+) -> List[NewsArticle]:
+    """피드 하나를 가져와 파싱 (피드별 마감 시간 적용, 실패 시 빈 목록)
+    
+    이전 응답의 ETag/Last-Modified를 조건부 요청으로 보내고, 304 응답이거나 본문 해시가 같으면
+    파싱 없이 이전에 만든 기사 목록을 그대로 사용합니다. 번역/종목 태깅이 기사를 제자리에서
+    바꾸므로 RSS_FEED_STATE의 기사는 복사본으로만 내보냅니다.
+    """
+    state_key = (rss_url, translate)
+    state = RSS_FEED_STATE.get(state_key)
+    headers = {"User-Agent": "Mozilla/5.0 (compatible; RSS Reader)"}
+    if state:
+        if state["etag"]:
+            headers["If-None-Match"] = state["etag"]
+        if state["last_modified"]:
+            headers["If-Modified-Since"] = state["last_modified"]
+    try:
+        async with semaphore:
+            response = await asyncio.wait_for(client.get(rss_url, headers=headers), timeout=RSS_FEED_DEADLINE)
+        if response.status_code == 304 and state:
+            RSS_FETCH_STATS["not_modified"] += 1
+            return [article.model_copy() for article in state["articles"]]
+        if response.status_code != 200:
+            logger.debug(f"RSS 피드 응답 실패 ({rss_url}): HTTP {response.status_code}")
+            return []
+        
+        # 검증 헤더를 무시하는 서버도 있으므로 본문 해시로 한 번 더 확인
+        body_hash = hashlib.sha256(response.content).hexdigest()
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body_hash": body_hash,
+        }
+        if state and state["body_hash"] == body_hash:
+            RSS_FETCH_STATS["unchanged"] += 1
+            state.update(validators)
+            return [article.model_copy() for article in state["articles"]]
+        
+        RSS_FETCH_STATS["parsed"] += 1
+        # 각 피드에서 최대 30개 (더 많은 뉴스 수집), 파싱은 이벤트 루프 밖에서
+        feed = await FEED_PARSER.parse(response.text, limit=30)
+        
+        # 피드가 유효한지 확인
+        if not feed.entries:
+            logger.debug(f"RSS 피드에 항목이 없음 ({rss_url})")
+            return []
+        
+        articles = [_rss_entry_to_article(entry, feed.title, translate) for entry in feed.entries]
+        RSS_FEED_STATE[state_key] = {**validators, "articles": articles}
+        return [article.model_copy() for article in articles]
+    except asyncio.TimeoutError:
+        logger.warning(f"RSS 피드 시간 초과 ({rss_url}): {RSS_FEED_DEADLINE}초")
+    except Exception as e:
+        logger.warning(f"RSS 피드 파싱 실패 ({rss_url}): {e}")
+    return []
+
+
 async def _fetch_rss_news(rss_urls: List[str], translate: bool = False) -> List[NewsArticle]:
     """RSS 피드에서 뉴스를 가져옵니다.
     
+    피드는 동시에 가져오며(최대 RSS_FETCH_CONCURRENCY개), 전체 갱신은 RSS_REFRESH_BUDGET초 안에
+    도착한 피드만으로 결과를 만듭니다. 느리거나 죽은 피드가 전체 갱신을 붙잡지 않습니다.
+    
     Args:
         rss_urls: RSS 피드 URL 목록
         translate: True이면 번역 시도 (미국 뉴스용)
     """
     articles: List[NewsArticle] = []
+    semaphore = asyncio.Semaphore(RSS_FETCH_CONCURRENCY)
     
-    async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-        for rss_url in rss_urls:
-            try:
-                response = await client.get(rss_url, headers={"User-Agent": "Mozilla/5.0 (compatible; RSS Reader)"})
-                if response.status_code != 200:
-                    logger.debug(f"RSS 피드 응답 실패 ({rss_url}): HTTP {response.status_code}")
-                    continue
-                
-                feed = feedparser.parse(response.text)
-                
-                # 피드가 유효한지 확인
-                if not hasattr(feed, 'entries') or not feed.entries:
-                    logger.debug(f"RSS 피드에 항목이 없음 ({rss_url})")
-                    continue
-                
-                for entry in feed.entries[:30]:  # 각 피드에서 최대 30개 (더 많은 뉴스 수집)
-                    # 날짜 파싱
-                    published_at = dt.datetime.utcnow()
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        try:
-                            published_at = dt.datetime(*entry.published_parsed[:6], tzinfo=dt.timezone.utc)
-                        except Exception:
-                            pass
-                    elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                        try:
-                            published_at = dt.datetime(*entry.updated_parsed[:6], tzinfo=dt.timezone.utc)
-                        except Exception:
-                            pass
-                    
-                    headline = entry.get("title", "").strip()
-                    # summary, description, content 등에서 요약 추출 시도
-                    summary = (
-                        entry.get("summary", "").strip() 
-                        or entry.get("description", "").strip()
-                        or (entry.get("content", [{}])[0].get("value", "").strip() if entry.get("content") and len(entry.get("content", [])) > 0 else "")
-                    )
-                    url = entry.get("link", "")
-                    source = entry.get("source", {}).get("title", "") if hasattr(entry, "source") else feed.feed.get("title", "")
-                    
-                    # 이미지 추출
-                    image = None
-                    if hasattr(entry, 'media_content') and entry.media_content:
-                        image = entry.media_content[0].get('url')
-                    elif hasattr(entry, 'enclosures') and entry.enclosures:
-                        for enc in entry.enclosures:
-                            if enc.get('type', '').startswith('image'):
-                                image = enc.get('href')
-                                break
-                    
-                    # summary가 빈 문자열이면 None으로 설정
-                    final_summary = summary if summary else None
-                    
-                    # 번역이 필요한 경우 (미국 뉴스)
-                    headline_ko = None
-                    summary_ko = None
-                    if translate:
-                        # 번역은 나중에 _fetch_usa_news에서 처리
-                        headline_ko = None
-                        summary_ko = None
-                    else:
-                        # 한국 뉴스는 이미 한국어
-                        headline_ko = headline
-                        summary_ko = final_summary
-                    
-                    articles.append(
-                        NewsArticle(
-                            headline=headline,
-                            headline_ko=headline_ko,
-                            summary=final_summary,
-                            summary_ko=summary_ko,
-                            url=url,
-                            source=source,
-                            published_at=published_at,
-                            symbols=[],
-                            image=image,
-                        )
-                    )
-            except Exception as e:
-                logger.warning(f"RSS 피드 파싱 실패 ({rss_url}): {e}")
-                continue
+    async with httpx.AsyncClient(timeout=RSS_FEED_TIMEOUT, follow_redirects=True) as client:
+        tasks = [
+            asyncio.create_task(_fetch_rss_feed(client, rss_url, semaphore, translate))
+            for rss_url in rss_urls
+        ]
+        done, pending = await asyncio.wait(tasks, timeout=RSS_REFRESH_BUDGET)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(f"RSS 갱신 시간 예산({RSS_REFRESH_BUDGET}초) 초과로 {len(pending)}개 피드 제외")
+    
+    # 피드 순서대로 합쳐서 같은 시각 기사의 정렬 순서를 유지
+    for task in tasks:
+        if task in done:
+            articles.extend(task.result())
     
     # 날짜순으로 정렬 (최신순)
     articles.sort(key=lambda x: x.published_at, reverse=True)
-    return articles[:50]  # 최대 50개 반환 (더 많은 뉴스 수집)
+    # 여러 피드에 함께 실린 기사(정규화한 URL 또는 거의 같은 헤드라인)는 하나만 남김
+    index = NewsDedupIndex()
+    unique = [article for article in articles if index.add(article.url, article.headline)]
+    if len(unique) < len(articles):
+        logger.debug(f"RSS 중복 기사 {len(articles) - len(unique)}개 제외")
+    return unique[:50]  # 최대 50개 반환 (더 많은 뉴스 수집)
 
 
 async def _fetch_korea_news() -> List[NewsArticle]:
@@ -1031,27 +1575,128 @@ async def _fetch_usa_news() -> List[NewsArticle]:
             if not articles:
                 return []
     
-    # 미국 뉴스는 영어이므로 번역 시도 (번역 실패해도 원문 반환)
-    for article in articles:
-        if article.headline and not article.headline_ko:
-            try:
-                translated = translate_to_korean(article.headline)
-                article.headline_ko = translated if translated and translated != article.headline else article.headline
-            except Exception as e:
-                logger.debug(f"헤드라인 번역 실패 (원문 사용): {e}")
-                article.headline_ko = article.headline
-        
-        if article.summary and not article.summary_ko:
-            try:
-                translated = translate_to_korean(article.summary)
-                article.summary_ko = translated if translated and translated != article.summary else article.summary
-            except Exception as e:
-                logger.debug(f"요약 번역 실패 (원문 사용): {e}")
-                article.summary_ko = article.summary
+    # 미국 뉴스는 영어이므로 캐시된 번역만 채우고, 나머지는 백그라운드에서 번역
+    await _apply_cached_translations(articles)
     
     return articles if articles else []
 
 
+# 백그라운드 루프가 갱신하는 RSS 뉴스 (캐시 키 -> 수집 함수)
+RSS_NEWS_SOURCES: Dict[str, Callable[[], Awaitable[List[NewsArticle]]]] = {
+    "korea": _fetch_korea_news,
+    "usa": _fetch_usa_news,
+}
+# 캐시 키별 진행 중인 RSS 뉴스 갱신 (동시에 여러 요청이 와도 수집은 한 번)
+NEWS_REVALIDATE_TASKS: Dict[str, asyncio.Task] = {}
+
+
+def _article_text(article: NewsArticle) -> str:
+    return " ".join(filter(None, (article.headline, article.summary, article.headline_ko, article.summary_ko)))
+
+
+def _tag_article_symbols(articles: List[NewsArticle]) -> None:
+    """기사 본문(제목/요약)에 나온 종목을 symbols에 추가합니다. (수집 시점에 한 번)"""
+    matcher = SYMBOL_MATCHER
+    for article in articles:
+        found = matcher.match(_article_text(article))
+        if found:
+            existing = list(article.symbols or [])
+            article.symbols = existing + [symbol for symbol in found if symbol not in existing]
+
+
+def _store_news(key: str, articles: List[NewsArticle], stored_at: float) -> None:
+    """NEWS_CACHE 항목과 종목 역색인(심볼 -> 기사 위치)을 함께 교체합니다. NEWS_CACHE_LOCK 안에서 호출"""
+    NEWS_CACHE[key] = (articles, stored_at)
+    index: Dict[str, List[int]] = {}
+    for position, article in enumerate(articles):
+        for symbol in article.symbols or ():
+            index.setdefault(symbol, []).append(position)
+    NEWS_SYMBOL_INDEX[key] = index
+
+
+async def _refresh_rss_news(key: str) -> Optional[List[NewsArticle]]:
+    try:
+        articles = await RSS_NEWS_SOURCES[key]()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(f"RSS 뉴스 갱신 실패({key}): {exc}")
+        return None
+    if not articles:
+        # 모든 피드가 실패한 경우 이전 캐시를 유지
+        logger.warning(f"RSS 뉴스 갱신 결과 없음({key}), 이전 캐시 유지")
+        return None
+
+    await asyncio.to_thread(_tag_article_symbols, articles)
+    async with NEWS_CACHE_LOCK:
+        _store_news(key, articles, time.time())
+    _schedule_news_translation(key)
+    return articles
+
+
+async def _current_rss_news(key: str) -> Optional[List[NewsArticle]]:
+    """스냅샷을 반영한 뒤 NEWS_STALE_AFTER보다 새로운 캐시 항목이 있으면 그 기사 목록을 반환"""
+    await _load_news_snapshot(NEWS_SNAPSHOT)
+    async with NEWS_CACHE_LOCK:
+        entry = NEWS_CACHE.get(key)
+    if entry and time.time() - entry[1] < NEWS_STALE_AFTER:
+        return entry[0]
+    return None
+
+
+async def _refresh_rss_news_shared(key: str) -> Optional[List[NewsArticle]]:
+    """
+    리더가 아닌 워커의 RSS 뉴스 갱신 (_ensure_news_cached와 같은 순서)
+
+    리더가 발행한 스냅샷을 먼저 읽고, 그래도 오래됐으면 키별 파일 잠금을 잡은 워커 하나만
+    피드를 수집해 스냅샷으로 발행합니다. 잠금을 기다린 나머지 워커는 그 스냅샷을 읽습니다.
+    """
+    articles = await _current_rss_news(key)
+    if articles is not None:
+        return articles
+    async with ON_DEMAND_FETCH_LOCK.hold(f"news:{key}", ON_DEMAND_LOCK_TIMEOUT):
+        articles = await _current_rss_news(key)
+        if articles is not None:
+            return articles
+        articles = await _refresh_rss_news(key)
+        if articles is not None:
+            await _publish_news_snapshot(NEWS_SNAPSHOT, [key])
+    return articles
+
+
+def _revalidate_news(key: str) -> asyncio.Task:
+    """진행 중인 갱신이 있으면 그 작업을, 없으면 새 갱신 작업을 반환합니다. (팔로워는 스냅샷부터 확인)"""
+    task = NEWS_REVALIDATE_TASKS.get(key)
+    if task is None or task.done():
+        refresh = _refresh_rss_news(key) if NEWS_LEASE.is_leader else _refresh_rss_news_shared(key)
+        task = NEWS_REVALIDATE_TASKS[key] = asyncio.create_task(refresh)
+    return task
+
+
+async def _cached_news(key: str) -> List[NewsArticle]:
+    """
+    메모리 캐시의 RSS 뉴스를 반환합니다 (stale-while-revalidate).
+
+    평소에는 _news_refresh_loop가 캐시를 갱신하므로 요청은 메모리만 읽습니다.
+    캐시가 NEWS_STALE_AFTER보다 오래되면 이전 목록으로 응답하면서 백그라운드 갱신을 시작하고,
+    서버 기동 직후처럼 캐시가 비어 있을 때만 진행 중인 갱신 하나를 함께 기다립니다.
+    번역 대기 기사는 리더만 번역합니다 (_schedule_news_translation).
+    """
+    async with NEWS_CACHE_LOCK:
+        entry = NEWS_CACHE.get(key)
+    if entry:
+        if time.time() - entry[1] >= NEWS_STALE_AFTER:
+            _revalidate_news(key)
+        if any(article.translation_pending for article in entry[0]):
+            _schedule_news_translation(key)
+        return entry[0]
+
+    articles = await asyncio.shield(_revalidate_news(key))
+    if articles is None:
+        async with NEWS_CACHE_LOCK:
+            entry = NEWS_CACHE.get(key)
+        return entry[0] if entry else []
+    return articles
+
+
 @app.get("/api/news", response_model=List[NewsArticle])
 async def get_news(category: str = "general") -> List[NewsArticle]:
     await _ensure_news_cached(category)
@@ -1070,38 +1715,52 @@ async def get_news(category: str = "general") -> List[NewsArticle]:
 
 @app.get("/api/news/korea", response_model=List[NewsArticle])
 async def get_korea_news() -> List[NewsArticle]:
-    """한국 경제 뉴스를 반환합니다."""
-    key = "korea"
-    # 캐시 무시하고 항상 최신 뉴스 가져오기 (요약 포함)
-    articles = await _fetch_korea_news()
-    async with NEWS_CACHE_LOCK:
-        NEWS_CACHE[key] = (articles, time.time())
-    
-    return articles
+    """한국 경제 뉴스를 반환합니다. (백그라운드 루프가 갱신한 메모리 캐시에서 응답)"""
+    return await _cached_news("korea")
 
 
 @app.get("/api/news/usa", response_model=List[NewsArticle])
 async def get_usa_news() -> List[NewsArticle]:
-    """미국 경제 뉴스를 반환합니다."""
-    key = "usa"
-    async with NEWS_CACHE_LOCK:
-        entry = NEWS_CACHE.get(key)
-        if entry and time.time() - entry[1] < NEWS_REFRESH_INTERVAL:
-            return entry[0]
-    
-    articles = await _fetch_usa_news()
-    async with NEWS_CACHE_LOCK:
-        NEWS_CACHE[key] = (articles, time.time())
-    
-    return articles
+    """미국 경제 뉴스를 반환합니다. (번역은 백그라운드에서 캐시에 반영)"""
+    return await _cached_news("usa")
 
 
-@app.get("/api/news/symbol/{symbol}", response_model=List[NewsArticle])
-async def get_news_by_symbol(symbol: str) -> List[NewsArticle]:
-    """특정 종목에 관련된 뉴스를 반환합니다.
-    
-    Args:
-        symbol: 종목 심볼 (예: "005930", "AAPL")
+@app.get("/api/news/events")
+async def stream_news_events(category: str = "usa") -> StreamingResponse:
+    """백그라운드 번역이 끝나 뉴스 캐시가 갱신될 때마다 해당 카테고리의 기사 목록을 Server-Sent Events로 전송"""
+    key = category.lower()
+
+    async def events():
+        queue: asyncio.Queue = asyncio.Queue()
+        NEWS_SUBSCRIBERS.setdefault(key, set()).add(queue)
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                async with NEWS_CACHE_LOCK:
+                    entry = NEWS_CACHE.get(key)
+                if entry:
+                    payload = [article.model_dump(mode="json") for article in entry[0]]
+                    yield f"event: translated\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+        finally:
+            NEWS_SUBSCRIBERS.get(key, set()).discard(queue)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+@app.get("/api/news/symbol/{symbol}", response_model=List[NewsArticle])
+async def get_news_by_symbol(symbol: str) -> List[NewsArticle]:
+    """특정 종목에 관련된 뉴스를 반환합니다.
+    
+    수집 시점에 기사마다 종목을 태깅해 둔 역색인(NEWS_SYMBOL_INDEX)에서 찾으므로
+    응답 시간은 결과 수에만 비례합니다. 색인에서 찾은 기사가 NEWS_SYMBOL_MIN_HITS개보다
+    적을 때만 외부 뉴스 검색으로 보충합니다.
+    
+    Args:
+        symbol: 종목 심볼 (예: "005930", "AAPL")
     """
     # 심볼 정규화 (005930.KS -> 005930)
     normalized_symbol = symbol.upper().replace(".KS", "").replace(".KQ", "")
@@ -1109,248 +1768,244 @@ async def get_news_by_symbol(symbol: str) -> List[NewsArticle]:
     # 한국 종목인지 확인 (6자리 숫자)
     is_korean = normalized_symbol.isdigit() and len(normalized_symbol) == 6
     
-    # 한국 종목인 경우 한국 뉴스, 그 외는 미국 뉴스
+    # 한국 종목인 경우 한국 뉴스, 그 외는 미국 뉴스 (+ Finnhub 일반 뉴스)
+    keys = ["korea"] if is_korean else ["usa", "general"]
+    stock_name = SYMBOL_MATCHER.names.get(normalized_symbol, "") if is_korean else symbol
+    # 서버 기동 직후처럼 캐시가 비어 있을 때만 첫 갱신을 기다림
+    await _cached_news(keys[0])
+    
+    filtered_articles: List[NewsArticle] = []
+    seen = NewsDedupIndex()
+    async with NEWS_CACHE_LOCK:
+        for key in keys:
+            entry = NEWS_CACHE.get(key)
+            if not entry:
+                continue
+            if normalized_symbol in SYMBOL_MATCHER.names:
+                candidates = [entry[0][i] for i in NEWS_SYMBOL_INDEX.get(key, {}).get(normalized_symbol, ())]
+            else:
+                # 종목 마스터에 없는 심볼은 태깅되지 않았으므로 이 심볼만으로 직접 검색
+                matcher = SymbolMatcher([(normalized_symbol, stock_name)])
+                candidates = [
+                    article
+                    for article in entry[0]
+                    if normalized_symbol in (article.symbols or []) or matcher.match(_article_text(article))
+                ]
+            for article in candidates:
+                if seen.add(article.url, article.headline):
+                    filtered_articles.append(article)
+    logger.info(f"종목별 뉴스 색인 조회: symbol={normalized_symbol}, stock_name={stock_name}, {len(filtered_articles)}개")
+    
+    # 색인 결과가 부족할 때만 외부 뉴스 소스에서 보충
+    if len(filtered_articles) < NEWS_SYMBOL_MIN_HITS:
+        try:
+            # Google News 검색 또는 NewsAPI를 사용하여 추가 뉴스 가져오기
+            additional_news = await _fetch_stock_news_from_external(stock_name or symbol, is_korean)
+            for news in additional_news:
+                if seen.add(news.url, news.headline):
+                    filtered_articles.append(news)
+                    if len(filtered_articles) >= 20:
+                        break
+            logger.info(f"외부 뉴스 소스에서 {len(additional_news)}개 추가, 총 {len(filtered_articles)}개")
+        except Exception as e:
+            logger.warning(f"외부 뉴스 소스에서 뉴스를 가져오는 중 오류 발생: {e}")
+    
+    # 최대 20개까지 반환 (더 많은 뉴스 제공)
+    return filtered_articles[:20]
+
+
+def _select_google_variants(lang: str) -> List[str]:
+    """이번 검색에서 실행할 Google News 검색어 변형 (접미사)
+
+    종목명 그대로인 기본 검색어는 항상 실행하고, 나머지 변형은 최근 검색에서 앞선 검색어에 없던
+    새 기사를 평균 GOOGLE_QUERY_MIN_YIELD개 미만으로 더했다면 생략합니다.
+    GOOGLE_QUERY_EXPLORE_EVERY번째 검색마다 전체를 실행해 생략된 변형의 통계도 갱신합니다.
+    """
+    suffixes = GOOGLE_NEWS_VARIANTS[lang][1]
+    searches = GOOGLE_QUERY_SEARCHES.get(lang, 0)
+    GOOGLE_QUERY_SEARCHES[lang] = searches + 1
+    if searches % GOOGLE_QUERY_EXPLORE_EVERY == 0:
+        return list(suffixes)
+
+    selected = []
+    for suffix in suffixes:
+        stats = GOOGLE_QUERY_STATS.get((lang, suffix))
+        if (
+            not suffix
+            or stats is None
+            or stats["runs"] < GOOGLE_QUERY_MIN_RUNS
+            or stats["yield"] >= GOOGLE_QUERY_MIN_YIELD
+        ):
+            selected.append(suffix)
+    EXTERNAL_NEWS_STATS["skipped_queries"] += len(suffixes) - len(selected)
+    return selected
+
+
+def _record_google_variant(lang: str, suffix: str, unique: int) -> None:
+    """검색어 변형이 더한 새 기사 수를 지수 이동 평균으로 기록 (오래된 검색보다 최근 검색을 반영)"""
+    stats = GOOGLE_QUERY_STATS.get((lang, suffix))
+    if stats is None:
+        GOOGLE_QUERY_STATS[(lang, suffix)] = {"runs": 1, "unique": unique, "yield": float(unique)}
+        return
+    stats["runs"] += 1
+    stats["unique"] += unique
+    stats["yield"] += GOOGLE_QUERY_DECAY * (unique - stats["yield"])
+
+
+async def _fetch_newsapi_articles(
+    client: httpx.AsyncClient, stock_query: str, lang: str, api_key: str
+) -> Optional[List[NewsArticle]]:
+    """NewsAPI 종목 뉴스 검색 (종목명과 관련 키워드가 함께 나오는 기사만). 요청이 실패하면 None"""
+    is_korean = lang == "ko"
     if is_korean:
-        all_articles = await _fetch_korea_news()
-        # 한국 종목명 가져오기 (KOREAN_STOCKS는 {name: symbol} 형태이므로 역방향 검색)
-        stock_name = ""
-        for name, sym in KOREAN_STOCKS.items():
-            if sym == normalized_symbol:
-                stock_name = name
-                break
+        query = f"{stock_query} 주가 OR {stock_query} 주식"
     else:
-        all_articles = await _fetch_usa_news()
-        stock_name = symbol
-    
-    # 종목명이나 심볼이 포함된 뉴스 필터링
-    filtered_articles = []
-    logger.info(f"종목별 뉴스 필터링 시작: symbol={normalized_symbol}, stock_name={stock_name}, 총 뉴스 수={len(all_articles)}")
-    
-    for article in all_articles:
-        # symbols 필드에 심볼이 포함되어 있는지 확인 (가장 확실한 방법)
-        if article.symbols and normalized_symbol in article.symbols:
-            filtered_articles.append(article)
-            logger.debug(f"심볼 매칭: {article.headline[:50]}")
+        query = f"{stock_query} stock OR {stock_query} shares"
+    params = {"q": query, "language": lang, "sortBy": "publishedAt", "pageSize": 20, "apiKey": api_key}
+    try:
+        response = await client.get("https://newsapi.org/v2/everything", params=params)
+        if response.status_code != 200:
+            logger.warning(f"NewsAPI 응답 오류: status={response.status_code}")
+            return None
+        data = response.json()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(f"NewsAPI에서 뉴스를 가져오는 중 오류 발생: {exc}")
+        return None
+    if data.get("status") != "ok":
+        return None
+
+    stock_lower = stock_query.lower()
+    articles: List[NewsArticle] = []
+    for item in (data.get("articles") or [])[:20]:
+        title = item.get("title") or ""
+        url = item.get("url") or ""
+        if not title or not url:
             continue
-        
-        # 헤드라인과 요약 텍스트 준비
-        headline_text = (article.headline_ko or article.headline or "").lower()
-        summary_text = (article.summary_ko or article.summary or "").lower()
-        full_text = f"{headline_text} {summary_text}"
-        
-        match_targets = []
-        if stock_name:
-            match_targets.append(stock_name.lower())
-        match_targets.extend([normalized_symbol.lower(), symbol.lower()])
-        
-        if any(target and target in full_text for target in match_targets):
-            filtered_articles.append(article)
-            logger.debug(f"종목 키워드 매칭: {article.headline[:50]}")
+        # 종목명이 포함되어 있고, 제목에 있거나 관련 키워드가 함께 있는 기사만
+        full_text = f"{title} {item.get('description') or ''} {item.get('content') or ''}".lower()
+        if stock_lower not in full_text:
             continue
-        
-    logger.info(f"필터링 완료: {len(filtered_articles)}개 뉴스 발견")
-    
-    # 항상 외부 뉴스 소스에서도 검색 (RSS 피드만으로는 부족할 수 있음)
+        if stock_lower not in title.lower() and not any(keyword in full_text for keyword in EXTERNAL_NEWS_KEYWORDS):
+            continue
+
+        published_at = dt.datetime.utcnow()
+        if item.get("publishedAt"):
+            try:
+                published_at = dt.datetime.fromisoformat(item["publishedAt"].replace("Z", "+00:00"))
+            except Exception:
+                pass
+        description = item.get("description") or None
+        articles.append(
+            NewsArticle(
+                headline=title,
+                headline_ko=title if is_korean else None,
+                summary=description,
+                summary_ko=description if is_korean else None,
+                url=url,
+                source=(item.get("source") or {}).get("name") or "NewsAPI",
+                published_at=published_at,
+                symbols=[],
+                image=item.get("urlToImage"),
+            )
+        )
+    return articles
+
+
+async def _fetch_google_news_articles(
+    client: httpx.AsyncClient, query_text: str, lang: str
+) -> Optional[List[NewsArticle]]:
+    """Google News RSS 검색 결과 (API 키 불필요). 요청이 실패하면 None"""
+    region = GOOGLE_NEWS_VARIANTS[lang][0]
+    url = f"https://news.google.com/rss/search?q={quote_plus(query_text)}&hl={lang}&gl={region}&ceid={region}:{lang}"
     try:
-        # Google News 검색 또는 NewsAPI를 사용하여 추가 뉴스 가져오기
-        additional_news = await _fetch_stock_news_from_external(stock_name or symbol, is_korean)
-        # 중복 제거
-        existing_urls = {article.url for article in filtered_articles}
-        for news in additional_news:
-            if news.url not in existing_urls:
-                filtered_articles.append(news)
-                existing_urls.add(news.url)
-                if len(filtered_articles) >= 20:
-                    break
-        logger.info(f"외부 뉴스 소스에서 {len(additional_news)}개 추가, 총 {len(filtered_articles)}개")
-    except Exception as e:
-        logger.warning(f"외부 뉴스 소스에서 뉴스를 가져오는 중 오류 발생: {e}")
-    
-    # 최대 20개까지 반환 (더 많은 뉴스 제공)
-    return filtered_articles[:20]
+        response = await client.get(url, headers={"User-Agent": EXTERNAL_NEWS_USER_AGENT})
+        if response.status_code != 200:
+            logger.warning(f"Google News RSS 응답 오류: status={response.status_code}, query={query_text}")
+            return None
+        feed = await FEED_PARSER.parse(response.text, limit=EXTERNAL_NEWS_LIMIT)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(f"Google News RSS에서 뉴스를 가져오는 중 오류 발생 (query={query_text}): {exc}")
+        return None
+    return [
+        _rss_entry_to_article(entry, "Google News", translate=lang != "ko")
+        for entry in feed.entries
+        if entry.link and entry.title
+    ]
+
+
+async def _search_external_news(stock_query: str, lang: str) -> Optional[List[NewsArticle]]:
+    """NewsAPI와 Google News 검색어 변형을 동시에 요청해 중복 없이 합침. 요청이 모두 실패하면 None"""
+    suffixes = _select_google_variants(lang)
+    queries = [f"{stock_query} {suffix}" if suffix else stock_query for suffix in suffixes]
+    news_api_key = os.getenv("NEWS_API_KEY")
+    EXTERNAL_NEWS_STATS["fetches"] += 1
+    EXTERNAL_NEWS_STATS["queries"] += len(queries)
+    logger.info(f"외부 뉴스 검색: stock_query={stock_query}, lang={lang}, 검색어 {len(queries)}개")
+
+    async with httpx.AsyncClient(timeout=EXTERNAL_NEWS_TIMEOUT, follow_redirects=True) as client:
+        fetches = [_fetch_google_news_articles(client, query_text, lang) for query_text in queries]
+        if news_api_key:
+            fetches.append(_fetch_newsapi_articles(client, stock_query, lang, news_api_key))
+        results = await asyncio.gather(*fetches)
+    if all(result is None for result in results):
+        return None
+
+    # NewsAPI 결과를 먼저, 이어서 검색어 변형 순서대로 합치며 변형마다 새로 더한 기사 수를 기록
+    seen = NewsDedupIndex()
+    articles: List[NewsArticle] = []
+    if news_api_key and results[-1]:
+        articles.extend(article for article in results[-1] if seen.add(article.url, article.headline))
+    for suffix, result in zip(suffixes, results):
+        if result is None:
+            continue
+        added = [article for article in result if seen.add(article.url, article.headline)]
+        _record_google_variant(lang, suffix, len(added))
+        articles.extend(added)
+    return articles[:EXTERNAL_NEWS_LIMIT]
+
+
+async def _refresh_external_news(key: Tuple[str, str], stock_query: str, lang: str) -> Optional[List[NewsArticle]]:
+    articles = await _search_external_news(stock_query, lang)
+    if articles is not None:
+        now = time.time()
+        for expired in [k for k, (_, stored_at) in EXTERNAL_NEWS_CACHE.items() if now - stored_at >= EXTERNAL_NEWS_TTL]:
+            del EXTERNAL_NEWS_CACHE[expired]
+        EXTERNAL_NEWS_CACHE[key] = (articles, now)
+    return articles
 
 
 async def _fetch_stock_news_from_external(stock_query: str, is_korean: bool) -> List[NewsArticle]:
     """외부 뉴스 소스에서 종목별 뉴스를 가져옵니다.
-    
+
+    (검색어, 언어)별로 EXTERNAL_NEWS_TTL 동안 결과를 메모리에 캐시하고, 같은 검색이 동시에
+    들어오면 요청 한 번을 공유합니다.
+
     Args:
         stock_query: 종목명 또는 심볼
         is_korean: 한국 종목 여부
     """
-    articles: List[NewsArticle] = []
-    logger.info(f"외부 뉴스 소스 검색 시작: stock_query={stock_query}, is_korean={is_korean}")
-    
+    lang = "ko" if is_korean else "en"
+    stock_query = stock_query.strip()
+    key = (stock_query.lower(), lang)
+    cached = EXTERNAL_NEWS_CACHE.get(key)
+    if cached is not None and time.time() - cached[1] < EXTERNAL_NEWS_TTL:
+        EXTERNAL_NEWS_STATS["hits"] += 1
+        return list(cached[0])
+
+    task = EXTERNAL_NEWS_TASKS.get(key)
+    if task is None:
+        task = asyncio.create_task(_refresh_external_news(key, stock_query, lang))
+        EXTERNAL_NEWS_TASKS[key] = task
+        task.add_done_callback(lambda _: EXTERNAL_NEWS_TASKS.pop(key, None))
     try:
-        # NewsAPI 사용 (환경 변수에 NEWS_API_KEY가 있는 경우)
-        news_api_key = os.getenv("NEWS_API_KEY")
-        if news_api_key:
-            try:
-                # NewsAPI로 종목별 뉴스 검색
-                if is_korean:
-                    # 한국 뉴스 검색
-                    query = f"{stock_query} 주가 OR {stock_query} 주식"
-                    url = f"https://newsapi.org/v2/everything"
-                    params = {
-                        "q": query,
-                        "language": "ko",
-                        "sortBy": "publishedAt",
-                        "pageSize": 20,
-                        "apiKey": news_api_key
-                    }
-                else:
-                    # 미국 뉴스 검색
-                    query = f"{stock_query} stock OR {stock_query} shares"
-                    url = f"https://newsapi.org/v2/everything"
-                    params = {
-                        "q": query,
-                        "language": "en",
-                        "sortBy": "publishedAt",
-                        "pageSize": 20,
-                        "apiKey": news_api_key
-                    }
-                
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get(url, params=params)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get("status") == "ok" and data.get("articles"):
-                            for item in data["articles"][:20]:
-                                # 제목과 설명에 종목명이 정확히 포함되어 있는지 확인
-                                title = (item.get("title") or "").lower()
-                                description = (item.get("description") or "").lower()
-                                content = (item.get("content") or "").lower()
-                                full_text = f"{title} {description} {content}"
-                                
-                                stock_lower = stock_query.lower()
-                                
-                                # 종목명이 정확히 포함되어 있고, 관련 키워드도 있는지 확인
-                                related_keywords = [
-                                    "주가", "주식", "기업", "회사", "증권", "투자", "시장",
-                                    "상승", "하락", "급등", "급락", "매수", "매도", "목표가",
-                                    "실적", "영업", "매출", "이익", "배당", "인수", "합병",
-                                    "stock", "shares", "price", "trading", "market", "earnings"
-                                ]
-                                
-                                if stock_lower in full_text:
-                                    has_related = any(keyword in full_text for keyword in related_keywords)
-                                    if has_related or stock_lower in title:
-                                        published_at = None
-                                        if item.get("publishedAt"):
-                                            try:
-                                                published_at = dt.datetime.fromisoformat(
-                                                    item["publishedAt"].replace("Z", "+00:00")
-                                                )
-                                            except Exception:
-                                                pass
-                                        
-                                        articles.append(
-                                            NewsArticle(
-                                                headline=item.get("title", ""),
-                                                headline_ko=item.get("title", "") if is_korean else None,
-                                                summary=item.get("description", ""),
-                                                summary_ko=item.get("description", "") if is_korean else None,
-                                                url=item.get("url", ""),
-                                                source=item.get("source", {}).get("name", "NewsAPI"),
-                                                published_at=published_at,
-                                                symbols=None,
-                                                image=item.get("urlToImage"),
-                                            )
-                                        )
-            except Exception as e:
-                logger.warning(f"NewsAPI에서 뉴스를 가져오는 중 오류 발생: {e}")
-        
-        # Google News RSS 피드 사용 (API 키 불필요) - 항상 실행
-        try:
-            google_queries = set()
-            if is_korean:
-                google_queries.update(
-                    filter(
-                        None,
-                        [
-                            stock_query,
-                            f"{stock_query} 주가",
-                            f"{stock_query} 주식",
-                            f"{stock_query} 실적",
-                            f"{stock_query} 전망",
-                            f"{stock_query} 공시",
-                            f"{stock_query} 뉴스",
-                        ],
-                    )
-                )
-                lang = "ko"
-                region = "KR"
-            else:
-                google_queries.update(
-                    filter(
-                        None,
-                        [
-                            stock_query,
-                            f"{stock_query} stock",
-                            f"{stock_query} shares",
-                            f"{stock_query} earnings",
-                            f"{stock_query} forecast",
-                            f"{stock_query} news",
-                        ],
-                    )
-                )
-                lang = "en"
-                region = "US"
-            
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-                for query_text in google_queries:
-                    query = quote_plus(query_text)
-                    google_news_rss = (
-                        f"https://news.google.com/rss/search?q={query}&hl={lang}&gl={region}&ceid={region}:{lang}"
-                    )
-                    logger.info(f"Google News RSS 요청: {google_news_rss}")
-                    response = await client.get(
-                        google_news_rss,
-                        headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
-                    )
-                    logger.info(f"Google News RSS 응답: status={response.status_code}")
-                    if response.status_code != 200:
-                        continue
-        
-                    feed = feedparser.parse(response.text)
-                    logger.info(f"Google News RSS 파싱: entries={len(feed.entries) if hasattr(feed, 'entries') else 0}")
-                    if hasattr(feed, 'entries') and feed.entries:
-                        logger.info(f"Google News RSS에서 {len(feed.entries)}개 뉴스 발견 (query={query_text})")
-                        for entry in feed.entries[:30]:  # 더 많이 가져와서 필터링
-                            published_at = None
-                            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                                try:
-                                    published_at = dt.datetime(*entry.published_parsed[:6], tzinfo=dt.timezone.utc)
-                                except Exception:
-                                    pass
-                            
-                            url = entry.get("link", "")
-                            if not url:
-                                continue
-                            
-                            if not any(a.url == url for a in articles):
-                                articles.append(
-                                    NewsArticle(
-                                        headline=entry.get("title", ""),
-                                        headline_ko=entry.get("title", "") if is_korean else None,
-                                        summary=entry.get("summary", "") or entry.get("description", ""),
-                                        summary_ko=(entry.get("summary", "") or entry.get("description", "")) if is_korean else None,
-                                        url=url,
-                                        source=entry.get("source", {}).get("title", "Google News") if hasattr(entry, 'source') else "Google News",
-                                        published_at=published_at,
-                                        symbols=None,
-                                        image=None,
-                                    )
-                                )
-                                logger.debug(f"Google News 매칭: {entry.get('title', '')[:50]}")
-                                if len(articles) >= 30:
-                                    break
-        except Exception as e:
-            logger.warning(f"Google News RSS에서 뉴스를 가져오는 중 오류 발생: {e}")
-    
-    except Exception as e:
-        logger.error(f"외부 뉴스 소스에서 뉴스를 가져오는 중 오류 발생: {e}")
-    
-    return articles
+        articles = await asyncio.shield(task)
+    except Exception as exc:  # noqa: BLE001
+        logger.error(f"외부 뉴스 소스에서 뉴스를 가져오는 중 오류 발생: {exc}")
+        articles = None
+    # 요청이 모두 실패하면 만료된 캐시라도 반환
+    if articles is None:
+        return list(cached[0]) if cached is not None else []
+    return list(articles)
 
 
 def _get_finnhub_api_key() -> str:
@@ -1377,16 +2032,56 @@ def _get_alpha_api_key() -> str:
     return api_key
 
 
-async def _fetch_alpha_series(symbol: str) -> List[dict]:
-    cache_entry = ALPHA_SERIES_CACHE.get(symbol.upper())
+def _alpha_series_path(symbol: str) -> str:
+    safe_name = "".join(ch if ch.isalnum() or ch in "._-" else "_" for ch in symbol.upper())
+    return os.path.join(STATE_DIR, "alpha", f"{safe_name}.npz")
+
+
+def _load_alpha_series(symbol: str) -> Optional[DailySeries]:
+    path = _alpha_series_path(symbol)
+    if not os.path.exists(path):
+        return None
+    try:
+        return DailySeries.load(path)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("저장된 Alpha Vantage 시계열 로드 실패 (%s): %s", symbol, exc)
+        return None
+
+
+def _save_alpha_series(symbol: str, series: DailySeries) -> None:
+    path = _alpha_series_path(symbol)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    series.save(tmp_path)
+    os.replace(tmp_path, path)
+
+
+async def _fetch_alpha_series(symbol: str) -> DailySeries:
+    """Alpha Vantage 일봉 시계열을 반환합니다.
+
+    처음 한 번은 전체 이력(outputsize=full)을 받아 디스크에 저장하고,
+    이후에는 최근 100일(outputsize=compact)만 받아 날짜 기준으로 병합합니다.
+    """
+    key = symbol.upper()
+    cache_entry = ALPHA_SERIES_CACHE.get(key)
     if cache_entry:
         series, cached_at = cache_entry
         if time.time() - cached_at < ALPHA_CACHE_TTL:
             return series
+        existing: Optional[DailySeries] = series
+    else:
+        existing = await asyncio.to_thread(_load_alpha_series, key)
+
+    outputsize = "full"
+    if existing is not None and len(existing) > 0:
+        gap_days = (dt.datetime.utcnow().date() - existing.last_date()).days
+        if gap_days <= ALPHA_COMPACT_MAX_GAP_DAYS:
+            outputsize = "compact"
 
     params = {
         "function": "TIME_SERIES_DAILY_ADJUSTED",
         "symbol": symbol,
+        "outputsize": outputsize,
         "apikey": _get_alpha_api_key(),
     }
 
@@ -1408,34 +2103,16 @@ async def _fetch_alpha_series(symbol: str) -> List[dict]:
             raise HTTPException(status_code=404, detail=error_message)
         raise HTTPException(status_code=404, detail=f"{symbol.upper()} 데이터가 없습니다.")
 
-    series: List[dict] = []
-    for date_str, values in series_raw.items():
-        try:
-            date = dt.datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=dt.timezone.utc)
-        except ValueError:
-            continue
-
-        try:
-            record = {
-                "date": date,
-                "open": float(values["1. open"]),
-                "high": float(values["2. high"]),
-                "low": float(values["3. low"]),
-                "close": float(values["4. close"]),
-                "adjusted_close": float(values.get("5. adjusted close", values["4. close"])),
-                "volume": float(values["6. volume"]),
-            }
-        except (KeyError, ValueError):
-            continue
-
-        series.append(record)
-
-    if not series:
+    update = DailySeries.from_alpha_payload(series_raw)
+    if len(update) == 0:
         raise HTTPException(status_code=404, detail=f"{symbol.upper()} 데이터가 충분하지 않습니다.")
 
-    series.sort(key=lambda item: item["date"], reverse=True)
-    series = series[:500]
-    ALPHA_SERIES_CACHE[symbol.upper()] = (series, time.time())
+    series = existing.merge(update) if existing is not None and outputsize == "compact" else update
+    ALPHA_SERIES_CACHE[key] = (series, time.time())
+    try:
+        await asyncio.to_thread(_save_alpha_series, key, series)
+    except OSError as exc:
+        logger.warning("Alpha Vantage 시계열 저장 실패 (%s): %s", key, exc)
     return series
 
 
@@ -1481,13 +2158,13 @@ async def _fetch_quote(symbol: str, name: Optional[str] = None) -> MarketQuote:
 
 
 def _quote_from_alpha_series(
-    provider_symbol: str, display_symbol: str, display_name: Optional[str], series: List[dict]
+    provider_symbol: str, display_symbol: str, display_name: Optional[str], series: DailySeries
 ) -> MarketQuote:
-    latest = series[0]
-    prev = series[1] if len(series) > 1 else latest
+    latest = len(series) - 1
+    prev = latest - 1 if len(series) > 1 else latest
 
-    current = latest["close"]
-    prev_close = prev["close"]
+    current = float(series.close[latest])
+    prev_close = float(series.close[prev])
 
     if prev_close:
         change = current - prev_close
@@ -1502,11 +2179,11 @@ def _quote_from_alpha_series(
         current=current,
         change=change,
         percent=percent,
-        high=latest["high"],
-        low=latest["low"],
-        open=latest["open"],
+        high=float(series.high[latest]),
+        low=float(series.low[latest]),
+        open=float(series.open[latest]),
         previous_close=prev_close,
-        timestamp=latest["date"],
+        timestamp=series.datetime_at(latest),
     )
 
 
@@ -1531,6 +2208,25 @@ def _candles_from_series(
     )
 
 
+def _candles_from_daily_series(
+    display_symbol: str, series: DailySeries, range_days: int, resolution: str = "D"
+) -> CandleResponse:
+    subset = series.tail(max(range_days, 1))
+
+    return CandleResponse(
+        symbol=display_symbol,
+        resolution=resolution,
+        data=CandleSeries(
+            timestamps=subset.timestamps().tolist(),
+            opens=subset.open.tolist(),
+            highs=subset.high.tolist(),
+            lows=subset.low.tolist(),
+            closes=subset.close.tolist(),
+            volumes=subset.volume.tolist(),
+        ),
+    )
+
+
 async def _refresh_symbol(symbol: str, name: Optional[str] = None) -> Optional[Dict[str, object]]:
     display_symbol = symbol.upper()
     provider_symbol, alias_name = _normalize_symbol(display_symbol, name)
@@ -1555,7 +2251,7 @@ async def _refresh_symbol(symbol: str, name: Optional[str] = None) -> Optional[D
             logger.warning("yfinance 업데이트 실패 (%s): %s", display_symbol, fallback_exc.detail)
             return None
     else:
-        candles = _candles_from_series(display_symbol, series, 60)
+        candles = _candles_from_daily_series(display_symbol, series, 60)
     CANDLE_CACHE[(provider_symbol.upper(), "D", 60)] = (candles, time.time())
     return {
         "quote": quote,
@@ -1564,27 +2260,44 @@ async def _refresh_symbol(symbol: str, name: Optional[str] = None) -> Optional[D
     }
 
 
-async def _ensure_symbol_cached(symbol: str, name: Optional[str] = None) -> None:
-    display_symbol = symbol.upper()
+async def _market_entry_fresh(display_symbol: str) -> bool:
     async with MARKET_CACHE_LOCK:
         entry = MARKET_CACHE.get(display_symbol)
-        if entry:
-            updated_at: dt.datetime = entry["updated_at"]  # type: ignore[assignment]
-            if (dt.datetime.utcnow() - updated_at).total_seconds() < CACHE_TTL_SECONDS:
-                return
+    if not entry:
+        return False
+    updated_at: dt.datetime = entry["updated_at"]  # type: ignore[assignment]
+    return (dt.datetime.utcnow() - updated_at).total_seconds() < CACHE_TTL_SECONDS
 
-    refreshed = await _refresh_symbol(symbol, name)
-    if refreshed:
-        async with MARKET_CACHE_LOCK:
-            MARKET_CACHE[display_symbol] = refreshed
+
+async def _ensure_symbol_cached(symbol: str, name: Optional[str] = None) -> None:
+    display_symbol = symbol.upper()
+    if await _market_entry_fresh(display_symbol):
+        return
+    # 리더나 다른 워커가 이미 받아 둔 결과가 있으면 외부 API를 호출하지 않음
+    await _load_market_snapshot(MARKET_SNAPSHOT)
+    if await _market_entry_fresh(display_symbol):
+        return
+
+    async with ON_DEMAND_FETCH_LOCK.hold(f"market:{display_symbol}", ON_DEMAND_LOCK_TIMEOUT):
+        # 잠금을 기다리는 동안 다른 워커가 받아 왔을 수 있음
+        await _load_market_snapshot(MARKET_SNAPSHOT)
+        if await _market_entry_fresh(display_symbol):
+            return
+        refreshed = await _refresh_symbol(symbol, name)
+        if refreshed:
+            async with MARKET_CACHE_LOCK:
+                MARKET_CACHE[display_symbol] = refreshed
+            await _publish_market_snapshot(MARKET_SNAPSHOT, {display_symbol: refreshed})
 
 
-async def _refresh_market_cache_once() -> None:
+async def _refresh_market_cache_once(on_progress: Optional[Callable[[], Awaitable[None]]] = None) -> None:
     for symbol, name in MARKET_OVERVIEW_SYMBOLS:
         refreshed = await _refresh_symbol(symbol, name)
         if refreshed:
             async with MARKET_CACHE_LOCK:
                 MARKET_CACHE[symbol.upper()] = refreshed
+        if on_progress:
+            await on_progress()
         await asyncio.sleep(15)
 
 
@@ -1595,41 +2308,238 @@ async def _refresh_news_category(category: str) -> Optional[List[NewsArticle]]:
         logger.warning("뉴스 갱신 실패(%s): %s", category, exc.detail)
         return None
 
+    await asyncio.to_thread(_tag_article_symbols, articles)
     async with NEWS_CACHE_LOCK:
-        NEWS_CACHE[category.lower()] = (articles, time.time())
+        _store_news(category.lower(), articles, time.time())
+    _schedule_news_translation(category.lower())
     return articles
 
 
 async def _refresh_news_cache_once() -> None:
+    await _refresh_symbol_matcher()
     for category in NEWS_CATEGORIES:
         await _refresh_news_category(category)
+    await asyncio.gather(*(_revalidate_news(key) for key in RSS_NEWS_SOURCES))
+
+
+def _news_snapshot_keys() -> List[str]:
+    return NEWS_CATEGORIES + list(RSS_NEWS_SOURCES)
+
+
+def _merge_market_snapshot(
+    current: Optional[Dict[str, Dict[str, object]]], entries: Dict[str, Dict[str, object]]
+) -> Dict[str, Dict[str, object]]:
+    merged = dict(current or {})
+    for symbol, entry in entries.items():
+        existing = merged.get(symbol)
+        if existing is None or existing["updated_at"] < entry["updated_at"]:  # type: ignore[operator]
+            merged[symbol] = entry
+    return merged
+
+
+async def _publish_market_snapshot(
+    channel: SnapshotChannel, entries: Optional[Dict[str, Dict[str, object]]] = None
+) -> None:
+    """entries(기본: 메모리 캐시 전체)를 스냅샷에 병합 - 다른 워커가 올린 종목은 유지"""
+    if entries is None:
+        async with MARKET_CACHE_LOCK:
+            entries = dict(MARKET_CACHE)
+    await asyncio.to_thread(channel.update, lambda current: _merge_market_snapshot(current, entries))
+
+
+async def _load_market_snapshot(channel: SnapshotChannel) -> None:
+    snapshot = await asyncio.to_thread(channel.load)
+    if not snapshot:
+        return
+    async with MARKET_CACHE_LOCK:
+        for symbol, entry in snapshot.items():
+            current = MARKET_CACHE.get(symbol)
+            if current is None or current["updated_at"] < entry["updated_at"]:  # type: ignore[operator]
+                MARKET_CACHE[symbol] = entry
+
+
+def _merge_news_snapshot(
+    current: Optional[Dict[str, tuple]], entries: Dict[str, tuple]
+) -> Dict[str, tuple]:
+    merged = dict(current or {})
+    for key, entry in entries.items():
+        existing = merged.get(key)
+        # 번역 후 다시 발행하는 항목은 수집 시각이 같으므로 같은 시각도 교체
+        if existing is None or existing[1] <= entry[1]:
+            merged[key] = entry
+    return merged
+
+
+async def _publish_news_snapshot(channel: SnapshotChannel, keys: Optional[List[str]] = None) -> None:
+    """keys(기본: 리더가 갱신하는 키) 항목을 스냅샷에 병합 - 다른 워커가 올린 카테고리는 유지"""
+    async with NEWS_CACHE_LOCK:
+        entries = {key: NEWS_CACHE[key] for key in (keys or _news_snapshot_keys()) if key in NEWS_CACHE}
+    await asyncio.to_thread(channel.update, lambda current: _merge_news_snapshot(current, entries))
+
+
+async def _load_news_snapshot(channel: SnapshotChannel) -> None:
+    snapshot = await asyncio.to_thread(channel.load)
+    if not snapshot:
+        return
+    changed = []
+    async with NEWS_CACHE_LOCK:
+        for key, entry in snapshot.items():
+            current = NEWS_CACHE.get(key)
+            # 번역이 끝나 다시 발행된 스냅샷은 수집 시각이 같으므로 같은 시각이면 내용을 비교
+            if current is None or current[1] < entry[1] or (current[1] == entry[1] and current[0] != entry[0]):
+                _store_news(key, entry[0], entry[1])
+                changed.append(key)
+    # 팔로워의 SSE 구독자도 리더의 번역 완료/새 기사를 받도록 알림
+    for key in changed:
+        _notify_news_subscribers(key)
+
+
+def _warn_if_leader_stalled(lease: LeaderLease, max_age: float) -> None:
+    """잠금은 잡혀 있는데 하트비트가 끊긴 리더(멈춘 프로세스)를 로그로 알림 - 잠금은 프로세스가 끝나야 풀림"""
+    if lease.leader_stalled(max_age):
+        holder = lease.holder() or {}
+        logger.warning(
+            "리더 하트비트가 %.0f초 넘게 갱신되지 않았습니다 (%s, pid=%s)", max_age, lease.name, holder.get("pid")
+        )
 
 
 async def _market_refresh_loop() -> None:
-    while True:
-        try:
-            await _refresh_market_cache_once()
-        except Exception as exc:  # noqa: BLE001
-            logger.exception("시장 데이터 갱신 루프 오류: %s", exc)
-        await asyncio.sleep(MARKET_REFRESH_INTERVAL)
+    # 여러 워커 중 잠금을 잡은 하나만 외부 API를 호출하고, 나머지는 스냅샷을 읽는다
+    lease = LeaderLease("market_refresh", STATE_DIR)
+    channel = MARKET_SNAPSHOT
+
+    async def publish_progress() -> None:
+        # 종목 하나를 받을 때마다 발행해 기동 직후에도 팔로워가 바로 응답할 수 있게 함
+        lease.heartbeat()
+        await _publish_market_snapshot(channel)
+
+    try:
+        while True:
+            delay = FOLLOWER_POLL_INTERVAL
+            try:
+                if lease.try_acquire():
+                    await _refresh_market_cache_once(on_progress=publish_progress)
+                    delay = MARKET_REFRESH_INTERVAL
+                else:
+                    await _load_market_snapshot(channel)
+                    _warn_if_leader_stalled(lease, MARKET_REFRESH_INTERVAL + 2 * len(MARKET_OVERVIEW_SYMBOLS) * 15)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("시장 데이터 갱신 루프 오류: %s", exc)
+            await asyncio.sleep(delay)
+    finally:
+        lease.release()
 
 
 async def _news_refresh_loop() -> None:
-    while True:
-        try:
-            await _refresh_news_cache_once()
-        except Exception as exc:  # noqa: BLE001
-            logger.exception("뉴스 데이터 갱신 루프 오류: %s", exc)
-        await asyncio.sleep(NEWS_REFRESH_INTERVAL)
+    lease = NEWS_LEASE
+    channel = NEWS_SNAPSHOT
+    try:
+        while True:
+            delay = FOLLOWER_POLL_INTERVAL
+            try:
+                if lease.try_acquire():
+                    await _refresh_news_cache_once()
+                    lease.heartbeat()
+                    await _publish_news_snapshot(channel)
+                    # 번역 전 원문을 먼저 발행하고, 번역이 끝나면 한 번 더 발행
+                    await _wait_news_translations(_news_snapshot_keys())
+                    lease.heartbeat()
+                    await _publish_news_snapshot(channel)
+                    delay = NEWS_REFRESH_INTERVAL
+                else:
+                    # 요청 중 직접 수집하는 기사도 리더와 같은 종목 마스터로 태깅
+                    await _refresh_symbol_matcher(fetch=False)
+                    await _load_news_snapshot(channel)
+                    _warn_if_leader_stalled(lease, 3 * NEWS_REFRESH_INTERVAL)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("뉴스 데이터 갱신 루프 오류: %s", exc)
+            await asyncio.sleep(delay)
+    finally:
+        lease.release()
+
+
+async def _screening_refresh_loop() -> None:
+    lease = LeaderLease("screening_refresh", STATE_DIR)
+    channel = SnapshotChannel("screening", STATE_DIR)
+    try:
+        while True:
+            delay = FOLLOWER_POLL_INTERVAL
+            try:
+                snapshot = await asyncio.to_thread(channel.load)
+                if snapshot:
+                    SCREENING_MATRICES.update(snapshot)
+                if lease.try_acquire():
+                    for universe in SCREENING_UNIVERSES:
+                        matrix = SCREENING_MATRICES.get(universe)
+                        if matrix is not None and time.time() - matrix.built_at < SCREENING_REBUILD_INTERVAL:
+                            continue
+                        try:
+                            SCREENING_MATRICES[universe] = await _build_factor_matrix(universe)
+                        except Exception as exc:  # noqa: BLE001
+                            logger.warning("팩터 행렬 계산 실패 (%s): %s", universe, exc)
+                            continue
+                        lease.heartbeat()
+                        await asyncio.to_thread(channel.publish, dict(SCREENING_MATRICES))
+                        logger.info("팩터 행렬 갱신 완료 (%s, %d종목)", universe, len(SCREENING_MATRICES[universe]))
+                    delay = SCREENING_CHECK_INTERVAL
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("팩터 행렬 갱신 루프 오류: %s", exc)
+            await asyncio.sleep(delay)
+    finally:
+        lease.release()
+
+
+async def _screener_refresh_loop() -> None:
+    lease = LeaderLease("screener_refresh", STATE_DIR)
+    channel = SnapshotChannel("screener", STATE_DIR)
+    try:
+        while True:
+            delay = FOLLOWER_POLL_INTERVAL
+            try:
+                snapshot = await asyncio.to_thread(channel.load)
+                if snapshot:
+                    SCREENER_MATRICES.update(snapshot)
+                if lease.try_acquire():
+                    for universe in SCREENING_UNIVERSES:
+                        matrix = SCREENER_MATRICES.get(universe)
+                        if matrix is not None and matrix.built_at >= _last_data_ready_time(universe):
+                            continue
+                        try:
+                            SCREENER_MATRICES[universe] = await _build_price_matrix(universe)
+                        except Exception as exc:  # noqa: BLE001
+                            logger.warning("스크리너 가격 행렬 계산 실패 (%s): %s", universe, exc)
+                            continue
+                        lease.heartbeat()
+                        await asyncio.to_thread(channel.publish, dict(SCREENER_MATRICES))
+                        logger.info("스크리너 가격 행렬 갱신 완료 (%s, %d종목)", universe, len(SCREENER_MATRICES[universe]))
+                    delay = SCREENING_CHECK_INTERVAL
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("스크리너 가격 행렬 갱신 루프 오류: %s", exc)
+            await asyncio.sleep(delay)
+    finally:
+        lease.release()
+
+
+async def _news_entry_fresh(key: str) -> bool:
+    async with NEWS_CACHE_LOCK:
+        entry = NEWS_CACHE.get(key)
+    return bool(entry) and time.time() - entry[1] < NEWS_REFRESH_INTERVAL
 
 
 async def _ensure_news_cached(category: str) -> None:
     key = category.lower()
-    async with NEWS_CACHE_LOCK:
-        entry = NEWS_CACHE.get(key)
-        if entry and time.time() - entry[1] < NEWS_REFRESH_INTERVAL:
+    if await _news_entry_fresh(key):
+        return
+    await _load_news_snapshot(NEWS_SNAPSHOT)
+    if await _news_entry_fresh(key):
+        return
+
+    async with ON_DEMAND_FETCH_LOCK.hold(f"news:{key}", ON_DEMAND_LOCK_TIMEOUT):
+        await _load_news_snapshot(NEWS_SNAPSHOT)
+        if await _news_entry_fresh(key):
             return
-    await _refresh_news_category(category)
+        if await _refresh_news_category(category) is not None:
+            await _publish_news_snapshot(NEWS_SNAPSHOT, [key])
 
 
 @app.get("/api/market/overview", response_model=List[MarketQuote])
@@ -1645,7 +2555,7 @@ async def market_overview() -> List[MarketQuote]:
                 missing.append((symbol, name))
 
     for symbol, name in missing:
-        asyncio.create_task(_refresh_symbol(symbol, name))
+        asyncio.create_task(_ensure_symbol_cached(symbol, name))
 
     if not results:
         raise HTTPException(status_code=503, detail="시장 데이터가 준비되지 않았습니다. 잠시 후 다시 시도해주세요.")
@@ -1755,6 +2665,83 @@ KOREAN_STOCKS = {
     "두산에너빌": "034020",
 }
 
+# 뉴스 종목 태깅용 종목 마스터: 기동 시에는 KOREAN_STOCKS만, 뉴스 갱신 루프가 KRX/S&P500 전체 목록으로 교체
+# (리더가 받아 디스크에 저장하고, 팔로워 워커는 디스크에서 읽음)
+SYMBOL_MASTER_CACHE = JsonDiskCache(os.path.join(STATE_DIR, "symbols"), ttl_seconds=24 * 3600)
+SYMBOL_MASTER_REFRESH_INTERVAL = 24 * 3600
+SYMBOL_MATCHER = SymbolMatcher([(code, name) for name, code in KOREAN_STOCKS.items()])
+SYMBOL_MATCHER_BUILT_AT = 0.0
+# 캐시 키 -> 심볼 -> NEWS_CACHE[키] 안의 기사 위치
+NEWS_SYMBOL_INDEX: Dict[str, Dict[str, List[int]]] = {}
+# 색인에서 찾은 기사가 이보다 적으면 외부 뉴스 검색으로 보충
+NEWS_SYMBOL_MIN_HITS = int(os.getenv("NEWS_SYMBOL_MIN_HITS", "5"))
+
+# 외부 종목 뉴스(NewsAPI, Google News) 검색: 요청별 제한 시간, 결과 수, (검색어, 언어)별 결과 캐시
+EXTERNAL_NEWS_TIMEOUT = httpx.Timeout(8.0, connect=3.0)
+EXTERNAL_NEWS_LIMIT = 30
+EXTERNAL_NEWS_TTL = int(os.getenv("EXTERNAL_NEWS_TTL", "600"))
+EXTERNAL_NEWS_CACHE: Dict[Tuple[str, str], Tuple[List[NewsArticle], float]] = {}
+EXTERNAL_NEWS_TASKS: Dict[Tuple[str, str], asyncio.Task] = {}
+EXTERNAL_NEWS_STATS = {"hits": 0, "fetches": 0, "queries": 0, "skipped_queries": 0}
+EXTERNAL_NEWS_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+# NewsAPI 결과 중 종목명이 제목에 없을 때 관련 기사로 볼 키워드
+EXTERNAL_NEWS_KEYWORDS = [
+    "주가", "주식", "기업", "회사", "증권", "투자", "시장",
+    "상승", "하락", "급등", "급락", "매수", "매도", "목표가",
+    "실적", "영업", "매출", "이익", "배당", "인수", "합병",
+    "stock", "shares", "price", "trading", "market", "earnings",
+]
+# 언어 -> (Google News 지역, 검색어 변형 접미사); 빈 접미사는 종목명 그대로
+GOOGLE_NEWS_VARIANTS = {
+    "ko": ("KR", ["", "주가", "주식", "실적", "전망", "공시", "뉴스"]),
+    "en": ("US", ["", "stock", "shares", "earnings", "forecast", "news"]),
+}
+# (언어, 접미사) -> 실행 횟수, 앞선 검색어에 없던 새 기사 누적 수와 그 지수 이동 평균
+GOOGLE_QUERY_STATS: Dict[Tuple[str, str], Dict[str, float]] = {}
+GOOGLE_QUERY_SEARCHES: Dict[str, int] = {}
+# 변형을 GOOGLE_QUERY_MIN_RUNS번 이상 실행했는데 평균 새 기사가 GOOGLE_QUERY_MIN_YIELD개 미만이면 생략
+GOOGLE_QUERY_MIN_RUNS = int(os.getenv("GOOGLE_QUERY_MIN_RUNS", "5"))
+GOOGLE_QUERY_MIN_YIELD = float(os.getenv("GOOGLE_QUERY_MIN_YIELD", "1"))
+GOOGLE_QUERY_DECAY = 0.2
+GOOGLE_QUERY_EXPLORE_EVERY = int(os.getenv("GOOGLE_QUERY_EXPLORE_EVERY", "10"))
+
+
+def _load_symbol_master() -> List[Tuple[str, str]]:
+    """(심볼, 종목명) 목록: KOREAN_STOCKS + KRX 상장 종목 + S&P 500 구성 종목"""
+    master = [(code, name) for name, code in KOREAN_STOCKS.items()]
+    for market, code_column in (("KRX", "Code"), ("S&P500", "Symbol")):
+        try:
+            listing = fdr.StockListing(market)
+            pairs = zip(listing[code_column].astype(str), listing["Name"].astype(str))
+            master.extend((code, name) for code, name in pairs if code and name)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"종목 마스터 로드 실패({market}): {exc}")
+    return master
+
+
+async def _refresh_symbol_matcher(fetch: bool = True) -> None:
+    """하루에 한 번 종목 마스터로 Aho-Corasick 매처를 다시 만듭니다. (디스크 캐시 우선)
+    
+    fetch=False(팔로워 워커)는 리더가 디스크 캐시에 저장한 마스터만 읽고, 아직 없으면 다음 주기에 다시 확인합니다.
+    """
+    global SYMBOL_MATCHER, SYMBOL_MATCHER_BUILT_AT
+    if time.time() - SYMBOL_MATCHER_BUILT_AT < SYMBOL_MASTER_REFRESH_INTERVAL:
+        return
+    master = await asyncio.to_thread(SYMBOL_MASTER_CACHE.get, "master")
+    if not master and not fetch:
+        return
+    SYMBOL_MATCHER_BUILT_AT = time.time()
+    try:
+        if not master:
+            master = await asyncio.to_thread(_load_symbol_master)
+            if len(master) > len(KOREAN_STOCKS):
+                await asyncio.to_thread(SYMBOL_MASTER_CACHE.set, "master", master)
+        SYMBOL_MATCHER = await asyncio.to_thread(SymbolMatcher, [tuple(pair) for pair in master])
+        logger.info(f"뉴스 종목 매처 생성: {len(SYMBOL_MATCHER)}개 종목")
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(f"뉴스 종목 매처 생성 실패 (기존 매처 유지): {exc}")
+
+
 @app.get("/api/market/search", response_model=List[SymbolSearchResult])
 async def market_search(query: str = Query(..., min_length=1, description="심볼 또는 종목명 검색어")) -> List[SymbolSearchResult]:
     results = []
@@ -1890,74 +2877,68 @@ def calculate_moving_averages(prices: pd.Series) -> Dict[str, pd.Series]:
     }
 
 
+def _pivot_points(values: np.ndarray, pivot_window: int, level_type: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """피벗 저점(support) 또는 고점(resistance)의 (인덱스, 가격, 강도)를 한 번에 계산"""
+    n = len(values)
+    span = pivot_window * 2 + 1
+    empty = np.array([], dtype=np.int64)
+    if n < span:
+        return empty, np.array([]), np.array([])
+
+    # 피벗 포인트: 좌우 pivot_window 구간의 최저/최고점 (NaN은 pandas min/max처럼 무시)
+    windows = np.lib.stride_tricks.sliding_window_view(values, span)
+    if level_type == "support":
+        extremes = np.fmin.reduce(windows, axis=1)
+    else:
+        extremes = np.fmax.reduce(windows, axis=1)
+    centers = np.arange(pivot_window, n - pivot_window)
+    pivots = centers[values[centers] == extremes]
+    if len(pivots) == 0:
+        return empty, np.array([]), np.array([])
+
+    # 강도: 피벗 기준 최대 50봉 전 ~ 9봉 후 구간에서 ±3% 범위 안에 있는 봉의 비율
+    offsets = np.arange(-50, 10)
+    neighbour_index = pivots[:, None] + offsets[None, :]
+    in_range = (neighbour_index >= 0) & (neighbour_index < n)
+    levels = values[pivots]
+    neighbours = values[np.clip(neighbour_index, 0, n - 1)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        touched = np.abs(neighbours - levels[:, None]) / levels[:, None] <= 0.03
+    touches = np.count_nonzero(touched & in_range, axis=1)
+    strengths = touches / np.count_nonzero(in_range, axis=1)
+    return pivots, levels, strengths
+
+
+def _pivot_levels(values: np.ndarray, pivot_window: int, level_type: str) -> List[SupportResistance]:
+    """피벗 지지/저항선 목록"""
+    _, levels, strengths = _pivot_points(values, pivot_window, level_type)
+    # 최소 강도 0.2 이상인 것만 유지 (더 신뢰성 있는 지지/저항선)
+    return [
+        SupportResistance(level=float(level), strength=min(float(strength), 1.0), type=level_type)
+        for level, strength in zip(levels, strengths)
+        if strength >= 0.2
+    ]
+
+
+def _level_bucket(level: float) -> float:
+    """지지/저항선 중복 제거용 가격대 키 (±2%)"""
+    price_range = level * 0.02
+    return round(level / price_range) * price_range
+
+
 def detect_support_resistance(highs: pd.Series, lows: pd.Series, closes: pd.Series, window: int = 20) -> Tuple[List[SupportResistance], List[SupportResistance]]:
-    """지지선과 저항선 탐지 (개선된 버전)"""
-    supports = []
-    resistances = []
-    
+    """지지선과 저항선 탐지 (NumPy 벡터화 버전)"""
     # 피벗 포인트 기반 지지/저항선 탐지
     pivot_window = max(window // 2, 5)  # 피벗 포인트 윈도우
-    
-    # 지지선 탐지 (로컬 최저점)
-    for i in range(pivot_window, len(lows) - pivot_window):
-        # 피벗 로우 (양쪽 모두보다 낮은 점)
-        if lows.iloc[i] == lows.iloc[i-pivot_window:i+pivot_window+1].min():
-            level = float(lows.iloc[i])
-            
-            # 주변 가격대에서 같은 레벨 근처의 터치 횟수 계산 (강도)
-            lookback = min(50, i)  # 최대 50일 전까지 확인
-            nearby_touches = 0
-            total_candles = 0
-            
-            for j in range(max(0, i - lookback), min(len(lows), i + 10)):
-                total_candles += 1
-                # ±3% 범위 내에서 터치 확인
-                if abs(lows.iloc[j] - level) / level <= 0.03:
-                    nearby_touches += 1
-            
-            strength = nearby_touches / total_candles if total_candles > 0 else 0
-            
-            # 최소 강도 0.2 이상인 것만 유지 (더 신뢰성 있는 지지선)
-            if strength >= 0.2:
-                supports.append(SupportResistance(
-                    level=level,
-                    strength=min(strength, 1.0),
-                    type="support"
-                ))
-    
-    # 저항선 탐지 (로컬 최고점)
-    for i in range(pivot_window, len(highs) - pivot_window):
-        # 피벗 하이 (양쪽 모두보다 높은 점)
-        if highs.iloc[i] == highs.iloc[i-pivot_window:i+pivot_window+1].max():
-            level = float(highs.iloc[i])
-            
-            # 주변 가격대에서 같은 레벨 근처의 터치 횟수 계산 (강도)
-            lookback = min(50, i)
-            nearby_touches = 0
-            total_candles = 0
-            
-            for j in range(max(0, i - lookback), min(len(highs), i + 10)):
-                total_candles += 1
-                # ±3% 범위 내에서 터치 확인
-                if abs(highs.iloc[j] - level) / level <= 0.03:
-                    nearby_touches += 1
-            
-            strength = nearby_touches / total_candles if total_candles > 0 else 0
-            
-            # 최소 강도 0.2 이상인 것만 유지
-            if strength >= 0.2:
-                resistances.append(SupportResistance(
-                    level=level,
-                    strength=min(strength, 1.0),
-                    type="resistance"
-                ))
+
+    supports = _pivot_levels(lows.to_numpy(dtype=np.float64), pivot_window, "support")
+    resistances = _pivot_levels(highs.to_numpy(dtype=np.float64), pivot_window, "resistance")
     
     def deduplicate_levels(level_items: List[SupportResistance], reverse: bool = False) -> List[SupportResistance]:
         unique_by_level: Dict[float, SupportResistance] = {}
         for item in level_items:
             # 같은 가격대(±2%)는 하나로 묶고, 강도가 더 높은 항목을 유지
-            price_range = item.level * 0.02  # ±2%
-            key = round(item.level / price_range) * price_range
+            key = _level_bucket(item.level)
             existing = unique_by_level.get(key)
             if existing is None or item.strength > existing.strength:
                 unique_by_level[key] = item
@@ -1982,42 +2963,36 @@ def detect_trend_lines(timestamps: List[int], prices: pd.Series, window: int = 2
     recent_timestamps = timestamps[-window:]
     
     # 선형 회귀로 추세 계산
-    x = np.arange(len(recent_prices))
-    y = recent_prices.values
-    coeffs = np.polyfit(x, y, 1)
-    slope = coeffs[0]
+    fit = last_linregress(recent_prices.to_numpy(dtype=np.float64), window)
     
     start_price = float(recent_prices.iloc[0])
     end_price = float(recent_prices.iloc[-1])
     
-    if slope > 0:
-        trend_type = "uptrend"
-    elif slope < 0:
-        trend_type = "downtrend"
-    else:
-        trend_type = "sideways"
-    
     trend_lines.append(TrendLine(
         start_price=start_price,
         end_price=end_price,
         start_time=recent_timestamps[0],
         end_time=recent_timestamps[-1],
-        type=trend_type
+        type=trend_types(fit.slope)[0]
     ))
     
     return trend_lines
 
 
+# 패턴 탐지 구간(봉)
+PATTERN_WINDOW = 20
+
+
 def detect_patterns(highs: pd.Series, lows: pd.Series, closes: pd.Series) -> List[Pattern]:
     """차트 패턴 탐지"""
     patterns = []
     
-    if len(closes) < 20:
+    if len(closes) < PATTERN_WINDOW:
         return patterns
     
-    recent_closes = closes.iloc[-20:]
-    recent_highs = highs.iloc[-20:]
-    recent_lows = lows.iloc[-20:]
+    recent_closes = closes.iloc[-PATTERN_WINDOW:]
+    recent_highs = highs.iloc[-PATTERN_WINDOW:]
+    recent_lows = lows.iloc[-PATTERN_WINDOW:]
     
     # 헤드앤숄더 패턴 (간단한 버전)
     if len(recent_highs) >= 5:
@@ -2037,18 +3012,18 @@ def detect_patterns(highs: pd.Series, lows: pd.Series, closes: pd.Series) -> Lis
                     signal="bearish"
                 ))
     
+    # 고점/저점 추세선 (최근 20봉 선형 회귀)
+    high_fit = last_linregress(recent_highs.to_numpy(dtype=np.float64), PATTERN_WINDOW)
+    low_fit = last_linregress(recent_lows.to_numpy(dtype=np.float64), PATTERN_WINDOW)
+    
     # 삼각형 패턴
-    if len(recent_highs) >= 10:
-        high_trend = np.polyfit(range(len(recent_highs)), recent_highs.values, 1)[0]
-        low_trend = np.polyfit(range(len(recent_lows)), recent_lows.values, 1)[0]
-        
-        if high_trend < 0 and low_trend > 0:
-            patterns.append(Pattern(
-                name="수렴 삼각형",
-                confidence=0.5,
-                description="가격이 수렴하고 있으며 곧 방향성이 결정될 수 있습니다.",
-                signal="neutral"
-            ))
+    if high_fit.slope[0] < 0 and low_fit.slope[0] > 0:
+        patterns.append(Pattern(
+            name="수렴 삼각형",
+            confidence=0.5,
+            description="가격이 수렴하고 있으며 곧 방향성이 결정될 수 있습니다.",
+            signal="neutral"
+        ))
     
     return patterns
 
@@ -2128,241 +3103,799 @@ def generate_trading_signal(
     )
 
 
+
+def _level_states(values: np.ndarray, level_type: str) -> Tuple[np.ndarray, np.ndarray]:
+    """봉마다 detect_support_resistance가 반환할 상위 5개 레벨을 상태 테이블로 계산
+
+    피벗 i는 i + pivot_window 봉부터 보이며, 강도 계산 구간(i-50 ~ i+9)이 그 시점 데이터 안에
+    있으므로 강도는 이후에도 변하지 않는다. 따라서 레벨 목록은 새 피벗이 나타날 때만 바뀐다.
+    반환값: (봉별 상태 인덱스, 상태별 레벨 테이블 (상태 x 5, 빈 칸은 NaN))
+    """
+    pivot_window = max(20 // 2, 5)  # detect_support_resistance 기본 window와 동일
+    pivots, levels, strengths = _pivot_points(values, pivot_window, level_type)
+
+    unique_by_level: Dict[float, Tuple[float, float]] = {}
+    tables = [np.full(5, np.nan)]
+    changed_at = []
+    for pivot, level, strength in zip(pivots, levels, strengths):
+        if strength < 0.2:
+            continue
+        strength = min(float(strength), 1.0)
+        key = _level_bucket(float(level))
+        existing = unique_by_level.get(key)
+        if existing is not None and strength <= existing[1]:
+            continue
+        unique_by_level[key] = (float(level), strength)
+        top = sorted(unique_by_level.values(), key=lambda item: item[1], reverse=True)[:5]
+        row = np.full(5, np.nan)
+        row[:len(top)] = [item[0] for item in top]
+        tables.append(row)
+        changed_at.append(pivot + pivot_window)
+
+    states = np.searchsorted(np.asarray(changed_at, dtype=np.int64), np.arange(len(values)), side="right")
+    return states, np.array(tables)
+
+
+def _head_and_shoulders_series(highs: np.ndarray) -> np.ndarray:
+    """봉마다 detect_patterns(최근 20봉)가 헤드앤숄더를 감지하는지 여부"""
+    n = len(highs)
+    detected = np.zeros(n, dtype=bool)
+    if n < 20:
+        return detected
+    with np.errstate(invalid="ignore"):
+        is_peak = np.zeros(n, dtype=bool)
+        is_peak[1:-1] = (highs[1:-1] > highs[:-2]) & (highs[1:-1] > highs[2:])
+    peak_values = np.where(is_peak, highs, np.nan)
+    # 최근 20봉 중 봉우리 후보는 3번째 ~ 끝에서 3번째 (t-17 ~ t-2), 16칸
+    windows = np.lib.stride_tricks.sliding_window_view(peak_values, 16)[2 : n - 17]
+    counts = np.count_nonzero(~np.isnan(windows), axis=1)
+    tops = np.fmax.reduce(windows, axis=1)
+    # 가장 높은 봉우리가 2, 3번째보다 높음 = 최고점이 하나뿐
+    unique_top = np.count_nonzero(windows == tops[:, None], axis=1) == 1
+    detected[19:] = (counts >= 3) & unique_top
+    return detected
+
+
+def generate_trading_signal_series(
+    closes: pd.Series,
+    highs: pd.Series,
+    lows: pd.Series,
+    rsi: Optional[pd.Series] = None,
+    macd: Optional[Dict[str, pd.Series]] = None,
+    include_patterns: bool = True,
+) -> pd.DataFrame:
+    """모든 봉의 매매 신호를 한 번에 계산 (벡터화)
+
+    각 행은 그 봉까지의 데이터로 generate_trading_signal을 호출한 결과와 같습니다
+    (지지/저항선은 detect_support_resistance, 패턴은 include_patterns일 때 detect_patterns 기준).
+    반환 컬럼: type, confidence, entry_price, target_price, stop_loss, reason (보유 봉의 가격은 NaN)
+    """
+    price = closes.to_numpy(dtype=np.float64)
+    n = len(price)
+    rsi_values = (rsi if rsi is not None else calculate_rsi(closes)).to_numpy(dtype=np.float64)
+    macd = macd if macd is not None else calculate_macd(closes)
+    macd_line = macd["macd"].to_numpy(dtype=np.float64)
+    signal_line = macd["signal"].to_numpy(dtype=np.float64)
+    histogram = macd["histogram"].to_numpy(dtype=np.float64)
+
+    support_states, support_table = _level_states(lows.to_numpy(dtype=np.float64), "support")
+    resistance_states, resistance_table = _level_states(highs.to_numpy(dtype=np.float64), "resistance")
+    support_levels = support_table[support_states]
+    resistance_levels = resistance_table[resistance_states]
+    has_supports = ~np.isnan(support_levels[:, 0])
+    has_resistances = ~np.isnan(resistance_levels[:, 0])
+
+    with np.errstate(invalid="ignore"):
+        rsi_buy = rsi_values < 30
+        rsi_sell = ~rsi_buy & (rsi_values > 70)
+        macd_buy = (macd_line > signal_line) & (histogram > 0)
+        macd_sell = ~macd_buy & (macd_line < signal_line) & (histogram < 0)
+
+        # 현재가 아래에서 가장 가까운 지지선 / 위에서 가장 가까운 저항선
+        nearest_support = np.fmax.reduce(np.where(support_levels < price[:, None], support_levels, np.nan), axis=1)
+        nearest_resistance = np.fmin.reduce(np.where(resistance_levels > price[:, None], resistance_levels, np.nan), axis=1)
+        support_buy = (nearest_support != 0) & (price <= nearest_support * 1.02)
+        resistance_sell = (nearest_resistance != 0) & (price >= nearest_resistance * 0.98)
+    pattern_sell = _head_and_shoulders_series(highs.to_numpy(dtype=np.float64)) if include_patterns else np.zeros(n, dtype=bool)
+
+    # generate_trading_signal과 같은 순서로 더해야 부동소수점 합이 정확히 같다
+    buy_parts = [(rsi_buy, 0.3), (macd_buy, 0.25), (support_buy, 0.2)]
+    sell_parts = [(rsi_sell, 0.3), (macd_sell, 0.25), (resistance_sell, 0.2), (pattern_sell, 0.6 * 0.15)]
+    buy_score = np.zeros(n)
+    for mask, weight in buy_parts:
+        buy_score = buy_score + np.where(mask, weight, 0.0)
+    sell_score = np.zeros(n)
+    for mask, weight in sell_parts:
+        sell_score = sell_score + np.where(mask, weight, 0.0)
+
+    is_buy = (buy_score > sell_score) & (buy_score > 0.3)
+    is_sell = ~is_buy & (sell_score > buy_score) & (sell_score > 0.3)
+    confidence = np.where(is_buy, np.minimum(buy_score, 1.0), np.where(is_sell, np.minimum(sell_score, 1.0), 0.5))
+    target_price = np.where(
+        is_buy,
+        np.where(has_resistances, price * 1.1, price * 1.05),
+        np.where(is_sell, np.where(has_supports, price * 0.9, price * 0.95), np.nan),
+    )
+    stop_loss = np.where(is_buy, price * 0.95, np.where(is_sell, price * 1.05, np.nan))
+
+    # 사유 문자열: 신호 조합(비트마스크)별로 한 번만 만들어 조회
+    buy_reasons = ["RSI가 과매도 구간입니다.", "MACD가 상승 신호를 보입니다.", "지지선 근처에서 매수 기회입니다."]
+    sell_reasons = ["RSI가 과매수 구간입니다.", "MACD가 하락 신호를 보입니다.", "저항선 근처에서 매도 기회입니다.", "하락 반전 패턴이 감지되었습니다."]
+    reason_table = np.array(
+        [" | ".join(r for bit, r in enumerate(buy_reasons) if code >> bit & 1) or "현재 추세 유지" for code in range(8)]
+        + [" | ".join(r for bit, r in enumerate(sell_reasons) if code >> bit & 1) for code in range(16)],
+        dtype=object,
+    )
+    buy_code = sum(mask.astype(np.int64) << bit for bit, (mask, _) in enumerate(buy_parts))
+    sell_code = sum(mask.astype(np.int64) << bit for bit, (mask, _) in enumerate(sell_parts))
+    reason = reason_table[np.where(is_buy, buy_code, np.where(is_sell, 8 + sell_code, 0))]
+
+    return pd.DataFrame(
+        {
+            "type": np.where(is_buy, "buy", np.where(is_sell, "sell", "hold")).astype(object),
+            "confidence": confidence,
+            "entry_price": np.where(is_buy | is_sell, price, np.nan),
+            "target_price": target_price,
+            "stop_loss": stop_loss,
+            "reason": reason,
+        },
+        index=closes.index,
+    )
+
+INDICATOR_ENGINE = IndicatorEngine()
+# (종목, 해상도, 기간) -> (마지막 봉 검증값, 분석 결과, 마지막 확인 시각)
+# 검증값은 마지막 봉의 타임스탬프와 OHLCV: 일봉은 장중 내내 타임스탬프가 같으므로 가격/거래량 변화도 반영
+ANALYSIS_CACHE: "OrderedDict[Tuple[str, str, int], Tuple[Tuple[float, ...], ChartAnalysisResponse, float]]" = OrderedDict()
+ANALYSIS_CACHE_MAX_ENTRIES = 1024
+# 이 시간 안의 반복 호출은 캔들 재조회 없이 캐시에서 바로 응답
+ANALYSIS_RECHECK_SECONDS = 30
+ANALYSIS_CACHE_STATS = {"hits": 0, "misses": 0}
+# 배치 분석 프로세스 풀 크기 (0이면 CPU 코어 수)
+ANALYSIS_POOL_SIZE = int(os.getenv("ANALYSIS_POOL_SIZE", "0")) or os.cpu_count() or 1
+ANALYSIS_POOL: Optional[ProcessPoolExecutor] = None
+BATCH_ANALYSIS_FETCH_CONCURRENCY = 8
+# 신뢰도 백테스트에 사용하는 일봉 기간 (기존 테스트 스크립트와 동일)
+BACKTEST_HISTORY_DAYS = 400
+# 결과는 데이터 해시가 키에 포함되므로 오래 보관해도 안전
+BACKTEST_RESULT_CACHE = JsonDiskCache(os.path.join(STATE_DIR, "backtests"), ttl_seconds=7 * 24 * 3600)
+BACKTEST_JOBS = JobQueue(
+    os.path.join(STATE_DIR, "jobs"),
+    workers=int(os.getenv("BACKTEST_JOB_WORKERS", "2")),
+)
+# 타임프레임별 봉 길이(초)와 pandas 리샘플링 규칙
+TIMEFRAME_SECONDS = {
+    "1": 60, "5": 300, "15": 900, "30": 1800, "60": 3600, "120": 7200, "240": 14400,
+    "D": 86400, "W": 7 * 86400, "M": 30 * 86400,
+}
+TIMEFRAME_RESAMPLE_RULES = {
+    "1": "1min", "5": "5min", "15": "15min", "30": "30min", "60": "60min", "120": "120min", "240": "240min",
+    "D": "1D", "W": "W", "M": "ME",
+}
+# yfinance 분봉 조회 가능 기간(일) 한도
+YF_INTRADAY_MAX_DAYS = {"1": 7, "5": 60, "15": 60, "30": 60, "60": 730}
+
+
+def _latest_indicators(symbol: str, resolution: str, timestamps: List[int], closes: pd.Series) -> IndicatorSnapshot:
+    """마지막 봉 기준 기술적 지표 (스트리밍 엔진 우선, 불가능하면 전체 재계산)
+
+    엔진 상태는 (종목, 해상도)별로 처음 받은 봉에서 시작해 이어지므로, 한 봉씩 밀리는 구간이나
+    기간이 다른 요청도 새 봉만 반영한다. 이동평균/볼린저/RSI는 요청 구간에 calculate_*를 적용한
+    값과 같고, MACD(EMA)는 상태 시작 봉부터의 전체 이력 기준이다. 과거 봉이 수정됐거나 상태보다
+    앞선 구간이 오면 엔진이 처음부터 다시 계산한다.
+    """
+    try:
+        return INDICATOR_ENGINE.update((symbol.upper(), resolution), timestamps, closes.to_numpy())
+    except ValueError as exc:
+        logger.debug(f"지표 스트리밍 계산 불가, 전체 재계산 ({symbol}): {exc}")
+
+    rsi = calculate_rsi(closes)
+    macd = calculate_macd(closes)
+    bb = calculate_bollinger_bands(closes)
+    mas = calculate_moving_averages(closes)
+    return IndicatorSnapshot(
+        timestamp=int(timestamps[-1]),
+        close=float(closes.iloc[-1]),
+        rsi=float(rsi.iloc[-1]),
+        macd=float(macd["macd"].iloc[-1]),
+        macd_signal=float(macd["signal"].iloc[-1]),
+        macd_histogram=float(macd["histogram"].iloc[-1]),
+        bb_upper=float(bb["upper"].iloc[-1]),
+        bb_middle=float(bb["middle"].iloc[-1]),
+        bb_lower=float(bb["lower"].iloc[-1]),
+        moving_averages={int(name[2:]): float(series.iloc[-1]) for name, series in mas.items()},
+    )
+
+
+async def _fetch_analysis_candles(symbol: str, resolution: str, range_days: int) -> CandleResponse:
+    """차트 분석용 캔들 데이터 조회"""
+    is_korean_stock = symbol.isdigit() and len(symbol) == 6
+    
+    if is_korean_stock:
+        candle_response = await _fetch_korean_stock_candles(symbol, resolution, range_days)
+    else:
+        # 미국 주식은 market_candles 엔드포인트와 동일한 로직 사용
+        candle_response = await market_candles(
+            symbol=symbol,
+            resolution=resolution,
+            range_days=range_days
+        )
+    
+    if not candle_response.data.timestamps:
+        raise HTTPException(status_code=404, detail="차트 데이터를 찾을 수 없습니다.")
+    return candle_response
+
+
+def _analyze_candles(symbol: str, candles: CandleResponse, indicators: IndicatorSnapshot) -> ChartAnalysisResponse:
+    """캔들 데이터로 지표 신호, 지지/저항선, 추세선, 패턴, 매매 신호를 계산 (CPU 작업만 수행)"""
+    # DataFrame 생성
+    df = pd.DataFrame({
+        "timestamp": candles.data.timestamps,
+        "open": candles.data.opens,
+        "high": candles.data.highs,
+        "low": candles.data.lows,
+        "close": candles.data.closes,
+        "volume": candles.data.volumes
+    })
+    
+    df["date"] = pd.to_datetime(df["timestamp"], unit="s")
+    df = df.set_index("date")
+    
+    closes = df["close"]
+    highs = df["high"]
+    lows = df["low"]
+    volumes = df["volume"]
+    
+    # 기술적 지표 (호출 측에서 스트리밍 엔진으로 계산한 마지막 봉 기준 값)
+    rsi_current = indicators.rsi if not pd.isna(indicators.rsi) else 50.0
+    macd_current = indicators.macd if not pd.isna(indicators.macd) else 0.0
+    macd = {
+        "macd": pd.Series([indicators.macd]),
+        "signal": pd.Series([indicators.macd_signal]),
+        "histogram": pd.Series([indicators.macd_histogram]),
+    }
+    
+    bb_current = {
+        "upper": indicators.bb_upper if not pd.isna(indicators.bb_upper) else closes.iloc[-1] * 1.1,
+        "middle": indicators.bb_middle if not pd.isna(indicators.bb_middle) else closes.iloc[-1],
+        "lower": indicators.bb_lower if not pd.isna(indicators.bb_lower) else closes.iloc[-1] * 0.9
+    }
+    
+    # 기술적 지표 신호 판단
+    rsi_signal = "oversold" if rsi_current < 30 else "overbought" if rsi_current > 70 else "neutral"
+    rsi_desc = f"RSI: {rsi_current:.2f} - {'과매도' if rsi_signal == 'oversold' else '과매수' if rsi_signal == 'overbought' else '중립'}"
+    
+    macd_signal = "buy" if indicators.macd > indicators.macd_signal else "sell" if indicators.macd < indicators.macd_signal else "neutral"
+    macd_desc = f"MACD: {macd_current:.2f} - {'상승 신호' if macd_signal == 'buy' else '하락 신호' if macd_signal == 'sell' else '중립'}"
+    
+    bb_signal = "overbought" if closes.iloc[-1] > bb_current["upper"] else "oversold" if closes.iloc[-1] < bb_current["lower"] else "neutral"
+    bb_desc = f"볼린저 밴드: 현재가가 {'상단' if bb_signal == 'overbought' else '하단' if bb_signal == 'oversold' else '중간'} 밴드에 위치"
+    
+    technical_indicators = [
+        TechnicalIndicator(name="RSI", value=rsi_current, signal=rsi_signal, description=rsi_desc),
+        TechnicalIndicator(name="MACD", value=macd_current, signal=macd_signal, description=macd_desc),
+        TechnicalIndicator(name="Bollinger Bands", value=closes.iloc[-1], signal=bb_signal, description=bb_desc),
+    ]
+    
+    # 지지/저항선 탐지
+    supports, resistances = detect_support_resistance(highs, lows, closes)
+    all_sr = supports + resistances
+    
+    # 추세선 탐지
+    trend_lines = detect_trend_lines(candles.data.timestamps, closes)
+    
+    # 패턴 탐지
+    patterns = detect_patterns(highs, lows, closes)
+    
+    # 매매 신호 생성
+    trading_signal = generate_trading_signal(rsi_current, macd, closes, supports, resistances, patterns)
+    
+    # 리스크 분석
+    volatility = float(closes.pct_change().std() * np.sqrt(252))  # 연간 변동성
+    risk_level = "high" if volatility > 0.3 else "medium" if volatility > 0.2 else "low"
+    
+    risk_analysis = {
+        "volatility": round(volatility * 100, 2),
+        "risk_level": risk_level,
+        "current_price": float(closes.iloc[-1]),
+        "price_range_52w": {
+            "high": float(highs.max()),
+            "low": float(lows.min())
+        }
+    }
+    
+    # 요약 생성
+    summary_parts = []
+    summary_parts.append(f"현재가: {closes.iloc[-1]:.2f}")
+    summary_parts.append(f"RSI: {rsi_current:.1f} ({rsi_signal})")
+    summary_parts.append(f"추세: {trend_lines[0].type if trend_lines else '불명확'}")
+    summary_parts.append(f"매매 신호: {trading_signal.type.upper()} (신뢰도: {trading_signal.confidence*100:.0f}%)")
+    if patterns:
+        summary_parts.append(f"패턴: {', '.join([p.name for p in patterns])}")
+    
+    summary = " | ".join(summary_parts)
+    
+    return ChartAnalysisResponse(
+        symbol=symbol,
+        technical_indicators=technical_indicators,
+        support_resistance=all_sr,
+        trend_lines=trend_lines,
+        patterns=patterns,
+        trading_signal=trading_signal,
+        risk_analysis=risk_analysis,
+        summary=summary
+    )
+
+
+async def _analyze_symbol(
+    symbol: str,
+    resolution: str,
+    range_days: int,
+    executor: Optional[ProcessPoolExecutor] = None,
+    fetch_semaphore: Optional[asyncio.Semaphore] = None,
+) -> ChartAnalysisResponse:
+    """캐시를 확인하고, 새 봉이 생기거나 마지막 봉이 바뀐 경우에만 분석을 다시 수행 (executor가 있으면 CPU 작업을 위임)
+
+    fetch_semaphore는 캔들 조회만 제한하며, 분석 작업은 제한 없이 executor에 넘긴다.
+    """
+    cache_key = (symbol.upper(), resolution, range_days)
+    entry = ANALYSIS_CACHE.get(cache_key)
+    if entry and time.time() - entry[2] < ANALYSIS_RECHECK_SECONDS:
+        ANALYSIS_CACHE.move_to_end(cache_key)
+        ANALYSIS_CACHE_STATS["hits"] += 1
+        return entry[1]
+
+    if fetch_semaphore is None:
+        candle_response = await _fetch_analysis_candles(symbol, resolution, range_days)
+    else:
+        async with fetch_semaphore:
+            candle_response = await _fetch_analysis_candles(symbol, resolution, range_days)
+    validator = _analysis_validator(candle_response)
+    
+    entry = ANALYSIS_CACHE.get(cache_key)
+    if entry and entry[0] == validator:
+        _store_analysis(cache_key, validator, entry[1])
+        ANALYSIS_CACHE_STATS["hits"] += 1
+        return entry[1]
+    
+    ANALYSIS_CACHE_STATS["misses"] += 1
+    # 지표 엔진 상태는 이 프로세스에 있으므로 스냅샷은 여기서(이벤트 루프 밖 스레드) 계산해 넘긴다
+    closes = pd.Series(candle_response.data.closes)
+    indicators = await asyncio.to_thread(_latest_indicators, symbol, resolution, candle_response.data.timestamps, closes)
+    if executor is None:
+        result = _analyze_candles(symbol, candle_response, indicators)
+    else:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(executor, _analyze_candles, symbol, candle_response, indicators)
+    _store_analysis(cache_key, validator, result)
+    return result
+
+
 @app.post("/api/chart/analyze", response_model=ChartAnalysisResponse)
 async def analyze_chart_data(payload: ChartAnalysisRequest) -> ChartAnalysisResponse:
-    """차트 데이터를 분석하여 기술적 지표, 패턴, 신호 등을 제공"""
+    """차트 데이터를 분석하여 기술적 지표, 패턴, 신호 등을 제공
+    
+    결과는 마지막 봉의 타임스탬프/OHLCV와 함께 캐시되며, 새 봉이 생기거나 형성 중인 봉이 바뀔 때만 다시 계산합니다.
+    """
     try:
-        # 캔들 데이터 가져오기
-        is_korean_stock = payload.symbol.isdigit() and len(payload.symbol) == 6
-        
-        if is_korean_stock:
-            candle_response = await _fetch_korean_stock_candles(payload.symbol, payload.resolution, payload.range_days)
-        else:
-            # 미국 주식은 market_candles 엔드포인트와 동일한 로직 사용
-            candle_response = await market_candles(
-                symbol=payload.symbol,
-                resolution=payload.resolution,
-                range_days=payload.range_days
-            )
-        
-        if not candle_response.data.timestamps:
-            raise HTTPException(status_code=404, detail="차트 데이터를 찾을 수 없습니다.")
-        
-        # DataFrame 생성
-        df = pd.DataFrame({
-            "timestamp": candle_response.data.timestamps,
-            "open": candle_response.data.opens,
-            "high": candle_response.data.highs,
-            "low": candle_response.data.lows,
-            "close": candle_response.data.closes,
-            "volume": candle_response.data.volumes
-        })
-        
-        df["date"] = pd.to_datetime(df["timestamp"], unit="s")
-        df = df.set_index("date")
-        
-        closes = df["close"]
-        highs = df["high"]
-        lows = df["low"]
-        volumes = df["volume"]
-        
-        # 기술적 지표 계산
-        rsi = calculate_rsi(closes)
-        rsi_current = float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50.0
-        
-        macd = calculate_macd(closes)
-        macd_current = float(macd["macd"].iloc[-1]) if not pd.isna(macd["macd"].iloc[-1]) else 0.0
-        
-        bb = calculate_bollinger_bands(closes)
-        bb_current = {
-            "upper": float(bb["upper"].iloc[-1]) if not pd.isna(bb["upper"].iloc[-1]) else closes.iloc[-1] * 1.1,
-            "middle": float(bb["middle"].iloc[-1]) if not pd.isna(bb["middle"].iloc[-1]) else closes.iloc[-1],
-            "lower": float(bb["lower"].iloc[-1]) if not pd.isna(bb["lower"].iloc[-1]) else closes.iloc[-1] * 0.9
-        }
-        
-        mas = calculate_moving_averages(closes)
-        
-        # 기술적 지표 신호 판단
-        rsi_signal = "oversold" if rsi_current < 30 else "overbought" if rsi_current > 70 else "neutral"
-        rsi_desc = f"RSI: {rsi_current:.2f} - {'과매도' if rsi_signal == 'oversold' else '과매수' if rsi_signal == 'overbought' else '중립'}"
-        
-        macd_signal = "buy" if macd["macd"].iloc[-1] > macd["signal"].iloc[-1] else "sell" if macd["macd"].iloc[-1] < macd["signal"].iloc[-1] else "neutral"
-        macd_desc = f"MACD: {macd_current:.2f} - {'상승 신호' if macd_signal == 'buy' else '하락 신호' if macd_signal == 'sell' else '중립'}"
-        
-        bb_signal = "overbought" if closes.iloc[-1] > bb_current["upper"] else "oversold" if closes.iloc[-1] < bb_current["lower"] else "neutral"
-        bb_desc = f"볼린저 밴드: 현재가가 {'상단' if bb_signal == 'overbought' else '하단' if bb_signal == 'oversold' else '중간'} 밴드에 위치"
-        
-        technical_indicators = [
-            TechnicalIndicator(name="RSI", value=rsi_current, signal=rsi_signal, description=rsi_desc),
-            TechnicalIndicator(name="MACD", value=macd_current, signal=macd_signal, description=macd_desc),
-            TechnicalIndicator(name="Bollinger Bands", value=closes.iloc[-1], signal=bb_signal, description=bb_desc),
-        ]
-        
-        # 지지/저항선 탐지
-        supports, resistances = detect_support_resistance(highs, lows, closes)
-        all_sr = supports + resistances
-        
-        # 추세선 탐지
-        trend_lines = detect_trend_lines(candle_response.data.timestamps, closes)
-        
-        # 패턴 탐지
-        patterns = detect_patterns(highs, lows, closes)
-        
-        # 매매 신호 생성
-        trading_signal = generate_trading_signal(rsi_current, macd, closes, supports, resistances, patterns)
-        
-        # 리스크 분석
-        volatility = float(closes.pct_change().std() * np.sqrt(252))  # 연간 변동성
-        risk_level = "high" if volatility > 0.3 else "medium" if volatility > 0.2 else "low"
-        
-        risk_analysis = {
-            "volatility": round(volatility * 100, 2),
-            "risk_level": risk_level,
-            "current_price": float(closes.iloc[-1]),
-            "price_range_52w": {
-                "high": float(highs.max()),
-                "low": float(lows.min())
-            }
-        }
-        
-        # 요약 생성
-        summary_parts = []
-        summary_parts.append(f"현재가: {closes.iloc[-1]:.2f}")
-        summary_parts.append(f"RSI: {rsi_current:.1f} ({rsi_signal})")
-        summary_parts.append(f"추세: {trend_lines[0].type if trend_lines else '불명확'}")
-        summary_parts.append(f"매매 신호: {trading_signal.type.upper()} (신뢰도: {trading_signal.confidence*100:.0f}%)")
-        if patterns:
-            summary_parts.append(f"패턴: {', '.join([p.name for p in patterns])}")
-        
-        summary = " | ".join(summary_parts)
-        
-        return ChartAnalysisResponse(
-            symbol=payload.symbol,
-            technical_indicators=technical_indicators,
-            support_resistance=all_sr,
-            trend_lines=trend_lines,
-            patterns=patterns,
-            trading_signal=trading_signal,
-            risk_analysis=risk_analysis,
-            summary=summary
-        )
-        
+        return await _analyze_symbol(payload.symbol, payload.resolution, payload.range_days)
     except Exception as e:
         logger.error(f"차트 분석 실패: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"차트 분석 실패: {str(e)}")
 
 
+@app.post("/api/chart/signals", response_model=TradingSignalSeriesResponse)
+async def get_trading_signal_series(payload: ChartAnalysisRequest) -> TradingSignalSeriesResponse:
+    """조회 기간 전체의 봉별 매매 신호 (차트 신호 오버레이용)"""
+    candle_response = await _fetch_analysis_candles(payload.symbol, payload.resolution, payload.range_days)
+    data = candle_response.data
+    frame = await asyncio.to_thread(
+        generate_trading_signal_series,
+        pd.Series(data.closes), pd.Series(data.highs), pd.Series(data.lows),
+    )
+    counts = frame["type"].value_counts()
+    points = frame[frame["type"] != "hold"]
+    signals = [
+        TradingSignalPoint(
+            time=int(data.timestamps[i]),
+            type=row.type,
+            confidence=float(row.confidence),
+            entry_price=float(row.entry_price),
+            target_price=float(row.target_price),
+            stop_loss=float(row.stop_loss),
+            reason=row.reason,
+        )
+        for i, row in zip(points.index, points.itertuples(index=False))
+    ]
+    return TradingSignalSeriesResponse(
+        symbol=payload.symbol,
+        resolution=payload.resolution,
+        signals=signals,
+        buy_count=int(counts.get("buy", 0)),
+        sell_count=int(counts.get("sell", 0)),
+        hold_count=int(counts.get("hold", 0)),
+    )
+
+
+def _analysis_pool() -> ProcessPoolExecutor:
+    """배치 분석용 프로세스 풀 (첫 사용 시 생성)"""
+    global ANALYSIS_POOL
+    if ANALYSIS_POOL is None:
+        # 이벤트 루프와 스레드가 이미 떠 있는 프로세스를 fork하지 않도록 spawn 사용
+        ANALYSIS_POOL = ProcessPoolExecutor(
+            max_workers=ANALYSIS_POOL_SIZE,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return ANALYSIS_POOL
+
+
+@app.post("/api/chart/analyze/batch")
+async def analyze_chart_batch(payload: BatchChartAnalysisRequest) -> StreamingResponse:
+    """여러 종목을 한 번에 분석하여 끝나는 순서대로 NDJSON 한 줄씩 스트리밍
+    
+    캔들은 BATCH_ANALYSIS_FETCH_CONCURRENCY개까지 동시에 조회하고, 지지·저항/패턴 계산은
+    조회가 끝나는 대로 프로세스 풀에 넘겨 코어 수만큼 병렬로 수행합니다.
+    각 줄은 {"symbol", "result"} 또는 {"symbol", "error"} 형태입니다.
+    """
+    symbols = list(dict.fromkeys(symbol.strip() for symbol in payload.symbols if symbol.strip()))
+    if not symbols:
+        raise HTTPException(status_code=400, detail="분석할 종목이 없습니다.")
+
+    executor = _analysis_pool()
+    semaphore = asyncio.Semaphore(BATCH_ANALYSIS_FETCH_CONCURRENCY)
+
+    async def analyze_one(symbol: str) -> str:
+        try:
+            result = await _analyze_symbol(symbol, payload.resolution, payload.range_days, executor, semaphore)
+            return json.dumps({"symbol": symbol, "result": result.model_dump()}, ensure_ascii=False)
+        except Exception as exc:  # noqa: BLE001
+            detail = exc.detail if isinstance(exc, HTTPException) else str(exc)
+            logger.warning(f"배치 차트 분석 실패 ({symbol}): {detail}")
+            return json.dumps({"symbol": symbol, "error": detail}, ensure_ascii=False)
+
+    async def stream():
+        tasks = [asyncio.create_task(analyze_one(symbol)) for symbol in symbols]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished + "\n"
+        finally:
+            # 클라이언트가 연결을 끊으면 남은 작업은 취소
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+def _resample_candles(candles: CandleResponse, resolution: str) -> CandleResponse:
+    """기준 캔들을 더 긴 타임프레임으로 리샘플링"""
+    df = pd.DataFrame(
+        {
+            "Open": candles.data.opens,
+            "High": candles.data.highs,
+            "Low": candles.data.lows,
+            "Close": candles.data.closes,
+            "Volume": candles.data.volumes,
+        },
+        index=pd.to_datetime(candles.data.timestamps, unit="s"),
+    )
+    df = df.resample(TIMEFRAME_RESAMPLE_RULES[resolution]).agg({
+        "Open": "first",
+        "High": "max",
+        "Low": "min",
+        "Close": "last",
+        "Volume": "sum",
+    }).dropna()
+    return CandleResponse(
+        symbol=candles.symbol,
+        resolution=resolution,
+        data=CandleSeries(
+            timestamps=(df.index.asi8 // 10**9).tolist(),
+            opens=df["Open"].tolist(),
+            highs=df["High"].tolist(),
+            lows=df["Low"].tolist(),
+            closes=df["Close"].tolist(),
+            volumes=df["Volume"].tolist(),
+        ),
+    )
+
+
+async def _fetch_base_candles(symbol: str, resolution: str, range_days: int) -> CandleResponse:
+    """멀티 타임프레임 분석용 기준 캔들 1회 조회 (분봉은 range_days를 yfinance 한도 내에서 반영)"""
+    if symbol.isdigit() and len(symbol) == 6:
+        # 한국 주식은 일봉만 제공
+        candles = await _fetch_korean_stock_candles(symbol, "D", range_days)
+    elif resolution in YF_INTRADAY_MAX_DAYS:
+        period = f"{min(range_days, YF_INTRADAY_MAX_DAYS[resolution])}d"
+        candles = await asyncio.to_thread(_load_us_stock_candles, symbol, resolution, range_days, period)
+    else:
+        candles = await asyncio.to_thread(_load_us_stock_candles, symbol, "D", range_days, _period_from_days(range_days))
+    if not candles.data.timestamps:
+        raise HTTPException(status_code=404, detail="차트 데이터를 찾을 수 없습니다.")
+    return candles
+
+
+def _timeframe_confluence(timeframes: List[TimeframeAnalysis]) -> TimeframeConfluence:
+    """타임프레임별 매매 신호를 모아 방향 일치도를 계산"""
+    analyses = [(item.resolution, item.analysis) for item in timeframes if item.analysis is not None]
+    votes = {"buy": 0, "sell": 0, "hold": 0}
+    for _, analysis in analyses:
+        votes[analysis.trading_signal.type] += 1
+
+    if votes["buy"] > votes["sell"] and votes["buy"] >= votes["hold"]:
+        signal = "buy"
+    elif votes["sell"] > votes["buy"] and votes["sell"] >= votes["hold"]:
+        signal = "sell"
+    else:
+        signal = "hold"
+    agreement = votes[signal] / len(analyses) if analyses else 0.0
+
+    signal_label = {"buy": "매수", "sell": "매도", "hold": "관망"}[signal]
+    parts = [f"{resolution}: {analysis.trading_signal.type.upper()}" for resolution, analysis in analyses]
+    summary = f"종합: {signal_label} ({votes[signal]}/{len(analyses)} 타임프레임 일치)"
+    if parts:
+        summary += " | " + ", ".join(parts)
+
+    return TimeframeConfluence(
+        signal=signal,
+        bullish=votes["buy"],
+        bearish=votes["sell"],
+        neutral=votes["hold"],
+        agreement=round(agreement, 4),
+        summary=summary,
+    )
+
+
+@app.post("/api/chart/analyze/multi", response_model=MultiTimeframeAnalysisResponse)
+async def analyze_chart_multi_timeframe(payload: MultiTimeframeAnalysisRequest) -> MultiTimeframeAnalysisResponse:
+    """여러 타임프레임을 한 번에 분석
+    
+    가장 짧은 타임프레임의 캔들만 한 번 조회한 뒤 서버에서 각 타임프레임으로 리샘플링하여
+    타임프레임별 분석과 종합(컨플루언스) 신호를 함께 반환합니다. 분봉 조회 한도가 요청 기간보다
+    짧으면 일/주/월봉은 일봉을 따로 받아 리샘플링하고, 타임프레임별 range_days에 실제 기간을 담습니다.
+    """
+    resolutions = list(dict.fromkeys(payload.resolutions))
+    unknown = [resolution for resolution in resolutions if resolution not in TIMEFRAME_SECONDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 해상도: {', '.join(unknown)}")
+
+    finest = min(resolutions, key=TIMEFRAME_SECONDS.__getitem__)
+    if finest in ("120", "240"):
+        # yfinance는 2시간/4시간봉을 제공하지 않으므로 60분봉에서 리샘플링
+        base_resolution = "60"
+    elif finest in YF_INTRADAY_MAX_DAYS:
+        base_resolution = finest
+    else:
+        base_resolution = "D"
+
+    # 분봉 기준 데이터는 yfinance 한도(YF_INTRADAY_MAX_DAYS)만큼만 받을 수 있으므로, 한도가 요청 기간보다
+    # 짧으면 일봉 이상 타임프레임은 요청 기간 전체의 일봉 기준 데이터를 따로 받아 리샘플링
+    is_korean = payload.symbol.isdigit() and len(payload.symbol) == 6
+    intraday_days = min(payload.range_days, YF_INTRADAY_MAX_DAYS.get(base_resolution, payload.range_days))
+    needs_daily_base = (
+        not is_korean
+        and intraday_days < payload.range_days
+        and any(TIMEFRAME_SECONDS[resolution] >= TIMEFRAME_SECONDS["D"] for resolution in resolutions)
+    )
+
+    try:
+        fetches = [_fetch_base_candles(payload.symbol, base_resolution, payload.range_days)]
+        if needs_daily_base:
+            fetches.append(_fetch_base_candles(payload.symbol, "D", payload.range_days))
+        results = await asyncio.gather(*fetches, return_exceptions=True)
+        if isinstance(results[0], BaseException):
+            raise results[0]
+        base = results[0]
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"멀티 타임프레임 기준 데이터 조회 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"차트 데이터를 가져올 수 없습니다: {str(e)}")
+
+    # 실제로 받은 데이터의 봉 간격 (한국 주식은 분봉 요청에도 일봉이 옴)
+    base_spacing = float(np.median(np.diff(base.data.timestamps))) if len(base.data.timestamps) > 1 else 0.0
+    if base_spacing >= TIMEFRAME_SECONDS["D"] * 0.5:
+        base_resolution = "D"
+        intraday_days = payload.range_days
+
+    # 해상도 -> (리샘플링할 기준 캔들, 기준 해상도, 기준 데이터가 덮는 기간(일))
+    daily_base = (base, base_resolution, intraday_days)
+    if needs_daily_base and base_resolution != "D":
+        if isinstance(results[1], BaseException):
+            # 일봉을 못 받으면 분봉 기준 데이터로 계산하고 줄어든 기간을 그대로 알림
+            logger.warning(f"{payload.symbol} 일봉 기준 데이터 조회 실패, 분봉 {intraday_days}일로 계산: {results[1]}")
+        else:
+            daily_base = (results[1], "D", payload.range_days)
+
+    timeframes: List[TimeframeAnalysis] = []
+    for resolution in sorted(resolutions, key=TIMEFRAME_SECONDS.__getitem__):
+        if TIMEFRAME_SECONDS[resolution] < TIMEFRAME_SECONDS[base_resolution]:
+            timeframes.append(TimeframeAnalysis(resolution=resolution, error="기준 데이터보다 짧은 타임프레임은 지원하지 않습니다."))
+            continue
+        if TIMEFRAME_SECONDS[resolution] >= TIMEFRAME_SECONDS["D"]:
+            source, source_resolution, covered_days = daily_base
+        else:
+            source, source_resolution, covered_days = base, base_resolution, intraday_days
+        try:
+            candles = source if resolution == source_resolution else _resample_candles(source, resolution)
+            if not candles.data.timestamps:
+                raise ValueError("리샘플링 결과가 비어 있습니다.")
+            closes = pd.Series(candles.data.closes)
+            # 단일 분석과 히스토리 길이가 다르므로 지표 엔진 상태는 기준 해상도별로 분리
+            indicators = _latest_indicators(payload.symbol, f"{resolution}@{source_resolution}", candles.data.timestamps, closes)
+            analysis = _analyze_candles(payload.symbol, candles, indicators)
+            timeframes.append(TimeframeAnalysis(resolution=resolution, analysis=analysis, range_days=covered_days))
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"{payload.symbol} {resolution} 타임프레임 분석 실패: {exc}")
+            timeframes.append(TimeframeAnalysis(resolution=resolution, error=str(exc), range_days=covered_days))
+
+    return MultiTimeframeAnalysisResponse(
+        symbol=payload.symbol,
+        base_resolution=base_resolution,
+        timeframes=timeframes,
+        confluence=_timeframe_confluence(timeframes),
+    )
+
+
+def _analysis_validator(candles: CandleResponse) -> Tuple[float, ...]:
+    """마지막 봉의 (타임스탬프, 시가, 고가, 저가, 종가, 거래량)"""
+    data = candles.data
+    return (
+        data.timestamps[-1], data.opens[-1], data.highs[-1], data.lows[-1], data.closes[-1], data.volumes[-1],
+    )
+
+
+def _store_analysis(cache_key: Tuple[str, str, int], validator: Tuple[float, ...], result: ChartAnalysisResponse) -> None:
+    ANALYSIS_CACHE[cache_key] = (validator, result, time.time())
+    ANALYSIS_CACHE.move_to_end(cache_key)
+    while len(ANALYSIS_CACHE) > ANALYSIS_CACHE_MAX_ENTRIES:
+        ANALYSIS_CACHE.popitem(last=False)
+
+
+@app.get("/api/chart/analyze/cache-stats")
+async def analysis_cache_stats() -> Dict[str, float]:
+    """차트 분석 캐시 적중률"""
+    hits = ANALYSIS_CACHE_STATS["hits"]
+    misses = ANALYSIS_CACHE_STATS["misses"]
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 4) if total else 0.0,
+        "entries": len(ANALYSIS_CACHE),
+    }
+
+
+def _candles_to_frame(candles: CandleResponse) -> pd.DataFrame:
+    """캔들 응답을 백테스트용 DataFrame(날짜 인덱스, 소문자 OHLCV 컬럼)으로 변환"""
+    df = pd.DataFrame({
+        "timestamp": candles.data.timestamps,
+        "open": candles.data.opens,
+        "high": candles.data.highs,
+        "low": candles.data.lows,
+        "close": candles.data.closes,
+        "volume": candles.data.volumes,
+    })
+    df.index = pd.to_datetime(df["timestamp"], unit="s")
+    df.index.name = "date"
+    return df.sort_index()
+
+
+def _run_technical_backtest(symbol: str, df: pd.DataFrame) -> Dict[str, Dict]:
+    """지지/저항선, 추세선, 이동평균선 신뢰도 테스트 (프로세스 풀에서 실행)"""
+    # 스크립트와 같이 한국 주식은 400일, 해외 주식은 1년치 사용
+    frame = df if symbol.isdigit() and len(symbol) == 6 else tail_days(df, 365)
+    closes = frame["close"]
+    return {
+        "support_resistance": support_resistance_accuracy(frame, detect_support_resistance),
+        "trend": trend_line_accuracy(frame),
+        "moving_average": moving_average_accuracy(
+            frame, calculate_moving_averages(closes), calculate_rsi(closes, period=14), calculate_macd(closes)
+        ),
+    }
+
+
+def _run_additional_backtest(symbol: str, df: pd.DataFrame) -> Dict[str, Dict]:
+    """RSI, MACD, 볼린저 밴드 신뢰도 테스트와 리스크 분석 (프로세스 풀에서 실행)"""
+    closes = df["close"]
+    return {
+        "rsi": rsi_accuracy(df, calculate_rsi(closes, period=14)),
+        "macd": macd_accuracy(df, calculate_macd(closes)),
+        "bollinger": bollinger_accuracy(df, calculate_bollinger_bands(closes)),
+        "risk": risk_metrics(tail_days(df, 365)),
+    }
+
+
+# 백테스트 종류 -> (실행 함수, 테스트 항목)
+BACKTEST_KINDS: Dict[str, Tuple[Callable[[str, pd.DataFrame], Dict[str, Dict]], List[str]]] = {
+    "technical": (_run_technical_backtest, ["support_resistance", "trend", "moving_average"]),
+    "additional": (_run_additional_backtest, ["rsi", "macd", "bollinger", "risk"]),
+}
+
+
+def _backtest_report(kind: str, results: Dict[str, Dict[str, Dict]]) -> str:
+    if kind == "technical":
+        return technical_report(results)
+    return "\n".join(additional_report(name, result) for name, result in results.items())
+
+
+def _frame_digest(df: pd.DataFrame) -> str:
+    columns = df[["timestamp", "open", "high", "low", "close", "volume"]].to_numpy(dtype=np.float64)
+    return hashlib.sha1(np.ascontiguousarray(columns).tobytes()).hexdigest()
+
+
+async def _run_backtests(
+    symbols: List[str],
+    kind: str,
+    on_progress: Optional[Callable[[float, str], None]] = None,
+) -> Dict[str, Dict[str, Dict]]:
+    """종목별 캔들을 동시에 조회하고 백테스트를 프로세스 풀에서 병렬 실행
+    
+    결과는 (종류, 종목, 데이터 해시) 기준으로 디스크에 저장되어, 같은 데이터로 다시 요청하면 바로 반환됩니다.
+    """
+    runner, test_names = BACKTEST_KINDS[kind]
+    loop = asyncio.get_running_loop()
+    completed = 0
+
+    async def run_one(symbol: str) -> Dict[str, Dict]:
+        nonlocal completed
+        try:
+            candles = await _fetch_analysis_candles(symbol, "D", BACKTEST_HISTORY_DAYS)
+        except Exception as exc:  # noqa: BLE001
+            detail = exc.detail if isinstance(exc, HTTPException) else str(exc)
+            result = {name: {"error": f"데이터 가져오기 실패: {detail}"} for name in test_names}
+        else:
+            frame = tail_days(_candles_to_frame(candles), BACKTEST_HISTORY_DAYS)
+            cache_key = f"{kind}:{symbol.upper()}:{_frame_digest(frame)}"
+            result = await asyncio.to_thread(BACKTEST_RESULT_CACHE.get, cache_key)
+            if result is None:
+                raw = await loop.run_in_executor(_analysis_pool(), runner, symbol, frame)
+                # 캐시에서 읽은 결과와 같은 형태가 되도록 JSON으로 정규화 (날짜는 문자열)
+                result = json.loads(json.dumps(raw, ensure_ascii=False, default=str))
+                await asyncio.to_thread(BACKTEST_RESULT_CACHE.set, cache_key, result)
+        completed += 1
+        if on_progress:
+            on_progress(completed / len(symbols), f"{symbol} 완료 ({completed}/{len(symbols)})")
+        return result
+
+    results = await asyncio.gather(*(run_one(symbol) for symbol in symbols))
+    return dict(zip(symbols, results))
+
+
+def _parse_backtest_symbols(symbol: str) -> List[str]:
+    return list(dict.fromkeys(part.strip() for part in symbol.split(",") if part.strip()))
+
+
 @app.get("/api/technical-indicators/test-additional")
-async def test_additional_indicators(symbol: str = Query(..., description="종목 심볼")):
+async def test_additional_indicators(symbol: str = Query(..., description="종목 심볼 (쉼표로 여러 종목 지정 가능)")):
     """
     추가 기술적 지표 신뢰도 테스트 실행 (RSI, MACD, 볼린저 밴드, 리스크)
     """
     try:
-        script_path = os.path.join(os.path.dirname(__file__), "tests", "test_additional_indicators.py")
-        # 스크립트 실행 시 backend 디렉토리를 작업 디렉토리로 설정
-        backend_dir = os.path.dirname(__file__)
-        env = os.environ.copy()
-        env['PYTHONIOENCODING'] = 'utf-8'
-        result = subprocess.run(
-            [sys.executable, script_path, "--symbol", symbol, "--format", "text"],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            timeout=180,
-            env=env,
-            cwd=backend_dir  # 작업 디렉토리를 backend로 설정
-        )
-        
-        if result.returncode != 0:
-            return {
-                "success": False,
-                "error": result.stderr or "테스트 실행 실패",
-                "report": result.stdout
-            }
-        
+        symbols = _parse_backtest_symbols(symbol)
+        results = await _run_backtests(symbols, "additional")
         return {
             "success": True,
             "format": "text",
-            "report": result.stdout
-        }
-    except subprocess.TimeoutExpired:
-        return {
-            "success": False,
-            "error": "테스트 실행 시간 초과 (3분 이상 소요)"
+            "report": _backtest_report("additional", results)
         }
     except Exception as e:
+        logger.error(f"추가 기술적 지표 테스트 오류: {e}", exc_info=True)
         return {
             "success": False,
             "error": str(e)
         }
 
 @app.get("/api/technical-indicators/test")
-async def test_technical_indicators(symbol: str = Query(..., description="종목 심볼")):
+async def test_technical_indicators(symbol: str = Query(..., description="종목 심볼 (쉼표로 여러 종목 지정 가능)")):
     """
     기술적 지표 신뢰도 테스트 실행
     """
     try:
-        # test_technical_indicators.py 스크립트 경로 찾기
-        backend_dir = os.path.dirname(__file__)
-        script_path = os.path.join(backend_dir, "tests", "test_technical_indicators.py")
-        
-        # 파일 존재 여부 확인
-        if not os.path.exists(script_path):
-            # 대체 경로 시도: 상위 디렉토리의 backend/tests
-            alt_path = os.path.join(os.path.dirname(backend_dir), "backend", "tests", "test_technical_indicators.py")
-            if os.path.exists(alt_path):
-                script_path = alt_path
-                backend_dir = os.path.dirname(alt_path)
-            else:
-                # 파일이 없는 경우 상세한 에러 메시지 반환
-                expected_paths = [
-                    os.path.join(backend_dir, "tests", "test_technical_indicators.py"),
-                    alt_path
-                ]
-                return {
-                    "success": False,
-                    "error": f"테스트 파일을 찾을 수 없습니다. 예상 경로: {expected_paths}",
-                    "backend_dir": backend_dir,
-                    "current_file": __file__
-                }
-        
-        # Python 스크립트를 실행하여 결과 가져오기
-        # Windows에서 UTF-8 인코딩 강제
-        env = os.environ.copy()
-        env['PYTHONIOENCODING'] = 'utf-8'
-        
-        # 스크립트 실행 시 backend 디렉토리를 작업 디렉토리로 설정
-        result = subprocess.run(
-            [sys.executable, script_path, "--symbol", symbol, "--format", "text"],
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',  # 인코딩 오류 시 대체 문자 사용
-            timeout=180,  # 3분 타임아웃
-            env=env,
-            cwd=backend_dir  # 작업 디렉토리를 backend로 설정
-        )
-        
-        if result.returncode != 0:
-            return {
-                "success": False,
-                "error": result.stderr or "테스트 실행 실패",
-                "output": result.stdout,
-                "script_path": script_path
-            }
-        
-        # 텍스트 리포트 반환
+        symbols = _parse_backtest_symbols(symbol)
+        results = await _run_backtests(symbols, "technical")
         return {
             "success": True,
             "format": "text",
-            "report": result.stdout
-        }
-            
-    except subprocess.TimeoutExpired:
-        return {
-            "success": False,
-            "error": "테스트 실행 시간이 초과되었습니다. (최대 3분)"
+            "report": _backtest_report("technical", results)
         }
     except Exception as e:
         logger.error(f"기술적 지표 테스트 오류: {e}", exc_info=True)
@@ -2372,6 +3905,116 @@ async def test_technical_indicators(symbol: str = Query(..., description="종목
         }
 
 
+@app.post("/api/backtests", status_code=202)
+async def submit_backtest(payload: BacktestJobRequest) -> Dict[str, object]:
+    """백테스트 작업 등록 (같은 조건의 작업이 진행 중이면 그 작업을 반환)"""
+    symbols = list(dict.fromkeys(symbol.strip().upper() for symbol in payload.symbols if symbol.strip()))
+    if not symbols:
+        raise HTTPException(status_code=400, detail="백테스트할 종목이 없습니다.")
+    params = {"symbols": symbols}
+    key = json.dumps({"kind": payload.kind, **params}, sort_keys=True)
+
+    async def run(progress: Callable[[float, str], None]) -> Dict[str, object]:
+        results = await _run_backtests(symbols, payload.kind, progress)
+        return {"format": "text", "report": _backtest_report(payload.kind, results), "results": results}
+
+    try:
+        job = BACKTEST_JOBS.submit(payload.kind, key, params, run)
+    except JobQueueFull:
+        raise HTTPException(status_code=429, detail="대기 중인 백테스트가 너무 많습니다. 잠시 후 다시 시도해주세요.")
+    return job.to_dict()
+
+
+@app.post("/api/backtests/sweep", status_code=202)
+async def submit_parameter_sweep(payload: ParameterSweepRequest) -> Dict[str, object]:
+    """지표 파라미터 스윕 작업 등록: 그리드의 모든 조합을 적중률·선행 수익률로 순위화"""
+    symbols = list(dict.fromkeys(symbol.strip().upper() for symbol in payload.symbols if symbol.strip()))
+    if not symbols:
+        raise HTTPException(status_code=400, detail="스윕할 종목이 없습니다.")
+    try:
+        combos = expand_grid(payload.indicator, payload.grid)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    params = {
+        "indicator": payload.indicator,
+        "symbols": symbols,
+        "horizon": payload.horizon,
+        "range_days": payload.range_days,
+        "combinations": len(combos),
+    }
+    key = json.dumps({"kind": "sweep", **params, "grid": combos, "top_k": payload.top_k, "min_signals": payload.min_signals}, sort_keys=True)
+    grid_digest = hashlib.sha1(json.dumps(combos, sort_keys=True).encode()).hexdigest()
+
+    async def run(progress: Callable[[float, str], None]) -> Dict[str, object]:
+        loop = asyncio.get_running_loop()
+        completed = 0
+        errors: Dict[str, str] = {}
+
+        async def run_one(symbol: str) -> Optional[Dict[str, object]]:
+            nonlocal completed
+            try:
+                candles = await _fetch_analysis_candles(symbol, "D", payload.range_days)
+            except Exception as exc:  # noqa: BLE001
+                errors[symbol] = f"데이터 가져오기 실패: {exc.detail if isinstance(exc, HTTPException) else exc}"
+                stats = None
+            else:
+                frame = _candles_to_frame(candles)
+                cache_key = f"sweep:{payload.indicator}:{payload.horizon}:{grid_digest}:{symbol}:{_frame_digest(frame)}"
+                stats = await asyncio.to_thread(BACKTEST_RESULT_CACHE.get, cache_key)
+                if stats is None:
+                    # 종목 하나의 그리드 전체를 프로세스 풀에서 한 번에 평가
+                    stats = await loop.run_in_executor(
+                        _analysis_pool(), sweep_symbol,
+                        payload.indicator, frame["close"].tolist(), combos, payload.horizon,
+                    )
+                    await asyncio.to_thread(BACKTEST_RESULT_CACHE.set, cache_key, stats)
+            completed += 1
+            progress(completed / len(symbols), f"{symbol} 완료 ({completed}/{len(symbols)})")
+            return stats
+
+        per_symbol = await asyncio.gather(*(run_one(symbol) for symbol in symbols))
+        usable = [stats for stats in per_symbol if stats is not None]
+        if not usable:
+            raise RuntimeError("스윕할 수 있는 종목 데이터가 없습니다.")
+        return {
+            "indicator": payload.indicator,
+            "horizon": payload.horizon,
+            "combinations": len(combos),
+            "bars": {symbol: stats["bars"] for symbol, stats in zip(symbols, per_symbol) if stats is not None},
+            "ranking": rank_parameters(combos, usable, top_k=payload.top_k, min_signals=payload.min_signals),
+            "errors": errors,
+        }
+
+    try:
+        job = BACKTEST_JOBS.submit("sweep", key, params, run)
+    except JobQueueFull:
+        raise HTTPException(status_code=429, detail="대기 중인 백테스트가 너무 많습니다. 잠시 후 다시 시도해주세요.")
+    return job.to_dict()
+
+
+@app.get("/api/backtests/{job_id}")
+async def get_backtest(job_id: str) -> Dict[str, object]:
+    """백테스트 작업 상태 및 결과 조회"""
+    record = BACKTEST_JOBS.get(job_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="백테스트 작업을 찾을 수 없습니다.")
+    return record
+
+
+@app.get("/api/backtests/{job_id}/events")
+async def stream_backtest(job_id: str) -> StreamingResponse:
+    """백테스트 진행 상황을 Server-Sent Events로 스트리밍 (완료 시 결과 포함 후 종료)"""
+    if BACKTEST_JOBS.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="백테스트 작업을 찾을 수 없습니다.")
+
+    async def events():
+        async for record in BACKTEST_JOBS.watch(job_id):
+            yield f"event: {record['status']}\ndata: {json.dumps(record, ensure_ascii=False, default=str)}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 @app.get("/api/market/orderbook")
 async def get_orderbook(symbol: str):
     """
@@ -2479,7 +4122,14 @@ async def market_candles(
                 logger.error(f"한국 주식 일봉 데이터 가져오기 실패: {e2}")
                 raise HTTPException(status_code=500, detail=f"한국 주식 데이터를 가져올 수 없습니다: {str(e)}")
     
-    # 미국 주식인 경우
+    # 미국 주식인 경우 (yfinance 호출은 블로킹이므로 스레드에서 실행)
+    return await asyncio.to_thread(_load_us_stock_candles, symbol, resolution, range_days)
+
+
+def _load_us_stock_candles(
+    symbol: str, resolution: str, range_days: int, period: Optional[str] = None
+) -> CandleResponse:
+    """yfinance로 미국 주식 캔들 데이터를 가져옵니다 (동기 함수). period를 주면 기본 조회 기간 대신 사용합니다."""
     # yfinance를 사용하여 분봉 데이터 가져오기 시도
     try:
         ticker = yf.Ticker(symbol.upper())
@@ -2490,7 +4140,7 @@ async def market_candles(
             "60": "1mo", "120": "3mo", "240": "6mo",
             "D": _period_from_days(range_days), "W": "1y", "M": "2y"
         }
-        period = period_map.get(resolution, "1mo")
+        period = period or period_map.get(resolution, "1mo")
         
         interval_map = {
             "1": "1m", "5": "5m", "15": "15m", "30": "30m",
@@ -2552,8 +4202,13 @@ async def market_candles(
 async def _fetch_korean_stock_candles(symbol: str, resolution: str, range_days: int) -> CandleResponse:
     """
     한국 주식 차트 데이터를 가져옵니다.
-    FinanceDataReader를 사용합니다.
+    FinanceDataReader 호출은 블로킹이므로 스레드에서 실행합니다.
     """
+    return await asyncio.to_thread(_load_korean_stock_candles, symbol, resolution, range_days)
+
+
+def _load_korean_stock_candles(symbol: str, resolution: str, range_days: int) -> CandleResponse:
+    """FinanceDataReader로 한국 주식 캔들 데이터를 가져옵니다 (동기 함수)."""
     try:
         # 종목 코드 정리 (005930.KS -> 005930)
         target_symbol = symbol.split('.')[0]
@@ -2649,16 +4304,19 @@ def health_check() -> dict[str, str]:
 
 @app.on_event("startup")
 async def _on_startup() -> None:
-    global MARKET_REFRESH_TASK, NEWS_REFRESH_TASK
+    global MARKET_REFRESH_TASK, NEWS_REFRESH_TASK, SCREENING_REFRESH_TASK, SCREENER_REFRESH_TASK
+    # 각 루프는 시작 즉시 한 번 갱신하므로 별도의 초기 갱신 태스크는 두지 않는다
     MARKET_REFRESH_TASK = asyncio.create_task(_market_refresh_loop())
     NEWS_REFRESH_TASK = asyncio.create_task(_news_refresh_loop())
-    asyncio.create_task(_refresh_market_cache_once())
-    asyncio.create_task(_refresh_news_cache_once())
+    SCREENING_REFRESH_TASK = asyncio.create_task(_screening_refresh_loop())
+    SCREENER_REFRESH_TASK = asyncio.create_task(_screener_refresh_loop())
 
 
 @app.on_event("shutdown")
 async def _on_shutdown() -> None:
-    tasks = [MARKET_REFRESH_TASK, NEWS_REFRESH_TASK]
+    tasks = [MARKET_REFRESH_TASK, NEWS_REFRESH_TASK, SCREENING_REFRESH_TASK, SCREENER_REFRESH_TASK]
+    tasks.extend(NEWS_TRANSLATION_TASKS.values())
+    tasks.extend(NEWS_REVALIDATE_TASKS.values())
     for task in tasks:
         if task:
             task.cancel()
@@ -2666,6 +4324,10 @@ async def _on_shutdown() -> None:
         if task:
             with contextlib.suppress(asyncio.CancelledError):
                 await task
+    await BACKTEST_JOBS.stop()
+    if ANALYSIS_POOL is not None:
+        ANALYSIS_POOL.shutdown(wait=False, cancel_futures=True)
+    FEED_PARSER.shutdown()
 
 
 def _fallback_quote_yfinance(
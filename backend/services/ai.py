@@ -8,18 +8,26 @@ This module implements Local LLM functionality using Hugging Face transformers:
 2. translate_to_korean: uses translation models for English→Korean translation (Local LLM).
    - Model: facebook/mbart-large-50-many-to-many-mmt
    - Falls back to API-based translation if models unavailable
+   - Results are cached on disk per (source text, model), see services/translation_cache.py
+   - translate_many_to_korean batches many texts per Ollama prompt for news refreshes
 3. rank_recommendations: scores stock candidates based on simple weighted factors.
 """
 
 from __future__ import annotations
 
+import asyncio
+import os
+import re
 from functools import lru_cache
-from typing import List, Mapping, Sequence
+from typing import List, Mapping, Optional, Sequence
 
+import httpx
 import numpy as np
 import pandas as pd
 import logging
 
+from services.translation_cache import TranslationCache
+
 # transformers를 선택적으로 import (없으면 AI 기능 비활성화)
 logger = logging.getLogger(__name__)
 
@@ -40,6 +48,15 @@ _DEFAULT_MAX_TOKENS = 180
 _DEFAULT_MIN_TOKENS = 45
 _TRANSLATOR_PIPELINE = None
 _TRANSLATOR_UNAVAILABLE = False
+# 번역 결과는 (원문 해시, 모델) 단위로 디스크에 보관해 같은 문장을 두 번 번역하지 않음
+_DEFAULT_STATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".state")
+TRANSLATION_CACHE = TranslationCache(
+    os.getenv(
+        "TRANSLATION_CACHE_PATH",
+        os.path.join(os.getenv("BACKEND_STATE_DIR", _DEFAULT_STATE_DIR), "translations.sqlite3"),
+    )
+)
+TRANSLATION_CACHE_STATS = {"hits": 0, "misses": 0}
 
 
 @lru_cache(maxsize=1)
@@ -136,20 +153,35 @@ def summarize_headline(text: str, max_tokens: int = _DEFAULT_MAX_TOKENS) -> str:
         return text[:max_tokens] if len(text) > max_tokens else text
 
 
+def _translation_cache_models(ollama_model: str) -> List[str]:
+    """Cache keys of the translation backends, in the order translate_to_korean tries them."""
+    return [f"ollama:{ollama_model}", "deep-translator:google", "googletrans"]
+
+
 def translate_to_korean(text: str) -> str:
     """
     Translate English text into Korean using Ollama LLM.
     Falls back to original text if translation fails.
+
+    Successful translations are stored in TRANSLATION_CACHE and served from there on the
+    next call, before any backend is contacted; failures are not cached.
     """
     if not text:
         return ""
 
+    ollama_model = os.getenv("OLLAMA_MODEL", "qwen2.5:0.5b")
+    # 캐시 조회 순서 = 백엔드 우선순위 (어느 백엔드로든 한 번 번역된 문장은 재사용)
+    cache_models = _translation_cache_models(ollama_model)
+    cached = TRANSLATION_CACHE.lookup(text, cache_models)
+    if cached is not None:
+        TRANSLATION_CACHE_STATS["hits"] += 1
+        return cached[1]
+    TRANSLATION_CACHE_STATS["misses"] += 1
+
     # Ollama를 사용한 번역 시도
     try:
-        import os
         import httpx
         
-        ollama_model = os.getenv("OLLAMA_MODEL", "qwen2.5:0.5b")
         ollama_host = os.getenv("OLLAMA_HOST", "http://127.0.0.1:11434")
         
         # 텍스트가 너무 길면 잘라서 번역
@@ -175,6 +207,7 @@ def translate_to_korean(text: str) -> str:
                 translated = data.get("response", "").strip()
                 if translated and translated != text_to_translate and len(translated) > 0:
                     logger.info(f"Translation successful (Ollama): {text[:50]}... -> {translated[:50]}...")
+                    TRANSLATION_CACHE.store(text, cache_models[0], translated)
                     return translated
     except ImportError:
         logger.warning("httpx not available for translation")
@@ -193,6 +226,7 @@ def translate_to_korean(text: str) -> str:
         
         if translated and translated != text_to_translate:
             logger.info(f"Translation successful (deep-translator): {text[:50]}... -> {translated[:50]}...")
+            TRANSLATION_CACHE.store(text, cache_models[1], translated)
             return translated
         else:
             logger.warning("Translation returned same text or empty")
@@ -209,6 +243,7 @@ def translate_to_korean(text: str) -> str:
         result = translator.translate(text, src='en', dest='ko')
         if result and result.text:
             logger.info(f"Translation successful (googletrans): {text[:50]}... -> {result.text[:50]}...")
+            TRANSLATION_CACHE.store(text, cache_models[2], result.text)
             return result.text
     except ImportError:
         logger.warning("googletrans not installed")
@@ -220,6 +255,168 @@ def translate_to_korean(text: str) -> str:
     return text
 
 
+# 여러 문장을 한 프롬프트로 묶어 번역할 때 쓰는 구분 표식과 한도
+TRANSLATION_BATCH_SIZE = int(os.getenv("TRANSLATION_BATCH_SIZE", "10"))
+TRANSLATION_BATCH_CHARS = int(os.getenv("TRANSLATION_BATCH_CHARS", "3000"))
+TRANSLATION_CONCURRENCY = int(os.getenv("TRANSLATION_CONCURRENCY", "4"))
+_MAX_TRANSLATION_CHARS = 500
+_MARKER_PATTERN = re.compile(r"<<<\s*(\d+)\s*>>>")
+TRANSLATION_BATCH_STATS = {"batches": 0, "batch_failures": 0, "fallback_items": 0}
+
+
+def _batch_prompt(texts: Sequence[str]) -> str:
+    # 원문에 표식 모양 문자열이 있으면 응답 분리가 어긋나므로 미리 지움
+    body = "\n".join(
+        f"<<<{index}>>> {_MARKER_PATTERN.sub(' ', text).replace('<<<', '').replace('>>>', '')}"
+        for index, text in enumerate(texts, start=1)
+    )
+    return (
+        "Translate each numbered English text below to Korean. Keep every <<<N>>> marker exactly "
+        "as it is, put the Korean translation right after its marker, and return nothing else.\n\n"
+        f"{body}"
+    )
+
+
+def split_batch_response(response: str, count: int) -> dict:
+    """
+    Map 0-based item index -> translation from a marker-delimited batch response.
+
+    Markers that repeat, fall outside 1..count or carry an empty translation are dropped, so
+    a garbled response only loses the affected items.
+    """
+    matches = list(_MARKER_PATTERN.finditer(response))
+    seen: dict = {}
+    duplicates = set()
+    for position, match in enumerate(matches):
+        number = int(match.group(1))
+        end = matches[position + 1].start() if position + 1 < len(matches) else len(response)
+        translated = response[match.end():end].strip()
+        if not 1 <= number <= count:
+            continue
+        if number in seen:
+            duplicates.add(number)
+            continue
+        seen[number] = translated
+    return {number - 1: text for number, text in seen.items() if text and number not in duplicates}
+
+
+def _chunk_texts(texts: Sequence[str]) -> List[List[str]]:
+    batches: List[List[str]] = []
+    current: List[str] = []
+    size = 0
+    for text in texts:
+        if current and (len(current) >= TRANSLATION_BATCH_SIZE or size + len(text) > TRANSLATION_BATCH_CHARS):
+            batches.append(current)
+            current, size = [], 0
+        current.append(text)
+        size += len(text)
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def _translate_batch(
+    client: httpx.AsyncClient, host: str, model: str, texts: List[str], semaphore: asyncio.Semaphore
+) -> dict:
+    """Translate one batch with a single Ollama request; returns the items it could split out."""
+    async with semaphore:
+        TRANSLATION_BATCH_STATS["batches"] += 1
+        try:
+            response = await client.post(
+                f"{host}/api/generate",
+                json={
+                    "model": model,
+                    "prompt": _batch_prompt(texts),
+                    "stream": False,
+                    "options": {
+                        "temperature": 0.3,
+                        "num_predict": 200 * len(texts),
+                    },
+                },
+            )
+            response.raise_for_status()
+            parsed = split_batch_response(response.json().get("response", ""), len(texts))
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"Batch translation failed ({len(texts)} items): {exc}")
+            parsed = {}
+    if len(parsed) < len(texts):
+        TRANSLATION_BATCH_STATS["batch_failures"] += 1
+    return parsed
+
+
+def cached_korean_translations(texts: Sequence[str]) -> List[Optional[str]]:
+    """Translations already in TRANSLATION_CACHE (None where missing); never calls a model."""
+    cache_models = _translation_cache_models(os.getenv("OLLAMA_MODEL", "qwen2.5:0.5b"))
+    return [cached[1] if cached is not None else None for cached in TRANSLATION_CACHE.lookup_many(texts, cache_models)]
+
+
+async def translate_many_to_korean(texts: Sequence[str]) -> List[str]:
+    """
+    Translate many English texts with batched, concurrent Ollama requests.
+
+    Cached texts are served from TRANSLATION_CACHE; the rest are deduplicated, grouped into
+    marker-delimited prompts of up to TRANSLATION_BATCH_SIZE items, and at most
+    TRANSLATION_CONCURRENCY batches run at once. Items a batch fails to return fall back to
+    translate_to_korean one at a time. The result is aligned with `texts`; as with
+    translate_to_korean, a text that cannot be translated comes back unchanged.
+
+    The cache is read once and written once per call, both in a worker thread, so a
+    database locked by another process never blocks the event loop.
+    """
+    ollama_model = os.getenv("OLLAMA_MODEL", "qwen2.5:0.5b")
+    ollama_host = os.getenv("OLLAMA_HOST", "http://127.0.0.1:11434")
+    cache_models = _translation_cache_models(ollama_model)
+
+    results: dict = {"": ""}
+    pending: List[str] = []
+    unique = [text for text in dict.fromkeys(texts) if text]
+    lookups = await asyncio.to_thread(TRANSLATION_CACHE.lookup_many, unique, cache_models) if unique else []
+    for text, cached in zip(unique, lookups):
+        if cached is not None:
+            TRANSLATION_CACHE_STATS["hits"] += 1
+            results[text] = cached[1]
+        else:
+            pending.append(text)
+
+    if pending:
+        TRANSLATION_CACHE_STATS["misses"] += len(pending)
+        semaphore = asyncio.Semaphore(max(1, TRANSLATION_CONCURRENCY))
+        batches = _chunk_texts(pending)
+        async with httpx.AsyncClient(timeout=60.0) as client:
+            parsed_batches = await asyncio.gather(
+                *(
+                    _translate_batch(
+                        client, ollama_host, ollama_model, [text[:_MAX_TRANSLATION_CHARS] for text in batch], semaphore
+                    )
+                    for batch in batches
+                )
+            )
+
+        failed: List[str] = []
+        rows = []
+        for batch, parsed in zip(batches, parsed_batches):
+            for index, text in enumerate(batch):
+                translated = parsed.get(index)
+                if translated and translated != text[:_MAX_TRANSLATION_CHARS]:
+                    rows.append((text, cache_models[0], translated))
+                    results[text] = translated
+                else:
+                    failed.append(text)
+        if rows:
+            await asyncio.to_thread(TRANSLATION_CACHE.store_many, rows)
+
+        if failed:
+            TRANSLATION_BATCH_STATS["fallback_items"] += len(failed)
+
+            async def translate_one(text: str) -> None:
+                async with semaphore:
+                    results[text] = await asyncio.to_thread(translate_to_korean, text)
+
+            await asyncio.gather(*(translate_one(text) for text in failed))
+
+    return [results.get(text or "", text) for text in texts]
+
+
 def _normalize_series(series: pd.Series) -> pd.Series:
     """
     Normalize a pandas Series to z-scores, guard against division by zero.
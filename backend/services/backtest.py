@@ -0,0 +1,654 @@
+"""
+In-process indicator reliability backtests.
+
+These are the checks from tests/test_technical_indicators.py and
+tests/test_additional_indicators.py (support/resistance, trend line, MA cross, RSI, MACD,
+Bollinger Bands and risk), rewritten to run on a candle frame the app already has instead
+of spawning a script that downloads its own data.
+
+Signals are found with boolean masks over the whole series, and forward outcomes (price
+N bars later, highest high or lowest low in the next N bars) come from sliding-window
+reductions, so each check is a few NumPy passes instead of an iterrows loop. Success
+criteria, example selection and report text are the same as in the scripts.
+
+Indicator series and the S/R detector are passed in by the caller (app.py owns them),
+which keeps this module free of app imports and safe to run in worker processes. The trend
+check reads every walk-forward prediction from one rolling regression (services.regression),
+the same fit detect_trend_lines uses for its latest window.
+
+Every frame is expected to have a sorted DatetimeIndex and lowercase open, high, low,
+close and volume columns.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Callable, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from services.regression import rolling_linregress, trend_types
+
+SUCCESS = "성공"
+FAILURE = "실패"
+
+
+def tail_days(df: pd.DataFrame, days: int, now: dt.datetime | None = None) -> pd.DataFrame:
+    """Rows from the last `days` calendar days, like the scripts' `start=now - days` downloads."""
+    now = now or dt.datetime.now()
+    return df[df.index >= pd.Timestamp(now - dt.timedelta(days=days)).normalize()]
+
+
+def forward_extreme(values: np.ndarray, horizon: int, reduce: np.ufunc) -> np.ndarray:
+    """out[i] = reduce(values[i:i + horizon + 1]) skipping NaN; NaN where the window runs past the end."""
+    out = np.full(len(values), np.nan)
+    if len(values) > horizon:
+        out[: len(values) - horizon] = reduce.reduce(sliding_window_view(values, horizon + 1), axis=1)
+    return out
+
+
+def _pct(new: np.ndarray, base: np.ndarray) -> np.ndarray:
+    return (new - base) / base * 100
+
+
+def _signal_positions(mask: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """Indices i in [start, stop) where mask is True."""
+    positions = np.flatnonzero(mask[start:stop]) + start if stop > start else np.array([], dtype=int)
+    return positions.astype(int)
+
+
+def _crossed_up(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """a[i-1] <= b[i-1] and a[i] > b[i] (False at i == 0 and wherever a value is NaN)."""
+    out = np.zeros(len(a), dtype=bool)
+    with np.errstate(invalid="ignore"):
+        out[1:] = (a[:-1] <= b[:-1]) & (a[1:] > b[1:])
+    return out
+
+
+def _crossed_down(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    out = np.zeros(len(a), dtype=bool)
+    with np.errstate(invalid="ignore"):
+        out[1:] = (a[:-1] >= b[:-1]) & (a[1:] < b[1:])
+    return out
+
+
+def _top_examples(signals: List[Dict], count: int = 2) -> List[Dict]:
+    """Largest |change_pct| first; ties keep signal order (same as sorted(..., reverse=True))."""
+    return sorted(signals, key=lambda x: abs(x["change_pct"]), reverse=True)[:count]
+
+
+def _pick_examples(successes: Sequence[bool]) -> List[int]:
+    """
+    Indices of the events the scripts keep as examples: successes while fewer than three
+    examples exist, and the first two failures while fewer than five exist.
+    """
+    picked: List[int] = []
+    misses = 0
+    for index, success in enumerate(successes):
+        if success:
+            if len(picked) < 3:
+                picked.append(index)
+        else:
+            misses += 1
+            if len(picked) < 5 and misses <= 2:
+                picked.append(index)
+        if len(picked) >= 5 or (len(picked) >= 3 and misses >= 2):
+            break
+    return picked
+
+
+def _accuracy(correct: int, total: int) -> float:
+    return round(correct / total * 100, 2) if total > 0 else 0
+
+
+def _forward_signals(
+    df: pd.DataFrame,
+    positions: np.ndarray,
+    horizon: int,
+    extreme: np.ndarray,
+    is_success: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    extra: Mapping[str, np.ndarray],
+    price_key: str = "signal_price",
+) -> List[Dict]:
+    """Signal dicts (date, `extra` fields, price, future_price, change_pct, result)."""
+    close = df["close"].to_numpy(dtype=np.float64)
+    signal_price = close[positions]
+    future_price = close[positions + horizon]
+    change_pct = _pct(future_price, signal_price)
+    extreme_pct = _pct(extreme[positions], signal_price)
+    success = is_success(change_pct, extreme_pct)
+    return [
+        {
+            "date": df.index[pos],
+            **{name: values[pos] for name, values in extra.items()},
+            price_key: signal_price[k],
+            "future_price": future_price[k],
+            "change_pct": change_pct[k],
+            "result": SUCCESS if success[k] else FAILURE,
+        }
+        for k, pos in enumerate(positions)
+    ]
+
+
+def _two_sided_summary(prefix_a: str, signals_a: List[Dict], prefix_b: str, signals_b: List[Dict]) -> Dict:
+    correct_a = sum(1 for s in signals_a if s["result"] == SUCCESS)
+    correct_b = sum(1 for s in signals_b if s["result"] == SUCCESS)
+    return {
+        f"{prefix_a}_correct": correct_a,
+        f"{prefix_a}_total": len(signals_a),
+        f"{prefix_b}_correct": correct_b,
+        f"{prefix_b}_total": len(signals_b),
+        "overall_accuracy": _accuracy(correct_a + correct_b, len(signals_a) + len(signals_b)),
+        f"{prefix_a}_accuracy": _accuracy(correct_a, len(signals_a)),
+        f"{prefix_b}_accuracy": _accuracy(correct_b, len(signals_b)),
+    }
+
+
+def rsi_accuracy(df: pd.DataFrame, rsi: pd.Series) -> Dict:
+    """RSI < 30 as a buy and RSI > 75 as a sell, judged 5 bars later."""
+    if df.empty or len(df) < 50:
+        return {"error": "데이터 부족"}
+    values = rsi.to_numpy(dtype=np.float64)
+    n = len(df)
+    high_ahead = forward_extreme(df["high"].to_numpy(dtype=np.float64), 5, np.fmax)
+    low_ahead = forward_extreme(df["low"].to_numpy(dtype=np.float64), 5, np.fmin)
+    with np.errstate(invalid="ignore"):
+        oversold = _signal_positions(values < 30, 30, n - 5)
+        overbought = _signal_positions(values > 75, 30, n - 5)
+
+    oversold_signals = _forward_signals(
+        df, oversold, 5, high_ahead, lambda change, high: (change > -0.5) | (high > 1), {"rsi": values}
+    )
+    overbought_signals = _forward_signals(
+        df, overbought, 5, low_ahead, lambda change, low: (change < 0.5) | (low < -1), {"rsi": values}
+    )
+    summary = _two_sided_summary("oversold", oversold_signals, "overbought", overbought_signals)
+    return {
+        **summary,
+        "oversold_examples": _top_examples(oversold_signals),
+        "overbought_examples": _top_examples(overbought_signals),
+    }
+
+
+def macd_accuracy(df: pd.DataFrame, macd: Mapping[str, pd.Series]) -> Dict:
+    """MACD / signal line crosses, judged 10 bars later."""
+    if df.empty or len(df) < 50:
+        return {"error": "데이터 부족"}
+    line = macd["macd"].to_numpy(dtype=np.float64)
+    signal = macd["signal"].to_numpy(dtype=np.float64)
+    n = len(df)
+    high_ahead = forward_extreme(df["high"].to_numpy(dtype=np.float64), 10, np.fmax)
+    low_ahead = forward_extreme(df["low"].to_numpy(dtype=np.float64), 10, np.fmin)
+
+    golden = _signal_positions(_crossed_up(line, signal), 30, n - 10)
+    death = _signal_positions(_crossed_down(line, signal), 30, n - 10)
+    extra = {"macd": line, "signal": signal}
+    golden_signals = _forward_signals(
+        df, golden, 10, high_ahead, lambda change, high: (change > -1) | (high > 1), extra
+    )
+    death_signals = _forward_signals(
+        df, death, 10, low_ahead, lambda change, low: (change < 1) | (low < -1), extra
+    )
+    summary = _two_sided_summary("golden_cross", golden_signals, "death_cross", death_signals)
+    return {
+        **summary,
+        "golden_examples": _top_examples(golden_signals),
+        "death_examples": _top_examples(death_signals),
+    }
+
+
+def bollinger_accuracy(df: pd.DataFrame, bands: Mapping[str, pd.Series]) -> Dict:
+    """Closes within 1% of the lower / upper band, judged 5 bars later."""
+    if df.empty or len(df) < 50:
+        return {"error": "데이터 부족"}
+    close = df["close"].to_numpy(dtype=np.float64)
+    upper = bands["upper"].to_numpy(dtype=np.float64)
+    lower = bands["lower"].to_numpy(dtype=np.float64)
+    n = len(df)
+    high_ahead = forward_extreme(df["high"].to_numpy(dtype=np.float64), 5, np.fmax)
+    low_ahead = forward_extreme(df["low"].to_numpy(dtype=np.float64), 5, np.fmin)
+
+    formed = ~np.isnan(upper) & ~np.isnan(lower)
+    with np.errstate(invalid="ignore"):
+        lower_touch = formed & (close <= lower * 1.01)
+        upper_touch = formed & ~lower_touch & (close >= upper * 0.99)
+    lower_signals = _forward_signals(
+        df, _signal_positions(lower_touch, 30, n - 5), 5, high_ahead,
+        lambda change, high: (change > -0.5) | (high > 0.5), {"lower_band": lower}, price_key="price",
+    )
+    upper_signals = _forward_signals(
+        df, _signal_positions(upper_touch, 30, n - 5), 5, low_ahead,
+        lambda change, low: (change < 0.5) | (low < -0.5), {"upper_band": upper}, price_key="price",
+    )
+    summary = _two_sided_summary("lower_touch", lower_signals, "upper_touch", upper_signals)
+    return {
+        **summary,
+        "lower_examples": _top_examples(lower_signals),
+        "upper_examples": _top_examples(upper_signals),
+    }
+
+
+def risk_metrics(df: pd.DataFrame) -> Dict:
+    """Annualised volatility, maximum drawdown and a simple Sharpe ratio."""
+    if df.empty or len(df) < 30:
+        return {"error": "데이터 부족"}
+    returns = df["close"].pct_change()
+    volatility = returns.std() * np.sqrt(252) * 100
+    cumulative = (1 + returns).cumprod()
+    running_max = cumulative.expanding().max()
+    mdd = abs(((cumulative - running_max) / running_max).min()) * 100
+    avg_return = returns.mean() * 252 * 100
+    sharpe_ratio = (avg_return / volatility) if volatility > 0 else 0
+    return {
+        "volatility": round(volatility, 2),
+        "volatility_grade": "낮음" if volatility < 15 else "보통" if volatility < 30 else "높음",
+        "mdd": round(mdd, 2),
+        "mdd_grade": "낮음" if mdd < 10 else "보통" if mdd < 20 else "높음",
+        "sharpe_ratio": round(sharpe_ratio, 2),
+        "avg_return": round(avg_return, 2),
+    }
+
+
+def _walk_forward_periods(total: int, test_periods: int) -> List[Tuple[int, int]]:
+    """(train_end, test_end) pairs; each test window follows its training window."""
+    period_size = total // (test_periods + 1)
+    periods = []
+    for period in range(test_periods):
+        train_end = period_size * (period + 1)
+        test_end = min(train_end + period_size, total)
+        if test_end - train_end >= 20:
+            periods.append((train_end, test_end))
+    return periods
+
+
+def support_resistance_accuracy(
+    df: pd.DataFrame,
+    detect_levels: Callable[[pd.Series, pd.Series, pd.Series], Tuple[list, list]],
+    test_periods: int = 10,
+    tolerance: float = 0.05,
+) -> Dict:
+    """
+    Walk-forward check of detected levels: a touch of a level in the test window counts
+    as a hit when price holds (or recovers) over the next 3 bars.
+    """
+    if df.empty or len(df) < 100:
+        return {"error": "데이터 부족"}
+    high = df["high"].to_numpy(dtype=np.float64)
+    low = df["low"].to_numpy(dtype=np.float64)
+    close = df["close"].to_numpy(dtype=np.float64)
+    n = len(df)
+
+    # idx부터 3봉(끝에서는 남은 봉) 동안의 최저가/최고가와 마지막 종가
+    last = np.minimum(np.arange(n) + 2, n - 1)
+    padded_low = np.concatenate([low, np.full(2, np.nan)])
+    padded_high = np.concatenate([high, np.full(2, np.nan)])
+    future_low = np.fmin.reduce(sliding_window_view(padded_low, 3), axis=1)
+    future_high = np.fmax.reduce(sliding_window_view(padded_high, 3), axis=1)
+    future_close = close[last]
+
+    results: Dict = {
+        "support_hits": 0,
+        "support_misses": 0,
+        "resistance_hits": 0,
+        "resistance_misses": 0,
+        "support_predictions": 0,
+        "resistance_predictions": 0,
+    }
+    support_events: List[Tuple[int, float, bool]] = []
+    resistance_events: List[Tuple[int, float, bool]] = []
+    touch = tolerance * 0.9
+
+    for train_end, test_end in _walk_forward_periods(n, test_periods):
+        train = df.iloc[:train_end]
+        supports, resistances = detect_levels(train["high"], train["low"], train["close"])
+        rows = np.arange(train_end, test_end)
+
+        support_levels = np.array([s.level for s in supports if getattr(s, "strength", 0.5) >= 0.2], dtype=np.float64)
+        resistance_levels = np.array([r.level for r in resistances if getattr(r, "strength", 0.5) >= 0.2], dtype=np.float64)
+
+        # (봉, 레벨) 행렬에서 터치 여부와 성공 여부를 한 번에 계산 (행 우선 순서 = 스크립트의 순회 순서)
+        lows = low[rows, None]
+        touched = (support_levels * (1 - touch) <= lows) & (lows <= support_levels * (1 + touch * 0.7))
+        held = (future_low[rows, None] >= support_levels * (1 - tolerance * 1.5)) | (future_close[rows, None] > lows)
+        for r, k in zip(*np.nonzero(touched)):
+            support_events.append((int(rows[r]), float(support_levels[k]), bool(held[r, k])))
+
+        highs = high[rows, None]
+        touched = (resistance_levels * (1 - tolerance * 0.7) <= highs) & (highs <= resistance_levels * (1 + tolerance))
+        rejected = (future_high[rows, None] <= resistance_levels * (1 + tolerance * 1.5)) | (future_close[rows, None] < highs)
+        for r, k in zip(*np.nonzero(touched)):
+            resistance_events.append((int(rows[r]), float(resistance_levels[k]), bool(rejected[r, k])))
+
+    def support_example(idx: int, level: float, success: bool) -> Dict:
+        example = {
+            "support_level": round(level, 0),
+            "touch_price": round(low[idx], 0),
+            "touch_pct": round((low[idx] - level) / level * 100, 2),
+            "future_low": round(future_low[idx], 0),
+            "future_close": round(future_close[idx], 0),
+        }
+        if success:
+            example["recovery_pct"] = round((future_close[idx] - low[idx]) / low[idx] * 100, 2)
+        else:
+            example["break_pct"] = round((future_low[idx] - level) / level * 100, 2)
+        example["result"] = SUCCESS if success else FAILURE
+        return example
+
+    def resistance_example(idx: int, level: float, success: bool) -> Dict:
+        example = {
+            "resistance_level": round(level, 0),
+            "touch_price": round(high[idx], 0),
+            "touch_pct": round((high[idx] - level) / level * 100, 2),
+            "future_high": round(future_high[idx], 0),
+            "future_close": round(future_close[idx], 0),
+        }
+        if success:
+            example["rejection_pct"] = round((future_close[idx] - high[idx]) / high[idx] * 100, 2)
+        else:
+            example["break_pct"] = round((future_high[idx] - level) / level * 100, 2)
+        example["result"] = SUCCESS if success else FAILURE
+        return example
+
+    for kind, events, make_example in (
+        ("support", support_events, support_example),
+        ("resistance", resistance_events, resistance_example),
+    ):
+        hits = sum(1 for _, _, success in events if success)
+        results[f"{kind}_predictions"] = len(events)
+        results[f"{kind}_hits"] = hits
+        results[f"{kind}_misses"] = len(events) - hits
+        results[f"{kind}_examples"] = [make_example(*events[i]) for i in _pick_examples([e[2] for e in events])]
+
+    results["support_accuracy"] = _accuracy(results["support_hits"], results["support_predictions"])
+    results["resistance_accuracy"] = _accuracy(results["resistance_hits"], results["resistance_predictions"])
+    results["overall_accuracy"] = _accuracy(
+        results["support_hits"] + results["resistance_hits"],
+        results["support_predictions"] + results["resistance_predictions"],
+    )
+    return results
+
+
+def trend_line_accuracy(df: pd.DataFrame, window: int = 20, test_periods: int = 10) -> Dict:
+    """
+    Walk-forward check of the detected trend against the next window's ±2% move.
+
+    The prediction at each split is the sign of the regression slope over the last `window`
+    closes before it (detect_trend_lines needs at least 2 * window bars to report a trend).
+    """
+    if df.empty or len(df) < 100:
+        return {"error": "데이터 부족"}
+    close = df["close"]
+    predicted_types = trend_types(rolling_linregress(close.to_numpy(dtype=np.float64), window).slope)
+    results = {
+        "correct_predictions": 0,
+        "total_predictions": 0,
+        "uptrend_correct": 0,
+        "downtrend_correct": 0,
+        "sideways_correct": 0,
+    }
+    for train_end, test_end in _walk_forward_periods(len(df), test_periods):
+        if train_end < window * 2:
+            continue
+        predicted = predicted_types[train_end - 1]
+        first, last = close.iloc[train_end], close.iloc[test_end - 1]
+        change_pct = (last - first) / first * 100
+        actual = "uptrend" if change_pct > 2 else "downtrend" if change_pct < -2 else "sideways"
+
+        results["total_predictions"] += 1
+        if predicted == actual:
+            results["correct_predictions"] += 1
+            results[f"{predicted}_correct"] += 1
+
+    results["accuracy"] = _accuracy(results["correct_predictions"], results["total_predictions"])
+    return results
+
+
+def moving_average_accuracy(
+    df: pd.DataFrame,
+    mas: Mapping[str, pd.Series],
+    rsi: pd.Series,
+    macd: Mapping[str, pd.Series],
+) -> Dict:
+    """5/20 moving average crosses (with the scripts' loose RSI/MACD filter), judged 10 bars later."""
+    if df.empty or len(df) < 100:
+        return {"error": "데이터 부족"}
+    n = len(df)
+    close = df["close"].to_numpy(dtype=np.float64)
+    ma5 = mas["ma5"].to_numpy(dtype=np.float64)
+    ma20 = mas["ma20"].to_numpy(dtype=np.float64)
+    rsi_values = np.nan_to_num(rsi.to_numpy(dtype=np.float64), nan=50.0)
+    macd_line = np.nan_to_num(macd["macd"].to_numpy(dtype=np.float64), nan=0.0)
+    macd_signal = np.nan_to_num(macd["signal"].to_numpy(dtype=np.float64), nan=0.0)
+    high_ahead = forward_extreme(df["high"].to_numpy(dtype=np.float64), 10, np.fmax)
+    low_ahead = forward_extreme(df["low"].to_numpy(dtype=np.float64), 10, np.fmin)
+
+    golden_valid = (rsi_values < 85) & ((macd_line > macd_signal) | (macd_line > -100))
+    death_valid = (rsi_values > 15) & ((macd_line < macd_signal) | (macd_line < 100))
+    golden = _signal_positions(_crossed_up(ma5, ma20) & golden_valid, 60, n - 10)
+    death = _signal_positions(_crossed_down(ma5, ma20) & death_valid, 60, n - 10)
+
+    results: Dict = {}
+    for kind, positions, ahead, extreme_key, succeeded in (
+        ("golden_cross", golden, high_ahead, "future_high", lambda change, ext: (change > -1) | (ext > 1)),
+        ("death_cross", death, low_ahead, "future_low", lambda change, ext: (change < 1) | (ext < -1)),
+    ):
+        current = close[positions]
+        future = close[positions + 10]
+        change_pct = _pct(future, current)
+        success = succeeded(change_pct, _pct(ahead[positions], current))
+        correct = int(success.sum())
+        results[f"{kind}_correct"] = correct
+        results[f"{kind}_wrong"] = len(positions) - correct
+        results[f"{kind}_examples"] = [
+            {
+                "signal_price": round(current[k], 0),
+                "future_price": round(future[k], 0),
+                extreme_key: round(ahead[positions[k]], 0),
+                "change_pct": round(change_pct[k], 2),
+                "result": SUCCESS if success[k] else FAILURE,
+            }
+            for k in _pick_examples(success.tolist())
+        ]
+        results[f"{kind}_accuracy"] = _accuracy(correct, len(positions))
+    return results
+
+
+def technical_report(results_by_symbol: Mapping[str, Mapping[str, Dict]], now: dt.datetime | None = None) -> str:
+    """
+    Report text of tests/test_technical_indicators.py generate_test_report().
+
+    `results_by_symbol` maps each symbol to {"support_resistance", "trend", "moving_average"} results.
+    """
+    now = now or dt.datetime.now()
+    report = []
+    report.append("=" * 80)
+    report.append("기술적 지표 신뢰도 테스트 리포트")
+    report.append("=" * 80)
+    report.append(f"테스트 일시: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+    report.append("")
+
+    all_support_accuracy = []
+    all_resistance_accuracy = []
+    all_trend_accuracy = []
+    all_golden_cross_accuracy = []
+    all_death_cross_accuracy = []
+
+    for symbol, results in results_by_symbol.items():
+        report.append(f"\n{'='*80}")
+        report.append(f"종목: {symbol}")
+        report.append(f"{'='*80}")
+
+        sr_results = results["support_resistance"]
+        if "error" not in sr_results:
+            report.append("\n[지지/저항선 정확도]")
+            report.append(f"  지지선 정확도: {sr_results['support_accuracy']}%")
+            report.append(f"    - 성공: {sr_results['support_hits']}회")
+            report.append(f"    - 실패: {sr_results['support_misses']}회")
+            report.append("    - 계산 과정:")
+            if sr_results.get('support_examples'):
+                for ex in sr_results['support_examples'][:2]:
+                    if ex['result'] == SUCCESS:
+                        report.append(f"      예시: 지지선 {ex['support_level']:,}원 탐지 -> {ex['touch_price']:,}원 도달 ({ex['touch_pct']:+.2f}%) -> 3일 후 {ex['future_close']:,}원 ({ex['recovery_pct']:+.2f}% 회복) -> {ex['result']}")
+                    else:
+                        report.append(f"      예시: 지지선 {ex['support_level']:,}원 탐지 -> {ex['touch_price']:,}원 도달 ({ex['touch_pct']:+.2f}%) -> 3일 후 {ex['future_low']:,}원까지 하락 ({ex['break_pct']:+.2f}% 돌파) -> {ex['result']}")
+            else:
+                report.append("      계산 방법: 학습 기간에서 지지선을 탐지하고, 테스트 기간에 가격이 지지선 근처(±5%)에 도달했을 때 3일 후 가격이 지지선 위로 유지되면 성공으로 카운트합니다.")
+            report.append(f"  저항선 정확도: {sr_results['resistance_accuracy']}%")
+            report.append(f"    - 성공: {sr_results['resistance_hits']}회")
+            report.append(f"    - 실패: {sr_results['resistance_misses']}회")
+            report.append("    - 계산 과정:")
+            if sr_results.get('resistance_examples'):
+                for ex in sr_results['resistance_examples'][:2]:
+                    if ex['result'] == SUCCESS:
+                        report.append(f"      예시: 저항선 {ex['resistance_level']:,}원 탐지 -> {ex['touch_price']:,}원 도달 ({ex['touch_pct']:+.2f}%) -> 3일 후 {ex['future_close']:,}원 ({ex['rejection_pct']:+.2f}% 하락) -> {ex['result']}")
+                    else:
+                        report.append(f"      예시: 저항선 {ex['resistance_level']:,}원 탐지 -> {ex['touch_price']:,}원 도달 ({ex['touch_pct']:+.2f}%) -> 3일 후 {ex['future_high']:,}원까지 상승 ({ex['break_pct']:+.2f}% 돌파) -> {ex['result']}")
+            else:
+                report.append("      계산 방법: 학습 기간에서 저항선을 탐지하고, 테스트 기간에 가격이 저항선 근처(±5%)에 도달했을 때 3일 후 가격이 저항선 아래로 유지되면 성공으로 카운트합니다.")
+            report.append(f"  전체 정확도: {sr_results['overall_accuracy']}%")
+
+            all_support_accuracy.append(sr_results['support_accuracy'])
+            all_resistance_accuracy.append(sr_results['resistance_accuracy'])
+
+        trend_results = results["trend"]
+        if "error" not in trend_results:
+            report.append("\n[추세선 정확도]")
+            report.append(f"  전체 정확도: {trend_results['accuracy']}%")
+            report.append(f"    - 상승 추세 정확도: {trend_results.get('uptrend_correct', 0)}회")
+            report.append(f"    - 하락 추세 정확도: {trend_results.get('downtrend_correct', 0)}회")
+            report.append(f"    - 횡보 정확도: {trend_results.get('sideways_correct', 0)}회")
+            report.append(f"  총 예측: {trend_results['total_predictions']}회")
+
+            all_trend_accuracy.append(trend_results['accuracy'])
+
+        ma_results = results["moving_average"]
+        if "error" not in ma_results:
+            report.append("\n[이동평균선 신호 정확도]")
+            report.append(f"  골든크로스 정확도: {ma_results['golden_cross_accuracy']}%")
+            report.append(f"    - 성공: {ma_results['golden_cross_correct']}회")
+            report.append(f"    - 실패: {ma_results['golden_cross_wrong']}회")
+            report.append("    - 계산 과정:")
+            if ma_results.get('golden_cross_examples'):
+                for ex in ma_results['golden_cross_examples'][:2]:
+                    report.append(f"      예시: {ex['signal_price']:,}원에서 5일선이 20일선 상향 돌파 (골든크로스) -> 10일 후 {ex['future_price']:,}원 ({ex['change_pct']:+.2f}% 변동, 최고가 {ex['future_high']:,}원) -> {ex['result']}")
+            else:
+                report.append("      계산 방법: 5일선이 20일선을 상향 돌파하는 시점을 골든크로스로 판단하고, RSI<80, MACD 양수 조건을 만족할 때만 신호로 인정합니다. 10일 후 가격이 상승했으면 성공으로 카운트합니다.")
+            report.append(f"  데드크로스 정확도: {ma_results['death_cross_accuracy']}%")
+            report.append(f"    - 성공: {ma_results['death_cross_correct']}회")
+            report.append(f"    - 실패: {ma_results['death_cross_wrong']}회")
+            report.append("    - 계산 과정:")
+            if ma_results.get('death_cross_examples'):
+                for ex in ma_results['death_cross_examples'][:2]:
+                    report.append(f"      예시: {ex['signal_price']:,}원에서 5일선이 20일선 하향 돌파 (데드크로스) -> 10일 후 {ex['future_price']:,}원 ({ex['change_pct']:+.2f}% 변동, 최저가 {ex['future_low']:,}원) -> {ex['result']}")
+            else:
+                report.append("      계산 방법: 5일선이 20일선을 하향 돌파하는 시점을 데드크로스로 판단하고, RSI>20, MACD 음수 조건을 만족할 때만 신호로 인정합니다. 10일 후 가격이 하락했으면 성공으로 카운트합니다.")
+
+            all_golden_cross_accuracy.append(ma_results['golden_cross_accuracy'])
+            all_death_cross_accuracy.append(ma_results['death_cross_accuracy'])
+
+    report.append(f"\n{'='*80}")
+    report.append("종합 통계")
+    report.append(f"{'='*80}")
+
+    if all_support_accuracy:
+        report.append(f"\n평균 지지선 정확도: {np.mean(all_support_accuracy):.2f}%")
+        report.append(f"평균 저항선 정확도: {np.mean(all_resistance_accuracy):.2f}%")
+    if all_trend_accuracy:
+        report.append(f"평균 추세선 정확도: {np.mean(all_trend_accuracy):.2f}%")
+    if all_golden_cross_accuracy:
+        report.append(f"평균 골든크로스 정확도: {np.mean(all_golden_cross_accuracy):.2f}%")
+        report.append(f"평균 데드크로스 정확도: {np.mean(all_death_cross_accuracy):.2f}%")
+
+    report.append("\n" + "=" * 80)
+    return "\n".join(report)
+
+
+def additional_report(symbol: str, results: Mapping[str, Dict], now: dt.datetime | None = None) -> str:
+    """
+    Report text of tests/test_additional_indicators.py generate_additional_indicators_report().
+
+    `results` holds the "rsi", "macd", "bollinger" and "risk" results for one symbol.
+    """
+    now = now or dt.datetime.now()
+    report = []
+    report.append(f"\n{'='*80}")
+    report.append("추가 기술적 지표 분석 리포트")
+    report.append(f"{'='*80}")
+    report.append(f"종목: {symbol}")
+    report.append(f"분석 일시: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+    report.append(f"{'='*80}\n")
+
+    rsi_results = results["rsi"]
+    report.append("\n[RSI 분석]")
+    if "error" not in rsi_results:
+        report.append(f"  전체 정확도: {rsi_results['overall_accuracy']}%")
+        report.append(f"  과매도 신호 (RSI < 30): {rsi_results['oversold_accuracy']}%")
+        report.append(f"    - 성공: {rsi_results['oversold_correct']}회 / 전체: {rsi_results['oversold_total']}회")
+        if rsi_results.get('oversold_examples'):
+            report.append("    - 계산 과정:")
+            for ex in rsi_results['oversold_examples'][:2]:
+                report.append(f"      예시: RSI {ex['rsi']:.1f} (과매도) -> {ex['signal_price']:,.0f}원 매수 신호 -> 5일 후 {ex['future_price']:,.0f}원 ({ex['change_pct']:+.2f}% 변동) -> {ex['result']}")
+        report.append(f"  과매수 신호 (RSI > 70): {rsi_results['overbought_accuracy']}%")
+        report.append(f"    - 성공: {rsi_results['overbought_correct']}회 / 전체: {rsi_results['overbought_total']}회")
+        if rsi_results.get('overbought_examples'):
+            report.append("    - 계산 과정:")
+            for ex in rsi_results['overbought_examples'][:2]:
+                report.append(f"      예시: RSI {ex['rsi']:.1f} (과매수) -> {ex['signal_price']:,.0f}원 매도 신호 -> 5일 후 {ex['future_price']:,.0f}원 ({ex['change_pct']:+.2f}% 변동) -> {ex['result']}")
+    else:
+        report.append(f"  오류: {rsi_results.get('error', '알 수 없는 오류')}")
+
+    macd_results = results["macd"]
+    report.append("\n[MACD 분석]")
+    if "error" not in macd_results:
+        report.append(f"  전체 정확도: {macd_results['overall_accuracy']}%")
+        report.append(f"  골든크로스 (MACD > Signal): {macd_results['golden_cross_accuracy']}%")
+        report.append(f"    - 성공: {macd_results['golden_cross_correct']}회 / 전체: {macd_results['golden_cross_total']}회")
+        if macd_results.get('golden_examples'):
+            report.append("    - 계산 과정:")
+            for ex in macd_results['golden_examples'][:2]:
+                report.append(f"      예시: MACD {ex['macd']:.2f} > Signal {ex['signal']:.2f} (골든크로스) -> {ex['signal_price']:,.0f}원 매수 신호 -> 10일 후 {ex['future_price']:,.0f}원 ({ex['change_pct']:+.2f}% 변동) -> {ex['result']}")
+        report.append(f"  데드크로스 (MACD < Signal): {macd_results['death_cross_accuracy']}%")
+        report.append(f"    - 성공: {macd_results['death_cross_correct']}회 / 전체: {macd_results['death_cross_total']}회")
+        if macd_results.get('death_examples'):
+            report.append("    - 계산 과정:")
+            for ex in macd_results['death_examples'][:2]:
+                report.append(f"      예시: MACD {ex['macd']:.2f} < Signal {ex['signal']:.2f} (데드크로스) -> {ex['signal_price']:,.0f}원 매도 신호 -> 10일 후 {ex['future_price']:,.0f}원 ({ex['change_pct']:+.2f}% 변동) -> {ex['result']}")
+    else:
+        report.append(f"  오류: {macd_results.get('error', '알 수 없는 오류')}")
+
+    bb_results = results["bollinger"]
+    report.append("\n[볼린저 밴드 분석]")
+    if "error" not in bb_results:
+        report.append(f"  전체 정확도: {bb_results['overall_accuracy']}%")
+        report.append(f"  하단 밴드 터치 (매수 신호): {bb_results['lower_touch_accuracy']}%")
+        report.append(f"    - 성공: {bb_results['lower_touch_correct']}회 / 전체: {bb_results['lower_touch_total']}회")
+        if bb_results.get('lower_examples'):
+            report.append("    - 계산 과정:")
+            for ex in bb_results['lower_examples'][:2]:
+                report.append(f"      예시: 가격 {ex['price']:,.0f}원이 하단 밴드 {ex['lower_band']:,.0f}원 터치 -> 매수 신호 -> 5일 후 {ex['future_price']:,.0f}원 ({ex['change_pct']:+.2f}% 변동) -> {ex['result']}")
+        report.append(f"  상단 밴드 터치 (매도 신호): {bb_results['upper_touch_accuracy']}%")
+        report.append(f"    - 성공: {bb_results['upper_touch_correct']}회 / 전체: {bb_results['upper_touch_total']}회")
+        if bb_results.get('upper_examples'):
+            report.append("    - 계산 과정:")
+            for ex in bb_results['upper_examples'][:2]:
+                report.append(f"      예시: 가격 {ex['price']:,.0f}원이 상단 밴드 {ex['upper_band']:,.0f}원 터치 -> 매도 신호 -> 5일 후 {ex['future_price']:,.0f}원 ({ex['change_pct']:+.2f}% 변동) -> {ex['result']}")
+    else:
+        report.append(f"  오류: {bb_results.get('error', '알 수 없는 오류')}")
+
+    risk_results = results["risk"]
+    report.append("\n[리스크 분석]")
+    if "error" not in risk_results:
+        report.append(f"  변동성: {risk_results['volatility']}% ({risk_results['volatility_grade']})")
+        report.append("    - 계산 방법: 일일 수익률의 표준편차를 연율화 (√252 곱하기)")
+        report.append(f"    - 예시: 일일 수익률 표준편차 1.5% -> 연율화 변동성 {1.5 * np.sqrt(252):.2f}%")
+        report.append(f"  최대 낙폭 (MDD): {risk_results['mdd']}% ({risk_results['mdd_grade']})")
+        report.append("    - 계산 방법: 누적 수익률의 최고점 대비 최대 하락폭")
+        report.append(f"  샤프 비율: {risk_results['sharpe_ratio']:.2f}")
+        report.append("    - 계산 방법: (평균 수익률 / 변동성)")
+        report.append(f"    - 예시: 평균 수익률 {risk_results['avg_return']:.2f}% / 변동성 {risk_results['volatility']:.2f}% = {risk_results['sharpe_ratio']:.2f}")
+    else:
+        report.append(f"  오류: {risk_results.get('error', '알 수 없는 오류')}")
+
+    return "\n".join(report)
@@ -0,0 +1,57 @@
+"""
+Small JSON file cache for slow-changing upstream data.
+
+Each key is stored as one JSON file together with the time it was written, so the cache
+survives restarts and is shared by every worker process on the host.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JsonDiskCache:
+    def __init__(self, directory: str, ttl_seconds: float) -> None:
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None when it is missing, unreadable or expired."""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.debug(f"Disk cache read failed ({key}): {exc}")
+            return None
+
+        if time.time() - entry.get("stored_at", 0) >= self.ttl_seconds:
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".cache-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({"key": key, "stored_at": time.time(), "value": value}, fh, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
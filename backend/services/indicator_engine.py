@@ -0,0 +1,274 @@
+"""
+Streaming technical indicators with per-(symbol, resolution, window) state.
+
+The batch functions in app.py (calculate_rsi, calculate_macd, calculate_bollinger_bands,
+calculate_moving_averages) recompute every indicator over the whole series. IndicatorEngine
+keeps the accumulators those functions imply and applies each new bar in O(1):
+
+- EMA accumulators for MACD (fast, slow, signal), seeded with the first bar like
+  pandas ewm(adjust=False).
+- Rolling sums and sums of squares for the moving averages and Bollinger Bands.
+- Rolling gain/loss sums for RSI. calculate_rsi averages gains and losses with a simple
+  rolling mean rather than Wilder smoothing, so the engine does the same.
+
+State is committed through the second-to-last bar only. The last bar may still be forming,
+so it is evaluated with non-mutating peek() calls on every update.
+
+A state is seeded once, at the first bar of the first history it sees, and keeps running
+from there: a window that slides forward by a bar resumes from the committed state instead
+of being replayed. The rolling indicators (moving averages, Bollinger Bands, RSI) only look
+at their last N bars, so they equal the batch functions over the incoming window; a value
+whose period is longer than that window is reported as NaN, as the batch functions would.
+The EMAs carry memory back to the seed bar, so MACD equals the batch function run over the
+whole history since the seed; against the window alone the difference decays by a factor of
+(1 - 2 / (span + 1)) per bar and is negligible after a few hundred bars. A full rebuild
+happens only when the window starts before the seed bar or when the last committed bar is
+missing from, or changed in, the incoming history (revised data).
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+MA_WINDOWS = (5, 20, 60, 120)
+RSI_PERIOD = 14
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+BB_PERIOD = 20
+BB_STD_DEV = 2
+
+
+class _RollingWindow:
+    """Fixed-size window with running sum and sum of squares."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.values: Deque[float] = deque()
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._pushes_since_resync = 0
+
+    def push(self, value: float) -> None:
+        self.values.append(value)
+        self.total += value
+        self.total_sq += value * value
+        if len(self.values) > self.size:
+            dropped = self.values.popleft()
+            self.total -= dropped
+            self.total_sq -= dropped * dropped
+
+        # 누적 오차가 쌓이지 않도록 창 크기만큼 밀릴 때마다 정확히 다시 합산 (분할 상환 O(1))
+        self._pushes_since_resync += 1
+        if self._pushes_since_resync >= self.size:
+            self.total = math.fsum(self.values)
+            self.total_sq = math.fsum(v * v for v in self.values)
+            self._pushes_since_resync = 0
+
+    def peek(self, value: float) -> Tuple[int, float, float]:
+        """(count, sum, sum of squares) as if `value` had been pushed."""
+        count = len(self.values) + 1
+        total = self.total + value
+        total_sq = self.total_sq + value * value
+        if count > self.size:
+            dropped = self.values[0]
+            count -= 1
+            total -= dropped
+            total_sq -= dropped * dropped
+        return count, total, total_sq
+
+    def peek_mean(self, value: float) -> float:
+        count, total, _ = self.peek(value)
+        return total / count if count == self.size else math.nan
+
+    def peek_std(self, value: float) -> float:
+        """Sample standard deviation (ddof=1), matching pandas rolling().std()."""
+        count, total, total_sq = self.peek(value)
+        if count != self.size or count < 2:
+            return math.nan
+        variance = (total_sq - total * total / count) / (count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+
+class _Ema:
+    def __init__(self, span: int) -> None:
+        self.alpha = 2.0 / (span + 1)
+        self.value: Optional[float] = None
+
+    def peek(self, x: float) -> float:
+        if self.value is None:
+            return x
+        return self.alpha * x + (1 - self.alpha) * self.value
+
+    def push(self, x: float) -> None:
+        self.value = self.peek(x)
+
+
+@dataclass
+class IndicatorSnapshot:
+    """Indicator values at the latest bar. NaN means not enough history yet."""
+
+    timestamp: int
+    close: float
+    rsi: float
+    macd: float
+    macd_signal: float
+    macd_histogram: float
+    bb_upper: float
+    bb_middle: float
+    bb_lower: float
+    moving_averages: Dict[int, float] = field(default_factory=dict)
+
+
+class IndicatorState:
+    def __init__(self, first_timestamp: Optional[int] = None) -> None:
+        self.first_timestamp = first_timestamp
+        self.last_timestamp: Optional[int] = None
+        self.last_close: Optional[float] = None
+        self.gains = _RollingWindow(RSI_PERIOD)
+        self.losses = _RollingWindow(RSI_PERIOD)
+        self.ema_fast = _Ema(MACD_FAST)
+        self.ema_slow = _Ema(MACD_SLOW)
+        self.ema_signal = _Ema(MACD_SIGNAL)
+        self.windows = {size: _RollingWindow(size) for size in set(MA_WINDOWS) | {BB_PERIOD}}
+
+    def _gain_loss(self, close: float) -> Tuple[float, float]:
+        # 첫 봉은 diff()가 NaN이므로 calculate_rsi와 같이 상승/하락폭 0으로 취급
+        if self.last_close is None:
+            return 0.0, 0.0
+        delta = close - self.last_close
+        return (delta if delta > 0 else 0.0), (-delta if delta < 0 else 0.0)
+
+    def push(self, timestamp: int, close: float) -> None:
+        """Commit a closed bar."""
+        gain, loss = self._gain_loss(close)
+        self.gains.push(gain)
+        self.losses.push(loss)
+        macd = self.ema_fast.peek(close) - self.ema_slow.peek(close)
+        self.ema_fast.push(close)
+        self.ema_slow.push(close)
+        self.ema_signal.push(macd)
+        for window in self.windows.values():
+            window.push(close)
+        self.last_timestamp = timestamp
+        self.last_close = close
+
+    def peek(self, timestamp: int, close: float) -> IndicatorSnapshot:
+        """Evaluate all indicators for a bar without committing it."""
+        gain, loss = self._gain_loss(close)
+        avg_gain = self.gains.peek_mean(gain)
+        avg_loss = self.losses.peek_mean(loss)
+        if math.isnan(avg_gain) or math.isnan(avg_loss) or (avg_gain == 0 and avg_loss == 0):
+            rsi = math.nan
+        elif avg_loss == 0:
+            rsi = 100.0
+        else:
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+        macd = self.ema_fast.peek(close) - self.ema_slow.peek(close)
+        macd_signal = self.ema_signal.peek(macd)
+
+        bb_window = self.windows[BB_PERIOD]
+        bb_middle = bb_window.peek_mean(close)
+        bb_std = bb_window.peek_std(close)
+
+        return IndicatorSnapshot(
+            timestamp=timestamp,
+            close=close,
+            rsi=rsi,
+            macd=macd,
+            macd_signal=macd_signal,
+            macd_histogram=macd - macd_signal,
+            bb_upper=bb_middle + bb_std * BB_STD_DEV,
+            bb_middle=bb_middle,
+            bb_lower=bb_middle - bb_std * BB_STD_DEV,
+            moving_averages={size: self.windows[size].peek_mean(close) for size in MA_WINDOWS},
+        )
+
+
+def _mask_short_window(snapshot: IndicatorSnapshot, length: int) -> IndicatorSnapshot:
+    """NaN for rolling indicators whose period is longer than the requested window of `length` bars."""
+    if length < RSI_PERIOD:
+        snapshot.rsi = math.nan
+    if length < BB_PERIOD:
+        snapshot.bb_upper = snapshot.bb_middle = snapshot.bb_lower = math.nan
+    for size in MA_WINDOWS:
+        if length < size:
+            snapshot.moving_averages[size] = math.nan
+    return snapshot
+
+
+class IndicatorEngine:
+    """
+    Keeps one IndicatorState per key, least recently used first out.
+
+    Use a key that identifies the series (e.g. (symbol, resolution)); windows of any length
+    over that series share the state, and a window sliding forward updates it in O(1) per bar.
+    update() and reset() are serialized with a lock so callers may run them in worker threads.
+    """
+
+    def __init__(self, max_states: int = 512) -> None:
+        self.max_states = max_states
+        self._states: "OrderedDict[Hashable, IndicatorState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"incremental": 0, "rebuilds": 0}
+
+    def update(self, key: Hashable, timestamps: Sequence[int], closes: Sequence[float]) -> IndicatorSnapshot:
+        """
+        Bring the state for `key` up to date with an ascending candle history and
+        return the indicators at its last bar.
+
+        Raises ValueError for an empty history or non-finite closes.
+        """
+        ts = np.asarray(timestamps, dtype=np.int64)
+        values = np.asarray(closes, dtype=np.float64)
+        if len(ts) == 0 or len(ts) != len(values):
+            raise ValueError("timestamps and closes must be non-empty and of equal length")
+        if not np.isfinite(values).all():
+            raise ValueError("closes must be finite")
+
+        with self._lock:
+            return self._update(key, ts, values)
+
+    def _update(self, key: Hashable, ts: np.ndarray, values: np.ndarray) -> IndicatorSnapshot:
+        state = self._states.get(key)
+        start = self._resume_position(state, ts, values) if state is not None else None
+        if start is None:
+            state = IndicatorState(first_timestamp=int(ts[0]))
+            start = 0
+            self.stats["rebuilds"] += 1
+        else:
+            self.stats["incremental"] += 1
+
+        for i in range(start, len(ts) - 1):
+            state.push(int(ts[i]), float(values[i]))
+
+        self._states[key] = state
+        self._states.move_to_end(key)
+        while len(self._states) > self.max_states:
+            self._states.popitem(last=False)
+
+        return _mask_short_window(state.peek(int(ts[-1]), float(values[-1])), len(ts))
+
+    @staticmethod
+    def _resume_position(state: IndicatorState, ts: np.ndarray, values: np.ndarray) -> Optional[int]:
+        """Index of the first uncommitted bar, or None if the history was revised or starts before the seed."""
+        if state.last_timestamp is None or state.first_timestamp is None or ts[0] < state.first_timestamp:
+            return None
+        pos = int(np.searchsorted(ts, state.last_timestamp))
+        if pos >= len(ts) - 1 or ts[pos] != state.last_timestamp:
+            return None
+        if values[pos] != state.last_close:
+            return None
+        return pos + 1
+
+    def reset(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._states.clear()
+            else:
+                self._states.pop(key, None)
@@ -0,0 +1,356 @@
+"""
+Background job queue for long-running analytics (backtests).
+
+Jobs are submitted with a deduplication key: while a job with the same key is queued or
+running, submitting again returns that job instead of starting another one. A fixed number
+of asyncio worker tasks drain the queue, so at most `workers` jobs run at once.
+
+Every state change (status, progress, result) is written to `<directory>/<job_id>.json`, so
+any worker process on the host can answer status queries and stream progress for a job
+that another process is running. Finished job records are pruned after `ttl_seconds`.
+
+Deduplication also works across worker processes: the id of the in-flight job for a key is
+kept in `<directory>/keys/`, and submit() returns another process's job for the same key.
+Each record carries the owner pid and a heartbeat that the owner refreshes every
+`heartbeat_interval` seconds. A queued/running record whose owner has exited or stopped
+heartbeating for `stale_after` seconds is marked failed when it is read, so a job whose
+worker died does not stay `running` forever.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # Windows 등 fcntl이 없는 환경은 단일 워커로 실행한다고 가정
+    FCNTL_AVAILABLE = False
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+TERMINAL_STATUSES = (SUCCEEDED, FAILED)
+
+ProgressCallback = Callable[[float, str], None]
+JobFunction = Callable[[ProgressCallback], Awaitable[Any]]
+
+
+class JobQueueFull(RuntimeError):
+    pass
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    key: str
+    params: Dict[str, Any]
+    status: str = QUEUED
+    progress: float = 0.0
+    message: str = ""
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    owner_pid: int = field(default_factory=os.getpid)
+    heartbeat_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any], key: str) -> "Job":
+        fields = {name: record[name] for name in cls.__dataclass_fields__ if name in record}
+        return cls(key=key, **fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "params": self.params,
+            "status": self.status,
+            "progress": round(self.progress, 4),
+            "message": self.message,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error,
+            "owner_pid": self.owner_pid,
+            "heartbeat_at": self.heartbeat_at,
+        }
+
+
+class JobQueue:
+    def __init__(
+        self,
+        directory: str,
+        workers: int = 2,
+        max_pending: int = 100,
+        ttl_seconds: float = 24 * 3600,
+        heartbeat_interval: float = 10.0,
+        stale_after: float = 60.0,
+    ) -> None:
+        self.directory = directory
+        self.workers = workers
+        self.max_pending = max_pending
+        self.ttl_seconds = ttl_seconds
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self._jobs: Dict[str, Job] = {}
+        self._functions: Dict[str, JobFunction] = {}
+        self._inflight: Dict[str, str] = {}
+        self._changed: Dict[str, asyncio.Event] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+    def submit(self, kind: str, key: str, params: Dict[str, Any], func: JobFunction) -> Job:
+        """
+        Queue `func` unless a job with the same key is already queued or running, in this
+        process or in another worker process sharing `directory`.
+
+        Raises JobQueueFull when `max_pending` jobs are already waiting.
+        """
+        existing_id = self._inflight.get(key)
+        if existing_id is not None:
+            return self._jobs[existing_id]
+
+        with self._key_lock(key):
+            record = self._inflight_elsewhere(key)
+            if record is not None:
+                return Job.from_record(record, key)
+
+            self._ensure_workers()
+            if self._queue.qsize() >= self.max_pending:
+                raise JobQueueFull(f"{self.max_pending} jobs are already waiting")
+
+            self._prune()
+            job = Job(id=uuid.uuid4().hex, kind=kind, key=key, params=params)
+            self._jobs[job.id] = job
+            self._functions[job.id] = func
+            self._inflight[key] = job.id
+            self._changed[job.id] = asyncio.Event()
+            self._persist(job)
+            self._write_atomic(self._key_path(key), job.id)
+            self._queue.put_nowait(job.id)
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job record from this process, or from disk if another process owns it."""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job.to_dict()
+        record = self._read(job_id)
+        if record is not None and record["status"] not in TERMINAL_STATUSES:
+            reason = self._stale_reason(record)
+            if reason is not None:
+                logger.warning("Job %s (%s) is stale: %s", job_id, record.get("kind"), reason)
+                record.update(status=FAILED, error=reason, finished_at=time.time())
+                self._write_atomic(self._path(job_id), json.dumps(record, ensure_ascii=False, default=str))
+        return record
+
+    async def watch(self, job_id: str, poll_interval: float = 1.0, heartbeat: float = 15.0) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the job record on every change (or every `heartbeat` seconds) until it finishes."""
+        last_seen = None
+        while True:
+            record = self.get(job_id)
+            if record is None:
+                return
+            version = (record["status"], record["progress"], record["message"])
+            if version != last_seen:
+                last_seen = version
+                yield record
+            if record["status"] in TERMINAL_STATUSES:
+                return
+
+            event = self._changed.get(job_id)
+            if event is not None:
+                # 이 프로세스가 실행 중인 작업은 변경 즉시 깨어난다
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(event.wait(), timeout=heartbeat)
+                event.clear()
+            else:
+                await asyncio.sleep(poll_interval)
+
+    async def stop(self) -> None:
+        tasks = self._worker_tasks + ([self._heartbeat_task] if self._heartbeat_task else [])
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._worker_tasks = []
+        self._heartbeat_task = None
+        self._queue = None
+        # 종료 시 끝나지 못한 작업은 실패로 기록해 다른 워커에서 같은 작업을 다시 제출할 수 있게 한다
+        for job in list(self._jobs.values()):
+            if job.status not in TERMINAL_STATUSES:
+                self._functions.pop(job.id, None)
+                self._finish(job, status=FAILED, error="worker stopped before the job finished", finished_at=time.time())
+
+    def _ensure_workers(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if not self._worker_tasks:
+            self._worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        if self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat())
+
+    async def _heartbeat(self) -> None:
+        """Refresh heartbeat_at of this process's unfinished jobs so other workers can tell it is alive."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            for job in list(self._jobs.values()):
+                if job.status not in TERMINAL_STATUSES:
+                    job.heartbeat_at = time.time()
+                    self._persist(job)
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        job = self._jobs[job_id]
+        func = self._functions.pop(job_id)
+        self._update(job, status=RUNNING, started_at=time.time(), message="started")
+
+        def progress(fraction: float, message: str) -> None:
+            self._update(job, progress=min(max(fraction, 0.0), 1.0), message=message)
+
+        try:
+            result = await func(progress)
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Job %s (%s) failed", job.id, job.kind)
+            self._finish(job, status=FAILED, error=str(exc), finished_at=time.time())
+        else:
+            self._finish(job, status=SUCCEEDED, progress=1.0, message="done", result=result, finished_at=time.time())
+
+    def _finish(self, job: Job, **changes: Any) -> None:
+        self._update(job, **changes)
+        self._inflight.pop(job.key, None)
+        with self._key_lock(job.key):
+            if self._read_key(job.key) == job.id:
+                with contextlib.suppress(OSError):
+                    os.remove(self._key_path(job.key))
+
+    def _update(self, job: Job, **changes: Any) -> None:
+        for name, value in changes.items():
+            setattr(job, name, value)
+        job.heartbeat_at = time.time()
+        self._persist(job)
+        event = self._changed.get(job.id)
+        if event is not None:
+            event.set()
+
+    def _path(self, job_id: str) -> str:
+        return os.path.join(self.directory, f"{job_id}.json")
+
+    def _key_path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, "keys", digest)
+
+    def _persist(self, job: Job) -> None:
+        self._write_atomic(self._path(job.id), json.dumps(job.to_dict(), ensure_ascii=False, default=str))
+
+    def _write_atomic(self, path: str, text: str) -> None:
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".job-")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Failed to write %s: %s", path, exc)
+
+    @contextlib.contextmanager
+    def _key_lock(self, key: str):
+        """Serialize submit/finish for one key across worker processes."""
+        if not FCNTL_AVAILABLE:
+            yield
+            return
+        path = self._key_path(key) + ".lock"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _read_key(self, key: str) -> Optional[str]:
+        try:
+            with open(self._key_path(key), "r", encoding="utf-8") as fh:
+                return fh.read().strip()
+        except OSError:
+            return None
+
+    def _inflight_elsewhere(self, key: str) -> Optional[Dict[str, Any]]:
+        """Record of an unfinished job for `key` owned by another queue (usually another process)."""
+        job_id = self._read_key(key)
+        if not job_id or job_id in self._jobs:
+            return None
+        record = self.get(job_id)
+        if record is None or record["status"] in TERMINAL_STATUSES:
+            return None
+        return record
+
+    def _stale_reason(self, record: Dict[str, Any]) -> Optional[str]:
+        owner_pid = record.get("owner_pid")
+        if owner_pid is not None and owner_pid != os.getpid() and not _pid_alive(owner_pid):
+            return f"worker process {owner_pid} exited before the job finished"
+        heartbeat_at = record.get("heartbeat_at") or record.get("started_at") or record.get("created_at") or 0
+        if time.time() - heartbeat_at > self.stale_after:
+            return f"no heartbeat from worker process {owner_pid} for {self.stale_after:.0f}s"
+        return None
+
+    def _read(self, job_id: str) -> Optional[Dict[str, Any]]:
+        # 경로 조작 방지: 작업 ID는 uuid4 hex
+        if len(job_id) != 32 or not all(c in "0123456789abcdef" for c in job_id):
+            return None
+        try:
+            with open(self._path(job_id), "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.ttl_seconds
+        for job_id, job in list(self._jobs.items()):
+            if job.status in TERMINAL_STATUSES and (job.finished_at or 0) < cutoff:
+                self._jobs.pop(job_id, None)
+                self._changed.pop(job_id, None)
+                with contextlib.suppress(OSError):
+                    os.remove(self._path(job_id))
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name != "posix":
+        # Windows의 os.kill은 프로세스를 종료시키므로 하트비트로만 판단
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # 권한이 없으면 다른 사용자의 살아 있는 프로세스
+        return True
+    return True
@@ -0,0 +1,232 @@
+"""
+Cross-process coordination for background refresh loops.
+
+Every worker process imports app.py and starts the same refresh loops. This module lets
+exactly one process run each loop and share its results with the others:
+
+1. LeaderLease: an exclusive, non-blocking file lock per loop name.
+   - The kernel drops the lock when the holder exits, so another worker takes over
+     on its next poll (failover).
+   - The holder writes its pid and a heartbeat timestamp into the lock file on every
+     iteration; followers read it to notice a leader that holds the lock but has stalled.
+2. SnapshotChannel: the leader publishes a pickled snapshot of its cache and the
+   followers load it whenever the file changes. update() merges into the current file
+   under a lock, so workers that fetch a missing key on demand can add it as well.
+3. KeyedFileLock: a lock per cache key for on-demand misses, so only one worker calls
+   the upstream API for a key while the others wait and then read the snapshot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, AsyncIterator, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # Windows 등 fcntl이 없는 환경은 단일 워커로 실행한다고 가정
+    FCNTL_AVAILABLE = False
+
+
+class LeaderLease:
+    """
+    File-lock based leadership for a named background loop.
+
+    Call try_acquire() on every loop iteration: it returns True (and refreshes the
+    heartbeat) while this process holds the lease and keeps returning False for the
+    other workers until the holder exits.
+    """
+
+    def __init__(self, name: str, lock_dir: str) -> None:
+        self.name = name
+        self.lock_dir = lock_dir
+        self.path = os.path.join(lock_dir, f"{name}.lock")
+        self._handle = None
+        self._single_process = not FCNTL_AVAILABLE
+
+    @property
+    def is_leader(self) -> bool:
+        return self._single_process or self._handle is not None
+
+    def try_acquire(self) -> bool:
+        if self.is_leader:
+            self.heartbeat()
+            return True
+
+        os.makedirs(self.lock_dir, exist_ok=True)
+        handle = open(self.path, "a+", encoding="utf-8")
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+
+        self._handle = handle
+        logger.info("리더로 선출되었습니다 (%s, pid=%s)", self.name, os.getpid())
+        self.heartbeat()
+        return True
+
+    def heartbeat(self) -> None:
+        """Record that the leader is alive and making progress."""
+        if self._handle is None:
+            return
+        self._handle.seek(0)
+        self._handle.truncate()
+        json.dump({"pid": os.getpid(), "heartbeat": time.time()}, self._handle)
+        self._handle.flush()
+
+    def holder(self) -> Optional[dict]:
+        """Return the pid and last heartbeat written by the current leader, if any."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+    def leader_stalled(self, max_age: float) -> bool:
+        """True when another process holds the lease but has not sent a heartbeat for max_age seconds."""
+        if self.is_leader:
+            return False
+        info = self.holder()
+        if not info:
+            return False
+        return time.time() - float(info.get("heartbeat", 0)) > max_age
+
+    def release(self) -> None:
+        if self._handle is None:
+            return
+        try:
+            fcntl.flock(self._handle.fileno(), fcntl.LOCK_UN)
+        except OSError:
+            pass
+        self._handle.close()
+        self._handle = None
+        logger.info("리더 권한을 반납했습니다 (%s)", self.name)
+
+
+class SnapshotChannel:
+    """
+    One-writer, many-reader snapshot file.
+
+    publish() replaces the file atomically; load() returns the payload only when the
+    file has changed since the previous load() in this process. update() is a locked
+    read-merge-write for writers that must not drop each other's entries.
+    """
+
+    def __init__(self, name: str, state_dir: str) -> None:
+        self.state_dir = state_dir
+        self.path = os.path.join(state_dir, f"{name}.snapshot")
+        self._loaded_mtime = 0
+
+    def _write(self, payload: Any) -> None:
+        os.makedirs(self.state_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, prefix=".snapshot-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    def _read(self) -> Optional[Any]:
+        try:
+            with open(self.path, "rb") as fh:
+                return pickle.load(fh)
+        except FileNotFoundError:
+            return None
+
+    def publish(self, payload: Any) -> None:
+        self._write(payload)
+        self._loaded_mtime = os.stat(self.path).st_mtime_ns
+
+    def update(self, merge: Callable[[Optional[Any]], Any]) -> Any:
+        """Replace the snapshot with merge(current payload) while holding the snapshot's lock."""
+        os.makedirs(self.state_dir, exist_ok=True)
+        with open(f"{self.path}.lock", "a+", encoding="utf-8") as lock:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                try:
+                    current = self._read()
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("스냅샷을 읽지 못해 새로 작성합니다 (%s): %s", self.path, exc)
+                    current = None
+                payload = merge(current)
+                self._write(payload)
+            finally:
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+        return payload
+
+    def load(self) -> Optional[Any]:
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        if mtime <= self._loaded_mtime:
+            return None
+        payload = self._read()
+        self._loaded_mtime = mtime
+        return payload
+
+
+class KeyedFileLock:
+    """
+    Exclusive file lock per key, shared by every worker on the host.
+
+    hold() polls a non-blocking lock on the event loop (so a cancelled request never
+    leaves a lock behind in a thread) and yields whether it got the lock before the
+    timeout; callers then re-check the shared cache and fetch only if it is still missing.
+    """
+
+    def __init__(self, name: str, lock_dir: str, poll_interval: float = 0.1) -> None:
+        self.lock_dir = os.path.join(lock_dir, name)
+        self.poll_interval = poll_interval
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.lock_dir, f"{digest}.lock")
+
+    def _try_lock(self, key: str):
+        os.makedirs(self.lock_dir, exist_ok=True)
+        handle = open(self._path(key), "a+", encoding="utf-8")
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return None
+        return handle
+
+    @contextlib.asynccontextmanager
+    async def hold(self, key: str, timeout: float) -> AsyncIterator[bool]:
+        if not FCNTL_AVAILABLE:
+            yield True
+            return
+
+        deadline = time.monotonic() + timeout
+        handle = self._try_lock(key)
+        while handle is None and time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            handle = self._try_lock(key)
+        if handle is None:
+            logger.warning("잠금 대기 시간 초과, 잠금 없이 진행합니다 (%s)", key)
+        try:
+            yield handle is not None
+        finally:
+            if handle is not None:
+                with contextlib.suppress(OSError):
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+                handle.close()
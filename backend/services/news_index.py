@@ -0,0 +1,224 @@
+"""
+Ingestion-time deduplication of news articles.
+
+The same wire story reaches us through several RSS feeds and once per Google News query,
+usually under slightly different URLs (tracking parameters, AMP pages, redirect wrappers) and
+often with a "- Source" suffix on the headline. `NewsDedupIndex` recognises those copies:
+
+- URLs are canonicalised (`canonical_url`) and kept in a set.
+- Headlines are normalised and kept in a set for exact matches. Long enough headlines also get
+  a MinHash signature over character 3-grams (works for Korean and English alike), bucketed by
+  `MINHASH_BANDS` bands (locality-sensitive hashing), so only articles sharing a band bucket
+  are compared and each check costs O(1) on average. Candidates are confirmed with the exact
+  Jaccard similarity of their 3-gram sets (>= MIN_JACCARD) and a word-level check: headlines
+  that swap a word for a different one ("beats"/"misses", "상회"/"하회") or differ by a
+  negation are different stories however similar their characters are. Added words
+  ("크게", "off") and inflections or particles (a word that is a prefix of the other) still
+  count as the same story.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import numpy as np
+
+# 16개 밴드 x 4행: Jaccard 0.8인 쌍은 거의 항상, 0.1인 쌍은 0.2% 확률로만 후보가 됨
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+MIN_JACCARD = 0.7
+# 한쪽에만 있으면 뜻이 반대가 되는 단어
+NEGATION_TOKENS = frozenset({"not", "no", "never", "without", "안", "못"})
+# 이보다 짧은 헤드라인은 한 글자 차이가 다른 기사일 수 있으므로 정확히 같을 때만 중복
+MIN_NEAR_DUPLICATE_CHARS = 20
+
+_ROWS = MINHASH_PERMUTATIONS // MINHASH_BANDS
+_PRIME = (1 << 31) - 1
+# 순열 h -> (a * h + b) mod p; a, b, h < 2^31이므로 uint64 안에서 넘치지 않음
+_rng = np.random.default_rng(20261019)
+_PERM_A = _rng.integers(1, _PRIME, MINHASH_PERMUTATIONS, dtype=np.uint64)
+_PERM_B = _rng.integers(0, _PRIME, MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid", "ocid", "cmpid",
+    "ref", "ref_src", "referrer", "feature", "rss", "rssfeed",
+    "outputtype", "amp", "guccounter", "guce_referrer", "guce_referrer_sig", "_ga", "ncid",
+}
+TRACKING_PREFIXES = ("utm_", "itm_", "at_", "__")
+# 목적지 URL을 쿼리 파라미터로 감싸는 리디렉션 주소
+REDIRECT_HOSTS = {"google.com", "news.google.com", "l.facebook.com", "lm.facebook.com", "t.co", "out.reddit.com"}
+REDIRECT_PARAMS = ("url", "u", "q", "dest", "target")
+_HOST_PREFIXES = ("www.", "m.", "amp.", "mobile.")
+
+_SOURCE_SUFFIX = re.compile(r"\s+[-–—|]\s+[^-–—|]{1,40}$")
+_LEADING_TAGS = re.compile(r"^(\s*[\[【(<][^\]】)>]{1,12}[\]】)>]\s*)+")
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def _strip_host(host: str) -> str:
+    host = host.lower().rstrip(".")
+    if host.endswith(":80") or host.endswith(":443"):
+        host = host.rsplit(":", 1)[0]
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix) and host.count(".") > 1:
+            return host[len(prefix):]
+    return host
+
+
+def _unwrap_redirect(parts) -> Optional[str]:
+    if _strip_host(parts.hostname or "") not in REDIRECT_HOSTS:
+        return None
+    params = dict(parse_qsl(parts.query, keep_blank_values=False))
+    for name in REDIRECT_PARAMS:
+        target = params.get(name, "")
+        if target.startswith(("http://", "https://")):
+            return target
+    return None
+
+
+def canonical_url(url: str) -> str:
+    """
+    Canonical form of an article URL for duplicate checks (not for fetching).
+
+    Unwraps known redirect wrappers, drops the scheme, www/m/amp host prefixes, fragments,
+    tracking parameters and AMP path markers, and sorts the remaining query parameters.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    for _ in range(3):  # 리디렉션이 겹쳐 있는 경우
+        target = _unwrap_redirect(parts)
+        if target is None:
+            break
+        parts = urlsplit(target)
+
+    host = _strip_host(parts.hostname or "")
+    path = re.sub(r"/+", "/", parts.path or "/")
+    # AMP 페이지: /amp, /amp/ 경로 조각과 .amp(.html) 확장자
+    path = re.sub(r"/amp(?=/|$)", "", path)
+    path = re.sub(r"\.amp(?=\.html?$|$)", "", path)
+    path = path.rstrip("/") or "/"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    canonical = f"{host}{path}"
+    return f"{canonical}?{urlencode(query)}" if query else canonical
+
+
+def normalize_headline(headline: str) -> str:
+    """Lower-cased headline without the "- Source" suffix, leading [tags] and punctuation."""
+    text = unicodedata.normalize("NFKC", headline or "").strip()
+    text = _SOURCE_SUFFIX.sub("", text)
+    text = _LEADING_TAGS.sub("", text)
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def shingles(text: str) -> FrozenSet[str]:
+    compact = re.sub(r"\s+", " ", text)
+    return frozenset(compact[i:i + 3] for i in range(max(1, len(compact) - 2)))
+
+
+def minhash(grams: FrozenSet[str]) -> np.ndarray:
+    """MINHASH_PERMUTATIONS minimum hash values of the 3-gram set."""
+    digests = b"".join(hashlib.blake2b(gram.encode("utf-8"), digest_size=4).digest() for gram in grams)
+    values = np.frombuffer(digests, dtype=">u4").astype(np.uint64) % _PRIME
+    return ((values[:, None] * _PERM_A + _PERM_B) % _PRIME).min(axis=0)
+
+
+def _same_word(word: str, other: str) -> bool:
+    """Inflection/particle variants ("market"/"markets", "삼성전자"/"삼성전자가"); numbers must match exactly."""
+    if any(c.isdigit() for c in word + other):
+        return word == other
+    return word.startswith(other) or other.startswith(word)
+
+
+def _word_conflict(words: FrozenSet[str], other: FrozenSet[str]) -> bool:
+    """True when each headline has a word the other lacks (a substitution) or only one has a negation."""
+    only, only_other = words - other, other - words
+    if (only | only_other) & NEGATION_TOKENS:
+        return True
+    unmatched = [w for w in only if not any(_same_word(w, o) for o in only_other)]
+    unmatched_other = [o for o in only_other if not any(_same_word(o, w) for w in only)]
+    return bool(unmatched) and bool(unmatched_other)
+
+
+def _bands(signature: np.ndarray) -> List[Tuple[int, bytes]]:
+    return [(band, signature[band * _ROWS:(band + 1) * _ROWS].tobytes()) for band in range(MINHASH_BANDS)]
+
+
+class NewsDedupIndex:
+    """
+    Remembers the articles seen so far and reports whether a new one is a duplicate.
+
+    An article is a duplicate when its canonical URL or normalised headline was seen before, or
+    when its headline's 3-gram Jaccard similarity to a seen one is at least MIN_JACCARD and
+    the two headlines do not differ by a substituted word or a negation.
+    """
+
+    def __init__(self) -> None:
+        self._urls: Set[str] = set()
+        self._headlines: Set[str] = set()
+        self._shingles: List[FrozenSet[str]] = []
+        self._words: List[FrozenSet[str]] = []
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _near_duplicate(self, signature: np.ndarray, grams: FrozenSet[str], words: FrozenSet[str]) -> bool:
+        checked = set()
+        for key in _bands(signature):
+            for index in self._buckets.get(key, ()):
+                if index in checked:
+                    continue
+                checked.add(index)
+                other = self._shingles[index]
+                if len(grams & other) >= MIN_JACCARD * len(grams | other) and not _word_conflict(words, self._words[index]):
+                    return True
+        return False
+
+    def _check(self, url: str, headline: str):
+        """(중복 여부, 정규화 URL, 정규화 헤드라인, 3-gram, 단어, MinHash) — 등록할 때 다시 계산하지 않도록 함께 반환"""
+        canonical = canonical_url(url)
+        if canonical and canonical in self._urls:
+            return True, canonical, "", None, None, None
+        normalized = normalize_headline(headline)
+        if not normalized:
+            return False, canonical, normalized, None, None, None
+        if normalized in self._headlines:
+            return True, canonical, normalized, None, None, None
+        if len(normalized) < MIN_NEAR_DUPLICATE_CHARS:
+            return False, canonical, normalized, None, None, None
+        grams = shingles(normalized)
+        words = frozenset(normalized.split())
+        signature = minhash(grams)
+        return self._near_duplicate(signature, grams, words), canonical, normalized, grams, words, signature
+
+    def is_duplicate(self, url: str, headline: str) -> bool:
+        return self._check(url, headline)[0]
+
+    def add(self, url: str, headline: str) -> bool:
+        """Register the article; returns False (and registers nothing) when it is a duplicate."""
+        duplicate, canonical, normalized, grams, words, signature = self._check(url, headline)
+        if duplicate:
+            return False
+        if canonical:
+            self._urls.add(canonical)
+        if normalized:
+            self._headlines.add(normalized)
+        if signature is not None:
+            self._shingles.append(grams)
+            self._words.append(words)
+            for key in _bands(signature):
+                self._buckets.setdefault(key, []).append(len(self._shingles) - 1)
+        self._count += 1
+        return True
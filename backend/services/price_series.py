@@ -0,0 +1,124 @@
+"""
+Typed daily price series for provider data that is maintained incrementally.
+
+DailySeries keeps one NumPy array per field, sorted by date (oldest first), so that a
+full-history backfill can be extended with small compact updates merged by date instead
+of re-downloading and re-parsing the whole history.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+# Alpha Vantage TIME_SERIES_DAILY_ADJUSTED 필드 매핑
+ALPHA_FIELDS = {
+    "open": "1. open",
+    "high": "2. high",
+    "low": "3. low",
+    "close": "4. close",
+    "adjusted_close": "5. adjusted close",
+    "volume": "6. volume",
+}
+VALUE_FIELDS = tuple(ALPHA_FIELDS)
+
+
+@dataclass(frozen=True)
+class DailySeries:
+    dates: np.ndarray  # datetime64[D], ascending
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    adjusted_close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @classmethod
+    def from_alpha_payload(cls, series_raw: Mapping[str, Mapping[str, str]]) -> "DailySeries":
+        """
+        Parse the "Time Series (Daily)" object of an Alpha Vantage response in bulk.
+
+        Rows with an unparsable date or missing OHLCV values are dropped; a missing
+        adjusted close falls back to the close.
+        """
+        frame = pd.DataFrame.from_dict(series_raw, orient="index")
+        if frame.empty:
+            return cls._from_columns(np.array([], dtype="datetime64[D]"), {})
+
+        dates = pd.to_datetime(frame.index, format="%Y-%m-%d", errors="coerce")
+        columns = {}
+        for field, key in ALPHA_FIELDS.items():
+            if key in frame.columns:
+                columns[field] = pd.to_numeric(frame[key], errors="coerce").to_numpy(dtype=np.float64)
+            else:
+                columns[field] = np.full(len(frame), np.nan)
+        columns["adjusted_close"] = np.where(
+            np.isnan(columns["adjusted_close"]), columns["close"], columns["adjusted_close"]
+        )
+
+        valid = ~np.asarray(dates.isna())
+        for field in VALUE_FIELDS:
+            valid &= ~np.isnan(columns[field])
+
+        day_values = dates[valid].to_numpy(dtype="datetime64[D]")
+        order = np.argsort(day_values, kind="stable")
+        return cls._from_columns(
+            day_values[order],
+            {field: values[valid][order] for field, values in columns.items()},
+        )
+
+    @classmethod
+    def _from_columns(cls, dates: np.ndarray, columns: Mapping[str, np.ndarray]) -> "DailySeries":
+        empty = np.array([], dtype=np.float64)
+        return cls(dates=dates, **{field: columns.get(field, empty) for field in VALUE_FIELDS})
+
+    def merge(self, update: "DailySeries") -> "DailySeries":
+        """Return a new series where rows from `update` replace rows with the same date."""
+        if len(update) == 0:
+            return self
+        if len(self) == 0:
+            return update
+
+        dates = np.concatenate([update.dates, self.dates])
+        # np.unique은 첫 번째 등장 위치를 돌려주므로 update 쪽 값이 우선한다
+        unique_dates, first_index = np.unique(dates, return_index=True)
+        return DailySeries._from_columns(
+            unique_dates,
+            {
+                field: np.concatenate([getattr(update, field), getattr(self, field)])[first_index]
+                for field in VALUE_FIELDS
+            },
+        )
+
+    def tail(self, count: int) -> "DailySeries":
+        start = len(self) - min(max(count, 0), len(self))
+        return DailySeries._from_columns(
+            self.dates[start:], {field: getattr(self, field)[start:] for field in VALUE_FIELDS}
+        )
+
+    def timestamps(self) -> np.ndarray:
+        """UTC midnight of each date as epoch seconds."""
+        return self.dates.astype("datetime64[s]").astype(np.int64)
+
+    def datetime_at(self, index: int) -> dt.datetime:
+        epoch = int(self.dates[index].astype("datetime64[s]").astype(np.int64))
+        return dt.datetime.fromtimestamp(epoch, tz=dt.timezone.utc)
+
+    def last_date(self) -> dt.date:
+        return self.dates[-1].astype(dt.date)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as fh:
+            np.savez(fh, dates=self.dates, **{field: getattr(self, field) for field in VALUE_FIELDS})
+
+    @classmethod
+    def load(cls, path: str) -> "DailySeries":
+        with np.load(path) as data:
+            return cls._from_columns(data["dates"], {field: data[field] for field in VALUE_FIELDS})
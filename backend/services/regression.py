@@ -0,0 +1,88 @@
+"""
+Rolling least-squares line fits.
+
+`rolling_linregress(y, window)` fits y = intercept + slope * x over every trailing window,
+with x = 0 .. window-1 inside each window (so the intercept is the fitted value at the
+window's first bar, as with np.polyfit on the window alone). All sums come from cumulative
+sums, so every window position costs O(1) and the whole series is O(n).
+
+Trend lines, triangle pattern checks, the signal series and the trend backtest all
+read their slopes from here instead of calling np.polyfit per window.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class RollingFit(NamedTuple):
+    """Per-bar fit of the window ending at that bar; NaN until the window is full."""
+
+    slope: np.ndarray
+    intercept: np.ndarray
+    r2: np.ndarray
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    csum = np.concatenate([[0.0], np.cumsum(values)])
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1:] = csum[window:] - csum[:-window]
+    return out
+
+
+def rolling_linregress(y: np.ndarray, window: int) -> RollingFit:
+    """
+    Slope, intercept and R² of the least-squares line through each trailing `window`.
+
+    Windows containing NaN yield NaN. A perfectly flat window has R² = 1 (zero residuals).
+    """
+    if window < 2:
+        raise ValueError("window must be at least 2")
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    valid = ~np.isnan(y)
+    # 누적합의 상쇄 오차를 줄이기 위해 평균을 빼고 계산 (기울기·R²는 평행 이동에 불변)
+    offset = float(y[valid].mean()) if valid.any() else 0.0
+    centered = np.where(valid, y - offset, 0.0)
+    position = np.arange(n, dtype=np.float64)
+
+    count = _window_sums(valid.astype(np.float64), window)
+    sum_y = _window_sums(centered, window)
+    sum_yy = _window_sums(centered * centered, window)
+    # 창 안의 x(0..window-1) 기준으로 바꾸기: sum((j - start) * y_j) = sum(j * y_j) - start * sum(y_j)
+    start = position - (window - 1)
+    sum_xy = _window_sums(position * centered, window) - start * sum_y
+
+    sum_x = window * (window - 1) / 2
+    sxx = window * (window * window - 1) / 12  # sum((x - mean_x)^2)
+    sxy = sum_xy - sum_x * sum_y / window
+    syy = np.clip(sum_yy - sum_y * sum_y / window, 0.0, None)
+
+    slope = sxy / sxx
+    intercept = (sum_y - slope * sum_x) / window + offset
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = np.where(syy > 0, np.minimum(sxy * sxy / (sxx * syy), 1.0), 1.0)
+
+    full = count == window
+    return RollingFit(
+        slope=np.where(full, slope, np.nan),
+        intercept=np.where(full, intercept, np.nan),
+        r2=np.where(full, r2, np.nan),
+    )
+
+
+def last_linregress(y: np.ndarray, window: int) -> RollingFit:
+    """Fit of the last `window` values only (scalars wrapped as 1-element arrays)."""
+    y = np.asarray(y, dtype=np.float64)[-window:]
+    fit = rolling_linregress(y, window)
+    return RollingFit(fit.slope[-1:], fit.intercept[-1:], fit.r2[-1:])
+
+
+def trend_types(slope: np.ndarray) -> np.ndarray:
+    """'uptrend' / 'downtrend' / 'sideways' per slope (NaN counts as sideways)."""
+    slope = np.asarray(slope, dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        return np.where(slope > 0, "uptrend", np.where(slope < 0, "downtrend", "sideways")).astype(object)
@@ -0,0 +1,270 @@
+"""
+Market-wide technical screener.
+
+A PriceMatrix holds a universe's daily closes and volumes as aligned (symbols x dates)
+arrays. Indicators are computed for every symbol at once with 2-D NumPy operations along
+the date axis and memoised per matrix, so a screen is a handful of vectorised comparisons
+no matter how large the universe is.
+
+Screens are condition trees made of plain dicts:
+
+    {"all": [
+        {"indicator": "rsi", "period": 14, "op": "<", "value": 30},
+        {"indicator": "golden_cross", "fast": 5, "slow": 20, "within": 1},
+    ]}
+
+- "all" / "any" nodes combine child conditions with AND / OR.
+- Comparison leaves compare an indicator with a constant ("value") or with another
+  indicator ("ref"), e.g. {"indicator": "close", "op": ">", "ref": {"indicator": "sma", "period": 60}}.
+- Event leaves ("golden_cross", "dead_cross") match when the fast SMA crossed the slow
+  SMA within the last `within` sessions.
+
+Conditions are evaluated at the last date in the matrix. Invalid trees raise ValueError.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+COMPARISON_OPS = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+}
+# 지표 이름 -> (기본 파라미터)
+INDICATOR_DEFAULTS: Dict[str, Dict[str, int]] = {
+    "close": {},
+    "volume": {},
+    "change": {"period": 1},
+    "sma": {"period": 20},
+    "rsi": {"period": 14},
+    "volume_ratio": {"period": 20},
+}
+CROSS_EVENTS = ("golden_cross", "dead_cross")
+MAX_PERIOD = 250
+MAX_DEPTH = 8
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing mean over the last axis, like pandas rolling(window).mean() per row.
+
+    Windows that contain a NaN (or are not yet full) are NaN.
+    """
+    filled = np.nan_to_num(values, nan=0.0)
+    valid = (~np.isnan(values)).astype(np.int64)
+    zeros = np.zeros(values.shape[:-1] + (1,))
+    csum = np.concatenate([zeros, np.cumsum(filled, axis=-1)], axis=-1)
+    ccount = np.concatenate([zeros.astype(np.int64), np.cumsum(valid, axis=-1)], axis=-1)
+
+    out = np.full(values.shape, np.nan)
+    if window <= values.shape[-1]:
+        sums = csum[..., window:] - csum[..., :-window]
+        counts = ccount[..., window:] - ccount[..., :-window]
+        out[..., window - 1:] = np.where(counts == window, sums / window, np.nan)
+    return out
+
+
+def rsi(closes: np.ndarray, period: int) -> np.ndarray:
+    """Row-wise RSI with the simple-average definition used by app.calculate_rsi."""
+    delta = np.diff(closes, axis=-1, prepend=np.nan)
+    # calculate_rsi처럼 첫 봉(직전 종가 없음)은 상승/하락폭 0으로 취급
+    gains = np.where(np.isnan(closes), np.nan, np.where(delta > 0, delta, 0.0))
+    losses = np.where(np.isnan(closes), np.nan, np.where(delta < 0, -delta, 0.0))
+    avg_gain = rolling_mean(gains, period)
+    avg_loss = rolling_mean(losses, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+@dataclass
+class PriceMatrix:
+    universe: str
+    tickers: np.ndarray
+    dates: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    built_at: float = field(default_factory=time.time)
+    _indicators: Dict[Tuple[str, int], np.ndarray] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(
+        cls,
+        universe: str,
+        tickers: Sequence[str],
+        closes: pd.DataFrame,
+        volumes: pd.DataFrame,
+    ) -> "PriceMatrix":
+        """
+        Build from (dates x tickers) frames whose columns are in the same order as `tickers`.
+
+        Suspended sessions carry the previous close forward (with zero volume) so every
+        row shares one date axis; dates before a symbol's first close stay NaN.
+        """
+        closes = closes.sort_index()
+        volumes = volumes.reindex(index=closes.index, columns=closes.columns)
+        volumes = volumes.where(closes.notna(), 0.0).fillna(0.0)
+        closes = closes.ffill()
+        return cls(
+            universe=universe,
+            tickers=np.asarray(tickers, dtype=object),
+            dates=closes.index.to_numpy(dtype="datetime64[D]"),
+            close=closes.to_numpy(dtype=np.float64).T.copy(),
+            volume=volumes.to_numpy(dtype=np.float64).T.copy(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # 스냅샷으로 공유할 때 지표 메모는 제외
+        state = self.__dict__.copy()
+        state["_indicators"] = {}
+        return state
+
+    @property
+    def as_of(self) -> Any:
+        return self.dates[-1] if len(self.dates) else None
+
+    def indicator(self, name: str, period: int = 0) -> np.ndarray:
+        """(symbols x dates) values of one indicator, computed once per matrix."""
+        key = (name, period)
+        cached = self._indicators.get(key)
+        if cached is not None:
+            return cached
+
+        if name == "close":
+            values = self.close
+        elif name == "volume":
+            values = self.volume
+        elif name == "sma":
+            values = rolling_mean(self.close, period)
+        elif name == "rsi":
+            values = rsi(self.close, period)
+        elif name == "change":
+            previous = np.full(self.close.shape, np.nan)
+            previous[:, period:] = self.close[:, :-period]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = (self.close / previous - 1) * 100
+        elif name == "volume_ratio":
+            # 오늘 거래량 / 직전 period일 평균 거래량
+            average = np.full(self.volume.shape, np.nan)
+            average[:, 1:] = rolling_mean(self.volume, period)[:, :-1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = self.volume / average
+        else:
+            raise ValueError(f"Unknown indicator: {name}")
+
+        self._indicators[key] = values
+        return values
+
+    def screen(self, conditions: Mapping[str, Any]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Evaluate a condition tree at the last date.
+
+        Returns a boolean mask over tickers and the last-date values of every indicator
+        referenced by the tree, keyed by label (e.g. "rsi_14").
+        """
+        if len(self.dates) == 0:
+            return np.zeros(len(self), dtype=bool), {}
+        values: Dict[str, np.ndarray] = {}
+        mask = self._evaluate(conditions, values, depth=0)
+        return mask, values
+
+    def _evaluate(self, node: Mapping[str, Any], values: Dict[str, np.ndarray], depth: int) -> np.ndarray:
+        if not isinstance(node, Mapping):
+            raise ValueError("Each condition must be an object")
+        if depth > MAX_DEPTH:
+            raise ValueError(f"Conditions may be nested at most {MAX_DEPTH} levels deep")
+
+        for combinator, reduce in (("all", np.logical_and), ("any", np.logical_or)):
+            if combinator in node:
+                children = node[combinator]
+                if not isinstance(children, list) or not children:
+                    raise ValueError(f'"{combinator}" must be a non-empty list of conditions')
+                masks = [self._evaluate(child, values, depth + 1) for child in children]
+                return reduce.reduce(masks)
+
+        name = node.get("indicator")
+        if name in CROSS_EVENTS:
+            return self._cross(node, values)
+
+        current = self._last_values(node, values)
+        op = COMPARISON_OPS.get(node.get("op"))
+        if op is None:
+            raise ValueError(f"Unsupported operator: {node.get('op')!r} (use one of {', '.join(COMPARISON_OPS)})")
+        if "ref" in node:
+            target = self._last_values(node["ref"], values)
+        elif isinstance(node.get("value"), (int, float)):
+            target = float(node["value"])
+        else:
+            raise ValueError(f"Condition on {name} needs a numeric \"value\" or a \"ref\" indicator")
+
+        with np.errstate(invalid="ignore"):
+            return op(current, target)  # NaN 비교는 False
+
+    def _last_values(self, spec: Mapping[str, Any], values: Dict[str, np.ndarray]) -> np.ndarray:
+        if not isinstance(spec, Mapping):
+            raise ValueError("Indicator reference must be an object")
+        name = spec.get("indicator")
+        if name not in INDICATOR_DEFAULTS:
+            raise ValueError(f"Unknown indicator: {name!r}")
+        label = name
+        period = 0
+        if "period" in INDICATOR_DEFAULTS[name]:
+            period = _period(spec.get("period", INDICATOR_DEFAULTS[name]["period"]))
+            label = f"{name}_{period}"
+        last = self.indicator(name, period)[:, -1]
+        values[label] = last
+        return last
+
+    def _cross(self, node: Mapping[str, Any], values: Dict[str, np.ndarray]) -> np.ndarray:
+        fast = _period(node.get("fast", 5))
+        slow = _period(node.get("slow", 20))
+        within = _period(node.get("within", 1))
+        if fast >= slow:
+            raise ValueError('"fast" must be shorter than "slow"')
+
+        fast_ma = self.indicator("sma", fast)[:, -(within + 1):]
+        slow_ma = self.indicator("sma", slow)[:, -(within + 1):]
+        above = fast_ma > slow_ma
+        below = fast_ma < slow_ma
+        if node["indicator"] == "golden_cross":
+            crossed = ~above[:, :-1] & above[:, 1:]
+        else:
+            crossed = ~below[:, :-1] & below[:, 1:]
+        # NaN 구간(이동평균 미형성)에서 생기는 가짜 교차는 제외
+        formed = ~np.isnan(fast_ma[:, :-1]) & ~np.isnan(slow_ma[:, :-1])
+        values[f"sma_{fast}"] = fast_ma[:, -1]
+        values[f"sma_{slow}"] = slow_ma[:, -1]
+        return (crossed & formed).any(axis=1)
+
+    def results(self, mask: np.ndarray, values: Mapping[str, np.ndarray], limit: int) -> List[Dict[str, Any]]:
+        """Matched tickers (in universe order) with their close, 1-day change and indicator values."""
+        rows = np.flatnonzero(mask)[:limit]
+        change = self.indicator("change", 1)[:, -1]
+        return [
+            {
+                "ticker": str(self.tickers[row]),
+                "close": float(self.close[row, -1]),
+                "change_pct": _finite_or_none(change[row]),
+                "values": {label: _finite_or_none(column[row]) for label, column in values.items()},
+            }
+            for row in rows
+        ]
+
+
+def _period(value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or not 1 <= value <= MAX_PERIOD:
+        raise ValueError(f"Periods must be integers between 1 and {MAX_PERIOD}, got {value!r}")
+    return value
+
+
+def _finite_or_none(value: float) -> Any:
+    return float(value) if np.isfinite(value) else None
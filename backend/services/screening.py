@@ -0,0 +1,101 @@
+"""
+Universe-scale factor screening.
+
+A FactorMatrix holds one row per ticker and one column per factor (momentum, volatility,
+revenue growth, EPS growth), z-scored once when the matrix is built. Ranking with a user's
+weights is then a single matrix-vector product followed by a top-k partial sort, so even a
+2,000-ticker universe can be re-ranked per request.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+FACTOR_NAMES = ("momentum", "volatility", "revenue_growth", "eps_growth")
+STD_TOLERANCE = 1e-12
+
+
+def compute_price_factors(closes: pd.DataFrame) -> pd.DataFrame:
+    """
+    Momentum and volatility for every column of a (dates x tickers) close-price frame.
+
+    Matches the per-ticker definitions used by /api/recommendations: momentum is
+    last / first - 1 over the available history and volatility is the sample standard
+    deviation of daily returns.
+    """
+    first = closes.bfill().iloc[0]
+    last = closes.ffill().iloc[-1]
+    # 결측 구간을 건너뛰고 실제 거래일 사이의 수익률만 사용
+    volatility = closes.apply(lambda column: column.dropna().pct_change().std())
+    return pd.DataFrame({
+        "momentum": last / first - 1,
+        "volatility": volatility,
+    })
+
+
+def _zscore_columns(raw: np.ndarray) -> np.ndarray:
+    """Column-wise z-scores (ddof=0). Missing values score as the column mean."""
+    mean = np.nanmean(raw, axis=0)
+    std = np.nanstd(raw, axis=0)
+    # 상수 열도 부동소수 오차로 1e-17 정도의 표준편차가 나오므로 값의 크기 대비로 판단
+    varies = std > STD_TOLERANCE * np.maximum(np.abs(mean), 1.0)
+    safe_std = np.where(varies, std, 1.0)
+    zscores = (raw - mean) / safe_std
+    zscores[:, ~varies] = 0.0
+    return np.nan_to_num(zscores, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+@dataclass(frozen=True)
+class FactorMatrix:
+    universe: str
+    tickers: np.ndarray
+    raw: np.ndarray
+    zscores: np.ndarray
+    built_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def build(cls, universe: str, tickers: Sequence[str], raw: np.ndarray) -> "FactorMatrix":
+        raw = np.asarray(raw, dtype=np.float64).reshape(len(tickers), len(FACTOR_NAMES))
+        return cls(
+            universe=universe,
+            tickers=np.asarray(tickers, dtype=object),
+            raw=raw,
+            zscores=_zscore_columns(raw),
+        )
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def rank(self, weights: Mapping[str, float], top_k: int) -> List[Dict[str, float]]:
+        """
+        Score every ticker with the given factor weights and return the best `top_k`.
+
+        Returns dicts shaped like rank_recommendations() output, sorted by score.
+        """
+        missing = set(FACTOR_NAMES) - set(weights)
+        if missing:
+            raise ValueError(f"Missing weights for factors: {', '.join(sorted(missing))}")
+        if len(self) == 0 or top_k <= 0:
+            return []
+
+        weight_vector = np.array([weights[name] for name in FACTOR_NAMES], dtype=np.float64)
+        scores = self.zscores @ weight_vector
+
+        k = min(top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        raw = np.nan_to_num(self.raw[top], nan=0.0)
+        return [
+            {
+                "ticker": str(self.tickers[row]),
+                "composite_score": float(scores[row]),
+                **{name: float(raw[i, col]) for col, name in enumerate(FACTOR_NAMES)},
+            }
+            for i, row in enumerate(top)
+        ]
@@ -0,0 +1,244 @@
+"""
+Vectorized indicator parameter sweeps.
+
+app.py's indicator functions use fixed defaults (RSI 14, MACD 12/26/9, Bollinger 20/2,
+MA 5/20/60/120). A sweep evaluates a whole grid of alternatives against one price history:
+
+1. Indicator values for every parameter set are built as a (combinations x bars) array:
+   rolling means for all windows come from one cumulative sum, EMAs are computed once per
+   distinct span, and MACD signal lines are smoothed column-wise per signal span.
+2. Buy/sell signals are boolean (combinations x bars) masks using the same rules as the
+   reliability backtests (RSI below/above thresholds, MACD and MA crosses, band touches).
+3. Each signal is scored against the forward return `horizon` bars later, so hit counts
+   and summed returns for all combinations are a few reductions along the bar axis.
+
+Per-symbol statistics (`sweep_symbol`) are plain lists so they can be cached as JSON and
+summed across symbols before ranking (`rank_parameters`).
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+SWEEP_INDICATORS = ("rsi", "macd", "bollinger", "ma_cross")
+DEFAULT_GRIDS: Dict[str, Dict[str, List[float]]] = {
+    "rsi": {"period": [6, 9, 14, 21, 28], "lower": [20, 25, 30, 35], "upper": [65, 70, 75, 80]},
+    "macd": {"fast": [5, 8, 12, 16], "slow": [20, 26, 35], "signal": [5, 9, 12]},
+    "bollinger": {"period": [10, 15, 20, 25, 30], "std_dev": [1.5, 2, 2.5, 3]},
+    "ma_cross": {"fast": [3, 5, 10, 20], "slow": [20, 30, 60, 120]},
+}
+# 정수여야 하는 파라미터 (기간)
+INTEGER_PARAMS = {"period", "fast", "slow", "signal"}
+MAX_COMBINATIONS = 2000
+MAX_WINDOW = 500
+
+
+def expand_grid(indicator: str, grid: Optional[Mapping[str, Sequence[float]]] = None) -> List[Dict[str, float]]:
+    """
+    All parameter combinations for `indicator`. Missing grid keys use DEFAULT_GRIDS;
+    combinations that make no sense (fast >= slow, lower >= upper) are skipped.
+
+    Raises ValueError for unknown indicators or parameters and oversized grids.
+    """
+    if indicator not in SWEEP_INDICATORS:
+        raise ValueError(f"Unknown indicator: {indicator!r} (use one of {', '.join(SWEEP_INDICATORS)})")
+    defaults = DEFAULT_GRIDS[indicator]
+    grid = dict(grid or {})
+    unknown = set(grid) - set(defaults)
+    if unknown:
+        raise ValueError(f"Unknown {indicator} parameters: {', '.join(sorted(unknown))}")
+
+    names = list(defaults)
+    axes = []
+    for name in names:
+        values = grid.get(name, defaults[name])
+        if not values:
+            raise ValueError(f"{name} needs at least one value")
+        if name in INTEGER_PARAMS:
+            if any(float(v) != int(v) or not 1 <= int(v) <= MAX_WINDOW for v in values):
+                raise ValueError(f"{name} values must be integers between 1 and {MAX_WINDOW}")
+            values = sorted({int(v) for v in values})
+        else:
+            values = sorted({float(v) for v in values})
+        axes.append(values)
+
+    combos = []
+    for values in itertools.product(*axes):
+        params = dict(zip(names, values))
+        if "fast" in params and params["fast"] >= params["slow"]:
+            continue
+        if "lower" in params and params["lower"] >= params["upper"]:
+            continue
+        combos.append(params)
+    if not combos:
+        raise ValueError("The grid has no valid parameter combinations")
+    if len(combos) > MAX_COMBINATIONS:
+        raise ValueError(f"The grid has {len(combos)} combinations (max {MAX_COMBINATIONS})")
+    return combos
+
+
+def rolling_mean_grid(values: np.ndarray, windows: Sequence[int]) -> np.ndarray:
+    """(len(windows) x bars) trailing means; NaN until each window is full."""
+    windows = np.asarray(windows, dtype=np.int64)
+    n = len(values)
+    csum = np.concatenate([[0.0], np.cumsum(values)])
+    end = np.arange(1, n + 1)
+    start = end[None, :] - windows[:, None]
+    sums = csum[end][None, :] - csum[np.clip(start, 0, None)]
+    return np.where(start >= 0, sums / windows[:, None], np.nan)
+
+
+def rolling_std_grid(values: np.ndarray, windows: Sequence[int]) -> np.ndarray:
+    """Sample standard deviation (ddof=1) for every window, like rolling().std()."""
+    windows = np.asarray(windows, dtype=np.float64)
+    # 큰 가격에서 제곱합 상쇄 오차를 줄이기 위해 평균을 빼고 계산
+    centered = values - values.mean()
+    mean = rolling_mean_grid(centered, windows.astype(np.int64))
+    mean_sq = rolling_mean_grid(centered * centered, windows.astype(np.int64))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        variance = (mean_sq - mean * mean) * windows[:, None] / (windows[:, None] - 1)
+    return np.sqrt(np.clip(variance, 0.0, None))
+
+
+def rsi_grid(close: np.ndarray, periods: Sequence[int]) -> np.ndarray:
+    """(len(periods) x bars) RSI with the simple-average definition of calculate_rsi."""
+    delta = np.diff(close, prepend=np.nan)
+    gains = np.where(delta > 0, delta, 0.0)
+    losses = np.where(delta < 0, -delta, 0.0)
+    avg_gain = rolling_mean_grid(gains, periods)
+    avg_loss = rolling_mean_grid(losses, periods)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+def _ema(close: np.ndarray, span: int) -> np.ndarray:
+    return pd.Series(close).ewm(span=span, adjust=False).mean().to_numpy()
+
+
+def macd_grid(close: np.ndarray, combos: Sequence[Mapping[str, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """(combinations x bars) MACD and signal lines, matching calculate_macd."""
+    spans = sorted({int(c["fast"]) for c in combos} | {int(c["slow"]) for c in combos})
+    emas = {span: _ema(close, span) for span in spans}
+    lines = np.array([emas[int(c["fast"])] - emas[int(c["slow"])] for c in combos])
+
+    signals = np.empty_like(lines)
+    by_signal: Dict[int, List[int]] = {}
+    for row, combo in enumerate(combos):
+        by_signal.setdefault(int(combo["signal"]), []).append(row)
+    for span, rows in by_signal.items():
+        # 같은 signal 기간끼리 묶어 열 단위로 한 번에 평활화
+        signals[rows] = pd.DataFrame(lines[rows].T).ewm(span=span, adjust=False).mean().to_numpy().T
+    return lines, signals
+
+
+def _crosses(fast: np.ndarray, slow: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    up = np.zeros(fast.shape, dtype=bool)
+    down = np.zeros(fast.shape, dtype=bool)
+    with np.errstate(invalid="ignore"):
+        up[:, 1:] = (fast[:, :-1] <= slow[:, :-1]) & (fast[:, 1:] > slow[:, 1:])
+        down[:, 1:] = (fast[:, :-1] >= slow[:, :-1]) & (fast[:, 1:] < slow[:, 1:])
+    return up, down
+
+
+def sweep_signals(indicator: str, close: np.ndarray, combos: Sequence[Mapping[str, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Boolean (combinations x bars) buy and sell masks."""
+    with np.errstate(invalid="ignore"):
+        if indicator == "rsi":
+            periods = sorted({int(c["period"]) for c in combos})
+            values = rsi_grid(close, periods)[[periods.index(int(c["period"])) for c in combos]]
+            lower = np.array([c["lower"] for c in combos])[:, None]
+            upper = np.array([c["upper"] for c in combos])[:, None]
+            return values < lower, values > upper
+
+        if indicator == "macd":
+            return _crosses(*macd_grid(close, combos))
+
+        if indicator == "bollinger":
+            periods = sorted({int(c["period"]) for c in combos})
+            rows = [periods.index(int(c["period"])) for c in combos]
+            middle = rolling_mean_grid(close, periods)[rows]
+            std = rolling_std_grid(close, periods)[rows]
+            width = std * np.array([c["std_dev"] for c in combos])[:, None]
+            return close <= middle - width, close >= middle + width
+
+        if indicator == "ma_cross":
+            windows = sorted({int(c["fast"]) for c in combos} | {int(c["slow"]) for c in combos})
+            means = rolling_mean_grid(close, windows)
+            fast = means[[windows.index(int(c["fast"])) for c in combos]]
+            slow = means[[windows.index(int(c["slow"])) for c in combos]]
+            return _crosses(fast, slow)
+
+    raise ValueError(f"Unknown indicator: {indicator!r}")
+
+
+def forward_returns(close: np.ndarray, horizon: int) -> np.ndarray:
+    """close[i + horizon] / close[i] - 1, NaN for the last `horizon` bars."""
+    out = np.full(len(close), np.nan)
+    if len(close) > horizon:
+        out[:-horizon] = close[horizon:] / close[:-horizon] - 1
+    return out
+
+
+def sweep_symbol(
+    indicator: str, close: Sequence[float], combos: Sequence[Mapping[str, float]], horizon: int
+) -> Dict[str, List[float]]:
+    """
+    Per-combination signal counts, hits and summed signed forward returns (%) for one series.
+
+    A buy hits when price is higher `horizon` bars later and a sell when it is lower; sell
+    returns are counted with the sign flipped so both sides read as "profit if followed".
+    """
+    close = np.asarray(close, dtype=np.float64)
+    close = close[np.isfinite(close)]
+    fwd = forward_returns(close, horizon) * 100
+    buy, sell = sweep_signals(indicator, close, combos)
+    scored = ~np.isnan(fwd)
+    buy &= scored
+    sell &= scored
+    fwd = np.nan_to_num(fwd)
+
+    return {
+        "signals": (buy.sum(axis=1) + sell.sum(axis=1)).tolist(),
+        "hits": ((buy & (fwd > 0)).sum(axis=1) + (sell & (fwd < 0)).sum(axis=1)).tolist(),
+        "return_sum": (buy.astype(np.float64) @ fwd - sell.astype(np.float64) @ fwd).tolist(),
+        "bars": int(len(close)),
+    }
+
+
+def rank_parameters(
+    combos: Sequence[Mapping[str, float]],
+    per_symbol: Sequence[Mapping[str, Any]],
+    top_k: int = 10,
+    min_signals: int = 5,
+) -> List[Dict[str, Any]]:
+    """
+    Pool the per-symbol statistics and rank combinations by hit rate, then average
+    forward return. Combinations with fewer than `min_signals` signals rank last.
+    """
+    signals = np.zeros(len(combos))
+    hits = np.zeros(len(combos))
+    returns = np.zeros(len(combos))
+    for stats in per_symbol:
+        signals += np.asarray(stats["signals"], dtype=np.float64)
+        hits += np.asarray(stats["hits"], dtype=np.float64)
+        returns += np.asarray(stats["return_sum"], dtype=np.float64)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        hit_rate = np.where(signals > 0, hits / signals, 0.0)
+        avg_return = np.where(signals > 0, returns / signals, 0.0)
+    enough = signals >= min_signals
+    # lexsort는 마지막 키가 우선: 신호 수 충족 > 적중률 > 평균 수익률
+    order = np.lexsort((-avg_return, -hit_rate, ~enough))[:top_k]
+    return [
+        {
+            "params": dict(combos[i]),
+            "signals": int(signals[i]),
+            "hit_rate": round(float(hit_rate[i]) * 100, 2),
+            "avg_return": round(float(avg_return[i]), 4),
+        }
+        for i in order
+    ]
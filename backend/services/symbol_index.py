@@ -0,0 +1,185 @@
+"""
+Tagging news articles with the stock symbols they mention.
+
+`AhoCorasick` is a plain multi-pattern automaton: one pass over the text finds every
+occurrence of every pattern, however many patterns there are. `SymbolMatcher` builds one over
+the symbol master (tickers, KRX codes and company names) and turns raw hits into symbols:
+
+- tickers match case-sensitively (so "IT spending" is not Gartner), and a short list of
+  ticker-shaped English words is never used as an alias;
+- Latin company names need proper-noun casing (an upper-case first letter), so "price target"
+  or "market news" are not Target or News Corp; Hangul names match as written;
+- company names that are ordinary words ("대상", "태양", "Target", "News") are only matched by
+  their full listed name ("Target Corporation", "News Corp") or their ticker/code;
+- a hit must not continue a Latin/digit word or (for Hangul names) a Hangul word; Latin/digit
+  aliases must also not run into a following Latin/digit character, while Hangul names may be
+  followed by anything, such as a particle ("삼성전자가");
+- overlapping hits resolve leftmost-longest, so "한화솔루션" does not also tag "한화".
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import Dict, Generic, Iterable, Iterator, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# 대문자 티커와 모양이 같은 흔한 영어 단어/약어 (헤드라인에서 티커로 보지 않음)
+AMBIGUOUS_TICKERS = {
+    "A", "AI", "ALL", "AN", "ARE", "AS", "AT", "BE", "BIG", "CAN", "CEO", "EU", "FOR", "GDP",
+    "GO", "HAS", "IPO", "IT", "KEY", "LOW", "NEW", "NOW", "ON", "ONE", "OR", "OUT", "SO",
+    "TV", "UK", "UP", "US", "USA", "WELL",
+}
+# 종목명이 흔한 단어인 경우 (기사 본문의 일반 단어와 구별할 수 없으므로 전체 상장명/코드로만 태깅)
+COMMON_WORD_NAMES = {
+    # KRX
+    "대상", "태양", "동방", "전방", "대교", "동양", "국보", "대성", "신성", "대원", "우진", "선진",
+    "평화", "미래", "고려", "조선", "남성", "세원", "정상", "광명", "신화", "한국", "서울", "진도",
+    # S&P 500 (접미사를 뗀 이름)
+    "ball", "block", "booking", "carrier", "dover", "fox", "match", "mosaic", "news", "pool",
+    "progressive", "southern", "target", "visa", "waters",
+}
+# 태깅 시 대소문자 규칙: 티커는 그대로, 영문 종목명은 첫 글자 대문자, 그 외(한글 등)는 구분 없음
+EXACT, PROPER, ANY = "exact", "proper", "any"
+_NAME_SUFFIXES = re.compile(
+    r"[\s,]+(inc\.?|incorporated|corp\.?|corporation|co\.?|company|ltd\.?|limited|plc|holdings?|"
+    r"group|class [a-c]|\(the\)|n\.?v\.?|s\.?a\.?|ag|se)$",
+    re.IGNORECASE,
+)
+MIN_NAME_CHARS = 2
+
+
+def _is_ascii_alnum(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _is_hangul(ch: str) -> bool:
+    return "가" <= ch <= "힣"
+
+
+class AhoCorasick(Generic[T]):
+    """Multi-pattern exact matcher; `finditer` yields (start, end, value) for every occurrence."""
+
+    def __init__(self, patterns: Iterable[Tuple[str, T]]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, T]]] = [[]]
+        for pattern, value in patterns:
+            if pattern:
+                self._insert(pattern, value)
+        self._link()
+
+    def _insert(self, pattern: str, value: T) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(pattern), value))
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                if node:
+                    fail = self._fail[node]
+                    while fail and ch not in self._goto[fail]:
+                        fail = self._fail[fail]
+                    self._fail[child] = self._goto[fail].get(ch, 0)
+                # 접미사가 같은 더 짧은 패턴의 출력도 함께 보고
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, T]]:
+        node = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for index, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, value in out[node]:
+                yield index + 1 - length, index + 1, value
+
+
+def company_aliases(name: str) -> List[str]:
+    """The name as listed plus its form without corporate suffixes ("Apple Inc." -> "Apple")."""
+    name = " ".join(name.split())
+    aliases = [name]
+    stripped = name
+    while True:
+        shorter = _NAME_SUFFIXES.sub("", stripped).strip(" ,")
+        if shorter == stripped:
+            break
+        stripped = shorter
+    if stripped and stripped != name:
+        aliases.append(stripped)
+    return [alias for alias in aliases if len(alias) >= MIN_NAME_CHARS]
+
+
+class SymbolMatcher:
+    """Finds the symbols a text mentions, using one Aho-Corasick pass over the lower-cased text."""
+
+    def __init__(self, master: Sequence[Tuple[str, str]]) -> None:
+        """`master`: (symbol, company name) pairs, e.g. ("005930", "삼성전자"), ("AAPL", "Apple Inc.")."""
+        self.names: Dict[str, str] = {}
+        patterns: List[Tuple[str, Tuple[str, str, str]]] = []
+        for symbol, name in master:
+            symbol = symbol.strip().upper()
+            if not symbol:
+                continue
+            self.names.setdefault(symbol, name)
+            if symbol.isdigit() or (len(symbol) >= 2 and symbol not in AMBIGUOUS_TICKERS):
+                patterns.append((symbol.lower(), (symbol, symbol, EXACT)))
+            for alias in company_aliases(name or ""):
+                if alias.upper() in AMBIGUOUS_TICKERS or alias.lower() in COMMON_WORD_NAMES:
+                    continue
+                casing = PROPER if _is_ascii_alnum(alias[0]) and alias[0].isalpha() else ANY
+                patterns.append((alias.lower(), (symbol, alias, casing)))
+        self._automaton: AhoCorasick[Tuple[str, str, str]] = AhoCorasick(patterns)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def match(self, text: str) -> List[str]:
+        """Symbols mentioned in `text`, in order of first mention."""
+        if not text:
+            return []
+        lowered = text.lower()
+        if len(lowered) != len(text):  # 소문자 변환으로 길이가 바뀌는 문자가 있으면 위치가 어긋나므로 그대로 둠
+            lowered = "".join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+        hits = []
+        for start, end, (symbol, alias, casing) in self._automaton.finditer(lowered):
+            if casing == EXACT and text[start:end] != alias:
+                continue
+            if casing == PROPER and not text[start].isupper():
+                continue
+            before = text[start - 1] if start > 0 else " "
+            if _is_ascii_alnum(before) or (_is_hangul(before) and _is_hangul(text[start])):
+                continue
+            after = text[end] if end < len(text) else " "
+            if _is_ascii_alnum(after) and not _is_hangul(text[end - 1]):
+                continue
+            hits.append((start, end, symbol))
+
+        # 겹치는 후보는 가장 왼쪽, 그 중 가장 긴 것만
+        hits.sort(key=lambda hit: (hit[0], -hit[1]))
+        symbols: List[str] = []
+        covered = 0
+        for start, end, symbol in hits:
+            if start < covered:
+                continue
+            covered = end
+            if symbol not in symbols:
+                symbols.append(symbol)
+        return symbols
@@ -0,0 +1,135 @@
+"""
+Persistent cache of machine translations.
+
+Rows are keyed by (sha256 of the source text, model name), so a headline translated once by
+any backend is reused across refreshes, restarts and worker processes on the host. SQLite in
+WAL mode lets several workers read while one writes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    text_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    translated TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (text_hash, model)
+)
+"""
+
+
+# Hashes per SELECT, kept well under SQLite's default limit of 999 bound parameters
+_LOOKUP_CHUNK = 500
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class TranslationCache:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def lookup(self, text: str, models: Sequence[str]) -> Optional[Tuple[str, str]]:
+        """
+        Return (model, translation) for the first of `models` that has `text` cached, or None.
+
+        Failures (locked or unreadable database) count as a miss so translation still proceeds.
+        """
+        return self.lookup_many([text], models)[0]
+
+    def lookup_many(self, texts: Sequence[str], models: Sequence[str]) -> List[Optional[Tuple[str, str]]]:
+        """
+        lookup() for many texts at once, aligned with `texts`, in a single read transaction.
+
+        This blocks on the database; callers on the event loop run it with asyncio.to_thread.
+        """
+        results: List[Optional[Tuple[str, str]]] = [None] * len(texts)
+        if not models:
+            return results
+        hashes = {text_hash(text): None for text in texts if text}
+        if not hashes:
+            return results
+        found: dict = {}
+        model_placeholders = ", ".join("?" for _ in models)
+        keys = list(hashes)
+        try:
+            with self._lock:
+                conn = self._connect()
+                for start in range(0, len(keys), _LOOKUP_CHUNK):
+                    chunk = keys[start : start + _LOOKUP_CHUNK]
+                    rows = conn.execute(
+                        "SELECT text_hash, model, translated FROM translations "
+                        f"WHERE text_hash IN ({', '.join('?' for _ in chunk)}) AND model IN ({model_placeholders})",
+                        (*chunk, *models),
+                    ).fetchall()
+                    for digest, model, translated in rows:
+                        found.setdefault(digest, {})[model] = translated
+        except sqlite3.Error as exc:
+            logger.debug(f"Translation cache read failed: {exc}")
+            return results
+        for position, text in enumerate(texts):
+            by_model = found.get(text_hash(text)) if text else None
+            if not by_model:
+                continue
+            for model in models:
+                if model in by_model:
+                    results[position] = (model, by_model[model])
+                    break
+        return results
+
+    def store(self, text: str, model: str, translated: str) -> None:
+        self.store_many([(text, model, translated)])
+
+    def store_many(self, rows: Iterable[Tuple[str, str, str]]) -> None:
+        """Store (text, model, translation) rows in one transaction; empty texts or translations are skipped."""
+        now = time.time()
+        values = [(text_hash(text), model, translated, now) for text, model, translated in rows if text and translated]
+        if not values:
+            return
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO translations (text_hash, model, translated, stored_at) VALUES (?, ?, ?, ?)",
+                        values,
+                    )
+        except sqlite3.Error as exc:
+            logger.warning(f"Translation cache write failed: {exc}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,207 @@
+"""
+배치 차트 분석 검증 스크립트
+
+/api/chart/analyze/batch가 종목마다 /api/chart/analyze와 같은 결과를 NDJSON 한 줄씩 돌려주는지
+(분석은 프로세스 풀에서 수행), 중복 종목은 한 번만 분석하는지, 조회에 실패한 종목은 오류 줄로만
+나오고 나머지 종목의 분석을 막지 않는지, 캔들 동시 조회 수가 BATCH_ANALYSIS_FETCH_CONCURRENCY를
+넘지 않는지, 이 제한이 분석 작업에는 걸리지 않고 지표 계산은 이벤트 루프 밖에서 하는지
+확인합니다. 캔들 조회는 가짜 시계열로 대신합니다.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from fastapi import HTTPException
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+
+DAY = 86400
+SYMBOLS = ["AAPL", "MSFT", "005930", "NVDA", "TSLA", "AMZN"]
+
+
+def _candles(symbol: str, count: int = 150) -> app.CandleResponse:
+    rng = np.random.default_rng(sum(map(ord, symbol)))
+    closes = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.015, count)))
+    start = 1_760_000_000 - 1_760_000_000 % DAY
+    return app.CandleResponse(
+        symbol=symbol,
+        resolution="D",
+        data=app.CandleSeries(
+            timestamps=[start + i * DAY for i in range(count)],
+            opens=list(closes * (1 + rng.normal(0, 0.003, count))),
+            highs=list(closes * 1.012),
+            lows=list(closes * 0.988),
+            closes=list(closes),
+            volumes=list(rng.integers(500_000, 2_000_000, count).astype(float)),
+        ),
+    )
+
+
+class _FakeCandles:
+    """_fetch_analysis_candles 대신: 조회 중인 요청 수의 최댓값을 기록"""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self.fetched = []
+
+    async def __call__(self, symbol, resolution, range_days):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.02)
+            self.fetched.append(symbol)
+            if symbol == "NOPE":
+                raise HTTPException(status_code=404, detail="NOPE 캔들 데이터가 없습니다.")
+            if symbol == "BROKEN":
+                raise RuntimeError("upstream timeout")
+            return _candles(symbol)
+        finally:
+            self.running -= 1
+
+
+async def _collect(payload: app.BatchChartAnalysisRequest) -> dict:
+    response = await app.analyze_chart_batch(payload)
+    lines = {}
+    async for chunk in response.body_iterator:
+        line = json.loads(chunk)
+        assert line["symbol"] not in lines
+        lines[line["symbol"]] = line
+    return lines
+
+
+def _run(scenario):
+    fake = _FakeCandles()
+    original = app._fetch_analysis_candles
+    app._fetch_analysis_candles = fake
+    app.ANALYSIS_CACHE.clear()
+    try:
+        return fake, asyncio.run(scenario())
+    finally:
+        app._fetch_analysis_candles = original
+        app.ANALYSIS_CACHE.clear()
+
+
+def test_batch_matches_single_analysis():
+    payload = app.BatchChartAnalysisRequest(symbols=SYMBOLS + [" AAPL ", "MSFT"], range_days=150)
+
+    async def scenario():
+        batch = await _collect(payload)
+        # 단일 분석은 캐시를 비운 뒤 현재 프로세스에서 다시 계산
+        app.ANALYSIS_CACHE.clear()
+        single = {}
+        for symbol in SYMBOLS:
+            request = app.ChartAnalysisRequest(symbol=symbol, range_days=150)
+            single[symbol] = (await app.analyze_chart_data(request)).model_dump()
+        return batch, single
+
+    fake, (batch, single) = _run(scenario)
+    assert sorted(batch) == sorted(SYMBOLS)
+    for symbol in SYMBOLS:
+        assert "error" not in batch[symbol], batch[symbol]
+        expected = json.loads(json.dumps(single[symbol], ensure_ascii=False))
+        assert batch[symbol]["result"] == expected, symbol
+    # 중복 종목은 한 번만 조회
+    assert sorted(fake.fetched) == sorted(SYMBOLS * 2)
+
+
+def test_failing_symbol_does_not_fail_batch():
+    symbols = ["AAPL", "NOPE", "BROKEN", "MSFT"]
+    fake, lines = _run(lambda: _collect(app.BatchChartAnalysisRequest(symbols=symbols)))
+    assert sorted(lines) == sorted(symbols)
+    assert lines["NOPE"] == {"symbol": "NOPE", "error": "NOPE 캔들 데이터가 없습니다."}
+    assert lines["BROKEN"] == {"symbol": "BROKEN", "error": "upstream timeout"}
+    for symbol in ("AAPL", "MSFT"):
+        assert lines[symbol]["result"]["symbol"] == symbol
+    assert fake.peak <= app.BATCH_ANALYSIS_FETCH_CONCURRENCY
+
+
+def test_fetch_concurrency_and_empty_request():
+    original = app.BATCH_ANALYSIS_FETCH_CONCURRENCY
+    app.BATCH_ANALYSIS_FETCH_CONCURRENCY = 2
+    try:
+        fake, lines = _run(lambda: _collect(app.BatchChartAnalysisRequest(symbols=SYMBOLS)))
+    finally:
+        app.BATCH_ANALYSIS_FETCH_CONCURRENCY = original
+    assert sorted(lines) == sorted(SYMBOLS)
+    assert fake.peak == 2
+
+    try:
+        asyncio.run(app.analyze_chart_batch(app.BatchChartAnalysisRequest(symbols=[" ", ""])))
+    except HTTPException as exc:
+        assert exc.status_code == 400
+    else:
+        raise AssertionError("빈 종목 목록은 400")
+
+
+class _SlowExecutor(ThreadPoolExecutor):
+    """프로세스 풀 대신: 분석 작업마다 0.2초를 더하고 동시에 실행 중인 작업 수의 최댓값을 기록"""
+
+    def __init__(self):
+        super().__init__(max_workers=len(SYMBOLS))
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def submit(self, fn, *args, **kwargs):
+        def tracked():
+            with self.lock:
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+            try:
+                time.sleep(0.2)
+                return fn(*args, **kwargs)
+            finally:
+                with self.lock:
+                    self.running -= 1
+
+        return super().submit(tracked)
+
+
+def test_analysis_is_not_capped_by_fetch_limit():
+    executor = _SlowExecutor()
+    indicator_threads = []
+    originals = (app._analysis_pool, app._latest_indicators, app.BATCH_ANALYSIS_FETCH_CONCURRENCY)
+
+    def latest_indicators(*args):
+        indicator_threads.append(threading.current_thread() is threading.main_thread())
+        return originals[1](*args)
+
+    app._analysis_pool = lambda: executor
+    app._latest_indicators = latest_indicators
+    app.BATCH_ANALYSIS_FETCH_CONCURRENCY = 2
+    try:
+        fake, lines = _run(lambda: _collect(app.BatchChartAnalysisRequest(symbols=SYMBOLS)))
+    finally:
+        app._analysis_pool, app._latest_indicators, app.BATCH_ANALYSIS_FETCH_CONCURRENCY = originals
+        executor.shutdown()
+    assert sorted(lines) == sorted(SYMBOLS)
+    # 조회는 2개씩, 분석은 조회가 끝난 종목 모두 동시에
+    assert fake.peak == 2
+    assert executor.peak > 2, executor.peak
+    # 지표 계산은 이벤트 루프 스레드가 아닌 곳에서
+    assert indicator_threads == [False] * len(SYMBOLS)
+
+
+def teardown_module(module):
+    if app.ANALYSIS_POOL is not None:
+        app.ANALYSIS_POOL.shutdown()
+        app.ANALYSIS_POOL = None
+
+
+if __name__ == "__main__":
+    test_batch_matches_single_analysis()
+    test_failing_symbol_does_not_fail_batch()
+    test_fetch_concurrency_and_empty_request()
+    test_analysis_is_not_capped_by_fetch_limit()
+    teardown_module(None)
+    print("배치 차트 분석 검증 완료")
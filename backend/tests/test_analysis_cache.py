@@ -0,0 +1,147 @@
+"""
+차트 분석 캐시 검증 스크립트
+
+_analyze_symbol이 ANALYSIS_RECHECK_SECONDS 안에서는 캔들을 다시 받지 않고, 그 뒤에는
+마지막 봉이 그대로면 분석을 재사용하며, 타임스탬프가 같아도 형성 중인 봉의 가격이나
+거래량이 바뀌면(장중 일봉) 또는 새 봉이 생기면 다시 분석하는지 확인합니다.
+LRU 상한과 /api/chart/analyze/cache-stats의 적중/미스 집계도 확인합니다.
+"""
+
+import asyncio
+import os
+import sys
+
+import numpy as np
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+
+DAY = 86400
+
+
+def _candles(symbol: str, count: int = 120, seed: int = 0) -> app.CandleResponse:
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, count)))
+    start = 1_760_000_000 - 1_760_000_000 % DAY
+    return app.CandleResponse(
+        symbol=symbol,
+        resolution="D",
+        data=app.CandleSeries(
+            timestamps=[start + i * DAY for i in range(count)],
+            opens=list(closes * 0.995),
+            highs=list(closes * 1.01),
+            lows=list(closes * 0.99),
+            closes=list(closes),
+            volumes=[1_000_000.0 + i for i in range(count)],
+        ),
+    )
+
+
+class _FakeMarket:
+    """_fetch_analysis_candles/_analyze_candles 대신: 현재 캔들을 돌려주고 호출 수를 기록"""
+
+    def __init__(self):
+        self.candles = {}
+        self.fetches = 0
+        self.analyses = 0
+        self._originals = None
+
+    async def fetch(self, symbol, resolution, range_days):
+        self.fetches += 1
+        return self.candles[symbol.upper()].model_copy(deep=True)
+
+    def analyze(self, symbol, candles, indicators=None):
+        self.analyses += 1
+        return self._originals[1](symbol, candles, indicators)
+
+    def __enter__(self):
+        self._originals = (app._fetch_analysis_candles, app._analyze_candles, app.ANALYSIS_RECHECK_SECONDS)
+        app._fetch_analysis_candles = self.fetch
+        app._analyze_candles = self.analyze
+        app.ANALYSIS_CACHE.clear()
+        app.ANALYSIS_CACHE_STATS.update(hits=0, misses=0)
+        return self
+
+    def __exit__(self, *exc):
+        app._fetch_analysis_candles, app._analyze_candles, app.ANALYSIS_RECHECK_SECONDS = self._originals
+        app.ANALYSIS_CACHE.clear()
+        app.ANALYSIS_CACHE_STATS.update(hits=0, misses=0)
+
+
+def _analyze(symbol: str = "AAPL"):
+    return asyncio.run(app._analyze_symbol(symbol, "D", 180))
+
+
+def test_hit_within_recheck_window_skips_fetch():
+    with _FakeMarket() as market:
+        market.candles["AAPL"] = _candles("AAPL")
+        first = _analyze()
+        second = _analyze("aapl")
+        assert second is first
+        assert (market.fetches, market.analyses) == (1, 1)
+        assert app.ANALYSIS_CACHE_STATS == {"hits": 1, "misses": 1}
+
+
+def test_forming_bar_changes_invalidate_entry():
+    with _FakeMarket() as market:
+        app.ANALYSIS_RECHECK_SECONDS = 0
+        market.candles["AAPL"] = _candles("AAPL")
+        first = _analyze()
+
+        # 마지막 봉이 그대로면 캔들은 다시 받지만 분석은 재사용
+        assert _analyze() is first
+        assert (market.fetches, market.analyses) == (2, 1)
+
+        # 같은 타임스탬프에서 종가만 바뀜 (장중 일봉)
+        data = market.candles["AAPL"].data
+        data.closes[-1] *= 1.05
+        data.highs[-1] = max(data.highs[-1], data.closes[-1])
+        moved = _analyze()
+        assert moved is not first
+        assert market.analyses == 2
+
+        # 거래량만 바뀌어도 다시 분석
+        data.volumes[-1] += 50_000
+        assert _analyze() is not moved
+        assert market.analyses == 3
+
+        # 새 봉
+        data.timestamps.append(data.timestamps[-1] + DAY)
+        for field in ("opens", "highs", "lows", "closes", "volumes"):
+            getattr(data, field).append(getattr(data, field)[-1])
+        _analyze()
+        assert market.analyses == 4
+        assert app.ANALYSIS_CACHE_STATS == {"hits": 1, "misses": 4}
+
+
+def test_lru_bound_and_cache_stats():
+    original_max = app.ANALYSIS_CACHE_MAX_ENTRIES
+    app.ANALYSIS_CACHE_MAX_ENTRIES = 2
+    try:
+        with _FakeMarket() as market:
+            for seed, symbol in enumerate(("AAPL", "MSFT", "NVDA")):
+                market.candles[symbol] = _candles(symbol, seed=seed)
+            _analyze("AAPL")
+            _analyze("MSFT")
+            _analyze("AAPL")  # 적중하면서 가장 최근으로
+            _analyze("NVDA")  # MSFT가 밀려남
+            assert [key[0] for key in app.ANALYSIS_CACHE] == ["AAPL", "NVDA"]
+            _analyze("MSFT")
+            assert market.analyses == 4
+
+            stats = asyncio.run(app.analysis_cache_stats())
+            assert stats == {"hits": 1, "misses": 4, "hit_rate": 0.2, "entries": 2}
+    finally:
+        app.ANALYSIS_CACHE_MAX_ENTRIES = original_max
+
+    app.ANALYSIS_CACHE_STATS.update(hits=0, misses=0)
+    assert asyncio.run(app.analysis_cache_stats())["hit_rate"] == 0.0
+
+
+if __name__ == "__main__":
+    test_hit_within_recheck_window_skips_fetch()
+    test_forming_bar_changes_invalidate_entry()
+    test_lru_bound_and_cache_stats()
+    print("차트 분석 캐시 검증 완료")
@@ -0,0 +1,156 @@
+"""
+인프로세스 백테스트 검증 스크립트
+
+services/backtest.py의 벡터화 구현이 기존 스크립트(test_technical_indicators.py,
+test_additional_indicators.py)와 같은 결과와 리포트를 내는지 확인합니다.
+기존 스크립트는 데이터를 직접 내려받으므로, 합성 일봉을 돌려주도록 데이터 조회만 바꿔 비교합니다.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(tests_dir)
+for path in (backend_dir, tests_dir):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+import test_additional_indicators as additional_script
+import test_technical_indicators as technical_script
+from app import (
+    calculate_bollinger_bands,
+    calculate_macd,
+    calculate_moving_averages,
+    calculate_rsi,
+    detect_support_resistance,
+)
+from services import backtest
+
+SYMBOL = "005930"
+
+
+def make_daily_frame(length: int, seed: int) -> pd.DataFrame:
+    """FinanceDataReader 형식의 합성 일봉 (호가 단위로 반올림)"""
+    rng = np.random.default_rng(seed)
+    close = np.round(50_000 * np.exp(np.cumsum(rng.normal(0, 0.02, length))), -1)
+    high = np.round(close * (1 + rng.uniform(0, 0.03, length)), -1)
+    low = np.round(close * (1 - rng.uniform(0, 0.03, length)), -1)
+    opens = np.round((high + low) / 2, -1)
+    index = pd.bdate_range("2023-01-02", periods=length, name="Date")
+    return pd.DataFrame(
+        {"Open": opens, "High": high, "Low": low, "Close": close, "Volume": rng.integers(1e5, 1e6, length)},
+        index=index,
+    )
+
+
+@contextlib.contextmanager
+def scripts_reading(frame: pd.DataFrame):
+    originals = (technical_script.fdr.DataReader, additional_script.fdr.DataReader)
+    technical_script.fdr.DataReader = lambda *args, **kwargs: frame.copy()
+    additional_script.fdr.DataReader = lambda *args, **kwargs: frame.copy()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        technical_script.fdr.DataReader, additional_script.fdr.DataReader = originals
+
+
+def to_backtest_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    df = frame.rename(columns=str.lower)
+    df.index.name = "date"
+    df["timestamp"] = df.index.asi8 // 10**9
+    return df
+
+
+def technical_results(df: pd.DataFrame) -> dict:
+    closes = df["close"]
+    return {
+        "support_resistance": backtest.support_resistance_accuracy(df, detect_support_resistance),
+        "trend": backtest.trend_line_accuracy(df),
+        "moving_average": backtest.moving_average_accuracy(
+            df, calculate_moving_averages(closes), calculate_rsi(closes, period=14), calculate_macd(closes)
+        ),
+    }
+
+
+def additional_results(df: pd.DataFrame) -> dict:
+    closes = df["close"]
+    return {
+        "rsi": backtest.rsi_accuracy(df, calculate_rsi(closes, period=14)),
+        "macd": backtest.macd_accuracy(df, calculate_macd(closes)),
+        "bollinger": backtest.bollinger_accuracy(df, calculate_bollinger_bands(closes)),
+        "risk": backtest.risk_metrics(df),
+    }
+
+
+def without_timestamps(report: str) -> str:
+    return "\n".join(line for line in report.splitlines() if "일시:" not in line)
+
+
+def test_technical_backtest_matches_script():
+    for seed in range(4):
+        frame = make_daily_frame(280, seed)
+        with scripts_reading(frame):
+            expected = {
+                "support_resistance": technical_script.test_support_resistance_accuracy(SYMBOL),
+                "trend": technical_script.test_trend_line_accuracy(SYMBOL),
+                "moving_average": technical_script.test_moving_average_signals(SYMBOL),
+            }
+            expected_report = technical_script.generate_test_report([SYMBOL])
+
+        actual = technical_results(to_backtest_frame(frame))
+        for name, result in expected.items():
+            for key, value in result.items():
+                assert actual[name][key] == value, (seed, name, key, actual[name][key], value)
+        assert without_timestamps(backtest.technical_report({SYMBOL: actual})) == without_timestamps(expected_report)
+
+
+def test_additional_backtest_matches_script():
+    for seed in range(4):
+        frame = make_daily_frame(280, seed)
+        with scripts_reading(frame):
+            expected = {
+                "rsi": additional_script.test_rsi_accuracy(SYMBOL),
+                "macd": additional_script.test_macd_accuracy(SYMBOL),
+                "bollinger": additional_script.test_bollinger_bands_accuracy(SYMBOL),
+                "risk": additional_script.test_risk_analysis(SYMBOL),
+            }
+            expected_report = additional_script.generate_additional_indicators_report(SYMBOL)
+
+        actual = additional_results(to_backtest_frame(frame))
+        for name, result in expected.items():
+            assert set(actual[name]) == set(result), (seed, name)
+            for key, value in result.items():
+                assert actual[name][key] == value, (seed, name, key)
+        assert without_timestamps(backtest.additional_report(SYMBOL, actual)) == without_timestamps(expected_report)
+
+
+def benchmark(length: int = 400) -> dict:
+    frame = make_daily_frame(length, seed=42)
+    timings = {}
+    with scripts_reading(frame):
+        start = time.perf_counter()
+        technical_script.generate_test_report([SYMBOL])
+        additional_script.generate_additional_indicators_report(SYMBOL)
+        timings["script"] = time.perf_counter() - start
+
+    df = to_backtest_frame(frame)
+    start = time.perf_counter()
+    backtest.technical_report({SYMBOL: technical_results(df)})
+    backtest.additional_report(SYMBOL, additional_results(df))
+    timings["in_process"] = time.perf_counter() - start
+    return timings
+
+
+if __name__ == "__main__":
+    test_technical_backtest_matches_script()
+    test_additional_backtest_matches_script()
+    result = benchmark()
+    print("400봉 신뢰도 백테스트 (데이터 조회 제외)")
+    print(f"  기존 스크립트: {result['script'] * 1000:.1f} ms")
+    print(f"  벡터화 구현:   {result['in_process'] * 1000:.1f} ms")
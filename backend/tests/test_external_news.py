@@ -0,0 +1,173 @@
+"""
+외부 종목 뉴스 검색 검증 스크립트
+
+Google News RSS와 NewsAPI를 가짜 응답(요청마다 지연)으로 대신해, 검색어 변형들이 동시에
+요청되는지, (검색어, 언어)별 캐시가 TTL 동안 요청 없이 응답하고 동시에 들어온 같은 검색이
+요청 한 번을 공유하는지, 새 기사를 더하지 못하는 검색어 변형이 통계에 따라 생략되고
+주기적으로 다시 시도되는지 확인합니다. 마지막으로 순차 요청과 응답 시간을 비교합니다.
+"""
+
+import asyncio
+import contextlib
+import os
+import sys
+import time
+from urllib.parse import parse_qs
+
+import httpx
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+
+
+def _rss(items) -> str:
+    body = "".join(
+        f"<item><title>{title}</title><link>{link}</link><pubDate>Mon, 19 Oct 2026 0{i % 10}:00:00 GMT</pubDate></item>"
+        for i, (link, title) in enumerate(items)
+    )
+    return f"<rss version='2.0'><channel><title>Google News</title>{body}</channel></rss>"
+
+
+@contextlib.contextmanager
+def fake_google_news(results, delay: float = 0.1):
+    """검색어 -> [(링크, 제목)] 응답을 delay초 뒤에 돌려주고, 받은 검색어를 순서대로 기록"""
+    queries = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        query = parse_qs(request.url.query.decode())["q"][0]
+        queries.append(query)
+        await asyncio.sleep(delay)
+        return httpx.Response(200, text=_rss(results.get(query, [])))
+
+    original = app.httpx.AsyncClient
+
+    def client_factory(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        return original(*args, **kwargs)
+
+    app.httpx.AsyncClient = client_factory
+    api_key = os.environ.pop("NEWS_API_KEY", None)
+    app.EXTERNAL_NEWS_CACHE.clear()
+    app.GOOGLE_QUERY_STATS.clear()
+    app.GOOGLE_QUERY_SEARCHES.clear()
+    try:
+        yield queries
+    finally:
+        app.httpx.AsyncClient = original
+        if api_key is not None:
+            os.environ["NEWS_API_KEY"] = api_key
+        app.EXTERNAL_NEWS_CACHE.clear()
+        app.EXTERNAL_NEWS_TASKS.clear()
+        app.GOOGLE_QUERY_STATS.clear()
+        app.GOOGLE_QUERY_SEARCHES.clear()
+
+
+def _samsung_results():
+    topics = ["반도체 업황 회복 신호", "노조 임금 협상 타결", "갤럭시 신제품 공개 행사", "파운드리 수주 확대 발표", "배당 정책 변경 검토"]
+    base = [(f"https://news.test/base/{i}", f"삼성전자 {topic}") for i, topic in enumerate(topics)]
+    return {
+        "삼성전자": base,
+        # 주가 검색은 새 기사 2개, 나머지 변형은 기본 검색과 같은 기사만 (URL 추적 파라미터만 다름)
+        "삼성전자 주가": base[:2] + [
+            ("https://news.test/price/0", "삼성전자 주가 급등 외국인 순매수"),
+            ("https://news.test/price/1", "증권사 목표가 일제히 상향 조정"),
+        ],
+        **{
+            f"삼성전자 {suffix}": [(f"{link}?utm_source=google", title) for link, title in base]
+            for suffix in ("주식", "실적", "전망", "공시", "뉴스")
+        },
+    }
+
+
+def test_variants_run_concurrently_and_merge_without_duplicates():
+    with fake_google_news(_samsung_results(), delay=0.2) as queries:
+        start = time.perf_counter()
+        articles = asyncio.run(app._fetch_stock_news_from_external("삼성전자", True))
+        elapsed = time.perf_counter() - start
+    assert len(queries) == 7
+    assert elapsed < 0.2 * 3, elapsed
+    assert [a.url for a in articles] == [f"https://news.test/base/{i}" for i in range(5)] + [
+        f"https://news.test/price/{i}" for i in range(2)
+    ]
+    assert all(a.headline_ko == a.headline and a.published_at.tzinfo is not None for a in articles)
+
+
+def test_cache_serves_repeated_and_concurrent_searches():
+    async def scenario(queries):
+        results = await asyncio.gather(*(app._fetch_stock_news_from_external("삼성전자", True) for _ in range(10)))
+        assert len(queries) == 7
+        assert all(len(result) == 7 for result in results)
+        # TTL 안에서는 요청 없이 응답 (대소문자/공백이 달라도 같은 키)
+        await app._fetch_stock_news_from_external(" 삼성전자 ", True)
+        assert len(queries) == 7
+        # 만료되면 다시 검색, 언어가 다르면 별도 캐시
+        articles, stored_at = app.EXTERNAL_NEWS_CACHE[("삼성전자", "ko")]
+        app.EXTERNAL_NEWS_CACHE[("삼성전자", "ko")] = (articles, stored_at - app.EXTERNAL_NEWS_TTL)
+        await app._fetch_stock_news_from_external("삼성전자", True)
+        assert len(queries) > 7
+        before = len(queries)
+        await app._fetch_stock_news_from_external("삼성전자", False)
+        assert len(queries) == before + 6
+
+    with fake_google_news(_samsung_results(), delay=0.05) as queries:
+        asyncio.run(scenario(queries))
+
+
+def test_unproductive_variants_are_trimmed_and_explored_again():
+    async def scenario(queries):
+        for _ in range(app.GOOGLE_QUERY_EXPLORE_EVERY):
+            app.EXTERNAL_NEWS_CACHE.clear()
+            await app._fetch_stock_news_from_external("삼성전자", True)
+        return queries
+
+    with fake_google_news(_samsung_results(), delay=0.0) as queries:
+        asyncio.run(scenario(queries))
+        # 처음 GOOGLE_QUERY_MIN_RUNS번은 모든 변형 실행, 이후에는 새 기사를 더한 기본/주가 검색만
+        per_search = 7 * app.GOOGLE_QUERY_MIN_RUNS + 2 * (app.GOOGLE_QUERY_EXPLORE_EVERY - app.GOOGLE_QUERY_MIN_RUNS)
+        assert len(queries) == per_search
+        assert queries[-2:] == ["삼성전자", "삼성전자 주가"]
+        assert app.GOOGLE_QUERY_STATS[("ko", "주가")]["yield"] == 2
+        assert app.GOOGLE_QUERY_STATS[("ko", "실적")]["yield"] == 0
+
+        # 주기적으로 전체 변형을 다시 실행해 생략된 변형의 통계를 갱신
+        app.EXTERNAL_NEWS_CACHE.clear()
+        asyncio.run(app._fetch_stock_news_from_external("삼성전자", True))
+        assert len(queries) == per_search + 7
+        assert app.GOOGLE_QUERY_STATS[("ko", "실적")]["runs"] == app.GOOGLE_QUERY_MIN_RUNS + 1
+
+
+def benchmark(delay: float = 0.2) -> dict:
+    """검색어 변형 7개, 요청마다 delay초: 순차 요청 대비 동시 요청과 캐시 응답 시간"""
+    results = _samsung_results()
+
+    async def sequential():
+        async with httpx.AsyncClient(timeout=app.EXTERNAL_NEWS_TIMEOUT) as client:
+            for suffix in app.GOOGLE_NEWS_VARIANTS["ko"][1]:
+                await app._fetch_google_news_articles(client, f"삼성전자 {suffix}".strip(), "ko")
+
+    with fake_google_news(results, delay=delay):
+        start = time.perf_counter()
+        asyncio.run(sequential())
+        sequential_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        asyncio.run(app._fetch_stock_news_from_external("삼성전자", True))
+        concurrent_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        asyncio.run(app._fetch_stock_news_from_external("삼성전자", True))
+        cached_time = time.perf_counter() - start
+    return {"sequential": sequential_time, "concurrent": concurrent_time, "cached": cached_time}
+
+
+if __name__ == "__main__":
+    test_variants_run_concurrently_and_merge_without_duplicates()
+    test_cache_serves_repeated_and_concurrent_searches()
+    test_unproductive_variants_are_trimmed_and_explored_again()
+    result = benchmark()
+    print("종목 뉴스 외부 검색 (검색어 7개, 요청당 200 ms)")
+    print(f"  순차 요청: {result['sequential'] * 1000:.0f} ms")
+    print(f"  동시 요청: {result['concurrent'] * 1000:.0f} ms")
+    print(f"  캐시 응답: {result['cached'] * 1000:.1f} ms")
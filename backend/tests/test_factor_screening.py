@@ -0,0 +1,145 @@
+"""
+유니버스 팩터 스크리닝 검증 스크립트
+
+services/screening.py의 FactorMatrix.rank가 pandas로 직접 계산한 순위(열별 z-score,
+결측값은 평균 취급, 가중합 내림차순 상위 k개)와 같은지, 결측값이 없을 때
+rank_recommendations(/api/recommendations)와 같은 점수/순서를 내는지, 가중치 검증과
+경계 조건(top_k 0, 유니버스보다 큰 top_k, 빈 행렬, 분산 0인 팩터)을 확인합니다.
+compute_price_factors는 종목별로 결측을 빼고 계산한 모멘텀/변동성과 비교합니다.
+마지막으로 2,000종목 재순위 시간을 rank_recommendations와 비교합니다.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+from services.ai import rank_recommendations
+from services.screening import FACTOR_NAMES, STD_TOLERANCE, FactorMatrix, compute_price_factors
+
+WEIGHTS = {"momentum": 0.4, "volatility": -0.2, "revenue_growth": 0.2, "eps_growth": 0.2}
+
+
+def _random_matrix(count: int, nan_fraction: float = 0.0, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    tickers = [f"T{i:04d}" for i in range(count)]
+    raw = rng.normal(size=(count, len(FACTOR_NAMES))) * [0.3, 0.02, 0.1, 0.5]
+    raw[rng.random(raw.shape) < nan_fraction] = np.nan
+    return tickers, raw
+
+
+def _pandas_ranking(tickers, raw, weights, top_k):
+    """기준 구현: DataFrame으로 z-score(ddof=0) -> 결측 0 -> 가중합 -> 내림차순 상위 k"""
+    frame = pd.DataFrame(raw, index=tickers, columns=FACTOR_NAMES)
+    mean, std = frame.mean(), frame.std(ddof=0)
+    zscores = ((frame - mean) / std.where(std > STD_TOLERANCE * mean.abs().clip(lower=1.0))).fillna(0.0)
+    scores = zscores.mul(pd.Series(weights)).sum(axis=1)
+    top = scores.sort_values(ascending=False, kind="stable").head(top_k)
+    return [(ticker, score, frame.loc[ticker].fillna(0.0).to_dict()) for ticker, score in top.items()]
+
+
+def _assert_same(ranked, expected):
+    assert [item["ticker"] for item in ranked] == [ticker for ticker, _, _ in expected]
+    for item, (_, score, factors) in zip(ranked, expected):
+        assert np.isclose(item["composite_score"], score)
+        for name in FACTOR_NAMES:
+            assert np.isclose(item[name], factors[name]), name
+
+
+def test_rank_matches_pandas_with_missing_values():
+    tickers, raw = _random_matrix(500, nan_fraction=0.1)
+    matrix = FactorMatrix.build("TEST", tickers, raw)
+    for top_k in (1, 10, 137, 500):
+        _assert_same(matrix.rank(WEIGHTS, top_k), _pandas_ranking(tickers, raw, WEIGHTS, top_k))
+    # 가중치 부호가 바뀌면 순위도 그에 맞게
+    flipped = {name: -weight for name, weight in WEIGHTS.items()}
+    _assert_same(matrix.rank(flipped, 25), _pandas_ranking(tickers, raw, flipped, 25))
+
+
+def test_rank_matches_rank_recommendations():
+    tickers, raw = _random_matrix(300)
+    candidates = [{"ticker": ticker, **dict(zip(FACTOR_NAMES, row))} for ticker, row in zip(tickers, raw)]
+    expected = rank_recommendations(candidates, weights=WEIGHTS)
+    ranked = FactorMatrix.build("TEST", tickers, raw).rank(WEIGHTS, len(tickers))
+    assert [item["ticker"] for item in ranked] == [item["ticker"] for item in expected]
+    assert np.allclose([item["composite_score"] for item in ranked], [item["composite_score"] for item in expected])
+
+
+def test_rank_validation_and_edge_cases():
+    tickers, raw = _random_matrix(20)
+    matrix = FactorMatrix.build("TEST", tickers, raw)
+    try:
+        matrix.rank({"momentum": 1.0}, 5)
+    except ValueError as exc:
+        assert "eps_growth" in str(exc) and "volatility" in str(exc)
+    else:
+        raise AssertionError("누락된 가중치는 ValueError")
+    # 모르는 팩터 가중치는 무시
+    assert matrix.rank({**WEIGHTS, "dividend": 5.0}, 5) == matrix.rank(WEIGHTS, 5)
+    assert matrix.rank(WEIGHTS, 0) == []
+    assert len(matrix.rank(WEIGHTS, 1000)) == 20
+    assert FactorMatrix.build("EMPTY", [], np.empty((0, len(FACTOR_NAMES)))).rank(WEIGHTS, 5) == []
+
+    # 분산이 0(상수 열의 부동소수 오차 포함)이거나 전부 결측인 팩터는 점수에 기여하지 않음
+    raw[:, 2] = 0.07
+    raw[:, 3] = np.nan
+    matrix = FactorMatrix.build("TEST", tickers, raw)
+    assert np.all(matrix.zscores[:, 2:] == 0)
+    _assert_same(matrix.rank(WEIGHTS, 20), _pandas_ranking(tickers, raw, WEIGHTS, 20))
+    assert all(item["eps_growth"] == 0.0 for item in matrix.rank(WEIGHTS, 20))
+
+
+def test_price_factors_match_per_ticker_definition():
+    rng = np.random.default_rng(1)
+    dates = pd.bdate_range("2026-04-01", periods=120)
+    closes = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.02, size=(len(dates), 6)), axis=0)),
+        index=dates,
+        columns=[f"T{i}" for i in range(6)],
+    )
+    closes.iloc[:15, 1] = np.nan  # 늦게 상장
+    closes.iloc[-10:, 2] = np.nan  # 거래 정지
+    closes.iloc[40:45, 3] = np.nan  # 중간 결측
+    closes.iloc[:, 4] = np.nan  # 데이터 없음
+
+    factors = compute_price_factors(closes)
+    for ticker in closes.columns:
+        prices = closes[ticker].dropna()
+        if prices.empty:
+            assert factors.loc[ticker].isna().all()
+            continue
+        assert np.isclose(factors.loc[ticker, "momentum"], prices.iloc[-1] / prices.iloc[0] - 1)
+        assert np.isclose(factors.loc[ticker, "volatility"], prices.pct_change().dropna().std())
+
+
+def benchmark(count: int = 2000) -> dict:
+    tickers, raw = _random_matrix(count)
+    candidates = [{"ticker": ticker, **dict(zip(FACTOR_NAMES, row))} for ticker, row in zip(tickers, raw)]
+    matrix = FactorMatrix.build("BENCH", tickers, raw)
+
+    start = time.perf_counter()
+    for _ in range(20):
+        matrix.rank(WEIGHTS, 20)
+    matrix_time = (time.perf_counter() - start) / 20
+
+    start = time.perf_counter()
+    for _ in range(20):
+        rank_recommendations(candidates, weights=WEIGHTS)[:20]
+    frame_time = (time.perf_counter() - start) / 20
+    return {"matrix": matrix_time, "frame": frame_time}
+
+
+if __name__ == "__main__":
+    test_rank_matches_pandas_with_missing_values()
+    test_rank_matches_rank_recommendations()
+    test_rank_validation_and_edge_cases()
+    test_price_factors_match_per_ticker_definition()
+    result = benchmark()
+    print("2,000종목 상위 20개 재순위 (요청 1회)")
+    print(f"  FactorMatrix.rank:      {result['matrix'] * 1000:.2f} ms")
+    print(f"  rank_recommendations:   {result['frame'] * 1000:.2f} ms")
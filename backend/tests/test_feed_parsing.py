@@ -0,0 +1,127 @@
+"""
+피드 파싱 워커 풀 검증 스크립트
+
+services/feeds.py의 parse_feed가 필요한 값(제목, 요약, 출처, 날짜, 이미지)을 그대로 담는지,
+스레드/프로세스 모드가 같은 결과를 내는지 확인하고, 큰 피드를 파싱하는 동안
+이벤트 루프가 얼마나 멈추는지(루프 지연)를 이벤트 루프 직접 파싱과 비교합니다.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+from services.feeds import FeedParsePool, parse_feed
+
+SAMPLE_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">
+<channel><title>테스트 경제</title>
+<item>
+  <title>첫 기사</title><link>https://example.com/1</link>
+  <description>첫 요약</description>
+  <pubDate>Mon, 19 Oct 2026 09:30:00 GMT</pubDate>
+  <media:content url="https://example.com/1.jpg" medium="image"/>
+</item>
+<item>
+  <title>둘째 기사</title><link>https://example.com/2</link>
+  <source url="https://wire.example.com">통신사</source>
+  <enclosure url="https://example.com/2.png" type="image/png" length="1"/>
+</item>
+<item><title>셋째 기사</title><link>https://example.com/3</link></item>
+</channel></rss>"""
+
+
+def large_feed(items: int = 400) -> str:
+    body = "".join(
+        f"<item><title>기사 {i}</title><link>https://example.com/{i}</link>"
+        f"<description>{'요약 ' * 40}</description><pubDate>Mon, 19 Oct 2026 09:30:00 GMT</pubDate></item>"
+        for i in range(items)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>big</title>{body}</channel></rss>'
+
+
+def test_parse_feed_records():
+    feed = parse_feed(SAMPLE_FEED, limit=2)
+    assert feed.title == "테스트 경제"
+    assert feed.total_entries == 3 and len(feed.entries) == 2
+    first, second = feed.entries
+    assert first.title == "첫 기사" and first.summary == "첫 요약" and first.link == "https://example.com/1"
+    assert first.published == (2026, 10, 19, 9, 30, 0)
+    assert first.image == "https://example.com/1.jpg"
+    assert first.source is None
+    assert second.source == "통신사" and second.image == "https://example.com/2.png"
+    assert second.published is None
+
+
+def test_thread_and_process_modes_agree():
+    async def run(mode: str):
+        pool = FeedParsePool(mode=mode, workers=1)
+        try:
+            return await pool.parse(SAMPLE_FEED)
+        finally:
+            pool.shutdown()
+
+    assert asyncio.run(run("thread")) == asyncio.run(run("process")) == parse_feed(SAMPLE_FEED)
+    try:
+        FeedParsePool(mode="fork")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown mode accepted")
+
+
+async def _max_loop_lag(parse_all) -> float:
+    """parse_all 실행 중 10ms 주기 타이머가 가장 늦게 깨어난 시간(초)"""
+    lag = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal lag
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lag = max(lag, time.perf_counter() - start - 0.01)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.02)
+    await parse_all()
+    done = True
+    await task
+    return lag
+
+
+def benchmark(feeds: int = 8) -> dict:
+    texts = [large_feed() for _ in range(feeds)]
+
+    async def inline():
+        for text in texts:
+            parse_feed(text)
+
+    async def measure(mode: str) -> float:
+        pool = FeedParsePool(mode=mode, workers=2)
+        await pool.parse(SAMPLE_FEED)  # 워커 준비
+        try:
+            return await _max_loop_lag(lambda: asyncio.gather(*(pool.parse(text) for text in texts)))
+        finally:
+            pool.shutdown()
+
+    async def main():
+        return {
+            "inline": await _max_loop_lag(inline),
+            "thread": await measure("thread"),
+            "process": await measure("process"),
+        }
+
+    return asyncio.run(main())
+
+
+if __name__ == "__main__":
+    test_parse_feed_records()
+    test_thread_and_process_modes_agree()
+    result = benchmark()
+    print("큰 피드 8개 파싱 중 이벤트 루프 최대 지연")
+    for mode, lag in result.items():
+        print(f"  {mode:8s}: {lag * 1000:.1f} ms")
@@ -0,0 +1,123 @@
+"""
+추천용 실적 데이터 수집/디스크 캐시 검증 스크립트
+
+services/disk_cache.py의 JsonDiskCache가 TTL이 지나거나 파일이 깨졌을 때 None을 돌려주고
+다시 쓸 수 있는지, _load_fundamentals가 캐시가 있으면 yfinance를 호출하지 않는지,
+_fetch_fundamentals가 실패한 종목만 빼고 나머지를 돌려주며 동시에 들어온 요청들을 합쳐도
+yfinance 동시 호출 수가 FUNDAMENTALS_CONCURRENCY를 넘지 않는지 확인합니다.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+from services.disk_cache import JsonDiskCache
+
+
+def test_disk_cache_ttl_and_corrupt_file():
+    directory = tempfile.mkdtemp()
+    cache = JsonDiskCache(directory, ttl_seconds=0.2)
+    assert cache.get("AAPL") is None
+    cache.set("AAPL", {"eps_growth": 0.1})
+    # 다른 워커(다른 인스턴스)에서도 같은 값
+    assert JsonDiskCache(directory, ttl_seconds=0.2).get("AAPL") == {"eps_growth": 0.1}
+    time.sleep(0.25)
+    assert cache.get("AAPL") is None
+
+    # 깨진 파일은 미스로 처리하고 다음 set으로 복구
+    with open(cache._path("MSFT"), "w", encoding="utf-8") as fh:
+        fh.write('{"stored_at": 1, "value": ')
+    assert cache.get("MSFT") is None
+    cache.set("MSFT", {"eps_growth": 0.2})
+    assert cache.get("MSFT") == {"eps_growth": 0.2}
+
+    # 직렬화할 수 없는 값은 예외를 그대로 올리고 임시 파일을 남기지 않음
+    try:
+        cache.set("NVDA", {"eps_growth": object()})
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("직렬화 실패는 TypeError")
+    assert not [name for name in os.listdir(directory) if name.startswith(".cache-")]
+    assert cache.get("MSFT") == {"eps_growth": 0.2}
+
+
+class _FakeTicker:
+    calls = []
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+
+    def get_earnings_dates(self, limit=4):
+        _FakeTicker.calls.append(self.ticker)
+        index = pd.to_datetime(["2026-07-20", "2026-04-20"])
+        return pd.DataFrame({"Revenue": [120.0, 100.0], "EPS": [1.5, 2.0]}, index=index)
+
+
+def test_load_fundamentals_uses_disk_cache():
+    originals = (app.FUNDAMENTALS_CACHE, app.yf.Ticker)
+    app.FUNDAMENTALS_CACHE = JsonDiskCache(tempfile.mkdtemp(), ttl_seconds=3600)
+    app.yf.Ticker = _FakeTicker
+    _FakeTicker.calls = []
+    try:
+        first = app._load_fundamentals("AAPL")
+        # 실적 발표일 순으로 정렬한 뒤 직전 대비 성장률
+        assert first == {"revenue_growth": 0.2, "eps_growth": -0.25}
+        assert app._load_fundamentals("AAPL") == first
+        assert _FakeTicker.calls == ["AAPL"]
+    finally:
+        app.FUNDAMENTALS_CACHE, app.yf.Ticker = originals
+
+
+def test_failing_ticker_is_skipped_and_concurrency_is_shared():
+    state = {"running": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_load(ticker):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        try:
+            time.sleep(0.02)
+            if ticker.startswith("BAD"):
+                raise ValueError("no earnings")
+            return {"revenue_growth": 0.0, "eps_growth": 0.0}
+        finally:
+            with lock:
+                state["running"] -= 1
+
+    async def scenario():
+        # 기본 스레드 풀 크기(CPU 수에 비례)가 제한보다 작으면 검증이 되지 않으므로 넉넉하게
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=32))
+        # 요청 세 개가 동시에 들어와도 전체 동시 호출 수는 제한을 넘지 않음
+        batches = [[f"T{request}_{i}" for i in range(10)] + [f"BAD{request}"] for request in range(3)]
+        return await asyncio.gather(*(app._fetch_fundamentals(batch) for batch in batches))
+
+    original = app._load_fundamentals
+    app._load_fundamentals = fake_load
+    app.FUNDAMENTALS_SEMAPHORE = asyncio.Semaphore(app.FUNDAMENTALS_CONCURRENCY)
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        app._load_fundamentals = original
+        app.FUNDAMENTALS_SEMAPHORE = asyncio.Semaphore(app.FUNDAMENTALS_CONCURRENCY)
+    for request, result in enumerate(results):
+        assert sorted(result) == sorted(f"T{request}_{i}" for i in range(10))
+    assert state["peak"] <= app.FUNDAMENTALS_CONCURRENCY, state
+
+
+if __name__ == "__main__":
+    test_disk_cache_ttl_and_corrupt_file()
+    test_load_fundamentals_uses_disk_cache()
+    test_failing_ticker_is_skipped_and_concurrency_is_shared()
+    print("실적 데이터 캐시 검증 완료")
@@ -0,0 +1,188 @@
+"""
+스트리밍 지표 엔진 검증 스크립트
+
+IndicatorEngine에 봉을 하나씩 추가했을 때의 RSI, MACD, 볼린저 밴드, 이동평균 값이
+app.py의 전체 재계산 함수(calculate_*) 결과와 일치하는지 확인합니다. 한 봉씩 밀리는
+구간은 다시 계산하지 않고 이어서 계산하는지(stats["incremental"]), 구간이 겹치는 여러 요청
+(기간이 다르거나 한 봉씩 밀리는 구간)이 섞여 들어와도 이동평균/볼린저/RSI는 응답 구간에
+calculate_*를 적용한 값과, MACD는 상태 시작 봉부터의 이력에 적용한 값과 같은지 확인합니다.
+"""
+
+import math
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+from app import calculate_bollinger_bands, calculate_macd, calculate_moving_averages, calculate_rsi
+from services.indicator_engine import IndicatorEngine
+
+
+def make_closes(length: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.02, length))), 2)
+
+
+def assert_close(actual: float, expected: float) -> None:
+    if pd.isna(expected):
+        assert math.isnan(actual), (actual, expected)
+    else:
+        assert math.isclose(actual, expected, rel_tol=1e-8, abs_tol=1e-8), (actual, expected)
+
+
+def assert_rolling_matches(snapshot, window: np.ndarray) -> None:
+    """이동평균/볼린저/RSI: 요청 구간에 calculate_*를 적용한 값"""
+    series = pd.Series(window)
+    rsi = calculate_rsi(series)
+    bb = calculate_bollinger_bands(series)
+    mas = calculate_moving_averages(series)
+
+    assert_close(snapshot.rsi, rsi.iloc[-1])
+    assert_close(snapshot.bb_upper, bb["upper"].iloc[-1])
+    assert_close(snapshot.bb_middle, bb["middle"].iloc[-1])
+    assert_close(snapshot.bb_lower, bb["lower"].iloc[-1])
+    for size, value in snapshot.moving_averages.items():
+        assert_close(value, mas[f"ma{size}"].iloc[-1])
+
+
+def assert_macd_matches(snapshot, history: np.ndarray) -> None:
+    """MACD: 상태 시작 봉부터의 전체 이력에 calculate_macd를 적용한 값"""
+    macd = calculate_macd(pd.Series(history))
+    assert_close(snapshot.macd, macd["macd"].iloc[-1])
+    assert_close(snapshot.macd_signal, macd["signal"].iloc[-1])
+    assert_close(snapshot.macd_histogram, macd["histogram"].iloc[-1])
+
+
+def assert_matches_batch(snapshot, closes: np.ndarray) -> None:
+    assert_rolling_matches(snapshot, closes)
+    assert_macd_matches(snapshot, closes)
+
+
+def test_incremental_updates_match_full_recompute():
+    closes = make_closes(400)
+    timestamps = np.arange(len(closes)) * 86400
+    engine = IndicatorEngine()
+
+    for end in range(1, len(closes) + 1):
+        snapshot = engine.update(("TEST", "D"), timestamps[:end], closes[:end])
+        assert_matches_batch(snapshot, closes[:end])
+
+    assert engine.stats["rebuilds"] == 2  # 첫 봉, 그리고 커밋된 봉이 없던 두 번째 호출
+
+
+def test_forming_bar_can_change_without_rebuild():
+    closes = make_closes(200, seed=1)
+    timestamps = np.arange(len(closes)) * 60
+    engine = IndicatorEngine()
+    engine.update("KEY", timestamps, closes)
+    rebuilds = engine.stats["rebuilds"]
+
+    for last_close in (closes[-1] * 1.01, closes[-1] * 0.97):
+        revised = closes.copy()
+        revised[-1] = last_close
+        assert_matches_batch(engine.update("KEY", timestamps, revised), revised)
+    assert engine.stats["rebuilds"] == rebuilds
+
+
+def test_revised_history_triggers_rebuild():
+    closes = make_closes(150, seed=2)
+    timestamps = np.arange(len(closes)) * 86400
+    engine = IndicatorEngine()
+    engine.update("KEY", timestamps[:-1], closes[:-1])
+
+    revised = closes.copy()
+    revised[-3] *= 1.05  # 이미 커밋된 봉이 수정됨
+    rebuilds = engine.stats["rebuilds"]
+    assert_matches_batch(engine.update("KEY", timestamps, revised), revised)
+    assert engine.stats["rebuilds"] == rebuilds + 1
+
+
+def test_sliding_window_resumes_state():
+    closes = make_closes(600, seed=4)
+    timestamps = np.arange(len(closes)) * 3600
+    engine = IndicatorEngine()
+    engine.update(("TEST", "60"), timestamps[:300], closes[:300])
+
+    # 가장 오래된 봉이 빠지고 새 봉이 들어오는 구간: 매번 새 봉만 반영
+    for end in range(301, len(closes) + 1):
+        incremental = engine.stats["incremental"]
+        snapshot = engine.update(("TEST", "60"), timestamps[end - 300 : end], closes[end - 300 : end])
+        assert engine.stats["incremental"] == incremental + 1
+        assert_rolling_matches(snapshot, closes[end - 300 : end])
+        assert_macd_matches(snapshot, closes[:end])
+    assert engine.stats["rebuilds"] == 1
+
+    # 구간만으로 계산한 MACD와의 차이는 300봉이 지나면 무시할 수준
+    window_macd = calculate_macd(pd.Series(closes[300:]))
+    assert abs(snapshot.macd - window_macd["macd"].iloc[-1]) < 1e-6
+    assert abs(snapshot.macd_signal - window_macd["signal"].iloc[-1]) < 1e-6
+
+
+def test_window_shorter_than_period_and_earlier_start():
+    closes = make_closes(400, seed=5)
+    timestamps = np.arange(len(closes)) * 86400
+    engine = IndicatorEngine()
+    engine.update("KEY", timestamps[100:300], closes[100:300])
+
+    # 상태에는 200봉이 있어도 요청 구간이 60봉이면 120일선은 calculate_*와 같이 NaN
+    snapshot = engine.update("KEY", timestamps[240:301], closes[240:301])
+    assert engine.stats["rebuilds"] == 1
+    assert math.isnan(snapshot.moving_averages[120]) and not math.isnan(snapshot.moving_averages[60])
+    assert_rolling_matches(snapshot, closes[240:301])
+    assert_macd_matches(snapshot, closes[100:301])
+
+    # 상태 시작 봉보다 앞선 구간은 그 구간부터 다시 계산
+    snapshot = engine.update("KEY", timestamps[50:302], closes[50:302])
+    assert engine.stats["rebuilds"] == 2
+    assert_matches_batch(snapshot, closes[50:302])
+
+
+def test_overlapping_requests_share_state():
+    closes = make_closes(500, seed=3)
+    timestamps = np.arange(len(closes)) * 86400
+    app.INDICATOR_ENGINE.reset()
+    app.INDICATOR_ENGINE.stats.update(incremental=0, rebuilds=0)
+
+    # (요청 기간, 마지막 봉 위치, 상태 시작 봉): 기간이 다른 요청, 한 봉씩 밀리는 구간, 같은 구간 반복이 섞임
+    # 두 번째 요청만 상태보다 앞선 구간이라 다시 계산
+    requests = [(100, 300, 200), (200, 300, 100), (100, 301, 100), (100, 301, 100), (200, 305, 100), (60, 305, 100), (100, 400, 100), (200, 400, 100)]
+    for range_days, end, seed in requests:
+        window = slice(end - range_days, end)
+        snapshot = app._latest_indicators("TEST", "D", timestamps[window].tolist(), pd.Series(closes[window]))
+        assert_rolling_matches(snapshot, closes[window])
+        assert_macd_matches(snapshot, closes[seed:end])
+    assert app.INDICATOR_ENGINE.stats["rebuilds"] == 2
+
+    # 형성 중인 마지막 봉만 바뀐 반복 요청은 재계산 없이 이어서 계산
+    revised = closes[:400].copy()
+    revised[-1] *= 1.02
+    snapshot = app._latest_indicators("TEST", "D", timestamps[300:400].tolist(), pd.Series(revised[300:400]))
+    assert_rolling_matches(snapshot, revised[300:400])
+    assert_macd_matches(snapshot, revised[100:400])
+    assert app.INDICATOR_ENGINE.stats["rebuilds"] == 2
+    app.INDICATOR_ENGINE.reset()
+
+
+def test_rejects_non_finite_closes():
+    engine = IndicatorEngine()
+    try:
+        engine.update("KEY", [1, 2, 3], [1.0, float("nan"), 2.0])
+    except ValueError:
+        return
+    raise AssertionError("NaN 종가는 ValueError가 발생해야 합니다")
+
+
+if __name__ == "__main__":
+    test_incremental_updates_match_full_recompute()
+    test_forming_bar_can_change_without_rebuild()
+    test_revised_history_triggers_rebuild()
+    test_sliding_window_resumes_state()
+    test_window_shorter_than_period_and_earlier_start()
+    test_overlapping_requests_share_state()
+    test_rejects_non_finite_closes()
+    print("스트리밍 지표 엔진 검증 완료")
@@ -0,0 +1,204 @@
+"""
+백그라운드 작업 큐 검증 스크립트
+
+같은 키의 작업 중복 제거, 진행률 스트리밍, 실패 처리, 다른 프로세스에서의 디스크 조회를 확인합니다.
+같은 디렉터리를 쓰는 다른 큐(다른 워커 프로세스)와의 중복 제거, 하트비트 갱신, 소유 프로세스가
+종료되었거나 하트비트가 끊긴 작업이 조회 시 실패로 바뀌는지, 종료 시 남은 작업 처리도 확인합니다.
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+from services.jobs import FAILED, RUNNING, SUCCEEDED, Job, JobQueue
+
+
+async def _dedup_and_progress() -> None:
+    queue = JobQueue(tempfile.mkdtemp(), workers=1)
+    release = asyncio.Event()
+    calls = []
+
+    async def work(progress):
+        calls.append(1)
+        progress(0.5, "half")
+        await release.wait()
+        return {"value": 42}
+
+    first = queue.submit("test", "same-key", {}, work)
+    second = queue.submit("test", "same-key", {}, work)
+    assert first.id == second.id
+
+    seen = []
+
+    async def collect():
+        async for record in queue.watch(first.id):
+            seen.append((record["status"], record["progress"]))
+
+    watcher = asyncio.create_task(collect())
+    await asyncio.sleep(0.05)
+    release.set()
+    await asyncio.wait_for(watcher, timeout=5)
+
+    assert calls == [1]
+    assert ("running", 0.5) in seen
+    assert seen[-1] == (SUCCEEDED, 1.0)
+
+    # 완료 후에는 같은 키로 새 작업을 만들 수 있다
+    third = queue.submit("test", "same-key", {}, work)
+    assert third.id != first.id
+
+    # 다른 프로세스(메모리에 작업 없음)에서도 디스크 기록으로 조회 가능
+    other = JobQueue(queue.directory)
+    assert other.get(first.id)["result"] == {"value": 42}
+    await queue.stop()
+
+
+async def _failure() -> None:
+    queue = JobQueue(tempfile.mkdtemp(), workers=1)
+
+    async def broken(progress):
+        raise ValueError("boom")
+
+    job = queue.submit("test", "broken", {}, broken)
+    records = [record async for record in queue.watch(job.id)]
+    assert records[-1]["status"] == FAILED
+    assert records[-1]["error"] == "boom"
+    await queue.stop()
+
+
+async def _cross_process_dedup() -> None:
+    directory = tempfile.mkdtemp()
+    owner = JobQueue(directory, workers=1, heartbeat_interval=0.05)
+    other = JobQueue(directory, workers=1)
+    release = asyncio.Event()
+    calls = []
+
+    async def work(progress):
+        calls.append(1)
+        await release.wait()
+        return {"value": 1}
+
+    first = owner.submit("test", "shared", {"symbols": ["AAPL"]}, work)
+    # 다른 워커의 같은 키 제출은 진행 중인 작업을 돌려받고 실행하지 않음
+    mirrored = other.submit("test", "shared", {"symbols": ["AAPL"]}, work)
+    assert mirrored.id == first.id
+    assert mirrored.to_dict()["params"] == {"symbols": ["AAPL"]}
+
+    # 실행 중에는 하트비트가 디스크 기록에 갱신됨
+    await asyncio.sleep(0.05)
+    before = other.get(first.id)["heartbeat_at"]
+    await asyncio.sleep(0.15)
+    record = other.get(first.id)
+    assert record["status"] == RUNNING and record["heartbeat_at"] > before
+    assert record["owner_pid"] == os.getpid()
+
+    release.set()
+    records = [record async for record in other.watch(first.id, poll_interval=0.01)]
+    assert records[-1]["status"] == SUCCEEDED
+    assert calls == [1]
+
+    # 끝난 뒤에는 다른 워커에서 새 작업
+    again = other.submit("test", "shared", {}, work)
+    assert again.id != first.id
+    await owner.stop()
+    await other.stop()
+
+
+def _write_orphan(queue: JobQueue, key: str, **fields) -> Job:
+    """다른 프로세스가 남긴 것처럼 진행 중 기록과 키 색인을 디스크에 씀"""
+    job = Job(id=os.urandom(16).hex(), kind="test", key=key, params={}, status=RUNNING, started_at=time.time(), **fields)
+    queue._persist(job)
+    queue._write_atomic(queue._key_path(key), job.id)
+    return job
+
+
+async def _stale_jobs_fail_on_read() -> None:
+    queue = JobQueue(tempfile.mkdtemp(), workers=1, stale_after=1.0)
+
+    # 소유 프로세스가 종료됨
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+    orphan = _write_orphan(queue, "dead-owner", owner_pid=exited.pid)
+    record = queue.get(orphan.id)
+    assert record["status"] == FAILED
+    assert f"process {exited.pid} exited" in record["error"]
+    with open(queue._path(orphan.id), encoding="utf-8") as fh:
+        assert json.load(fh)["status"] == FAILED
+
+    # 프로세스는 살아 있지만 하트비트가 끊김
+    hung = _write_orphan(queue, "hung-owner", heartbeat_at=time.time() - 5)
+    assert queue.get(hung.id)["status"] == FAILED
+    assert "no heartbeat" in queue.get(hung.id)["error"]
+
+    # 하트비트가 최근이면 그대로
+    alive = _write_orphan(queue, "alive-owner")
+    assert queue.get(alive.id)["status"] == RUNNING
+    records = [r async for r in queue.watch(orphan.id)]
+    assert [r["status"] for r in records] == [FAILED]
+
+    async def work(progress):
+        return "ok"
+
+    # 살아 있는 작업은 돌려받고, 멈춘 작업은 중복 제거에서 빠져 새로 실행
+    assert queue.submit("test", "alive-owner", {}, work).id == alive.id
+    fresh = queue.submit("test", "dead-owner", {}, work)
+    assert fresh.id != orphan.id
+    records = [r async for r in queue.watch(fresh.id)]
+    assert records[-1]["result"] == "ok"
+    await queue.stop()
+
+
+async def _stop_fails_unfinished_jobs() -> None:
+    queue = JobQueue(tempfile.mkdtemp(), workers=1)
+
+    async def forever(progress):
+        await asyncio.sleep(3600)
+
+    running = queue.submit("test", "running", {}, forever)
+    waiting = queue.submit("test", "waiting", {}, forever)
+    await asyncio.sleep(0.05)
+    await queue.stop()
+
+    other = JobQueue(queue.directory)
+    for job in (running, waiting):
+        record = other.get(job.id)
+        assert record["status"] == FAILED and "stopped" in record["error"]
+    # 키 색인도 정리되어 다른 워커가 같은 작업을 다시 실행할 수 있음
+    assert other.submit("test", "running", {}, forever).id != running.id
+    await other.stop()
+
+
+def test_dedup_and_progress():
+    asyncio.run(_dedup_and_progress())
+
+
+def test_failure_is_recorded():
+    asyncio.run(_failure())
+
+
+def test_dedup_across_queues_and_heartbeat():
+    asyncio.run(_cross_process_dedup())
+
+
+def test_stale_jobs_fail_on_read():
+    asyncio.run(_stale_jobs_fail_on_read())
+
+
+def test_stop_fails_unfinished_jobs():
+    asyncio.run(_stop_fails_unfinished_jobs())
+
+
+if __name__ == "__main__":
+    test_dedup_and_progress()
+    test_failure_is_recorded()
+    test_dedup_across_queues_and_heartbeat()
+    test_stale_jobs_fail_on_read()
+    test_stop_fails_unfinished_jobs()
+    print("작업 큐 검증 완료")
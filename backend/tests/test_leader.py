@@ -0,0 +1,174 @@
+"""
+워커 간 리더 선출/스냅샷 공유 검증 스크립트
+
+services/leader.py의 잠금이 한 프로세스만 리더로 만들고 리더가 종료되면 다른 워커가
+승계하는지, 하트비트가 끊긴 리더를 알아채는지, 스냅샷이 다른 워커에서 그대로 읽히고
+여러 워커가 동시에 병합해도 항목을 잃지 않는지, 종목별 잠금이 같은 키의 요청을 한
+워커로 모으는지 확인합니다. 마지막으로 요청 중 캐시 미스가 다른 워커가 받아 둔 스냅샷으로
+채워져 외부 API를 다시 호출하지 않는지 확인합니다.
+"""
+
+import asyncio
+import datetime as dt
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+from services.leader import KeyedFileLock, LeaderLease, SnapshotChannel
+
+HOLD_LEASE_SCRIPT = """
+import sys, time
+sys.path.insert(0, {backend_dir!r})
+from services.leader import LeaderLease
+lease = LeaderLease("loop", {lock_dir!r})
+assert lease.try_acquire()
+print("acquired", flush=True)
+time.sleep(60)
+"""
+
+
+def test_single_leader_and_failover():
+    lock_dir = tempfile.mkdtemp()
+    script = HOLD_LEASE_SCRIPT.format(backend_dir=backend_dir, lock_dir=lock_dir)
+    holder = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, text=True)
+    try:
+        assert holder.stdout.readline().strip() == "acquired"
+        follower = LeaderLease("loop", lock_dir)
+        assert not follower.try_acquire()
+        assert not follower.is_leader
+        assert follower.holder()["pid"] == holder.pid
+    finally:
+        holder.kill()
+        holder.wait()
+
+    # 리더 프로세스가 죽으면 커널이 잠금을 풀고 다음 시도에서 승계
+    assert follower.try_acquire()
+    assert follower.holder()["pid"] == os.getpid()
+    other = LeaderLease("loop", lock_dir)
+    assert not other.try_acquire()
+    follower.release()
+    assert other.try_acquire()
+    other.release()
+
+
+def test_heartbeat_reveals_stalled_leader():
+    lock_dir = tempfile.mkdtemp()
+    leader = LeaderLease("loop", lock_dir)
+    follower = LeaderLease("loop", lock_dir)
+    assert leader.try_acquire()
+    assert not follower.try_acquire()
+    assert not follower.leader_stalled(max_age=5)
+
+    before = leader.holder()["heartbeat"]
+    time.sleep(0.05)
+    assert leader.try_acquire()  # 반복마다 하트비트 갱신
+    assert leader.holder()["heartbeat"] > before
+    assert not follower.leader_stalled(max_age=5)
+    time.sleep(0.05)
+    assert follower.leader_stalled(max_age=0.01)
+    assert not leader.leader_stalled(max_age=0.01)
+    leader.release()
+
+
+def test_snapshot_round_trip_and_concurrent_merge():
+    state_dir = tempfile.mkdtemp()
+    writer = SnapshotChannel("cache", state_dir)
+    reader = SnapshotChannel("cache", state_dir)
+    assert reader.load() is None
+
+    payload = {"AAPL": {"price": 1.5, "at": dt.datetime(2026, 10, 19)}}
+    writer.publish(payload)
+    assert writer.load() is None  # 자신이 발행한 것은 다시 읽지 않음
+    assert reader.load() == payload
+    assert reader.load() is None  # 바뀌지 않았으면 다시 읽지 않음
+
+    # 여러 워커(스레드)가 동시에 병합해도 항목을 잃지 않음
+    def add(index):
+        SnapshotChannel("cache", state_dir).update(lambda current: {**(current or {}), f"S{index}": index})
+
+    threads = [threading.Thread(target=add, args=(index,)) for index in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    merged = reader.load()
+    assert set(merged) == {"AAPL"} | {f"S{index}" for index in range(20)}
+
+
+def test_keyed_lock_serializes_same_key_only():
+    lock = KeyedFileLock("fetch", tempfile.mkdtemp(), poll_interval=0.01)
+    events = []
+
+    async def worker(key, name):
+        async with lock.hold(key, timeout=5) as acquired:
+            assert acquired
+            events.append(("start", name))
+            await asyncio.sleep(0.1)
+            events.append(("end", name))
+
+    async def scenario():
+        start = time.perf_counter()
+        await asyncio.gather(worker("a", 1), worker("a", 2), worker("b", 3))
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(scenario())
+    same_key = [event for event in events if event[1] in (1, 2)]
+    assert same_key in ([("start", 1), ("end", 1), ("start", 2), ("end", 2)],
+                        [("start", 2), ("end", 2), ("start", 1), ("end", 1)])
+    assert elapsed < 0.3, elapsed
+
+    async def timed_out():
+        async with lock.hold("a", timeout=5):
+            async with lock.hold("a", timeout=0.05) as acquired:
+                return acquired
+
+    assert asyncio.run(timed_out()) is False
+
+
+def test_on_demand_miss_reads_other_workers_snapshot():
+    state_dir = tempfile.mkdtemp()
+    calls = []
+
+    async def fake_refresh(symbol, name=None):
+        calls.append(symbol)
+        await asyncio.sleep(0.05)
+        return {"quote": f"{symbol} quote", "series": None, "updated_at": dt.datetime.utcnow()}
+
+    originals = (app._refresh_symbol, app.MARKET_SNAPSHOT, app.ON_DEMAND_FETCH_LOCK)
+    app._refresh_symbol = fake_refresh
+    app.MARKET_SNAPSHOT = SnapshotChannel("market_cache", state_dir)
+    app.ON_DEMAND_FETCH_LOCK = KeyedFileLock("fetch", state_dir, poll_interval=0.01)
+    app.MARKET_CACHE.pop("TSLA", None)
+    try:
+        # 같은 워커 안의 동시 미스는 잠금으로 한 번만 호출
+        async def burst():
+            await asyncio.gather(*(app._ensure_symbol_cached("tsla") for _ in range(5)))
+
+        asyncio.run(burst())
+        assert calls == ["tsla"]
+
+        # 메모리가 빈 다른 워커: 스냅샷에서 읽고 외부 API를 호출하지 않음
+        app.MARKET_CACHE.pop("TSLA")
+        app.MARKET_SNAPSHOT = SnapshotChannel("market_cache", state_dir)
+        asyncio.run(app._ensure_symbol_cached("TSLA"))
+        assert calls == ["tsla"]
+        assert app.MARKET_CACHE["TSLA"]["quote"] == "tsla quote"
+    finally:
+        app._refresh_symbol, app.MARKET_SNAPSHOT, app.ON_DEMAND_FETCH_LOCK = originals
+        app.MARKET_CACHE.pop("TSLA", None)
+
+
+if __name__ == "__main__":
+    test_single_leader_and_failover()
+    test_heartbeat_reveals_stalled_leader()
+    test_snapshot_round_trip_and_concurrent_merge()
+    test_keyed_lock_serializes_same_key_only()
+    test_on_demand_miss_reads_other_workers_snapshot()
+    print("리더 선출/스냅샷 공유 검증 완료")
@@ -0,0 +1,140 @@
+"""
+한국 뉴스 메모리 캐시 검증 스크립트
+
+RSS 수집을 흉내 내어 호출 횟수를 세고, /api/news/korea와 종목 뉴스가 메모리 캐시에서만
+응답하는지, 서버 기동 직후 동시에 몰린 요청이 수집 한 번을 공유하는지, 오래된 캐시는
+바로 응답하면서 백그라운드에서 갱신하는지(stale-while-revalidate), 리더가 아닌 워커는
+다른 워커가 발행한 스냅샷을 먼저 읽고 수집한 결과는 스냅샷으로 발행하는지, 수집이 모두
+실패하면 이전 캐시를 유지하는지 확인합니다.
+"""
+
+import asyncio
+import contextlib
+import datetime as dt
+import os
+import sys
+import tempfile
+import time
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+from services.leader import KeyedFileLock, SnapshotChannel
+
+
+@contextlib.contextmanager
+def fake_korea_feeds(delay: float = 0.0):
+    """RSS 수집 대신 호출 횟수(stats['fetches'])와 결과(stats['articles'])를 제어"""
+    stats = {"fetches": 0, "articles": ["삼성전자 실적 발표", "코스피 상승 마감"]}
+
+    async def fake_rss(feeds, translate=False):
+        stats["fetches"] += 1
+        await asyncio.sleep(delay)
+        now = dt.datetime.now(dt.timezone.utc)
+        return [
+            app.NewsArticle(headline=title, headline_ko=title, url=f"https://news.test/{stats['fetches']}/{i}", published_at=now)
+            for i, title in enumerate(stats["articles"])
+        ]
+
+    async def no_external(stock_query, is_korean):
+        return []
+
+    state_dir = tempfile.mkdtemp()
+    originals = (app._fetch_rss_news, app._fetch_stock_news_from_external, app.NEWS_SNAPSHOT, app.ON_DEMAND_FETCH_LOCK)
+    app._fetch_rss_news, app._fetch_stock_news_from_external = fake_rss, no_external
+    app.NEWS_SNAPSHOT = SnapshotChannel("news_cache", state_dir)
+    app.ON_DEMAND_FETCH_LOCK = KeyedFileLock("fetch", state_dir, poll_interval=0.01)
+    stats["state_dir"] = state_dir
+    app.NEWS_CACHE.pop("korea", None)
+    try:
+        yield stats
+    finally:
+        app._fetch_rss_news, app._fetch_stock_news_from_external, app.NEWS_SNAPSHOT, app.ON_DEMAND_FETCH_LOCK = originals
+        app.NEWS_CACHE.pop("korea", None)
+        app.NEWS_REVALIDATE_TASKS.clear()
+
+
+def test_cold_start_requests_share_one_fetch():
+    async def scenario(stats):
+        results = await asyncio.gather(*(app.get_korea_news() for _ in range(20)))
+        assert stats["fetches"] == 1
+        assert all(len(articles) == 2 for articles in results)
+        # 캐시가 채워진 뒤에는 수집하지 않음
+        await app.get_korea_news()
+        symbol_news = await app.get_news_by_symbol("005930")
+        assert stats["fetches"] == 1
+        assert [a.headline for a in symbol_news] == ["삼성전자 실적 발표"]
+
+    with fake_korea_feeds(delay=0.1) as stats:
+        asyncio.run(scenario(stats))
+
+
+def test_stale_cache_is_served_while_revalidating():
+    async def scenario(stats):
+        await app.get_korea_news()
+        articles, stored_at = app.NEWS_CACHE["korea"]
+        # 갱신이 멈춘 상황: 메모리 캐시와 발행된 스냅샷이 모두 오래됨
+        app.NEWS_CACHE["korea"] = (articles, stored_at - app.NEWS_STALE_AFTER)
+        app.NEWS_SNAPSHOT.publish({"korea": app.NEWS_CACHE["korea"]})
+
+        stats["articles"] = ["새 기사"]
+        start = time.perf_counter()
+        stale = await app.get_korea_news()
+        elapsed = time.perf_counter() - start
+        assert elapsed < 0.1, elapsed
+        assert [a.headline for a in stale] == ["삼성전자 실적 발표", "코스피 상승 마감"]
+
+        await app.NEWS_REVALIDATE_TASKS["korea"]
+        assert stats["fetches"] == 2
+        assert [a.headline for a in await app.get_korea_news()] == ["새 기사"]
+        # 수집한 결과는 다른 워커가 읽도록 발행
+        published = SnapshotChannel("news_cache", stats["state_dir"]).load()
+        assert [a.headline for a in published["korea"][0]] == ["새 기사"]
+
+    with fake_korea_feeds(delay=0.3) as stats:
+        asyncio.run(scenario(stats))
+
+
+def test_follower_reads_published_snapshot_instead_of_fetching():
+    async def scenario(stats):
+        # 첫 워커: 캐시가 비어 있어 수집하고 스냅샷으로 발행
+        await app.get_korea_news()
+        assert stats["fetches"] == 1
+
+        # 다른 워커(메모리 캐시 없음, 자기 스냅샷 채널): 스냅샷을 읽고 수집하지 않음
+        app.NEWS_CACHE.pop("korea")
+        app.NEWS_SNAPSHOT = SnapshotChannel("news_cache", stats["state_dir"])
+        assert [a.headline for a in await app.get_korea_news()] == ["삼성전자 실적 발표", "코스피 상승 마감"]
+        assert stats["fetches"] == 1
+
+        # 오래된 항목도 더 새로운 스냅샷이 있으면 그 스냅샷으로 교체
+        articles, stored_at = app.NEWS_CACHE["korea"]
+        app.NEWS_CACHE["korea"] = (articles, stored_at - app.NEWS_STALE_AFTER)
+        app.NEWS_SNAPSHOT = SnapshotChannel("news_cache", stats["state_dir"])
+        await app.get_korea_news()
+        await app.NEWS_REVALIDATE_TASKS["korea"]
+        assert stats["fetches"] == 1
+        assert app.NEWS_CACHE["korea"][1] == stored_at
+
+    with fake_korea_feeds() as stats:
+        asyncio.run(scenario(stats))
+
+
+def test_failed_refresh_keeps_previous_articles():
+    async def scenario(stats):
+        await app.get_korea_news()
+        stats["articles"] = []
+        assert await app._refresh_rss_news("korea") is None
+        assert [a.headline for a in await app.get_korea_news()] == ["삼성전자 실적 발표", "코스피 상승 마감"]
+
+    with fake_korea_feeds() as stats:
+        asyncio.run(scenario(stats))
+
+
+if __name__ == "__main__":
+    test_cold_start_requests_share_one_fetch()
+    test_stale_cache_is_served_while_revalidating()
+    test_follower_reads_published_snapshot_instead_of_fetching()
+    test_failed_refresh_keeps_previous_articles()
+    print("한국 뉴스 메모리 캐시 검증 완료")
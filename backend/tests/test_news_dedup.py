@@ -0,0 +1,137 @@
+"""
+뉴스 중복 제거 인덱스 검증 스크립트
+
+services/news_index.py의 URL 정규화(추적 파라미터, AMP, 리디렉션)와 헤드라인 MinHash
+유사 중복 판정(글자가 비슷해도 단어가 반대 뜻으로 바뀌거나 부정어가 붙은 기사는 유지)을
+확인하고, 같은 기사가 여러 RSS 피드에 실려도 한 번만 남는지 확인합니다.
+마지막으로 기사 수에 따른 중복 검사 시간을 기존 방식(목록 전체 비교)과 비교합니다.
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+import httpx
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+from services.news_index import NewsDedupIndex, canonical_url, normalize_headline
+
+
+def test_canonical_url():
+    base = "reuters.com/markets/fed-holds?id=3"
+    for url in (
+        "https://www.reuters.com/markets/fed-holds/?utm_source=rss&utm_medium=feed&id=3#comments",
+        "http://m.reuters.com/markets/fed-holds/amp?fbclid=abc&id=3",
+        "https://amp.reuters.com/markets/fed-holds?outputType=amp&id=3",
+        "https://www.google.com/url?sa=t&q=https%3A%2F%2Fwww.reuters.com%2Fmarkets%2Ffed-holds%3Fid%3D3",
+    ):
+        assert canonical_url(url) == base, (url, canonical_url(url))
+    assert canonical_url("https://news.example.com/a/b.amp.html") == "news.example.com/a/b.html"
+    # 기사를 구분하는 파라미터는 유지 (순서만 정렬)
+    assert canonical_url("https://n.news.naver.com/article?oid=001&aid=123") == "n.news.naver.com/article?aid=123&oid=001"
+    assert canonical_url("https://n.news.naver.com/article?oid=001&aid=124") != canonical_url(
+        "https://n.news.naver.com/article?oid=001&aid=123"
+    )
+
+
+def test_headline_near_duplicates():
+    assert normalize_headline("[속보] 삼성전자 실적 발표 - 연합뉴스") == "삼성전자 실적 발표"
+
+    index = NewsDedupIndex()
+    assert index.add("https://a.com/1", "Fed holds interest rates steady as inflation continues to cool")
+    assert not index.add("https://b.com/x", "Fed holds interest rates steady as inflation continues to cool off")
+    assert not index.add("https://c.com/y", "Fed holds interest rates steady as inflation continues to cool - Reuters")
+    assert index.add("https://a.com/2", "삼성전자 3분기 영업이익 10조원 돌파 시장 예상치 상회")
+    assert not index.add("https://d.com/z", "[단독] 삼성전자, 3분기 영업이익 10조원 돌파…시장 예상치 크게 상회")
+    # 글자는 거의 같아도 단어 하나가 반대 뜻으로 바뀐 기사는 유지
+    assert index.add("https://e.com/1", "Samsung Electronics third-quarter profit beats analyst estimates")
+    assert index.add("https://e.com/2", "Samsung Electronics third-quarter profit misses analyst estimates")
+    assert index.add("https://e.com/3", "삼성전자 3분기 영업이익 시장 예상치 상회")
+    assert index.add("https://e.com/4", "삼성전자 3분기 영업이익 시장 예상치 하회")
+    assert index.add("https://e.com/5", "Apple will raise iPhone prices in Europe next year")
+    assert index.add("https://e.com/6", "Apple will not raise iPhone prices in Europe next year")
+    # 조사/복수형 차이는 같은 기사
+    assert not index.add("https://f.com/1", "Samsung Electronics third-quarter profits miss analyst estimates")
+    assert not index.add("https://f.com/2", "삼성전자가 3분기 영업이익 시장 예상치 하회")
+    # 주제가 겹쳐도 다른 기사는 유지
+    assert index.add("https://a.com/3", "Fed officials signal rate cuts may come later than markets expect")
+    assert index.add("https://a.com/4", "삼성전자 노조 파업 돌입 반도체 생산 차질 우려")
+    # 짧은 헤드라인은 정확히 같을 때만 중복
+    assert index.add("https://a.com/5", "코스피 2% 상승") and index.add("https://a.com/6", "코스피 3% 상승")
+    assert not index.add("https://www.a.com/1?utm_campaign=x", "다른 제목")
+    assert len(index) == 12
+
+
+def test_rss_aggregation_drops_cross_feed_copies():
+    feeds = {
+        "wire": [("https://www.wire.com/story/1?utm_source=rss", "Oil prices slip as demand worries weigh on markets"),
+                 ("https://www.wire.com/story/2", "Tech shares lead Wall Street higher on chip rally")],
+        "paper": [("https://paper.com/oil-story", "Oil prices slip as demand worries weigh on market - Paper"),
+                  ("https://paper.com/local", "City council approves new transit budget for next year")],
+        "mobile": [("https://m.wire.com/story/2/amp", "Tech stocks rally")],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.path.strip("/")
+        items = "".join(
+            f"<item><title>{title}</title><link>{link.replace('&', '&amp;')}</link>"
+            f"<pubDate>Mon, 19 Oct 2026 0{i}:00:00 GMT</pubDate></item>"
+            for i, (link, title) in enumerate(feeds[name])
+        )
+        return httpx.Response(200, text=f"<rss version='2.0'><channel><title>{name}</title>{items}</channel></rss>")
+
+    original = app.httpx.AsyncClient
+
+    def client_factory(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        return original(*args, **kwargs)
+
+    app.RSS_FEED_STATE.clear()
+    app.httpx.AsyncClient = client_factory
+    try:
+        articles = asyncio.run(app._fetch_rss_news([f"https://feeds.test/{name}" for name in feeds]))
+    finally:
+        app.httpx.AsyncClient = original
+    assert sorted(a.headline for a in articles) == [
+        "City council approves new transit budget for next year",
+        "Oil prices slip as demand worries weigh on markets",
+        "Tech shares lead Wall Street higher on chip rally",
+    ]
+
+
+def benchmark(count: int = 6000) -> dict:
+    """피드 여러 개가 같은 기사를 싣는 상황: 고유 기사 count/2개가 서로 다른 URL로 두 번씩"""
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = ["".join(rng.choice(letters) for _ in range(rng.randint(3, 9))) for _ in range(2000)]
+    stories = [" ".join(rng.choice(words) for _ in range(8)) for _ in range(count // 2)]
+    items = [(f"https://wire.test/{i}?utm_source=rss", stories[i]) for i in range(count // 2)]
+    items += [(f"https://paper.test/story-{i}", f"{stories[i]} - Paper") for i in range(count // 2)]
+
+    start = time.perf_counter()
+    kept = []
+    for url, headline in items:
+        if not any(existing == url for existing, _ in kept):
+            kept.append((url, headline))
+    scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = NewsDedupIndex()
+    indexed = [item for item in items if index.add(*item)]
+    index_time = time.perf_counter() - start
+    return {"scan": scan, "index": index_time, "scan_kept": len(kept), "index_kept": len(indexed)}
+
+
+if __name__ == "__main__":
+    test_canonical_url()
+    test_headline_near_duplicates()
+    test_rss_aggregation_drops_cross_feed_copies()
+    result = benchmark()
+    print("기사 6,000개(고유 기사 3,000개 x 2곳) 중복 검사")
+    print(f"  목록 전체 비교(URL만): {result['scan'] * 1000:.0f} ms, {result['scan_kept']}개 남음")
+    print(f"  인덱스(URL+헤드라인):  {result['index'] * 1000:.0f} ms, {result['index_kept']}개 남음")
@@ -0,0 +1,244 @@
+"""
+뉴스 백그라운드 번역 검증 스크립트
+
+RSS 수집과 Ollama 번역을 흉내 내어(번역 한 번에 0.5초), /api/news/usa가 번역을 기다리지 않고
+원문과 translation_pending 표시로 바로 응답하는지, 백그라운드 작업이 캐시를 번역본으로
+바꾸는지, 번역 캐시에 있던 문장은 처음부터 채워지는지, SSE 구독자가 번역 완료 이벤트를
+받는지 확인합니다. 여러 워커로 실행할 때 팔로워가 리더의 스냅샷을 읽으면 구독자에게 알리는지,
+스냅샷에서 읽었거나 직접 수집한 번역 대기 기사는 팔로워가 번역하지 않고 리더만 번역하는지도 확인합니다.
+"""
+
+import asyncio
+import contextlib
+import datetime as dt
+import json
+import os
+import sys
+import tempfile
+import time
+
+import httpx
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+from services import ai
+from services.leader import KeyedFileLock, LeaderLease, SnapshotChannel
+from services.translation_cache import TranslationCache
+
+TRANSLATION_LATENCY = 0.5
+
+
+def make_articles(count: int = 5):
+    now = dt.datetime.now(dt.timezone.utc)
+    return [
+        app.NewsArticle(
+            headline=f"Headline {i}",
+            summary=f"Summary {i}",
+            url=f"https://example.com/{i}",
+            source="wire",
+            published_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+@contextlib.contextmanager
+def news_environment(leader: bool = True):
+    """RSS 수집은 고정 기사 목록, Ollama 배치 번역은 0.5초 뒤 'KO:<원문>'으로 응답 (leader면 뉴스 리더 권한 보유)"""
+
+    async def fake_rss(feeds, translate=False):
+        return make_articles()
+
+    async def ollama(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(TRANSLATION_LATENCY)
+        prompt = json.loads(request.content)["prompt"]
+        lines = [line for line in prompt.splitlines() if line.startswith("<<<")]
+        reply = "\n".join(f"{line.split('>>> ', 1)[0]}>>> KO:{line.split('>>> ', 1)[1]}" for line in lines)
+        return httpx.Response(200, json={"response": reply})
+
+    original_client = httpx.AsyncClient
+    original_rss = app._fetch_rss_news
+    original_cache = ai.TRANSLATION_CACHE
+    original_lease = app.NEWS_LEASE
+    original_shared = (app.NEWS_SNAPSHOT, app.ON_DEMAND_FETCH_LOCK)
+
+    def client_factory(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(ollama)
+        return original_client(*args, **kwargs)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        httpx.AsyncClient = client_factory
+        app._fetch_rss_news = fake_rss
+        ai.TRANSLATION_CACHE = TranslationCache(os.path.join(tmp, "translations.sqlite3"))
+        app.NEWS_LEASE = LeaderLease("news_refresh", tmp)
+        app.NEWS_SNAPSHOT = SnapshotChannel("news_cache", tmp)
+        app.ON_DEMAND_FETCH_LOCK = KeyedFileLock("fetch", tmp, poll_interval=0.01)
+        if leader:
+            assert app.NEWS_LEASE.try_acquire()
+        app.NEWS_CACHE.pop("usa", None)
+        try:
+            yield
+        finally:
+            app.NEWS_LEASE.release()
+            app.NEWS_LEASE = original_lease
+            app.NEWS_SNAPSHOT, app.ON_DEMAND_FETCH_LOCK = original_shared
+            httpx.AsyncClient = original_client
+            app._fetch_rss_news = original_rss
+            ai.TRANSLATION_CACHE.close()
+            ai.TRANSLATION_CACHE = original_cache
+            app.NEWS_CACHE.pop("usa", None)
+            app.NEWS_TRANSLATION_TASKS.clear()
+            app.NEWS_REVALIDATE_TASKS.clear()
+
+
+def test_news_is_served_before_translation():
+    async def scenario():
+        start = time.perf_counter()
+        first = await app.get_usa_news()
+        elapsed = time.perf_counter() - start
+        assert elapsed < TRANSLATION_LATENCY / 2, elapsed
+        assert all(a.translation_pending and a.headline_ko is None for a in first)
+
+        await app._wait_news_translations(["usa"])
+        second = await app.get_usa_news()
+        assert [a.headline_ko for a in second] == [f"KO:Headline {i}" for i in range(5)]
+        assert [a.summary_ko for a in second] == [f"KO:Summary {i}" for i in range(5)]
+        assert not any(a.translation_pending for a in second)
+        # 이미 응답으로 나간 목록은 그대로
+        assert all(a.translation_pending for a in first)
+
+    with news_environment():
+        asyncio.run(scenario())
+
+
+def test_cached_translations_are_filled_immediately():
+    async def scenario():
+        ai.TRANSLATION_CACHE.store("Headline 0", "ollama:" + os.getenv("OLLAMA_MODEL", "qwen2.5:0.5b"), "캐시된 제목")
+        articles = await app.get_usa_news()
+        assert articles[0].headline_ko == "캐시된 제목" and articles[0].summary_ko is None
+        assert articles[0].translation_pending
+        await app._wait_news_translations(["usa"])
+
+    with news_environment():
+        asyncio.run(scenario())
+
+
+def test_pending_flag_is_cleared_when_cache_fills():
+    model = "ollama:" + os.getenv("OLLAMA_MODEL", "qwen2.5:0.5b")
+
+    async def scenario():
+        # 바뀌지 않은 피드에서 이전 갱신의 번역 대기 표시를 그대로 갖고 온 기사
+        articles = make_articles(2)
+        for article in articles:
+            article.translation_pending = True
+        ai.TRANSLATION_CACHE.store("Headline 0", model, "제목 0")
+        ai.TRANSLATION_CACHE.store("Summary 0", model, "요약 0")
+        ai.TRANSLATION_CACHE.store("Headline 1", model, "제목 1")
+        await app._apply_cached_translations(articles)
+        assert (articles[0].headline_ko, articles[0].summary_ko) == ("제목 0", "요약 0")
+        assert not articles[0].translation_pending
+        assert articles[1].headline_ko == "제목 1" and articles[1].translation_pending
+
+    with news_environment():
+        asyncio.run(scenario())
+
+
+def test_subscribers_receive_translated_articles():
+    async def scenario():
+        response = await app.stream_news_events(category="usa")
+        events = response.body_iterator
+        first_event = asyncio.ensure_future(events.__anext__())
+        await asyncio.sleep(0)  # 구독 등록
+        await app.get_usa_news()
+        message = await asyncio.wait_for(first_event, timeout=5)
+        await events.aclose()
+        assert message.startswith("event: translated\n")
+        payload = json.loads(message.split("data: ", 1)[1])
+        assert payload[0]["headline_ko"] == "KO:Headline 0" and payload[0]["translation_pending"] is False
+        assert not app.NEWS_SUBSCRIBERS["usa"]
+
+    with news_environment():
+        asyncio.run(scenario())
+
+
+def test_follower_subscribers_receive_leader_snapshot():
+    state_dir = tempfile.mkdtemp()
+    leader = SnapshotChannel("news_cache", state_dir)
+    follower = SnapshotChannel("news_cache", state_dir)
+    stored_at = time.time()
+    pending = make_articles()
+    for article in pending:
+        article.translation_pending = True
+    translated = [article.model_copy(update={"headline_ko": f"KO:{article.headline}", "translation_pending": False}) for article in pending]
+
+    async def next_event(events):
+        return await asyncio.wait_for(events.__anext__(), timeout=1)
+
+    async def scenario():
+        response = await app.stream_news_events(category="usa")
+        events = response.body_iterator
+        first_event = asyncio.ensure_future(next_event(events))
+        await asyncio.sleep(0)  # 구독 등록
+
+        # 원문 발행 -> 번역 후 같은 수집 시각으로 다시 발행: 둘 다 알림
+        leader.publish({"usa": (pending, stored_at)})
+        await app._load_news_snapshot(follower)
+        message = await first_event
+        assert json.loads(message.split("data: ", 1)[1])[0]["translation_pending"] is True
+
+        leader.publish({"usa": (translated, stored_at)})
+        await app._load_news_snapshot(follower)
+        message = await next_event(events)
+        assert json.loads(message.split("data: ", 1)[1])[0]["headline_ko"] == "KO:Headline 0"
+
+        # 내용이 같은 재발행은 알리지 않음
+        leader.publish({"usa": ([a.model_copy() for a in translated], stored_at)})
+        await app._load_news_snapshot(follower)
+        assert app.NEWS_SUBSCRIBERS["usa"] and all(queue.empty() for queue in app.NEWS_SUBSCRIBERS["usa"])
+        await events.aclose()
+
+    app.NEWS_CACHE.pop("usa", None)
+    try:
+        asyncio.run(scenario())
+    finally:
+        app.NEWS_CACHE.pop("usa", None)
+
+
+def test_only_leader_translates_snapshot_articles():
+    pending = make_articles()
+    for article in pending:
+        article.translation_pending = True
+
+    async def scenario():
+        async with app.NEWS_CACHE_LOCK:
+            app._store_news("usa", pending, time.time())
+        # 팔로워: 스냅샷의 번역 대기 기사로 응답만 하고 번역은 예약하지 않음
+        assert all(a.translation_pending for a in await app.get_usa_news())
+        assert "usa" not in app.NEWS_TRANSLATION_TASKS
+
+        # 팔로워가 직접 수집한 기사도 번역하지 않음
+        fresh = await app._refresh_rss_news("usa")
+        assert all(a.translation_pending for a in fresh)
+        assert "usa" not in app.NEWS_TRANSLATION_TASKS
+
+        # 리더가 되면 남은 번역 대기 기사를 번역
+        assert app.NEWS_LEASE.try_acquire()
+        await app.get_usa_news()
+        assert "usa" in app.NEWS_TRANSLATION_TASKS
+        await app._wait_news_translations(["usa"])
+        assert [a.headline_ko for a in await app.get_usa_news()] == [f"KO:Headline {i}" for i in range(5)]
+
+    with news_environment(leader=False):
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    test_news_is_served_before_translation()
+    test_cached_translations_are_filled_immediately()
+    test_pending_flag_is_cleared_when_cache_fills()
+    test_subscribers_receive_translated_articles()
+    test_follower_subscribers_receive_leader_snapshot()
+    test_only_leader_translates_snapshot_articles()
+    print("뉴스 백그라운드 번역 검증 완료")
@@ -0,0 +1,130 @@
+"""
+지표 파라미터 스윕 검증 스크립트
+
+services/sweep.py의 (조합 x 봉) 지표 배열이 app.py의 지표 함수와 같은 값을 내는지,
+신호 평가가 단순 반복문과 같은 통계를 내는지, 10년치 100개 조합이 빠르게 끝나는지 확인합니다.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+from app import calculate_bollinger_bands, calculate_macd, calculate_rsi
+from services import sweep
+
+
+def make_closes(length: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.round(50_000 * np.exp(np.cumsum(rng.normal(0, 0.02, length))), -1)
+
+
+def test_indicator_grids_match_app():
+    close = make_closes(600)
+    series = pd.Series(close)
+
+    periods = [6, 14, 21]
+    rsi = sweep.rsi_grid(close, periods)
+    for row, period in enumerate(periods):
+        np.testing.assert_allclose(rsi[row], calculate_rsi(series, period=period).to_numpy(), rtol=1e-9, equal_nan=True)
+
+    combos = sweep.expand_grid("macd", {"fast": [8, 12], "slow": [26], "signal": [5, 9]})
+    lines, signals = sweep.macd_grid(close, combos)
+    for row, combo in enumerate(combos):
+        expected = calculate_macd(series, fast=combo["fast"], slow=combo["slow"], signal=combo["signal"])
+        np.testing.assert_allclose(lines[row], expected["macd"].to_numpy(), rtol=1e-9)
+        np.testing.assert_allclose(signals[row], expected["signal"].to_numpy(), rtol=1e-9)
+
+    windows = [10, 20, 30]
+    middle = sweep.rolling_mean_grid(close, windows)
+    std = sweep.rolling_std_grid(close, windows)
+    for row, window in enumerate(windows):
+        bands = calculate_bollinger_bands(series, period=window, std_dev=1)
+        np.testing.assert_allclose(middle[row], bands["middle"].to_numpy(), rtol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(std[row], (bands["upper"] - bands["middle"]).to_numpy(), rtol=1e-6, equal_nan=True)
+
+
+def naive_stats(buy: np.ndarray, sell: np.ndarray, close: np.ndarray, horizon: int) -> dict:
+    signals = hits = 0
+    total = 0.0
+    for i in range(len(close) - horizon):
+        change = (close[i + horizon] / close[i] - 1) * 100
+        if buy[i]:
+            signals += 1
+            hits += change > 0
+            total += change
+        if sell[i]:
+            signals += 1
+            hits += change < 0
+            total -= change
+    return {"signals": signals, "hits": hits, "return_sum": total}
+
+
+def test_evaluation_matches_loop():
+    close = make_closes(800, seed=3)
+    for indicator in sweep.SWEEP_INDICATORS:
+        combos = sweep.expand_grid(indicator)
+        buy, sell = sweep.sweep_signals(indicator, close, combos)
+        stats = sweep.sweep_symbol(indicator, close, combos, horizon=10)
+        for row in range(0, len(combos), 7):
+            expected = naive_stats(buy[row], sell[row], close, 10)
+            assert stats["signals"][row] == expected["signals"], (indicator, row)
+            assert stats["hits"][row] == expected["hits"], (indicator, row)
+            assert abs(stats["return_sum"][row] - expected["return_sum"]) < 1e-6, (indicator, row)
+
+
+def test_grid_validation_and_ranking():
+    for bad in ({"period": [0]}, {"unknown": [1]}, {"period": []}):
+        try:
+            sweep.expand_grid("rsi", bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(bad)
+    assert all(c["fast"] < c["slow"] for c in sweep.expand_grid("ma_cross"))
+
+    combos = [{"period": 1}, {"period": 2}, {"period": 3}]
+    per_symbol = [
+        {"signals": [10, 10, 2], "hits": [6, 6, 2], "return_sum": [5.0, 8.0, 9.0]},
+        {"signals": [10, 10, 1], "hits": [6, 6, 1], "return_sum": [5.0, 8.0, 9.0]},
+    ]
+    ranking = sweep.rank_parameters(combos, per_symbol, top_k=3, min_signals=5)
+    # 신호가 부족한 조합은 적중률이 높아도 뒤로
+    assert [r["params"]["period"] for r in ranking] == [2, 1, 3]
+    assert ranking[0]["hit_rate"] == 60.0 and ranking[0]["signals"] == 20
+
+
+def benchmark(bars: int = 2520) -> dict:
+    close = make_closes(bars, seed=7)
+    combos = sweep.expand_grid("rsi", {"lower": [20, 25, 30, 35, 40]})
+    start = time.perf_counter()
+    sweep.sweep_symbol("rsi", close, combos, horizon=10)
+    vectorized = time.perf_counter() - start
+
+    series = pd.Series(close)
+    start = time.perf_counter()
+    for combo in combos:
+        rsi = calculate_rsi(series, period=combo["period"]).to_numpy()
+        naive_stats(rsi < combo["lower"], rsi > combo["upper"], close, 10)
+    loop = time.perf_counter() - start
+    return {"combinations": len(combos), "vectorized": vectorized, "loop": loop}
+
+
+def test_sweep_is_fast():
+    result = benchmark()
+    assert result["vectorized"] < 1.0, result
+
+
+if __name__ == "__main__":
+    test_indicator_grids_match_app()
+    test_evaluation_matches_loop()
+    test_grid_validation_and_ranking()
+    result = benchmark()
+    print(f"RSI {result['combinations']}개 조합 x 2520봉 (10년) 스윕")
+    print(f"  벡터화: {result['vectorized'] * 1000:.1f} ms")
+    print(f"  반복문: {result['loop'] * 1000:.1f} ms")
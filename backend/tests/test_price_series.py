@@ -0,0 +1,162 @@
+"""
+일봉 시계열 증분 병합 검증 스크립트
+
+services/price_series.py의 DailySeries가 Alpha Vantage 응답을 날짜순으로 파싱하고,
+전체 이력(full) 위에 최근 구간(compact)을 날짜 기준으로 병합할 때 같은 날짜는 새 값으로
+한 번만 남기며, npz로 저장했다가 다시 읽어도 같은 시계열이 되는지 pandas 기준 결과와
+비교합니다. 마지막으로 _fetch_alpha_series가 처음에는 full, 이후에는 compact로 받아
+디스크 시계열과 병합하는지 가짜 응답으로 확인합니다.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+import httpx
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+from services.price_series import ALPHA_FIELDS, VALUE_FIELDS, DailySeries
+
+
+def _payload(days, offset: float = 0.0) -> dict:
+    """일자 문자열 -> Alpha Vantage 필드 (값은 일자 순번 + offset)"""
+    payload = {}
+    for day in days:
+        base = pd.Timestamp(day).toordinal() % 1000 + offset
+        payload[day] = {
+            ALPHA_FIELDS["open"]: f"{base:.2f}",
+            ALPHA_FIELDS["high"]: f"{base + 2:.2f}",
+            ALPHA_FIELDS["low"]: f"{base - 2:.2f}",
+            ALPHA_FIELDS["close"]: f"{base + 1:.2f}",
+            ALPHA_FIELDS["adjusted_close"]: f"{base + 0.5:.2f}",
+            ALPHA_FIELDS["volume"]: str(int(base * 100)),
+        }
+    return payload
+
+
+def _reference(*payloads) -> pd.DataFrame:
+    """pandas로 만든 기준 결과: 뒤에 오는 응답이 같은 날짜를 덮어씀"""
+    frames = []
+    for payload in payloads:
+        frame = pd.DataFrame.from_dict(payload, orient="index").apply(pd.to_numeric, errors="coerce")
+        frame.index = pd.to_datetime(frame.index)
+        frames.append(frame)
+    merged = pd.concat(frames)
+    merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+    return merged.rename(columns={key: field for field, key in ALPHA_FIELDS.items()})
+
+
+def _assert_matches(series: DailySeries, reference: pd.DataFrame) -> None:
+    assert len(series) == len(reference)
+    assert np.array_equal(series.dates, reference.index.to_numpy(dtype="datetime64[D]"))
+    for field in VALUE_FIELDS:
+        assert np.allclose(getattr(series, field), reference[field].to_numpy(dtype=float)), field
+
+
+def _business_days(start, end):
+    return [day.strftime("%Y-%m-%d") for day in pd.bdate_range(start, end)]
+
+
+def test_parse_sorts_and_drops_invalid_rows():
+    payload = _payload(["2026-10-16", "2026-10-14", "2026-10-15"])
+    payload["not-a-date"] = payload["2026-10-14"]
+    payload["2026-10-13"] = dict(payload["2026-10-14"], **{ALPHA_FIELDS["close"]: "n/a"})
+    payload["2026-10-12"] = {key: value for key, value in payload["2026-10-14"].items() if key != ALPHA_FIELDS["adjusted_close"]}
+    series = DailySeries.from_alpha_payload(payload)
+    assert [str(day) for day in series.dates] == ["2026-10-12", "2026-10-14", "2026-10-15", "2026-10-16"]
+    # 수정 종가가 없으면 종가로 대체
+    assert series.adjusted_close[0] == series.close[0]
+    assert len(DailySeries.from_alpha_payload({})) == 0
+
+
+def test_backfill_then_compact_merge():
+    full = _payload(_business_days("2025-01-01", "2026-09-30"))
+    # compact: 최근 100거래일, 기존 구간과 겹치는 날짜는 수정된 값(+0.25)
+    compact = _payload(_business_days("2026-06-01", "2026-10-16"), offset=0.25)
+    series = DailySeries.from_alpha_payload(full).merge(DailySeries.from_alpha_payload(compact))
+    _assert_matches(series, _reference(full, compact))
+    assert len(np.unique(series.dates)) == len(series)
+    assert np.all(np.diff(series.dates.astype(np.int64)) > 0)
+
+    # 같은 compact를 다시 병합해도 그대로 (날짜 중복 없음), 빈 응답 병합은 원본 유지
+    again = series.merge(DailySeries.from_alpha_payload(compact))
+    _assert_matches(again, _reference(full, compact))
+    assert series.merge(DailySeries.from_alpha_payload({})) is series
+    assert DailySeries.from_alpha_payload({}).merge(series) is series
+
+    # tail과 타임스탬프
+    tail = series.tail(3)
+    assert [str(day) for day in tail.dates] == ["2026-10-14", "2026-10-15", "2026-10-16"]
+    assert tail.timestamps()[-1] == int(pd.Timestamp("2026-10-16", tz="UTC").timestamp())
+    assert series.last_date().isoformat() == "2026-10-16"
+    assert len(series.tail(0)) == 0 and len(series.tail(10**6)) == len(series)
+
+
+def test_npz_persist_and_reload():
+    series = DailySeries.from_alpha_payload(_payload(_business_days("2026-01-01", "2026-10-16")))
+    path = os.path.join(tempfile.mkdtemp(), "AAPL.npz")
+    series.save(path)
+    loaded = DailySeries.load(path)
+    assert loaded.dates.dtype == np.dtype("datetime64[D]")
+    for field in ("dates",) + VALUE_FIELDS:
+        assert np.array_equal(getattr(loaded, field), getattr(series, field)), field
+
+
+def test_fetch_alpha_series_backfills_then_merges_compact():
+    # compact 여부는 오늘 기준 마지막 보유 일자로 정해지므로 날짜를 오늘 기준으로 만듦
+    today = pd.Timestamp.utcnow().normalize().tz_localize(None)
+    full = _payload(_business_days(today - pd.Timedelta(days=600), today - pd.Timedelta(days=10)))
+    compact = _payload(_business_days(today - pd.Timedelta(days=140), today), offset=0.25)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outputsize = request.url.params["outputsize"]
+        requests.append(outputsize)
+        return httpx.Response(200, json={"Time Series (Daily)": full if outputsize == "full" else compact})
+
+    original_client = app.httpx.AsyncClient
+
+    def client_factory(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        return original_client(*args, **kwargs)
+
+    originals = (app.STATE_DIR, os.environ.get("ALPHAVANTAGE_API_KEY"))
+    app.STATE_DIR = tempfile.mkdtemp()
+    os.environ["ALPHAVANTAGE_API_KEY"] = "test"
+    app.httpx.AsyncClient = client_factory
+    app.ALPHA_SERIES_CACHE.pop("TEST", None)
+    try:
+        first = asyncio.run(app._fetch_alpha_series("TEST"))
+        _assert_matches(first, _reference(full))
+
+        # 다른 프로세스(메모리 캐시 없음): 디스크의 전체 이력에 compact만 받아 병합
+        app.ALPHA_SERIES_CACHE.pop("TEST")
+        second = asyncio.run(app._fetch_alpha_series("TEST"))
+        _assert_matches(second, _reference(full, compact))
+        _assert_matches(DailySeries.load(app._alpha_series_path("TEST")), _reference(full, compact))
+
+        # TTL 안에서는 요청하지 않음
+        asyncio.run(app._fetch_alpha_series("TEST"))
+        assert requests == ["full", "compact"]
+    finally:
+        app.httpx.AsyncClient = original_client
+        app.STATE_DIR = originals[0]
+        if originals[1] is None:
+            os.environ.pop("ALPHAVANTAGE_API_KEY", None)
+        else:
+            os.environ["ALPHAVANTAGE_API_KEY"] = originals[1]
+        app.ALPHA_SERIES_CACHE.pop("TEST", None)
+
+
+if __name__ == "__main__":
+    test_parse_sorts_and_drops_invalid_rows()
+    test_backfill_then_compact_merge()
+    test_npz_persist_and_reload()
+    test_fetch_alpha_series_backfills_then_merges_compact()
+    print("일봉 시계열 증분 병합 검증 완료")
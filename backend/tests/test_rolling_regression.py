@@ -0,0 +1,82 @@
+"""
+이동 선형 회귀 검증 스크립트
+
+services/regression.py의 누적합 기반 rolling_linregress가 창마다 np.polyfit으로 구한
+기울기·절편·R²와 같은지 확인하고, 10,000봉에서 두 방식의 실행 시간을 비교합니다.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+from services.regression import last_linregress, rolling_linregress, trend_types
+
+
+def make_prices(length: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 50_000 * np.exp(np.cumsum(rng.normal(0, 0.02, length)))
+
+
+def polyfit_windows(y: np.ndarray, window: int) -> np.ndarray:
+    """창마다 np.polyfit (비교 기준): (기울기, 절편, R²) x 봉"""
+    out = np.full((3, len(y)), np.nan)
+    x = np.arange(window)
+    for end in range(window, len(y) + 1):
+        values = y[end - window:end]
+        slope, intercept = np.polyfit(x, values, 1)
+        out[:, end - 1] = slope, intercept, np.corrcoef(x, values)[0, 1] ** 2
+    return out
+
+
+def test_matches_polyfit():
+    for seed, window in ((0, 20), (1, 5), (2, 60)):
+        y = make_prices(400, seed)
+        fit = rolling_linregress(y, window)
+        expected = polyfit_windows(y, window)
+        assert np.isnan(fit.slope[: window - 1]).all()
+        np.testing.assert_allclose(fit.slope, expected[0], rtol=1e-6, atol=1e-6, equal_nan=True)
+        np.testing.assert_allclose(fit.intercept, expected[1], rtol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(fit.r2, expected[2], atol=1e-8, equal_nan=True)
+        # 추세 방향은 polyfit 결과와 같아야 한다
+        assert (trend_types(fit.slope[window - 1:]) == trend_types(expected[0][window - 1:])).all()
+
+    # 마지막 창만 계산해도 같은 값
+    last = last_linregress(y, window)
+    np.testing.assert_allclose(last.slope[0], expected[0][-1], rtol=1e-6)
+    np.testing.assert_allclose(last.intercept[0], expected[1][-1], rtol=1e-9)
+
+
+def test_nan_and_flat_windows():
+    y = np.array([1.0, 2.0, 3.0, np.nan, 5.0, 6.0, 7.0, 7.0, 7.0, 7.0])
+    fit = rolling_linregress(y, 3)
+    # NaN이 포함된 창(인덱스 3~5)만 NaN
+    assert np.isnan(fit.slope[[0, 1, 3, 4, 5]]).all()
+    assert np.isclose(fit.slope[2], 1.0) and np.isclose(fit.intercept[2], 1.0) and np.isclose(fit.r2[2], 1.0)
+    assert np.isclose(fit.slope[6], 1.0)
+    # 평평한 구간: 기울기 0, R² 1
+    assert abs(fit.slope[9]) < 1e-9 and fit.r2[9] == 1.0
+
+
+def benchmark(length: int = 10_000, window: int = 20) -> dict:
+    y = make_prices(length, seed=5)
+    start = time.perf_counter()
+    rolling_linregress(y, window)
+    rolling = time.perf_counter() - start
+    start = time.perf_counter()
+    polyfit_windows(y, window)
+    per_window = time.perf_counter() - start
+    return {"rolling": rolling, "polyfit": per_window}
+
+
+if __name__ == "__main__":
+    test_matches_polyfit()
+    test_nan_and_flat_windows()
+    result = benchmark()
+    print("10,000봉 x 20봉 창 선형 회귀")
+    print(f"  누적합:  {result['rolling'] * 1000:.2f} ms")
+    print(f"  polyfit: {result['polyfit'] * 1000:.1f} ms")
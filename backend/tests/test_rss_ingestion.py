@@ -0,0 +1,137 @@
+"""
+RSS 동시 수집 검증 스크립트
+
+실제 네트워크 대신 httpx.MockTransport로 느린 피드, 죽은 피드, 정상 피드를 흉내 내어
+피드를 동시에 가져오는지, 피드별 마감 시간과 전체 시간 예산이 지켜지는지,
+바뀌지 않은 피드는 다시 파싱하지 않는지(조건부 요청, 본문 해시) 확인합니다.
+"""
+
+import asyncio
+import contextlib
+import os
+import sys
+import time
+
+import httpx
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+
+RSS_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>{name}</title>
+{items}
+</channel></rss>"""
+ITEM_TEMPLATE = """<item><title>{name} 기사 {i}</title><link>https://example.com/{name}/{i}</link>
+<description>{name} 요약 {i}</description><pubDate>Mon, 19 Oct 2026 0{i}:00:00 GMT</pubDate></item>"""
+
+
+def rss_body(name: str, count: int = 3) -> str:
+    items = "\n".join(ITEM_TEMPLATE.format(name=name, i=i) for i in range(count))
+    return RSS_TEMPLATE.format(name=name, items=items)
+
+
+@contextlib.contextmanager
+def mock_feeds(delays: dict, statuses: dict = None, handler=None):
+    """피드 이름 -> 응답 지연(초). URL은 https://feeds.test/<이름>"""
+    statuses = statuses or {}
+
+    async def default_handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.path.strip("/")
+        await asyncio.sleep(delays.get(name, 0))
+        return httpx.Response(statuses.get(name, 200), text=rss_body(name))
+
+    handler = handler or default_handler
+    original = app.httpx.AsyncClient
+
+    def client_factory(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        return original(*args, **kwargs)
+
+    app.httpx.AsyncClient = client_factory
+    try:
+        yield [f"https://feeds.test/{name}" for name in delays]
+    finally:
+        app.httpx.AsyncClient = original
+
+
+def test_feeds_are_fetched_concurrently():
+    delays = {f"feed{i}": 0.3 for i in range(6)}
+    with mock_feeds(delays) as urls:
+        start = time.perf_counter()
+        articles = asyncio.run(app._fetch_rss_news(urls))
+        elapsed = time.perf_counter() - start
+    assert len(articles) == 18
+    # 순차 실행이면 1.8초
+    assert elapsed < 1.0, elapsed
+    assert articles[0].headline_ko == articles[0].headline
+
+
+def test_slow_and_dead_feeds_do_not_block_refresh():
+    original = (app.RSS_FEED_DEADLINE, app.RSS_REFRESH_BUDGET)
+    app.RSS_FEED_DEADLINE, app.RSS_REFRESH_BUDGET = 0.5, 1.0
+    delays = {"fast": 0.05, "hung": 30, "dead": 0, "also-fast": 0.1}
+    try:
+        with mock_feeds(delays, statuses={"dead": 503}) as urls:
+            start = time.perf_counter()
+            articles = asyncio.run(app._fetch_rss_news(urls, translate=True))
+            elapsed = time.perf_counter() - start
+    finally:
+        app.RSS_FEED_DEADLINE, app.RSS_REFRESH_BUDGET = original
+    assert elapsed < 1.0, elapsed
+    assert {article.source for article in articles} == {"fast", "also-fast"}
+    assert all(article.headline_ko is None for article in articles)
+
+
+def test_refresh_budget_returns_what_arrived():
+    original = (app.RSS_FEED_DEADLINE, app.RSS_REFRESH_BUDGET)
+    app.RSS_FEED_DEADLINE, app.RSS_REFRESH_BUDGET = 10.0, 0.5
+    try:
+        with mock_feeds({"quick": 0, "slow": 5}) as urls:
+            start = time.perf_counter()
+            articles = asyncio.run(app._fetch_rss_news(urls))
+            elapsed = time.perf_counter() - start
+    finally:
+        app.RSS_FEED_DEADLINE, app.RSS_REFRESH_BUDGET = original
+    assert elapsed < 1.0, elapsed
+    assert {article.source for article in articles} == {"quick"}
+
+
+def test_unchanged_feeds_are_not_parsed():
+    versions = {"validated": 1, "ignores-validators": 1, "changing": 1}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.path.strip("/")
+        etag = f'"{name}-{versions[name]}"'
+        if name == "validated" and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        headers = {"ETag": etag} if name == "validated" else {}
+        return httpx.Response(200, text=rss_body(f"{name}{versions[name]}"), headers=headers)
+
+    app.RSS_FEED_STATE.clear()
+    with mock_feeds(dict.fromkeys(versions, 0), handler=handler) as urls:
+        first = asyncio.run(app._fetch_rss_news(urls))
+        before = dict(app.RSS_FETCH_STATS)
+        versions["changing"] = 2
+        second = asyncio.run(app._fetch_rss_news(urls))
+    delta = {key: app.RSS_FETCH_STATS[key] - before[key] for key in before}
+
+    # 304 한 번, 본문 해시 일치 한 번, 실제 변경된 피드만 다시 파싱
+    assert delta == {"parsed": 1, "not_modified": 1, "unchanged": 1}, delta
+    assert {a.source for a in second} == {"validated1", "ignores-validators1", "changing2"}
+    assert {a.url for a in first if a.source == "validated1"} == {a.url for a in second if a.source == "validated1"}
+
+    # 다음 갱신이 돌려준 기사를 바꿔도 이전 응답과 피드 상태의 기사는 그대로
+    for article in second:
+        article.headline_ko = "변경됨"
+    assert all(a.headline_ko != "변경됨" for a in first)
+    assert all(a.headline_ko != "변경됨" for state in app.RSS_FEED_STATE.values() for a in state["articles"])
+
+
+if __name__ == "__main__":
+    test_feeds_are_fetched_concurrently()
+    test_slow_and_dead_feeds_do_not_block_refresh()
+    test_refresh_budget_returns_what_arrived()
+    test_unchanged_feeds_are_not_parsed()
+    print("RSS 동시 수집 검증 완료")
@@ -0,0 +1,122 @@
+"""
+기술적 스크리너 검증 스크립트
+
+PriceMatrix의 2차원 벡터화 지표가 app.py의 종목별 계산(calculate_rsi, rolling mean)과
+일치하는지, 조건 트리(all/any, 골든 크로스)가 올바르게 평가되는지 확인하고
+2,000종목 유니버스 스크리닝 시간을 측정합니다.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+from app import calculate_rsi
+from services.screener import PriceMatrix
+
+
+def make_matrix(symbols: int, days: int, seed: int = 0) -> PriceMatrix:
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2024-01-01", periods=days)
+    tickers = [f"T{i:04d}" for i in range(symbols)]
+    closes = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.02, (days, symbols)), axis=0)),
+        index=dates,
+        columns=tickers,
+    )
+    # 일부 종목은 중간에 상장된 것으로 처리
+    for column, listed in zip(tickers[:3], (10, 40, days - 5)):
+        closes.iloc[:listed, closes.columns.get_loc(column)] = np.nan
+    volumes = pd.DataFrame(rng.integers(1_000, 100_000, (days, symbols)), index=dates, columns=tickers)
+    return PriceMatrix.build("TEST", tickers, closes, volumes)
+
+
+def test_indicators_match_per_symbol_calculation():
+    matrix = make_matrix(20, 200)
+    for row in range(len(matrix)):
+        closes = pd.Series(matrix.close[row]).dropna()
+        offset = len(matrix.dates) - len(closes)
+
+        expected_rsi = calculate_rsi(closes).to_numpy()
+        actual_rsi = matrix.indicator("rsi", 14)[row, offset:]
+        np.testing.assert_allclose(actual_rsi, expected_rsi, rtol=1e-9, equal_nan=True)
+
+        expected_sma = closes.rolling(window=20).mean().to_numpy()
+        actual_sma = matrix.indicator("sma", 20)[row, offset:]
+        np.testing.assert_allclose(actual_sma, expected_sma, rtol=1e-9, equal_nan=True)
+        assert np.isnan(matrix.indicator("rsi", 14)[row, :offset]).all()
+
+
+def test_condition_tree():
+    matrix = make_matrix(300, 120, seed=3)
+    rsi = matrix.indicator("rsi", 14)[:, -1]
+    fast = matrix.indicator("sma", 5)
+    slow = matrix.indicator("sma", 20)
+    golden = (fast[:, -2] <= slow[:, -2]) & (fast[:, -1] > slow[:, -1])
+
+    mask, values = matrix.screen({
+        "any": [
+            {"indicator": "rsi", "period": 14, "op": "<", "value": 40},
+            {"indicator": "golden_cross", "fast": 5, "slow": 20},
+        ]
+    })
+    np.testing.assert_array_equal(mask, (rsi < 40) | golden)
+    assert set(values) == {"rsi_14", "sma_5", "sma_20"}
+
+    mask, _ = matrix.screen({
+        "all": [
+            {"indicator": "close", "op": ">", "ref": {"indicator": "sma", "period": 20}},
+            {"indicator": "rsi", "op": ">=", "value": 50},
+        ]
+    })
+    with np.errstate(invalid="ignore"):
+        expected = (matrix.close[:, -1] > slow[:, -1]) & (rsi >= 50)
+    np.testing.assert_array_equal(mask, expected)
+
+
+def test_invalid_conditions_raise_value_error():
+    matrix = make_matrix(5, 30)
+    invalid = [
+        {"indicator": "rsi", "op": "<"},
+        {"indicator": "unknown", "op": "<", "value": 1},
+        {"indicator": "rsi", "op": "!=", "value": 1},
+        {"all": []},
+        {"indicator": "golden_cross", "fast": 20, "slow": 5},
+        {"indicator": "sma", "period": 0, "op": ">", "value": 1},
+    ]
+    for conditions in invalid:
+        try:
+            matrix.screen(conditions)
+        except ValueError:
+            continue
+        raise AssertionError(f"ValueError가 발생해야 합니다: {conditions}")
+
+
+def benchmark(symbols: int = 2000, days: int = 250) -> float:
+    matrix = make_matrix(symbols, days)
+    start = time.perf_counter()
+    mask, values = matrix.screen({
+        "all": [
+            {"indicator": "rsi", "period": 14, "op": "<", "value": 30},
+            {"indicator": "golden_cross", "fast": 5, "slow": 20, "within": 3},
+            {"indicator": "volume_ratio", "period": 20, "op": ">", "value": 1.5},
+        ]
+    })
+    matrix.results(mask, values, limit=100)
+    return time.perf_counter() - start
+
+
+def test_full_universe_screen_is_fast():
+    assert benchmark() < 1.0
+
+
+if __name__ == "__main__":
+    test_indicators_match_per_symbol_calculation()
+    test_condition_tree()
+    test_invalid_conditions_raise_value_error()
+    print(f"2,000종목 x 250일 스크리닝 (지표 계산 포함): {benchmark() * 1000:.1f} ms")
@@ -0,0 +1,122 @@
+"""
+지지/저항선 벡터화 구현 검증 스크립트
+
+detect_support_resistance의 NumPy 구현이 기존 반복문(.iloc) 구현과 동일한 결과를
+내는지 확인하고, 5,000봉 시계열에서 두 구현의 실행 시간을 비교합니다.
+"""
+
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+from app import SupportResistance, detect_support_resistance
+
+
+def reference_support_resistance(
+    highs: pd.Series, lows: pd.Series, closes: pd.Series, window: int = 20
+) -> Tuple[List[SupportResistance], List[SupportResistance]]:
+    """벡터화 이전의 반복문 구현 (비교 기준)"""
+    supports = []
+    resistances = []
+    pivot_window = max(window // 2, 5)
+
+    for i in range(pivot_window, len(lows) - pivot_window):
+        if lows.iloc[i] == lows.iloc[i-pivot_window:i+pivot_window+1].min():
+            level = float(lows.iloc[i])
+            lookback = min(50, i)
+            nearby_touches = 0
+            total_candles = 0
+            for j in range(max(0, i - lookback), min(len(lows), i + 10)):
+                total_candles += 1
+                if abs(lows.iloc[j] - level) / level <= 0.03:
+                    nearby_touches += 1
+            strength = nearby_touches / total_candles if total_candles > 0 else 0
+            if strength >= 0.2:
+                supports.append(SupportResistance(level=level, strength=min(strength, 1.0), type="support"))
+
+    for i in range(pivot_window, len(highs) - pivot_window):
+        if highs.iloc[i] == highs.iloc[i-pivot_window:i+pivot_window+1].max():
+            level = float(highs.iloc[i])
+            lookback = min(50, i)
+            nearby_touches = 0
+            total_candles = 0
+            for j in range(max(0, i - lookback), min(len(highs), i + 10)):
+                total_candles += 1
+                if abs(highs.iloc[j] - level) / level <= 0.03:
+                    nearby_touches += 1
+            strength = nearby_touches / total_candles if total_candles > 0 else 0
+            if strength >= 0.2:
+                resistances.append(SupportResistance(level=level, strength=min(strength, 1.0), type="resistance"))
+
+    def deduplicate_levels(level_items: List[SupportResistance]) -> List[SupportResistance]:
+        unique_by_level: Dict[float, SupportResistance] = {}
+        for item in level_items:
+            price_range = item.level * 0.02
+            key = round(item.level / price_range) * price_range
+            existing = unique_by_level.get(key)
+            if existing is None or item.strength > existing.strength:
+                unique_by_level[key] = item
+        return sorted(unique_by_level.values(), key=lambda x: x.strength, reverse=True)[:5]
+
+    return deduplicate_levels(supports), deduplicate_levels(resistances)
+
+
+def make_candles(length: int, seed: int, tick: float = 0.0) -> pd.DataFrame:
+    """랜덤워크 캔들 (tick > 0이면 호가 단위로 반올림해 같은 가격이 반복되도록 함)"""
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, length)))
+    highs = closes * (1 + rng.uniform(0, 0.02, length))
+    lows = closes * (1 - rng.uniform(0, 0.02, length))
+    if tick:
+        closes, highs, lows = (np.round(values / tick) * tick for values in (closes, highs, lows))
+    return pd.DataFrame({"high": highs, "low": lows, "close": closes})
+
+
+def test_matches_reference_implementation():
+    cases = [(length, seed, tick) for length in (0, 10, 11, 21, 60, 250, 600) for seed in range(3) for tick in (0.0, 0.5)]
+    for length, seed, tick in cases:
+        df = make_candles(length, seed, tick)
+        for window in (10, 20, 40):
+            expected = reference_support_resistance(df["high"], df["low"], df["close"], window=window)
+            actual = detect_support_resistance(df["high"], df["low"], df["close"], window=window)
+            assert actual == expected, (length, seed, tick, window)
+
+
+def test_handles_missing_values_like_reference():
+    df = make_candles(300, seed=7)
+    df.loc[[15, 80, 81, 200], ["high", "low"]] = np.nan
+    expected = reference_support_resistance(df["high"], df["low"], df["close"])
+    assert detect_support_resistance(df["high"], df["low"], df["close"]) == expected
+
+
+def benchmark(length: int = 5000, repeat: int = 3) -> Dict[str, float]:
+    df = make_candles(length, seed=42)
+    timings = {}
+    for name, func in (("loop", reference_support_resistance), ("vectorized", detect_support_resistance)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func(df["high"], df["low"], df["close"])
+        timings[name] = (time.perf_counter() - start) / repeat
+    return timings
+
+
+def test_vectorized_is_faster_on_5000_bars():
+    timings = benchmark(repeat=1)
+    assert timings["vectorized"] < timings["loop"]
+
+
+if __name__ == "__main__":
+    test_matches_reference_implementation()
+    test_handles_missing_values_like_reference()
+    result = benchmark()
+    print("5,000봉 지지/저항선 탐지")
+    print(f"  반복문 구현:  {result['loop'] * 1000:.1f} ms")
+    print(f"  벡터화 구현:  {result['vectorized'] * 1000:.1f} ms")
+    print(f"  속도 향상:    {result['loop'] / result['vectorized']:.0f}x")
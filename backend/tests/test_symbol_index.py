@@ -0,0 +1,222 @@
+"""
+뉴스 종목 태깅/역색인 검증 스크립트
+
+services/symbol_index.py의 Aho-Corasick 매처가 단순 검색과 같은 위치를 모두 찾는지,
+종목명·티커 경계 규칙(조사, 대소문자, 긴 이름 우선)이 지켜지는지, 흔한 단어인 종목명
+(대상, Target, News Corp 등)이 관계없는 기사에 태깅되지 않는지 확인하고, 팔로워 워커가
+리더가 저장한 종목 마스터를 디스크에서 읽는지,
+수집 시점에 태깅된 역색인으로 /api/news/symbol이 응답하며 결과가 부족할 때만
+외부 검색을 하는지 확인합니다. 마지막으로 종목 3,000개 x 기사 500개 태깅 시간을
+종목명마다 문자열을 검색하는 방식과 비교합니다.
+"""
+
+import asyncio
+import contextlib
+import datetime as dt
+import os
+import random
+import sys
+import tempfile
+import time
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+from services.disk_cache import JsonDiskCache
+from services.leader import KeyedFileLock, SnapshotChannel
+from services.symbol_index import AhoCorasick, SymbolMatcher, company_aliases
+
+MASTER = [
+    ("005930", "삼성전자"),
+    ("000880", "한화"),
+    ("009830", "한화솔루션"),
+    ("035420", "NAVER"),
+    ("000660", "SK하이닉스"),
+    ("AAPL", "Apple Inc."),
+    ("IT", "Gartner, Inc."),
+    ("F", "Ford Motor Company"),
+    ("META", "Meta Platforms, Inc."),
+]
+
+
+def test_aho_corasick_matches_naive_search():
+    rng = random.Random(0)
+    patterns = sorted({"".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(30)})
+    automaton = AhoCorasick((pattern, pattern) for pattern in patterns)
+    text = "".join(rng.choice("abcd") for _ in range(500))
+    found = sorted((start, end, value) for start, end, value in automaton.finditer(text))
+    expected = sorted(
+        (start, start + len(pattern), pattern)
+        for pattern in patterns
+        for start in range(len(text))
+        if text.startswith(pattern, start)
+    )
+    assert found == expected
+
+
+def test_symbol_matcher_rules():
+    matcher = SymbolMatcher(MASTER)
+    assert company_aliases("Meta Platforms, Inc.") == ["Meta Platforms, Inc.", "Meta Platforms"]
+    # 조사가 붙은 한글 종목명, 영문/숫자 경계
+    assert matcher.match("삼성전자가 3분기 실적 발표, NAVER는 SK하이닉스와 협력") == ["005930", "035420", "000660"]
+    # 긴 이름 우선: 한화솔루션은 한화를 함께 태깅하지 않음, 다른 단어 중간은 무시
+    assert matcher.match("한화솔루션 급등, 신한화학과 무관") == ["009830"]
+    # 티커는 대소문자 구분, 흔한 단어 모양 티커(IT)는 제외, 단어 중간은 무시
+    assert matcher.match("AAPL and META rally as IT spending slows") == ["AAPL", "META"]
+    assert matcher.match("pineapple metadata and aapl") == []
+    assert matcher.match("Apple shares rise; Ford Motor recalls") == ["AAPL", "F"]
+    assert matcher.names["005930"] == "삼성전자"
+
+
+# KRX/S&P 500 상장명 그대로
+LISTED = MASTER + [
+    ("001680", "대상"),
+    ("053620", "태양"),
+    ("004140", "동방"),
+    ("NWSA", "News Corp"),
+    ("NWS", "News Corp"),
+    ("TGT", "Target Corporation"),
+    ("V", "Visa Inc."),
+    ("BKNG", "Booking Holdings Inc."),
+]
+
+
+def test_common_word_names_are_not_tagged():
+    matcher = SymbolMatcher(LISTED)
+    assert matcher.match("정부, 중소기업 대상 지원 확대") == []
+    assert matcher.match("태양광 업계, 동방 진출 확대 검토") == []
+    assert matcher.match("Stock market news: analysts raise price target on Apple") == ["AAPL"]
+    # 제목식 대문자 표기도 흔한 단어는 태깅하지 않음
+    assert matcher.match("Stock Market News: Analysts Raise Price Target On Apple") == ["AAPL"]
+    assert matcher.match("Travel Booking Demand Cools as Visa Rules Tighten") == []
+    # 영문 종목명은 첫 글자가 대문자일 때만
+    assert matcher.match("apple orchards and ford crossings") == []
+    assert matcher.match("APPLE, Ford Motor shares rise") == ["AAPL", "F"]
+
+    # 전체 상장명이나 코드/티커로는 태깅
+    assert matcher.match("대상(001680) 3분기 영업이익 증가") == ["001680"]
+    assert matcher.match("Target Corporation cuts outlook; TGT falls") == ["TGT"]
+    assert matcher.match("News Corp weighs sale of NWSA stake") == ["NWSA"]
+    assert matcher.match("Booking Holdings Inc. beats estimates") == ["BKNG"]
+
+
+def test_follower_loads_symbol_master_from_disk():
+    fetched = []
+
+    def fake_load_master():
+        fetched.append(1)
+        return [(code, name) for name, code in app.KOREAN_STOCKS.items()] + LISTED
+
+    originals = (app.SYMBOL_MASTER_CACHE, app.SYMBOL_MATCHER, app.SYMBOL_MATCHER_BUILT_AT, app._load_symbol_master)
+    app.SYMBOL_MASTER_CACHE = JsonDiskCache(tempfile.mkdtemp(), ttl_seconds=3600)
+    app._load_symbol_master = fake_load_master
+    app.SYMBOL_MATCHER_BUILT_AT = 0.0
+    initial = app.SYMBOL_MATCHER
+    try:
+        # 리더가 아직 저장하지 않았으면 팔로워는 기존 매처를 유지하고 다음 주기에 다시 확인
+        asyncio.run(app._refresh_symbol_matcher(fetch=False))
+        assert app.SYMBOL_MATCHER is initial and app.SYMBOL_MATCHER_BUILT_AT == 0.0
+
+        # 리더: 외부에서 받아 디스크에 저장
+        asyncio.run(app._refresh_symbol_matcher())
+        assert fetched == [1] and "TGT" in app.SYMBOL_MATCHER.names
+
+        # 팔로워(메모리에는 기동 시 매처만): 외부 호출 없이 디스크 마스터로 생성
+        app.SYMBOL_MATCHER, app.SYMBOL_MATCHER_BUILT_AT = initial, 0.0
+        asyncio.run(app._refresh_symbol_matcher(fetch=False))
+        assert fetched == [1]
+        assert app.SYMBOL_MATCHER.match("대상(001680), Target Corporation") == ["001680", "TGT"]
+    finally:
+        (app.SYMBOL_MASTER_CACHE, app.SYMBOL_MATCHER, app.SYMBOL_MATCHER_BUILT_AT, app._load_symbol_master) = originals
+
+
+@contextlib.contextmanager
+def indexed_news(headlines):
+    """한국 RSS 수집 결과를 headlines로 고정하고 외부 검색 호출 횟수를 셈"""
+    calls = []
+
+    async def fake_rss(feeds, translate=False):
+        now = dt.datetime.now(dt.timezone.utc)
+        return [
+            app.NewsArticle(headline=title, headline_ko=title, url=f"https://news.test/{i}", published_at=now)
+            for i, title in enumerate(headlines)
+        ]
+
+    async def fake_external(stock_query, is_korean):
+        calls.append(stock_query)
+        now = dt.datetime.now(dt.timezone.utc)
+        return [app.NewsArticle(headline=f"{stock_query} 외부 기사", url="https://external.test/1", published_at=now)]
+
+    state_dir = tempfile.mkdtemp()
+    originals = (app._fetch_rss_news, app._fetch_stock_news_from_external, app.SYMBOL_MATCHER, app.NEWS_SNAPSHOT, app.ON_DEMAND_FETCH_LOCK)
+    app._fetch_rss_news, app._fetch_stock_news_from_external = fake_rss, fake_external
+    app.SYMBOL_MATCHER = SymbolMatcher(MASTER)
+    # 수집 결과를 발행하는 스냅샷/잠금은 임시 디렉터리에
+    app.NEWS_SNAPSHOT = SnapshotChannel("news_cache", state_dir)
+    app.ON_DEMAND_FETCH_LOCK = KeyedFileLock("fetch", state_dir, poll_interval=0.01)
+    app.NEWS_CACHE.pop("korea", None)
+    try:
+        yield calls
+    finally:
+        app._fetch_rss_news, app._fetch_stock_news_from_external, app.SYMBOL_MATCHER, app.NEWS_SNAPSHOT, app.ON_DEMAND_FETCH_LOCK = originals
+        app.NEWS_CACHE.pop("korea", None)
+        app.NEWS_SYMBOL_INDEX.pop("korea", None)
+        app.NEWS_REVALIDATE_TASKS.clear()
+
+
+def test_symbol_news_comes_from_index():
+    headlines = [f"삼성전자 소식 {i}" for i in range(6)] + ["한화솔루션 태양광 수주", "코스피 마감 시황"]
+
+    async def scenario(calls):
+        samsung = await app.get_news_by_symbol("005930.KS")
+        assert [a.headline for a in samsung] == [f"삼성전자 소식 {i}" for i in range(6)]
+        assert calls == []
+        assert app.NEWS_SYMBOL_INDEX["korea"]["009830"] == [6]
+        assert app.NEWS_CACHE["korea"][0][6].symbols == ["009830"]
+
+        # 색인 결과가 부족하면 외부 검색으로 보충
+        hanwha = await app.get_news_by_symbol("009830")
+        assert [a.headline for a in hanwha] == ["한화솔루션 태양광 수주", "한화솔루션 외부 기사"]
+        assert calls == ["한화솔루션"]
+
+    with indexed_news(headlines) as calls:
+        asyncio.run(scenario(calls))
+
+
+def benchmark(names: int = 3000, articles: int = 500) -> dict:
+    rng = random.Random(1)
+    syllables = "가나다라마바사아자차카타파하전자화학바이오금융건설"
+    master = [(f"{i:06d}", "".join(rng.choice(syllables) for _ in range(rng.randint(3, 6)))) for i in range(names)]
+    texts = [
+        " ".join(rng.choice(master)[1] if rng.random() < 0.1 else "".join(rng.choice(syllables) for _ in range(3)) for _ in range(60))
+        for _ in range(articles)
+    ]
+
+    start = time.perf_counter()
+    matcher = SymbolMatcher(master)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    for text in texts:
+        matcher.match(text)
+    automaton = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for text in texts:
+        lowered = text.lower()
+        [code for code, name in master if name.lower() in lowered]
+    scan = time.perf_counter() - start
+    return {"build": build, "automaton": automaton, "scan": scan}
+
+
+if __name__ == "__main__":
+    test_aho_corasick_matches_naive_search()
+    test_symbol_matcher_rules()
+    test_common_word_names_are_not_tagged()
+    test_follower_loads_symbol_master_from_disk()
+    test_symbol_news_comes_from_index()
+    result = benchmark()
+    print("종목 3,000개 x 기사 500개 태깅")
+    print(f"  매처 생성:         {result['build'] * 1000:.0f} ms")
+    print(f"  Aho-Corasick:      {result['automaton'] * 1000:.0f} ms")
+    print(f"  종목명별 문자열 검색: {result['scan'] * 1000:.0f} ms")
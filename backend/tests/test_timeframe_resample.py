@@ -0,0 +1,196 @@
+"""
+멀티 타임프레임 리샘플링/종합 신호 검증 스크립트
+
+_resample_candles가 60분봉을 4시간/일/주/월봉으로 묶을 때 pandas로 직접 묶은 결과
+(구간별 첫 시가, 최고가, 최저가, 마지막 종가, 거래량 합)와 같은지 확인합니다. 월말/주말
+경계를 넘는 구간, 거래가 없는 날(주말), 마지막의 덜 찬 구간을 포함합니다. 주/월봉은
+기존 한국 주식 경로와 같이 구간 끝 날짜(일요일, 말일)로 표시됩니다.
+_timeframe_confluence는 다수결, 동률, 분석 실패 타임프레임 제외를 확인합니다.
+분봉 조회 한도가 요청 기간보다 짧으면 일/주봉은 요청 기간 전체의 일봉에서 계산하는지도 확인합니다.
+"""
+
+import asyncio
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+
+
+def _hourly_candles() -> app.CandleResponse:
+    """미국 정규장(13:30~19:30 UTC) 60분봉, 9월 중순부터 10월 15일 14:30(마지막 구간 미완성)까지"""
+    times = [
+        day + pd.Timedelta(hours=13, minutes=30) + pd.Timedelta(hours=hour)
+        for day in pd.bdate_range("2026-09-14", "2026-10-15")
+        for hour in range(7)
+    ]
+    times = [t for t in times if t <= pd.Timestamp("2026-10-15 14:30")]
+    rng = np.random.default_rng(3)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, len(times))))
+    opens = closes * (1 + rng.normal(0, 0.002, len(times)))
+    return app.CandleResponse(
+        symbol="AAPL",
+        resolution="60",
+        data=app.CandleSeries(
+            timestamps=[int(t.timestamp()) for t in times],
+            opens=opens.tolist(),
+            highs=(np.maximum(opens, closes) * 1.003).tolist(),
+            lows=(np.minimum(opens, closes) * 0.997).tolist(),
+            closes=closes.tolist(),
+            volumes=rng.integers(1_000, 5_000, len(times)).astype(float).tolist(),
+        ),
+    )
+
+
+def _reference(candles: app.CandleResponse, labels) -> pd.DataFrame:
+    """기준 구현: 봉마다 구간 라벨을 붙여 groupby로 집계"""
+    data = candles.data
+    frame = pd.DataFrame(
+        {"open": data.opens, "high": data.highs, "low": data.lows, "close": data.closes, "volume": data.volumes},
+        index=pd.to_datetime(data.timestamps, unit="s"),
+    )
+    return frame.groupby(labels(frame.index)).agg(
+        {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+    )
+
+
+def _assert_matches(resampled: app.CandleResponse, reference: pd.DataFrame) -> None:
+    data = resampled.data
+    assert data.timestamps == [int(t.timestamp()) for t in reference.index]
+    for field in ("open", "high", "low", "close", "volume"):
+        assert np.allclose(getattr(data, f"{field}s"), reference[field].to_numpy()), field
+
+
+def test_intraday_and_daily_buckets():
+    candles = _hourly_candles()
+    four_hour = app._resample_candles(candles, "240")
+    assert four_hour.resolution == "240"
+    # 하루 안의 13:30~15:30은 12:00 구간, 16:30~19:30은 16:00 구간
+    _assert_matches(four_hour, _reference(candles, lambda index: index.floor("4h")))
+
+    daily = app._resample_candles(candles, "D")
+    _assert_matches(daily, _reference(candles, lambda index: index.floor("D")))
+    # 주말은 빈 봉을 만들지 않고, 마지막 날은 받은 두 시간만으로 구성
+    assert len(daily.data.timestamps) == len(pd.bdate_range("2026-09-14", "2026-10-15"))
+    last_day = [i for i, ts in enumerate(candles.data.timestamps) if ts >= int(pd.Timestamp("2026-10-15").timestamp())]
+    assert len(last_day) == 2
+    assert daily.data.opens[-1] == candles.data.opens[last_day[0]]
+    assert daily.data.closes[-1] == candles.data.closes[-1]
+    assert daily.data.volumes[-1] == sum(candles.data.volumes[i] for i in last_day)
+
+
+def test_week_and_month_edges():
+    candles = _hourly_candles()
+    weekly = app._resample_candles(candles, "W")
+    _assert_matches(weekly, _reference(candles, lambda index: index.to_period("W-SUN").end_time.normalize()))
+    # 월~금이 한 주, 라벨은 그 주 일요일 (마지막 주는 목요일까지만)
+    assert [pd.Timestamp(ts, unit="s").day_name() for ts in weekly.data.timestamps] == ["Sunday"] * 5
+    assert pd.Timestamp(weekly.data.timestamps[-1], unit="s") == pd.Timestamp("2026-10-18")
+
+    monthly = app._resample_candles(candles, "M")
+    _assert_matches(monthly, _reference(candles, lambda index: index.to_period("M").end_time.normalize()))
+    assert [pd.Timestamp(ts, unit="s").date().isoformat() for ts in monthly.data.timestamps] == ["2026-09-30", "2026-10-31"]
+    # 9월 마지막 봉과 10월 첫 봉이 서로 다른 월봉으로
+    september = [i for i, ts in enumerate(candles.data.timestamps) if ts < int(pd.Timestamp("2026-10-01").timestamp())]
+    assert monthly.data.closes[0] == candles.data.closes[september[-1]]
+    assert monthly.data.opens[1] == candles.data.opens[september[-1] + 1]
+
+
+def _timeframe(resolution: str, signal_type=None) -> app.TimeframeAnalysis:
+    if signal_type is None:
+        return app.TimeframeAnalysis(resolution=resolution, error="데이터 부족")
+    analysis = app.ChartAnalysisResponse(
+        symbol="AAPL",
+        technical_indicators=[],
+        support_resistance=[],
+        trend_lines=[],
+        patterns=[],
+        trading_signal=app.TradingSignal(type=signal_type, confidence=0.5, reason="test"),
+        risk_analysis={},
+        summary="",
+    )
+    return app.TimeframeAnalysis(resolution=resolution, analysis=analysis)
+
+
+def test_confluence_scoring():
+    result = app._timeframe_confluence([_timeframe("60", "buy"), _timeframe("D", "buy"), _timeframe("W", "sell")])
+    assert (result.signal, result.bullish, result.bearish, result.neutral) == ("buy", 2, 1, 0)
+    assert result.agreement == round(2 / 3, 4)
+    assert result.summary == "종합: 매수 (2/3 타임프레임 일치) | 60: BUY, D: BUY, W: SELL"
+
+    # 매수/매도 동률은 관망, 관망과 동률인 방향은 그 방향
+    assert app._timeframe_confluence([_timeframe("D", "buy"), _timeframe("W", "sell")]).signal == "hold"
+    tied = app._timeframe_confluence([_timeframe("60", "sell"), _timeframe("D", "hold"), _timeframe("W", "hold"), _timeframe("M", "sell")])
+    assert (tied.signal, tied.agreement) == ("sell", 0.5)
+    assert app._timeframe_confluence([_timeframe("D", "buy"), _timeframe("W", "hold"), _timeframe("M", "hold")]).signal == "hold"
+
+    # 분석에 실패한 타임프레임은 집계에서 제외
+    partial = app._timeframe_confluence([_timeframe("60"), _timeframe("D", "sell")])
+    assert (partial.signal, partial.agreement, partial.bearish) == ("sell", 1.0, 1)
+    assert partial.summary == "종합: 매도 (1/1 타임프레임 일치) | D: SELL"
+    empty = app._timeframe_confluence([_timeframe("60"), _timeframe("D")])
+    assert (empty.signal, empty.agreement, empty.summary) == ("hold", 0.0, "종합: 관망 (0/0 타임프레임 일치)")
+
+
+def _minute_and_daily_candles(resolution: str, range_days: int) -> app.CandleResponse:
+    """_fetch_base_candles 대신: 분봉은 yfinance 한도(YF_INTRADAY_MAX_DAYS)만큼, 일봉은 요청 기간 전체"""
+    rng = np.random.default_rng(len(resolution))
+    if resolution == "D":
+        times = pd.bdate_range(end="2026-10-16", periods=int(range_days * 5 / 7))
+    else:
+        days = pd.bdate_range(end="2026-10-16", periods=min(range_days, app.YF_INTRADAY_MAX_DAYS[resolution]) * 5 // 7)
+        times = [day + pd.Timedelta(hours=13, minutes=30) + pd.Timedelta(minutes=m) for day in days for m in range(0, 390, 5)]
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, len(times))))
+    return app.CandleResponse(
+        symbol="AAPL",
+        resolution=resolution,
+        data=app.CandleSeries(
+            timestamps=[int(pd.Timestamp(t).timestamp()) for t in times],
+            opens=closes.tolist(),
+            highs=(closes * 1.003).tolist(),
+            lows=(closes * 0.997).tolist(),
+            closes=closes.tolist(),
+            volumes=[1_000.0] * len(times),
+        ),
+    )
+
+
+def test_coarse_timeframes_use_full_range_daily_base():
+    calls = []
+
+    async def fake_base(symbol, resolution, range_days):
+        calls.append((resolution, range_days))
+        return _minute_and_daily_candles(resolution, range_days)
+
+    original = app._fetch_base_candles
+    app._fetch_base_candles = fake_base
+    try:
+        payload = app.MultiTimeframeAnalysisRequest(symbol="AAPL", resolutions=["1", "D", "W"], range_days=365)
+        result = asyncio.run(app.analyze_chart_multi_timeframe(payload))
+        # 1분봉 한도(7일)가 요청(365일)보다 짧으므로 일봉을 따로 받음
+        assert sorted(calls) == [("1", 365), ("D", 365)]
+        assert result.base_resolution == "1"
+        assert {item.resolution: item.range_days for item in result.timeframes} == {"1": 7, "D": 365, "W": 365}
+        assert all(item.analysis is not None for item in result.timeframes)
+
+        # 60분봉 한도(730일)가 요청 기간보다 길면 60분봉 한 번만 받아 일/주봉도 리샘플링
+        calls.clear()
+        payload = app.MultiTimeframeAnalysisRequest(symbol="AAPL", resolutions=["60", "D", "W"], range_days=365)
+        result = asyncio.run(app.analyze_chart_multi_timeframe(payload))
+        assert calls == [("60", 365)]
+        assert {item.range_days for item in result.timeframes} == {365}
+    finally:
+        app._fetch_base_candles = original
+
+
+if __name__ == "__main__":
+    test_intraday_and_daily_buckets()
+    test_week_and_month_edges()
+    test_confluence_scoring()
+    test_coarse_timeframes_use_full_range_daily_base()
+    print("멀티 타임프레임 리샘플링/종합 신호 검증 완료")
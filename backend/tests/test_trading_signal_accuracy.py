@@ -5,7 +5,6 @@
 PPT 발표용 테스트 결과를 생성합니다.
 """
 
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple
@@ -17,13 +16,7 @@ import argparse
 backend_dir = os.path.dirname(os.path.dirname(__file__))
 if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
-from app import (
-    generate_trading_signal,
-    calculate_rsi,
-    calculate_macd,
-    detect_support_resistance,
-    calculate_moving_averages
-)
+from app import generate_trading_signal_series
 import yfinance as yf
 import FinanceDataReader as fdr
 
@@ -80,52 +73,20 @@ def test_trading_signal_accuracy(
     
     examples = []
     
+    # 전체 기간의 봉별 신호를 한 번에 계산 (각 봉 신호는 그 시점까지의 데이터만 사용)
+    signal_series = generate_trading_signal_series(closes, highs, lows, include_patterns=False)
+    
     for i in range(len(test_data) - 10):  # 최소 10일 후 결과 확인
         current_idx = test_start_idx + i
         if current_idx < 20:  # 최소 20일 데이터 필요
             continue
         
-        # 현재 시점까지의 데이터로 분석
-        historical_data = df.iloc[:current_idx + 1]
-        historical_closes = historical_data['close']
-        historical_highs = historical_data['high'] if 'high' in historical_data.columns else historical_closes
-        historical_lows = historical_data['low'] if 'low' in historical_data.columns else historical_closes
-        
-        # 기술적 지표 계산
-        rsi = calculate_rsi(historical_closes, period=14)
-        macd_data = calculate_macd(historical_closes)
-        supports, resistances = detect_support_resistance(historical_closes, historical_highs, historical_lows)
-        ma_data = calculate_moving_averages(historical_closes)
-        
-        if len(rsi) == 0 or len(macd_data['macd']) == 0:
-            continue
-        
-        rsi_current = rsi.iloc[-1]
-        macd_current = macd_data['macd'].iloc[-1]
-        signal_current = macd_data['signal'].iloc[-1]
-        macd_histogram = macd_data['histogram'].iloc[-1]
-        
-        current_price = historical_closes.iloc[-1]
-        
-        # 매매 신호 생성
-        patterns = []  # 패턴은 간단히 생략
-        macd_dict = {
-            'macd': pd.Series([macd_current]),
-            'signal': pd.Series([signal_current]),
-            'histogram': pd.Series([macd_histogram])
-        }
-        trading_signal = generate_trading_signal(
-            rsi=rsi_current,
-            macd=macd_dict,
-            closes=historical_closes,
-            supports=supports,
-            resistances=resistances,
-            patterns=patterns
-        )
+        current_price = closes.iloc[current_idx]
+        trading_signal = signal_series.iloc[current_idx]
         
-        signal_type = trading_signal.type
-        signal_score = trading_signal.confidence
-        signal_reason = trading_signal.reason
+        signal_type = trading_signal["type"]
+        signal_score = trading_signal["confidence"]
+        signal_reason = trading_signal["reason"]
         
         # 10일 후 결과 확인
         future_idx = current_idx + 10
@@ -0,0 +1,102 @@
+"""
+매매 신호 시계열 검증 스크립트
+
+generate_trading_signal_series의 봉별 결과가, 각 시점까지의 데이터로 지표·지지/저항선·패턴을
+다시 계산해 generate_trading_signal을 호출한 결과와 정확히 같은지 확인하고 실행 시간을 비교합니다.
+"""
+
+import math
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+from app import (
+    calculate_macd,
+    calculate_rsi,
+    detect_patterns,
+    detect_support_resistance,
+    generate_trading_signal,
+    generate_trading_signal_series,
+)
+
+
+def make_candles(length: int, seed: int, tick: float = 0.0) -> pd.DataFrame:
+    """랜덤워크 캔들 (tick > 0이면 호가 단위로 반올림해 같은 가격이 반복되도록 함)"""
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, length)))
+    highs = closes * (1 + rng.uniform(0, 0.02, length))
+    lows = closes * (1 - rng.uniform(0, 0.02, length))
+    if tick:
+        closes, highs, lows = (np.round(values / tick) * tick for values in (closes, highs, lows))
+    return pd.DataFrame({"high": highs, "low": lows, "close": closes})
+
+
+def per_bar_signals(df: pd.DataFrame, include_patterns: bool = True) -> list:
+    """기존 방식: 봉마다 그 시점까지의 데이터로 전체 지표를 다시 계산"""
+    signals = []
+    for end in range(1, len(df) + 1):
+        history = df.iloc[:end]
+        closes, highs, lows = history["close"], history["high"], history["low"]
+        supports, resistances = detect_support_resistance(highs, lows, closes)
+        patterns = detect_patterns(highs, lows, closes) if include_patterns else []
+        signals.append(generate_trading_signal(
+            float(calculate_rsi(closes).iloc[-1]), calculate_macd(closes), closes, supports, resistances, patterns
+        ))
+    return signals
+
+
+def same_price(actual: float, expected) -> bool:
+    return math.isnan(actual) if expected is None else actual == expected
+
+
+def assert_matches(df: pd.DataFrame, include_patterns: bool = True) -> None:
+    series = generate_trading_signal_series(df["close"], df["high"], df["low"], include_patterns=include_patterns)
+    expected = per_bar_signals(df, include_patterns)
+    for i, (row, signal) in enumerate(zip(series.itertuples(index=False), expected)):
+        assert row.type == signal.type, (i, row.type, signal.type)
+        assert row.confidence == signal.confidence, (i, row.confidence, signal.confidence)
+        assert row.reason == signal.reason, (i, row.reason, signal.reason)
+        for name in ("entry_price", "target_price", "stop_loss"):
+            assert same_price(getattr(row, name), getattr(signal, name)), (i, name)
+
+
+def test_series_matches_per_bar_signal():
+    seen = set()
+    for seed in range(6):
+        df = make_candles(260, seed, tick=0.5 if seed % 2 else 0.0)
+        assert_matches(df)
+        seen.update(generate_trading_signal_series(df["close"], df["high"], df["low"])["reason"])
+    # 지지/저항선, 패턴 사유가 실제로 검증되었는지 확인
+    assert any("지지선" in reason for reason in seen)
+    assert any("저항선" in reason for reason in seen)
+    assert any("하락 반전" in reason for reason in seen)
+
+
+def test_series_without_patterns():
+    assert_matches(make_candles(200, 11), include_patterns=False)
+
+
+def benchmark(length: int = 500) -> dict:
+    df = make_candles(length, seed=42)
+    start = time.perf_counter()
+    per_bar_signals(df)
+    per_bar = time.perf_counter() - start
+    start = time.perf_counter()
+    generate_trading_signal_series(df["close"], df["high"], df["low"])
+    vectorized = time.perf_counter() - start
+    return {"per_bar": per_bar, "vectorized": vectorized}
+
+
+if __name__ == "__main__":
+    test_series_matches_per_bar_signal()
+    test_series_without_patterns()
+    result = benchmark()
+    print("500봉 전체 매매 신호 계산")
+    print(f"  봉별 재계산: {result['per_bar'] * 1000:.1f} ms")
+    print(f"  시계열 계산: {result['vectorized'] * 1000:.1f} ms")
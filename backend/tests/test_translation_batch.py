@@ -0,0 +1,197 @@
+"""
+배치 번역 파이프라인 검증 스크립트
+
+Ollama 서버 대신 httpx.MockTransport로 번역 응답을 흉내 내어, 여러 문장을 한 프롬프트로
+묶어 보내고 표식(<<<N>>>)으로 정확히 나누는지, 동시 요청 수가 제한되는지, 배치 응답이
+깨진 항목만 한 건씩 다시 번역하는지, 번역 캐시 조회/저장이 한 번씩 이벤트 루프 밖에서
+실행되는지 확인하고, 50개 기사(제목+요약 100건) 번역 시간을
+한 건씩 번역하는 방식과 비교합니다.
+"""
+
+import asyncio
+import contextlib
+import datetime as dt
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+
+import httpx
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+import app
+from services import ai
+from services.translation_cache import TranslationCache
+
+ITEM_PATTERN = re.compile(r"^<<<(\d+)>>> (.*)$", re.MULTILINE)
+
+
+@contextlib.contextmanager
+def mock_ollama(latency: float = 0.0, drop=()):
+    """
+    배치 프롬프트에는 항목마다 '<<<N>>> KO:<원문>'으로, 단건 프롬프트에는 'KO:<원문>'으로 응답.
+    drop에 든 원문은 배치 응답에서 빠뜨림 (모델이 항목을 누락한 상황)
+    """
+    stats = {"batch": 0, "single": 0, "in_flight": 0, "max_in_flight": 0}
+
+    def reply(prompt: str) -> str:
+        items = ITEM_PATTERN.findall(prompt)
+        if not items:
+            stats["single"] += 1
+            return "KO:" + prompt.rsplit("\n\n", 1)[-1]
+        stats["batch"] += 1
+        return "\n".join(f"<<<{number}>>> KO:{text}" for number, text in items if text not in drop)
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        try:
+            await asyncio.sleep(latency)
+            return httpx.Response(200, json={"response": reply(json.loads(request.content)["prompt"])})
+        finally:
+            stats["in_flight"] -= 1
+
+    def sync_handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(latency)
+        return httpx.Response(200, json={"response": reply(json.loads(request.content)["prompt"])})
+
+    originals = (httpx.Client, httpx.AsyncClient)
+
+    def client(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(sync_handler)
+        return originals[0](*args, **kwargs)
+
+    def async_client(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(async_handler)
+        return originals[1](*args, **kwargs)
+
+    httpx.Client, httpx.AsyncClient = client, async_client
+    try:
+        yield stats
+    finally:
+        httpx.Client, httpx.AsyncClient = originals
+
+
+@contextlib.contextmanager
+def temporary_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        original = ai.TRANSLATION_CACHE
+        ai.TRANSLATION_CACHE = TranslationCache(os.path.join(tmp, "translations.sqlite3"))
+        try:
+            yield ai.TRANSLATION_CACHE
+        finally:
+            ai.TRANSLATION_CACHE.close()
+            ai.TRANSLATION_CACHE = original
+
+
+def test_split_batch_response():
+    response = "<<<1>>> 첫째\n<<< 2 >>>둘째 <줄>\n\n<<<2>>> 중복\n<<<4>>> 범위 밖\n<<<3>>>   "
+    # 2번은 중복, 3번은 비어 있고, 4번은 범위 밖이므로 1번만 남음
+    assert ai.split_batch_response(response, 3) == {0: "첫째"}
+    assert ai.split_batch_response("머리말\n<<<1>>> 가\n<<<2>>> 나\n다", 2) == {0: "가", 1: "나\n다"}
+    assert ai.split_batch_response("표식 없음", 1) == {}
+    # 원문 안의 표식 모양 문자열은 프롬프트에서 지워짐
+    assert ai._batch_prompt(["a <<<2>>> b"]).endswith("<<<1>>> a   b")
+
+
+def test_batches_are_aligned_and_cached():
+    texts = [f"Headline {i}" for i in range(25)] + ["Headline 3", ""]
+    with temporary_cache() as cache, mock_ollama() as stats:
+        result = asyncio.run(ai.translate_many_to_korean(texts))
+        assert result == [f"KO:{text}" if text else "" for text in texts]
+        # 중복을 뺀 25건을 10건씩 3개 배치로
+        assert stats["batch"] == 3 and stats["single"] == 0
+        assert len(cache) == 25
+        # 캐시에 있는 문장은 다시 보내지 않음
+        again = asyncio.run(ai.translate_many_to_korean(texts[:5] + ["New headline"]))
+        assert again[-1] == "KO:New headline" and stats["batch"] == 4
+        assert ai.translate_to_korean("Headline 7") == "KO:Headline 7" and stats["single"] == 0
+
+
+def test_cache_is_used_off_the_event_loop():
+    texts = [f"Brief {i}" for i in range(12)]
+    with temporary_cache() as cache, mock_ollama():
+        calls = []
+        for name in ("lookup_many", "store_many"):
+            method = getattr(cache, name)
+
+            def recorded(*args, _name=name, _method=method):
+                calls.append((_name, threading.current_thread() is threading.main_thread()))
+                return _method(*args)
+
+            setattr(cache, name, recorded)
+        cache.store("Brief 0", ai._translation_cache_models(os.getenv("OLLAMA_MODEL", "qwen2.5:0.5b"))[0], "캐시된 번역")
+        calls.clear()
+        result = asyncio.run(ai.translate_many_to_korean(texts))
+        assert result == ["캐시된 번역"] + [f"KO:{text}" for text in texts[1:]]
+        # 조회 한 번, 저장 한 번, 모두 이벤트 루프가 아닌 스레드에서
+        assert calls == [("lookup_many", False), ("store_many", False)]
+        assert len(cache) == 12
+
+
+def test_concurrency_is_bounded():
+    original = ai.TRANSLATION_CONCURRENCY
+    ai.TRANSLATION_CONCURRENCY = 2
+    try:
+        with temporary_cache(), mock_ollama(latency=0.05) as stats:
+            asyncio.run(ai.translate_many_to_korean([f"Story {i}" for i in range(60)]))
+    finally:
+        ai.TRANSLATION_CONCURRENCY = original
+    assert stats["batch"] == 6 and stats["max_in_flight"] == 2
+
+
+def test_failed_items_fall_back_one_by_one():
+    texts = [f"Report {i}" for i in range(10)]
+    with temporary_cache(), mock_ollama(drop={"Report 4", "Report 8"}) as stats:
+        result = asyncio.run(ai.translate_many_to_korean(texts))
+    assert result == [f"KO:{text}" for text in texts]
+    assert stats["batch"] == 1 and stats["single"] == 2
+
+
+def test_articles_are_translated_in_place():
+    now = dt.datetime.now(dt.timezone.utc)
+    articles = [
+        app.NewsArticle(headline="Stocks rise", summary="Tech leads", url="https://a", published_at=now, symbols=[]),
+        app.NewsArticle(headline="Oil falls", summary=None, url="https://b", published_at=now, symbols=[]),
+        app.NewsArticle(headline="Done", headline_ko="완료", url="https://c", published_at=now, symbols=[]),
+    ]
+    with temporary_cache(), mock_ollama() as stats:
+        asyncio.run(app._translate_articles(articles))
+    assert [(a.headline_ko, a.summary_ko) for a in articles] == [
+        ("KO:Stocks rise", "KO:Tech leads"),
+        ("KO:Oil falls", None),
+        ("완료", None),
+    ]
+    assert stats["batch"] == 1
+
+
+def benchmark(articles: int = 50, latency: float = 0.05) -> dict:
+    texts = [f"Headline {i} on markets" for i in range(articles)] + [f"Summary {i} of the day" for i in range(articles)]
+    with temporary_cache(), mock_ollama(latency=latency):
+        start = time.perf_counter()
+        for text in texts:
+            ai.translate_to_korean(text)
+        sequential = time.perf_counter() - start
+    with temporary_cache(), mock_ollama(latency=latency):
+        start = time.perf_counter()
+        asyncio.run(ai.translate_many_to_korean(texts))
+        batched = time.perf_counter() - start
+    return {"sequential": sequential, "batched": batched}
+
+
+if __name__ == "__main__":
+    test_split_batch_response()
+    test_batches_are_aligned_and_cached()
+    test_cache_is_used_off_the_event_loop()
+    test_concurrency_is_bounded()
+    test_failed_items_fall_back_one_by_one()
+    test_articles_are_translated_in_place()
+    result = benchmark()
+    print("기사 50개(제목+요약 100건) 번역, 요청당 50ms 가정")
+    print(f"  한 건씩: {result['sequential'] * 1000:.0f} ms")
+    print(f"  배치:    {result['batched'] * 1000:.0f} ms")
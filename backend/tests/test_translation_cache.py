@@ -0,0 +1,140 @@
+"""
+번역 캐시 검증 스크립트
+
+Ollama 서버 대신 httpx.MockTransport로 번역 응답을 흉내 내어, 같은 문장은
+두 번째부터 모델을 호출하지 않고 디스크 캐시에서 나오는지, 캐시가 재시작(새 연결) 후에도
+남는지, 모델 이름이 바뀌면 따로 번역하는지, 실패한 번역은 캐시하지 않는지, 여러 문장을 한 번에
+조회/저장하는 lookup_many/store_many가 한 건씩 처리한 것과 같은지 확인합니다.
+"""
+
+import contextlib
+import os
+import sys
+import tempfile
+import time
+
+import httpx
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+from services import ai
+from services.translation_cache import TranslationCache
+
+
+@contextlib.contextmanager
+def mock_ollama(status: int = 200, delay: float = 0.0):
+    """Ollama /api/generate 응답을 흉내 내고 호출된 프롬프트를 기록"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.content)
+        time.sleep(delay)
+        return httpx.Response(status, json={"response": f"번역 {len(calls)}"})
+
+    original = httpx.Client
+
+    def client_factory(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        return original(*args, **kwargs)
+
+    httpx.Client = client_factory
+    try:
+        yield calls
+    finally:
+        httpx.Client = original
+
+
+@contextlib.contextmanager
+def temporary_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        original = ai.TRANSLATION_CACHE
+        ai.TRANSLATION_CACHE = TranslationCache(os.path.join(tmp, "translations.sqlite3"))
+        try:
+            yield ai.TRANSLATION_CACHE
+        finally:
+            ai.TRANSLATION_CACHE.close()
+            ai.TRANSLATION_CACHE = original
+
+
+def test_same_text_is_translated_once():
+    headline = "Fed holds rates steady as inflation cools"
+    with temporary_cache() as cache, mock_ollama() as calls:
+        first = ai.translate_to_korean(headline)
+        second = ai.translate_to_korean(headline)
+        other = ai.translate_to_korean("Oil prices slip on demand worries")
+        assert first == second == "번역 1" and other == "번역 2"
+        assert len(calls) == 2
+
+        # 재시작 후(새 연결)에도 캐시가 남아 있어야 함
+        path = cache.path
+        cache.close()
+        ai.TRANSLATION_CACHE = TranslationCache(path)
+        assert ai.translate_to_korean(headline) == "번역 1"
+        assert len(calls) == 2
+
+
+def test_model_is_part_of_the_key():
+    headline = "Chipmakers rally on AI demand"
+    original_model = os.environ.get("OLLAMA_MODEL")
+    with temporary_cache(), mock_ollama() as calls:
+        try:
+            os.environ["OLLAMA_MODEL"] = "model-a"
+            ai.translate_to_korean(headline)
+            os.environ["OLLAMA_MODEL"] = "model-b"
+            ai.translate_to_korean(headline)
+            ai.translate_to_korean(headline)
+        finally:
+            if original_model is None:
+                os.environ.pop("OLLAMA_MODEL", None)
+            else:
+                os.environ["OLLAMA_MODEL"] = original_model
+        assert len(calls) == 2
+
+
+def test_failed_translation_is_not_cached():
+    headline = "Treasury yields climb"
+    with temporary_cache() as cache:
+        with mock_ollama(status=500):
+            assert ai.translate_to_korean(headline) == headline
+        assert len(cache) == 0
+        with mock_ollama() as calls:
+            assert ai.translate_to_korean(headline) == "번역 1"
+        assert len(calls) == 1 and len(cache) == 1
+
+
+def test_lookup_many_and_store_many():
+    with temporary_cache() as cache:
+        cache.store_many([("Stocks rise", "model-a", "주가 상승"), ("Oil falls", "model-b", "유가 하락"), ("", "model-a", "무시")])
+        cache.store("Oil falls", "model-a", "유가 하락 (a)")
+        assert len(cache) == 3
+        found = cache.lookup_many(["Oil falls", "Stocks rise", "Unknown", "", "Stocks rise"], ["model-a", "model-b"])
+        # 모델 목록의 앞쪽이 우선, 결과는 입력 순서대로
+        assert found == [("model-a", "유가 하락 (a)"), ("model-a", "주가 상승"), None, None, ("model-a", "주가 상승")]
+        assert cache.lookup_many(["Oil falls"], ["model-b"]) == [("model-b", "유가 하락")]
+        assert cache.lookup("Oil falls", ["model-c"]) is None
+
+
+def benchmark(headlines: int = 50, model_latency: float = 0.02) -> dict:
+    texts = [f"Headline number {i} about markets" for i in range(headlines)]
+    with temporary_cache(), mock_ollama(delay=model_latency):
+        start = time.perf_counter()
+        for text in texts:
+            ai.translate_to_korean(text)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        for text in texts:
+            ai.translate_to_korean(text)
+        warm = time.perf_counter() - start
+    return {"cold": cold, "warm": warm}
+
+
+if __name__ == "__main__":
+    test_same_text_is_translated_once()
+    test_model_is_part_of_the_key()
+    test_failed_translation_is_not_cached()
+    test_lookup_many_and_store_many()
+    result = benchmark()
+    print("헤드라인 50개 번역 (모델 응답 20ms 가정)")
+    print(f"  첫 갱신:   {result['cold'] * 1000:.1f} ms")
+    print(f"  다음 갱신: {result['warm'] * 1000:.1f} ms")